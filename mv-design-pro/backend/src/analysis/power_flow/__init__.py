@@ -1,30 +1,73 @@
 """Power flow solver (Newton-Raphson) public API."""
 
-from .result import PowerFlowResult
-from .solver import PowerFlowSolver, solve_power_flow
-from .types import (
-    BranchLimitSpec,
-    BusVoltageLimitSpec,
-    PQSpec,
-    PVSpec,
-    PowerFlowInput,
-    PowerFlowOptions,
-    ShuntSpec,
-    SlackSpec,
-    TransformerTapSpec,
-)
-from .violations import (
-    BusInfo,
-    ViolationType,
-    VoltageViolation,
-    VoltageViolationsDetector,
-    VoltageViolationsResult,
-)
-from .violations_report import (
-    add_violations_section_to_pdf,
-    export_violations_report_to_bytes,
-    export_violations_report_to_pdf,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .result import PowerFlowResult
+    from .solver import PowerFlowSolver, solve_power_flow
+    from .types import (
+        BranchLimitSpec,
+        BusVoltageLimitSpec,
+        PQSpec,
+        PVSpec,
+        PowerFlowInput,
+        PowerFlowOptions,
+        ShuntSpec,
+        SlackSpec,
+        TransformerTapSpec,
+    )
+    from .violations import (
+        BusInfo,
+        ViolationType,
+        VoltageViolation,
+        VoltageViolationsDetector,
+        VoltageViolationsResult,
+    )
+    from .violations_report import (
+        add_violations_section_to_pdf,
+        export_violations_report_to_bytes,
+        export_violations_report_to_pdf,
+    )
+
+# Submodules load on first access; the PDF report pulls in reportlab
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".result": (
+        "PowerFlowResult",
+    ),
+    ".solver": (
+        "PowerFlowSolver",
+        "solve_power_flow",
+    ),
+    ".types": (
+        "BranchLimitSpec",
+        "BusVoltageLimitSpec",
+        "PQSpec",
+        "PVSpec",
+        "PowerFlowInput",
+        "PowerFlowOptions",
+        "ShuntSpec",
+        "SlackSpec",
+        "TransformerTapSpec",
+    ),
+    ".violations": (
+        "BusInfo",
+        "ViolationType",
+        "VoltageViolation",
+        "VoltageViolationsDetector",
+        "VoltageViolationsResult",
+    ),
+    ".violations_report": (
+        "add_violations_section_to_pdf",
+        "export_violations_report_to_bytes",
+        "export_violations_report_to_pdf",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "PowerFlowInput",
@@ -50,3 +93,16 @@ __all__ = [
     "export_violations_report_to_bytes",
     "export_violations_report_to_pdf",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
@@ -1,9 +1,34 @@
 """Protection curves I–t (ETAP++ visual layer)."""
 
-from analysis.protection_curves_it.builder import ProtectionCurvesITBuilder
-from analysis.protection_curves_it.models import ProtectionCurvesITView
-from analysis.protection_curves_it.renderer_pdf import render_protection_curves_pdf
-from analysis.protection_curves_it.renderer_svg import render_protection_curves_svg
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from analysis.protection_curves_it.builder import ProtectionCurvesITBuilder
+    from analysis.protection_curves_it.models import ProtectionCurvesITView
+    from analysis.protection_curves_it.renderer_pdf import render_protection_curves_pdf
+    from analysis.protection_curves_it.renderer_svg import render_protection_curves_svg
+
+# Submodules load on first access; the PDF renderer pulls in reportlab
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "analysis.protection_curves_it.builder": (
+        "ProtectionCurvesITBuilder",
+    ),
+    "analysis.protection_curves_it.models": (
+        "ProtectionCurvesITView",
+    ),
+    "analysis.protection_curves_it.renderer_pdf": (
+        "render_protection_curves_pdf",
+    ),
+    "analysis.protection_curves_it.renderer_svg": (
+        "render_protection_curves_svg",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "ProtectionCurvesITBuilder",
@@ -11,3 +36,16 @@ __all__ = [
     "render_protection_curves_pdf",
     "render_protection_curves_svg",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from api.canonical_run_views import (
     build_analysis_run_detail,
@@ -15,20 +16,78 @@ from api.canonical_run_views import (
     build_results_index_response,
     build_run_trace_payload,
     build_short_circuit_results_response,
-    build_sld_overlay,
+    build_trace_index_response,
+    build_trace_steps_response,
 )
-from api.dependencies import get_uow_factory
-from application.analysis_run.read_model import canonicalize_json, build_trace_summary
+from api.dependencies import get_read_only_uow_factory
+from api.sld import OverlayFormat, sld_overlay_response
+from application.analysis_run.read_model import (
+    build_trace_summary,
+    canonicalize_json,
+    query_result_rows,
+)
+from application.pagination import InvalidCursorError, keyset_page, offset_page
 from enm.canonical_analysis import (
     CanonicalRun,
     get_run as get_canonical_run,
+    get_trace_index,
     list_runs_for_project as list_canonical_runs_for_project,
 )
+from network_model.reporting.export_jsonl import (
+    JSONL_MEDIA_TYPES,
+    JSONL_SUFFIXES,
+    JsonlCompression,
+    iter_jsonl_chunks,
+    iter_trace_jsonl,
+)
 
 
 router = APIRouter()
 
 
+class ResultRowsQuery:
+    """Server-side sort/filter/paging parameters of the result tables."""
+
+    def __init__(
+        self,
+        sort: str | None = Query(default=None, description="Kolumna sortowania"),
+        order: Literal["asc", "desc"] = Query(default="asc"),
+        q: str | None = Query(default=None, description="Fragment nazwy lub ID"),
+        flag: str | None = Query(default=None, description="np. OVERLOADED, SLACK"),
+        limit: int | None = Query(default=None, ge=1, le=5000),
+        cursor: str | None = Query(default=None),
+    ) -> None:
+        self.sort = sort
+        self.order = order
+        self.q = q
+        self.flag = flag
+        self.limit = limit
+        self.cursor = cursor
+
+    def apply(self, table: dict[str, Any]) -> dict[str, Any]:
+        """Table payload with its rows queried and paged (total = filtered count)."""
+        try:
+            rows = query_result_rows(
+                table.get("rows", []),
+                sort=self.sort,
+                descending=self.order == "desc",
+                search=self.q,
+                flag=self.flag,
+            )
+            next_cursor = None
+            total = len(rows)
+            if self.limit is not None:
+                page = offset_page(rows, limit=self.limit, cursor=self.cursor)
+                rows, next_cursor = list(page.items), page.next_cursor
+        except (InvalidCursorError, ValueError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        return canonicalize_json(
+            {**table, "rows": rows, "total": total, "next_cursor": next_cursor}
+        )
+
+
 def _require_canonical_run(run_id: UUID) -> CanonicalRun:
     run = get_canonical_run(run_id)
     if run is None:
@@ -39,6 +98,25 @@ def _require_canonical_run(run_id: UUID) -> CanonicalRun:
     return run
 
 
+def _run_display_names(run: CanonicalRun, uow_factory: Any) -> tuple[str, str]:
+    """Nazwy projektu i przypadku przebiegu; identyfikator, gdy brak ich w bazie."""
+    project_name = f"Projekt {run.project_id}" if run.project_id else "Projekt"
+    case_name = f"Przypadek {run.case_id}"
+    try:
+        case_id = UUID(run.case_id)
+        project_id = UUID(run.project_id) if run.project_id else None
+    except ValueError:
+        return project_name, case_name
+    with uow_factory() as uow:
+        case = uow.cases.get_study_case(case_id)
+        project = uow.projects.get(project_id) if project_id is not None else None
+    if case is not None:
+        case_name = case.name
+    if project is not None:
+        project_name = project.name
+    return project_name, case_name
+
+
 @router.get("/projects/{project_id}/analysis-runs")
 def list_analysis_runs(
     project_id: UUID,
@@ -46,17 +124,37 @@ def list_analysis_runs(
     status_filter: str | None = Query(default=None, alias="status"),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
 ) -> dict[str, Any]:
-    items = [
-        build_analysis_run_summary(run)
+    runs = [
+        run
         for run in list_canonical_runs_for_project(
             str(project_id),
             analysis_type=analysis_type,
         )
         if status_filter is None or run.status == status_filter
     ]
-    sliced_items = items[offset : offset + limit]
-    return canonicalize_json({"items": sliced_items, "count": len(items)})
+    next_cursor = None
+    if offset:
+        page_runs = runs[offset : offset + limit]
+    else:
+        try:
+            page = keyset_page(
+                runs,
+                key=lambda run: (run.created_at, str(run.id)),
+                limit=limit,
+                cursor=cursor,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        page_runs, next_cursor = list(page.items), page.next_cursor
+    # Summaries are built for the page only
+    items = [build_analysis_run_summary(run) for run in page_runs]
+    return canonicalize_json(
+        {"items": items, "count": len(runs), "next_cursor": next_cursor}
+    )
 
 
 @router.get("/analysis-runs/{run_id}")
@@ -94,12 +192,15 @@ def get_analysis_run_results(run_id: UUID) -> dict[str, Any]:
     return canonicalize_json(build_result_items(canonical_run))
 
 
-@router.get("/analysis-runs/{run_id}/overlay")
+@router.get("/analysis-runs/{run_id}/overlay", response_model=None)
 def get_analysis_run_overlay(
     run_id: UUID,
+    request: Request,
+    response: Response,
     diagram_id: UUID = Query(...),
-    uow_factory=Depends(get_uow_factory),
-) -> dict[str, Any]:
+    format: OverlayFormat = Query("json", description="json | columnar (packed buffers)"),
+    uow_factory=Depends(get_read_only_uow_factory),
+) -> dict[str, Any] | Response:
     canonical_run = _require_canonical_run(run_id)
     with uow_factory() as uow:
         diagram = uow.sld.get(diagram_id)
@@ -119,16 +220,20 @@ def get_analysis_run_overlay(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Run does not belong to this project",
         )
-    overlay = build_sld_overlay(
-        canonical_run,
+    return sld_overlay_response(
+        request,
+        response,
+        run=canonical_run,
         diagram_id=diagram_id,
         sld_payload=diagram.get("payload", {}),
-    )
-    return canonicalize_json(
-        {
-            "bus_overlays": overlay.get("nodes", []),
-            "branch_overlays": overlay.get("branches", []),
-        }
+        overlay_format=format,
+        shape="analysis-run-overlay",
+        build_json=lambda overlay: canonicalize_json(
+            {
+                "bus_overlays": overlay.get("nodes", []),
+                "branch_overlays": overlay.get("branches", []),
+            }
+        ),
     )
 
 
@@ -164,6 +269,95 @@ def get_analysis_run_trace_summary(run_id: UUID) -> dict[str, Any]:
     )
 
 
+@router.get("/analysis-runs/{run_id}/results/trace/export/jsonl")
+def export_analysis_run_trace_jsonl(
+    run_id: UUID,
+    compression: JsonlCompression = Query(default="gzip", description="gzip | zstd | none"),
+) -> StreamingResponse:
+    run = _require_canonical_run(run_id)
+    try:
+        # Steps are serialized and compressed one at a time while streaming
+        chunks = iter_jsonl_chunks(
+            iter_trace_jsonl(iter(run.white_box_trace)), compression=compression
+        )
+    except ImportError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Kompresja zstd wymaga zstandard. Zainstaluj: pip install zstandard",
+        ) from exc
+    return StreamingResponse(
+        chunks,
+        media_type=JSONL_MEDIA_TYPES[compression],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="trace_{run_id}{JSONL_SUFFIXES[compression]}"'
+            ),
+        },
+    )
+
+
+@router.get("/analysis-runs/{run_id}/proof-pack")
+def export_analysis_run_proof_pack(
+    run_id: UUID,
+    layout: Literal["project", "per_bus"] = Query(
+        default="project", description="project: jeden pakiet | per_bus: pakiet na szynę"
+    ),
+    uow_factory=Depends(get_read_only_uow_factory),
+) -> StreamingResponse:
+    # The proof generator loads on first use (import_time_guard)
+    from application.proof_engine.batch import (
+        SC3FColumns,
+        iter_sc3f_proofs,
+        proof_artifact_id,
+        stream_sc3f_pack_bundle,
+    )
+    from application.proof_engine.proof_pack import (
+        ProjectProofPackBuilder,
+        ProofPackContext,
+        resolve_mv_design_pro_version,
+    )
+
+    run = _require_canonical_run(run_id)
+    rows = None
+    if run.analysis_type == "short_circuit_sn":
+        rows = (run.raw_result or {}).get("results")
+    if run.status != "FINISHED" or not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dowody SC3F niedostępne dla tego przebiegu analizy",
+        )
+    project_name, case_name = _run_display_names(run, uow_factory)
+    # Whole run at once: unit conversions and |Z_th| are computed column-wise
+    columns = SC3FColumns.from_short_circuit_payloads(
+        rows, project_name=project_name, case_name=case_name, run_timestamp=run.finished_at
+    )
+    # Same run, same bus → same artifact_id on every export
+    artifact_ids = [
+        proof_artifact_id(str(run.id), fault_type, node_id)
+        for fault_type, node_id in zip(columns.fault_type, columns.fault_node_id)
+    ]
+    context = ProofPackContext(
+        project_id=run.project_id or run.case_id,
+        case_id=run.case_id,
+        run_id=str(run.id),
+        snapshot_id=run.snapshot_hash,
+        mv_design_pro_version=resolve_mv_design_pro_version(),
+    )
+    if layout == "per_bus":
+        chunks = stream_sc3f_pack_bundle(columns, context, artifact_ids=artifact_ids)
+    else:
+        chunks = ProjectProofPackBuilder(context).stream(iter_sc3f_proofs(columns, artifact_ids))
+    return StreamingResponse(
+        chunks,
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="mv-design-pro__proofpack__SC3F__{run_id}.zip"'
+            ),
+        },
+    )
+
+
 @router.get("/projects/{project_id}/analysis-runs/{run_id}/export/docx")
 def export_analysis_run_docx(project_id: UUID, run_id: UUID) -> dict[str, Any]:
     _ = project_id, run_id
@@ -194,22 +388,57 @@ def get_results_index(run_id: UUID) -> dict[str, Any]:
 
 
 @router.get("/analysis-runs/{run_id}/results/buses")
-def get_bus_results(run_id: UUID) -> dict[str, Any]:
-    return canonicalize_json(build_bus_results_response(_require_canonical_run(run_id)))
+def get_bus_results(run_id: UUID, query: ResultRowsQuery = Depends()) -> dict[str, Any]:
+    return query.apply(build_bus_results_response(_require_canonical_run(run_id)))
 
 
 @router.get("/analysis-runs/{run_id}/results/branches")
-def get_branch_results(run_id: UUID) -> dict[str, Any]:
-    return canonicalize_json(build_branch_results_response(_require_canonical_run(run_id)))
+def get_branch_results(run_id: UUID, query: ResultRowsQuery = Depends()) -> dict[str, Any]:
+    return query.apply(build_branch_results_response(_require_canonical_run(run_id)))
 
 
 @router.get("/analysis-runs/{run_id}/results/short-circuit")
-def get_short_circuit_results(run_id: UUID) -> dict[str, Any]:
-    return canonicalize_json(
-        build_short_circuit_results_response(_require_canonical_run(run_id))
-    )
+def get_short_circuit_results(
+    run_id: UUID, query: ResultRowsQuery = Depends()
+) -> dict[str, Any]:
+    return query.apply(build_short_circuit_results_response(_require_canonical_run(run_id)))
 
 
 @router.get("/analysis-runs/{run_id}/results/trace")
 def get_extended_trace(run_id: UUID) -> dict[str, Any]:
     return canonicalize_json(build_extended_trace_response(_require_canonical_run(run_id)))
+
+
+@router.get("/analysis-runs/{run_id}/results/trace/index")
+def get_trace_selection_index(run_id: UUID) -> dict[str, Any]:
+    return canonicalize_json(build_trace_index_response(_require_canonical_run(run_id)))
+
+
+@router.get("/analysis-runs/{run_id}/results/trace/steps")
+def get_trace_steps(
+    run_id: UUID,
+    element_id: str | None = Query(default=None),
+    target_id: str | None = Query(default=None),
+    key: str | None = Query(default=None, description="Klucz kroku śladu"),
+    limit: int = Query(default=200, ge=1, le=5000),
+    cursor: str | None = Query(default=None),
+) -> dict[str, Any]:
+    run = _require_canonical_run(run_id)
+    positions = get_trace_index(run).positions(
+        element_id=element_id, target_id=target_id, key=key
+    )
+    try:
+        page = offset_page(positions, limit=limit, cursor=cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    # Only the returned page is enriched with catalog context
+    return canonicalize_json(
+        build_trace_steps_response(
+            run,
+            list(page.items),
+            total=len(positions),
+            next_cursor=page.next_cursor,
+        )
+    )
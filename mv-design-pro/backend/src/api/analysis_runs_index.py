@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import timezone
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from api.dependencies import get_uow_factory
+from api.dependencies import get_read_only_uow_factory
+from application.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/analysis-runs", tags=["analysis-runs"])
 
@@ -16,17 +17,41 @@ def list_analysis_runs_index(
     analysis_type: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    uow_factory=Depends(get_uow_factory),
+    cursor: str | None = Query(default=None),
+    include_meta: bool = Query(default=False),
+    uow_factory=Depends(get_read_only_uow_factory),
 ) -> dict[str, Any]:
+    """
+    Runs newest first. Keyset paging: pass next_cursor back as cursor.
+
+    offset > 0 keeps the legacy offset paging (no next_cursor).
+    meta_json is selected only with include_meta=true.
+    """
     with uow_factory() as uow:
-        entries = uow.analysis_runs_index.list(
-            case_id=case_id,
-            analysis_type=analysis_type,
-            limit=limit,
-            offset=offset,
-        )
+        if offset:
+            entries = uow.analysis_runs_index.list(
+                case_id=case_id,
+                analysis_type=analysis_type,
+                limit=limit,
+                offset=offset,
+            )
+            next_cursor = None
+        else:
+            try:
+                page = uow.analysis_runs_index.list_page(
+                    case_id=case_id,
+                    analysis_type=analysis_type,
+                    limit=limit,
+                    cursor=cursor,
+                    include_meta=include_meta,
+                )
+            except InvalidCursorError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+                ) from exc
+            entries, next_cursor = list(page.items), page.next_cursor
     items = [_index_entry_to_dict(entry) for entry in entries]
-    return {"items": items, "count": len(entries)}
+    return {"items": items, "count": len(entries), "next_cursor": next_cursor}
 
 
 def _index_entry_to_dict(entry) -> dict[str, Any]:
@@ -9,19 +9,22 @@ Endpoints:
     GET    /api/execution/study-cases/{id}/batches        — List batches
     GET    /api/execution/batches/{id}                    — Get batch details
     POST   /api/execution/study-cases/{id}/comparisons    — Create comparison
+    POST   /api/execution/study-cases/{id}/comparisons/n-way — Base vs many variants
     GET    /api/execution/comparisons/{id}                — Get comparison
 
-No pagination (v1).
+Listings use keyset pagination on (created_at, id): limit + cursor,
+next page via next_cursor.
 No ResultSet mutation.
 All responses use Polish error messages for UI consistency.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from api.execution_runs import get_engine
@@ -30,6 +33,7 @@ from application.batch_execution_service import (
     BatchNotFoundError,
     BatchNotPendingError,
 )
+from application.pagination import InvalidCursorError, Page
 from application.sc_comparison_service import (
     ScComparisonService,
     AnalysisTypeMismatchError,
@@ -49,6 +53,9 @@ from application.execution_engine.errors import (
     StudyCaseNotFoundError,
 )
 from domain.execution import ExecutionAnalysisType
+from domain.sc_comparison import ShortCircuitComparison
+
+T = TypeVar("T")
 
 router = APIRouter(tags=["batch-execution"])
 
@@ -130,6 +137,7 @@ class BatchListResponse(BaseModel):
 
     batches: list[BatchResponse]
     count: int
+    next_cursor: str | None = None
 
 
 class CreateComparisonRequest(BaseModel):
@@ -143,6 +151,23 @@ class CreateComparisonRequest(BaseModel):
     )
 
 
+class ComparisonVariantRequest(BaseModel):
+    """Single variant of an N-way comparison."""
+
+    run_id: str = Field(..., description="UUID przebiegu wariantu")
+    scenario_id: str = Field(..., description="UUID scenariusza wariantu")
+
+
+class CreateNWayComparisonRequest(BaseModel):
+    """Request to compare one base run against many variants."""
+
+    base_run_id: str = Field(..., description="UUID przebiegu bazowego")
+    base_scenario_id: str = Field(..., description="UUID scenariusza bazowego")
+    variants: list[ComparisonVariantRequest] = Field(
+        ..., min_length=1, description="Warianty porównywane (kolejność zachowana)"
+    )
+
+
 class NumericDeltaResponse(BaseModel):
     """Numeric delta response."""
 
@@ -167,6 +192,13 @@ class ComparisonResponse(BaseModel):
     deltas_by_branch: list[dict[str, Any]]
 
 
+class NWayComparisonResponse(BaseModel):
+    """N-way comparison response (one comparison per variant)."""
+
+    comparisons: list[ComparisonResponse]
+    count: int
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
@@ -190,6 +222,17 @@ def _parse_uuid(value: str, field_name: str = "id") -> UUID:
         ) from exc
 
 
+def _keyset(load_page: Callable[[], Page[T]]) -> Page[T]:
+    """Strona listy; nieprawidłowy kursor → 400."""
+    try:
+        return load_page()
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Nieprawidłowy kursor stronicowania",
+        ) from exc
+
+
 def _parse_analysis_type(value: str) -> ExecutionAnalysisType:
     """Parse and validate an analysis type string."""
     try:
@@ -287,19 +330,26 @@ def execute_batch(batch_id: str) -> dict[str, Any]:
     "/api/execution/study-cases/{case_id}/batches",
     response_model=BatchListResponse,
 )
-def list_batches(case_id: str) -> dict[str, Any]:
+def list_batches(
+    case_id: str,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+) -> dict[str, Any]:
     """
-    Lista zadań wsadowych dla przypadku obliczeniowego.
+    Lista zadań wsadowych dla przypadku obliczeniowego (najnowsze pierwsze).
 
     GET /api/execution/study-cases/{case_id}/batches
     """
     parsed_case_id = _parse_uuid(case_id, "case_id")
     service = _get_batch_service()
 
-    batches = service.list_batches(parsed_case_id)
+    page = _keyset(
+        lambda: service.list_batches_page(parsed_case_id, limit=limit, cursor=cursor)
+    )
     return {
-        "batches": [b.to_dict() for b in batches],
-        "count": len(batches),
+        "batches": [b.to_dict() for b in page.items],
+        "count": len(page.items),
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -392,6 +442,72 @@ def create_comparison(
         ) from exc
 
 
+@router.post(
+    "/api/execution/study-cases/{case_id}/comparisons/n-way",
+    response_model=NWayComparisonResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_n_way_comparison(
+    case_id: str,
+    request: CreateNWayComparisonRequest,
+) -> dict[str, Any]:
+    """
+    Utwórz porównania scenariusza bazowego z wieloma wariantami.
+
+    POST /api/execution/study-cases/{case_id}/comparisons/n-way
+    """
+    parsed_case_id = _parse_uuid(case_id, "case_id")
+    parsed_base_run_id = _parse_uuid(request.base_run_id, "base_run_id")
+    parsed_base_scenario_id = _parse_uuid(
+        request.base_scenario_id, "base_scenario_id"
+    )
+    others = [
+        (
+            _parse_uuid(variant.run_id, "run_id"),
+            _parse_uuid(variant.scenario_id, "scenario_id"),
+        )
+        for variant in request.variants
+    ]
+    service = _get_comparison_service()
+
+    try:
+        comparisons = service.compute_comparisons_many(
+            study_case_id=parsed_case_id,
+            base_run_id=parsed_base_run_id,
+            base_scenario_id=parsed_base_scenario_id,
+            others=others,
+        )
+        return {
+            "comparisons": [c.to_dict() for c in comparisons],
+            "count": len(comparisons),
+        }
+    except RunNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except RunNotDoneError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        ) from exc
+    except AnalysisTypeMismatchError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except StudyCaseMismatchError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except ResultSetNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+
+
 @router.get(
     "/api/execution/comparisons/{comparison_id}",
     response_model=ComparisonResponse,
@@ -457,17 +573,43 @@ def get_sld_delta_overlay(comparison_id: str) -> dict[str, Any]:
 @router.get(
     "/api/execution/study-cases/{case_id}/comparisons",
 )
-def list_comparisons(case_id: str) -> dict[str, Any]:
+def list_comparisons(
+    case_id: str,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    include_deltas: bool = Query(default=True),
+) -> dict[str, Any]:
     """
-    Lista porownan dla przypadku obliczeniowego.
+    Lista porownan dla przypadku obliczeniowego (najnowsze pierwsze).
+
+    include_deltas=false — projekcja bez delt (widok listy).
 
     GET /api/execution/study-cases/{case_id}/comparisons
     """
     parsed_case_id = _parse_uuid(case_id, "case_id")
     service = _get_comparison_service()
 
-    comparisons = service.list_comparisons(parsed_case_id)
+    page = _keyset(
+        lambda: service.list_comparisons_page(parsed_case_id, limit=limit, cursor=cursor)
+    )
+    return {
+        "comparisons": [
+            c.to_dict() if include_deltas else _comparison_summary(c)
+            for c in page.items
+        ],
+        "count": len(page.items),
+        "next_cursor": page.next_cursor,
+    }
+
+
+def _comparison_summary(comparison: ShortCircuitComparison) -> dict[str, Any]:
+    """Porownanie bez delt (deltas_*) — tylko pola identyfikujace."""
     return {
-        "comparisons": [c.to_dict() for c in comparisons],
-        "count": len(comparisons),
+        "comparison_id": str(comparison.comparison_id),
+        "study_case_id": str(comparison.study_case_id),
+        "analysis_type": comparison.analysis_type.value,
+        "base_scenario_id": str(comparison.base_scenario_id),
+        "other_scenario_id": str(comparison.other_scenario_id),
+        "created_at": comparison.created_at.isoformat(),
+        "input_hash": comparison.input_hash,
     }
@@ -12,11 +12,10 @@ from analysis.power_flow_interpretation import (
 from application.analysis_run import build_trace_summary
 from enm.canonical_analysis import (
     CanonicalRun,
-    build_branch_results,
-    build_bus_results,
     build_extended_trace,
-    build_results_index,
-    build_short_circuit_results,
+    enrich_trace_steps,
+    get_results_read_model,
+    get_trace_index,
 )
 
 
@@ -103,17 +102,18 @@ def build_sld_overlay(
     diagram_id: UUID,
     sld_payload: dict[str, Any],
 ) -> dict[str, Any]:
+    read_model = get_results_read_model(run)
     bus_rows = {
         row["bus_id"]: row
-        for row in build_bus_results(run).get("rows", [])
+        for row in read_model.bus_results.get("rows", [])
     }
     branch_rows = {
         row["branch_id"]: row
-        for row in build_branch_results(run).get("rows", [])
+        for row in read_model.branch_results.get("rows", [])
     }
     sc_rows = {
         row["target_id"]: row
-        for row in build_short_circuit_results(run).get("rows", [])
+        for row in read_model.short_circuit_results.get("rows", [])
     }
 
     node_symbols = list(sld_payload.get("nodes", []))
@@ -273,6 +273,7 @@ def build_power_flow_interpretation(run: CanonicalRun) -> dict[str, Any]:
 
 def build_power_flow_export_bundle(run: CanonicalRun) -> dict[str, Any]:
     extended_trace = build_extended_trace(run)
+    read_model = get_results_read_model(run)
     return {
         "result": get_power_flow_result(run),
         "trace": get_power_flow_trace(run),
@@ -280,9 +281,9 @@ def build_power_flow_export_bundle(run: CanonicalRun) -> dict[str, Any]:
         "catalog_context": extended_trace.get("catalog_context", []),
         "catalog_context_by_element": extended_trace.get("catalog_context_by_element", {}),
         "catalog_context_summary": extended_trace.get("catalog_context_summary", {}),
-        "bus_results": build_bus_results(run),
-        "branch_results": build_branch_results(run),
-        "results_index": build_results_index(run),
+        "bus_results": read_model.bus_results,
+        "branch_results": read_model.branch_results,
+        "results_index": read_model.results_index,
         "metadata": {
             "run_id": str(run.id),
             "project_id": run.project_id,
@@ -297,25 +298,54 @@ def build_power_flow_export_bundle(run: CanonicalRun) -> dict[str, Any]:
 
 
 def build_results_index_response(run: CanonicalRun) -> dict[str, Any]:
-    return build_results_index(run)
+    return get_results_read_model(run).results_index
 
 
 def build_bus_results_response(run: CanonicalRun) -> dict[str, Any]:
-    return build_bus_results(run)
+    return get_results_read_model(run).bus_results
 
 
 def build_branch_results_response(run: CanonicalRun) -> dict[str, Any]:
-    return build_branch_results(run)
+    return get_results_read_model(run).branch_results
 
 
 def build_short_circuit_results_response(run: CanonicalRun) -> dict[str, Any]:
-    return build_short_circuit_results(run)
+    return get_results_read_model(run).short_circuit_results
 
 
 def build_extended_trace_response(run: CanonicalRun) -> dict[str, Any]:
     return build_extended_trace(run)
 
 
+def build_trace_index_response(run: CanonicalRun) -> dict[str, Any]:
+    trace_index = get_trace_index(run)
+    return {
+        "run_id": str(run.id),
+        "step_count": trace_index.step_count,
+        "selection_index": trace_index.selection_index,
+        "step_keys": sorted(trace_index.steps_by_key),
+        "target_ids": sorted(trace_index.steps_by_target),
+    }
+
+
+def build_trace_steps_response(
+    run: CanonicalRun,
+    positions: list[int],
+    *,
+    total: int,
+    next_cursor: str | None,
+) -> dict[str, Any]:
+    return {
+        "run_id": str(run.id),
+        "snapshot_id": run.snapshot_hash,
+        "input_hash": run.input_hash,
+        "positions": positions,
+        "steps": enrich_trace_steps(run, positions),
+        "total": total,
+        "next_cursor": next_cursor,
+    }
+
+
 def _build_element_counts(run: CanonicalRun) -> dict[str, int]:
     snapshot = run.snapshot or {}
     return {
@@ -33,6 +33,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from api.dependencies import get_uow_factory
+from application.pagination import InvalidCursorError, keyset_page
 
 logger = logging.getLogger("mv_design_pro.case_runs")
 
@@ -208,6 +209,7 @@ class CaseRunListResponse(BaseModel):
 
     items: list[CaseRunSummaryResponse]
     total: int
+    next_cursor: str | None = None
 
 
 class CaseRunTraceResponse(BaseModel):
@@ -514,12 +516,15 @@ def list_case_runs(
     ),
     limit: int = Query(default=50, ge=1, le=500, description="Limit wynikow"),
     offset: int = Query(default=0, ge=0, description="Przesuniecie"),
+    cursor: str | None = Query(default=None, description="Kursor nastepnej strony"),
     uow_factory=Depends(get_uow_factory),
 ) -> dict[str, Any]:
     """Pobierz liste wszystkich przebiegow analizy powiazanych z przypadkiem.
 
     Wyniki sa posortowane po dacie utworzenia malejaco (najnowsze pierwsze)
-    i moga byc filtrowane po typie analizy lub statusie.
+    i moga byc filtrowane po typie analizy lub statusie. Stronicowanie
+    kursorem (created_at, id): next_cursor przekazany jako cursor zwraca
+    nastepna strone; offset > 0 zachowuje dawne stronicowanie.
 
     Zwraca 404 jesli przypadek nie istnieje.
     """
@@ -541,15 +546,31 @@ def list_case_runs(
     if status_filter is not None:
         matching = [r for r in matching if r["status"] == status_filter]
 
-    # Sort deterministically: newest first, then by id for stability
-    matching.sort(key=lambda r: (r["created_at"], r["id"]), reverse=True)
-
     total = len(matching)
-    page = matching[offset : offset + limit]
+    next_cursor = None
+    if offset:
+        # Sort deterministically: newest first, then by id for stability
+        matching.sort(key=lambda r: (r["created_at"], r["id"]), reverse=True)
+        page = matching[offset : offset + limit]
+    else:
+        try:
+            keyset = keyset_page(
+                matching,
+                key=lambda r: (datetime.fromisoformat(r["created_at"]), r["id"]),
+                limit=limit,
+                cursor=cursor,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Nieprawidlowy kursor stronicowania",
+            ) from exc
+        page, next_cursor = list(keyset.items), keyset.next_cursor
 
     return {
         "items": [_run_to_summary(r) for r in page],
         "total": total,
+        "next_cursor": next_cursor,
     }
 
 
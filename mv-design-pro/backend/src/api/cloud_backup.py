@@ -16,12 +16,19 @@ from __future__ import annotations
 
 import logging
 import os
+import tempfile
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
+from domain.archive_chunks import (
+    assemble_archive,
+    chunk_archive,
+    read_chunk_manifest,
+)
 from infrastructure.cloud_backup import (
     CloudBackendType,
     CloudBackupConfig,
@@ -33,7 +40,6 @@ from infrastructure.cloud_backup import (
     CloudBackupPermissionError,
     CloudBackupUploadError,
     create_backup_provider,
-    compute_file_hash,
 )
 
 logger = logging.getLogger("mv_design_pro.api.cloud_backup")
@@ -97,6 +103,8 @@ class BackupResponse(BaseModel):
     archive_hash: str | None = None
     timestamp: str | None = None
     size_bytes: int | None = None
+    chunks_total: int | None = None
+    chunks_uploaded: int | None = None
 
 
 class BackupEntryResponse(BaseModel):
@@ -132,6 +140,7 @@ class DeleteBackupResponse(BaseModel):
 
     success: bool
     message_pl: str
+    chunks_pruned: int | None = None
 
 
 # ============================================================================
@@ -182,10 +191,9 @@ def backup_project(
     """
     Utwórz kopię zapasową projektu w chmurze.
 
-    1. Eksportuj projekt do archiwum ZIP
-    2. Oblicz hash archiwum
-    3. Prześlij do skonfigurowanego backendu chmurowego
-    4. Zweryfikuj hash po przesłaniu
+    1. Zbierz archiwum projektu i podziel je na chunki (run, wynik, dowód...)
+    2. Prześlij chunki, których backend jeszcze nie ma
+    3. Zapisz manifest chunków jako kopię zapasową (.mvdp.zip)
 
     Args:
         project_id: ID projektu do archiwizacji
@@ -200,7 +208,7 @@ def backup_project(
     try:
         with uow_factory() as uow:
             service = ProjectArchiveService(uow.session)
-            archive_bytes = service.export_project(project_id)
+            archive = service.build_archive(project_id)
     except ArchiveError as exc:
         raise HTTPException(
             status_code=404,
@@ -212,15 +220,14 @@ def backup_project(
             detail=f"Błąd wewnętrzny eksportu: {exc}",
         )
 
-    # Oblicz hash
-    archive_hash = compute_file_hash(archive_bytes)
+    manifest, chunks = chunk_archive(archive)
 
-    # Prześlij do chmury
+    # Prześlij do chmury (tylko brakujące chunki)
     try:
-        result = provider.upload(
-            archive_bytes=archive_bytes,
+        result = provider.upload_chunked(
+            manifest,
+            chunks,
             project_id=str(project_id),
-            archive_hash=archive_hash,
             metadata={
                 "project_id": str(project_id),
                 "source": "api-backup",
@@ -249,9 +256,11 @@ def backup_project(
         )
 
     logger.info(
-        "Kopia zapasowa utworzona: project=%s, hash=%s",
+        "Kopia zapasowa utworzona: project=%s, hash=%s, chunki=%s/%s",
         project_id,
-        archive_hash[:12],
+        archive.fingerprints.archive_hash[:12],
+        result.chunks_uploaded,
+        result.chunks_total,
     )
 
     return BackupResponse(
@@ -261,6 +270,8 @@ def backup_project(
         archive_hash=result.hash,
         timestamp=result.timestamp,
         size_bytes=result.size_bytes,
+        chunks_total=result.chunks_total,
+        chunks_uploaded=result.chunks_uploaded,
     )
 
 
@@ -319,7 +330,8 @@ def restore_from_backup(
     """
     Przywróć projekt z kopii zapasowej.
 
-    1. Pobierz archiwum z chmury
+    1. Pobierz archiwum z chmury do pliku tymczasowego
+       (kopia chunkowana: manifest + chunki)
     2. Zaimportuj archiwum (tworzony jest nowy projekt)
 
     Args:
@@ -331,43 +343,65 @@ def restore_from_backup(
     provider = _get_backup_provider(request)
     uow_factory = _get_archive_service(request)
 
-    # Pobierz archiwum z chmury
-    try:
-        archive_bytes = provider.download(
-            backup_id=backup_id,
-            project_id=str(project_id),
-        )
-    except CloudBackupNotFoundError as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=str(exc),
-        )
-    except CloudBackupPermissionError as exc:
-        raise HTTPException(
-            status_code=403,
-            detail=str(exc),
-        )
-    except CloudBackupError as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Błąd pobierania kopii zapasowej: {exc}",
-        )
+    with tempfile.TemporaryDirectory(prefix="mvdp-restore-") as tmp_dir:
+        archive_path = Path(tmp_dir) / f"{backup_id}.mvdp.zip"
 
-    archive_hash = compute_file_hash(archive_bytes)
+        # Pobierz archiwum z chmury (równoległe zakresy, strumieniowy hash)
+        try:
+            download = provider.download_file(
+                backup_id=backup_id,
+                project_id=str(project_id),
+                destination=archive_path,
+            )
+        except CloudBackupNotFoundError as exc:
+            raise HTTPException(
+                status_code=404,
+                detail=str(exc),
+            )
+        except CloudBackupPermissionError as exc:
+            raise HTTPException(
+                status_code=403,
+                detail=str(exc),
+            )
+        except CloudBackupError as exc:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Błąd pobierania kopii zapasowej: {exc}",
+            )
 
-    # Importuj archiwum
-    try:
-        with uow_factory() as uow:
-            service = ProjectArchiveService(uow.session)
-            result = service.import_project(
-                archive_bytes=archive_bytes,
-                verify_integrity=True,
+        # Importuj archiwum
+        try:
+            with archive_path.open("rb") as archive_file:
+                manifest = read_chunk_manifest(archive_file)
+                archive = (
+                    assemble_archive(
+                        manifest, provider.fetch_chunks(manifest, str(project_id))
+                    )
+                    if manifest is not None
+                    else None
+                )
+                archive_file.seek(0)
+                with uow_factory() as uow:
+                    service = ProjectArchiveService(uow.session)
+                    if archive is not None:
+                        result = service.import_archive(archive, verify_integrity=True)
+                    else:
+                        result = service.import_project_stream(
+                            archive_file,
+                            verify_integrity=True,
+                        )
+        except CloudBackupNotFoundError as exc:
+            raise HTTPException(
+                status_code=404,
+                detail=str(exc),
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Błąd importu archiwum z kopii zapasowej: {exc}",
             )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Błąd importu archiwum z kopii zapasowej: {exc}",
-        )
+
+    archive_hash = download.hash or ""
 
     if result.status.value == "FAILED":
         raise HTTPException(
@@ -389,7 +423,7 @@ def restore_from_backup(
         success=True,
         message_pl="Projekt przywrócony z kopii zapasowej pomyślnie.",
         archive_hash=archive_hash,
-        size_bytes=len(archive_bytes),
+        size_bytes=download.size_bytes,
     )
 
 
@@ -405,6 +439,9 @@ def delete_project_backup(
     """
     Usuń kopię zapasową projektu.
 
+    Po usunięciu manifestu usuwane są chunki, do których nie odwołuje się
+    już żadna kopia projektu (prune_chunks).
+
     Args:
         project_id: ID projektu
         backup_id: ID kopii zapasowej
@@ -444,7 +481,20 @@ def delete_project_backup(
         backup_id,
     )
 
+    # Manifest jest już usunięty; chunki pozostawione przez nieudany prune
+    # zostaną usunięte przy następnym usunięciu kopii
+    try:
+        chunks_pruned = provider.prune_chunks(str(project_id))
+    except CloudBackupError as exc:
+        logger.warning(
+            "Nie usunięto osieroconych chunków: project=%s, błąd=%s",
+            project_id,
+            exc,
+        )
+        chunks_pruned = None
+
     return DeleteBackupResponse(
         success=True,
         message_pl="Kopia zapasowa usunięta pomyślnie.",
+        chunks_pruned=chunks_pruned,
     )
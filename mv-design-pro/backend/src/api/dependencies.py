@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Callable
 
-from fastapi import Request
+from fastapi import Depends, Request
 
 from infrastructure.persistence.unit_of_work import UnitOfWork
 
@@ -12,3 +12,10 @@ def get_uow_factory(request: Request) -> Callable[[], UnitOfWork]:
     if uow_factory is None:
         raise RuntimeError("UnitOfWork factory not configured")
     return uow_factory
+
+
+def get_read_only_uow_factory(
+    uow_factory: Callable[..., UnitOfWork] = Depends(get_uow_factory),
+) -> Callable[[], UnitOfWork]:
+    """UnitOfWork factory for GET endpoints: no autoflush, no commit."""
+    return lambda: uow_factory(read_only=True)
@@ -7,6 +7,7 @@ Routes:
   GET  /api/cases/{case_id}/enm/validate     → ValidationResult
   GET  /api/cases/{case_id}/enm/topology     → TopologyGraph (substations, bays, junctions, corridors)
   GET  /api/cases/{case_id}/enm/topology/summary → TopologySummary (graph view: adjacency, spine, laterals)
+  GET  /api/cases/{case_id}/enm/relay-pairs  → RelayPairIndex (upstream/downstream relay pairs)
   GET  /api/cases/{case_id}/enm/readiness    → ReadinessMatrix (SC/PF/PR)
   POST /api/cases/{case_id}/enm/ops          → Topology operations (atomic graph CRUD)
   POST /api/cases/{case_id}/runs/short-circuit → dispatch SC run via ENM
@@ -26,6 +27,7 @@ from api.domain_ops_policy import validate_and_materialize_catalog_binding
 from enm.canonical_analysis import run_power_flow_now, run_short_circuit_now
 from enm.hash import compute_enm_hash
 from enm.models import EnergyNetworkModel
+from enm.relay_pairs import get_relay_pair_index, sync_relay_pair_index
 from enm.store import get_enm as _get_enm
 from enm.store import set_enm as _set_enm
 from enm.topology_ops import (
@@ -313,6 +315,22 @@ async def get_topology_summary(case_id: str) -> dict[str, Any]:
     }
 
 
+@router.get("/{case_id}/enm/relay-pairs")
+async def get_relay_pairs(case_id: str) -> dict[str, Any]:
+    """Zwróć indeks par przekaźników (upstream/downstream) ze ścieżkami do źródła.
+
+    Indeks jest cache'owany po odcisku topologii + zabezpieczeń.
+    DETERMINISTYCZNE: ten sam ENM → identyczny wynik.
+    """
+    enm = _get_enm(case_id)
+    index = get_relay_pair_index(enm.model_dump(mode="json"))
+    return {
+        "case_id": case_id,
+        "enm_revision": enm.header.revision,
+        **index.to_dict(),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Topology Operations (atomic graph CRUD)
 # ---------------------------------------------------------------------------
@@ -371,6 +389,7 @@ async def topology_ops(case_id: str, req: TopologyOpRequest) -> dict[str, Any]:
 
     if result.success:
         saved = _set_enm(case_id, EnergyNetworkModel.model_validate(result.enm))
+        sync_relay_pair_index(req.op, enm_dict, result.enm, result.created_ref)
         return {
             "success": True,
             "op": req.op,
@@ -414,6 +433,7 @@ async def topology_ops_batch(case_id: str, req: BatchOpsRequest) -> dict[str, An
     enm_dict = enm.model_dump(mode="json")
 
     results: list[dict[str, Any]] = []
+    applied: list[tuple[str, dict[str, Any], dict[str, Any], str | None]] = []
     current_enm = enm_dict
 
     for op_req in req.operations:
@@ -448,10 +468,13 @@ async def topology_ops_batch(case_id: str, req: BatchOpsRequest) -> dict[str, An
                 "revision": enm.header.revision,
             }
 
+        applied.append((op_req.op, current_enm, result.enm, result.created_ref))
         current_enm = result.enm
 
     # All operations succeeded — persist
     saved = _set_enm(case_id, EnergyNetworkModel.model_validate(current_enm))
+    for op, enm_before, enm_after, ref in applied:
+        sync_relay_pair_index(op, enm_before, enm_after, ref)
     return {
         "success": True,
         "results": results,
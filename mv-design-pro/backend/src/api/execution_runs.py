@@ -10,10 +10,11 @@ from __future__ import annotations
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from pydantic import BaseModel, Field
 
 from application.execution_engine import ExecutionEngineService
+from application.pagination import InvalidCursorError, keyset_page
 from domain.execution import ExecutionAnalysisType
 from enm.canonical_analysis import (
     build_execution_result_set,
@@ -25,6 +26,9 @@ from enm.canonical_analysis import (
 
 router = APIRouter(tags=["execution-runs"])
 
+# Page size when only a cursor is given
+_DEFAULT_PAGE_LIMIT = 100
+
 # Retained only for compatibility with modules/tests importing get_engine().
 _engine = ExecutionEngineService()
 
@@ -54,6 +58,7 @@ class RunResponse(BaseModel):
 class RunListResponse(BaseModel):
     runs: list[RunResponse]
     count: int
+    next_cursor: str | None = None
 
 
 class ElementResultResponse(BaseModel):
@@ -140,12 +145,33 @@ def create_run(case_id: str, request: CreateRunRequest, http_request: Request) -
     "/api/execution/study-cases/{case_id}/runs",
     response_model=RunListResponse,
 )
-def list_runs(case_id: str) -> dict[str, Any]:
+def list_runs(
+    case_id: str,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+) -> dict[str, Any]:
     _parse_uuid(case_id, "case_id")
     runs = list_canonical_runs_for_case(case_id)
+    if limit is None and cursor is None:
+        # Neither limit nor cursor: the full list, as before paging
+        return {
+            "runs": [run.to_execution_dict() for run in runs],
+            "count": len(runs),
+            "next_cursor": None,
+        }
+    try:
+        page = keyset_page(
+            runs,
+            key=lambda run: (run.created_at, str(run.id)),
+            limit=limit or _DEFAULT_PAGE_LIMIT,
+            cursor=cursor,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return {
-        "runs": [run.to_execution_dict() for run in runs],
+        "runs": [run.to_execution_dict() for run in page.items],
         "count": len(runs),
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -6,6 +6,8 @@ from typing import Any
 
 from fastapi import APIRouter, Request
 
+from infrastructure.persistence.db import pool_metrics
+
 router = APIRouter(prefix="/api/health", tags=["health"])
 
 _start_time = time.monotonic()
@@ -32,14 +34,17 @@ async def health_check(request: Request) -> dict[str, Any]:
     - version: wersja aplikacji
     - solvers: lista dostępnych solwerów
     - uptime_seconds: czas działania w sekundach
+    - db_pool: metryki puli połączeń (rozmiar, zajęte, przepełnienie, liczniki)
     """
     uptime = time.monotonic() - _start_time
 
     # Check DB connectivity
     db_ok = False
+    db_pool: dict[str, Any] | None = None
     try:
         engine = getattr(request.app.state, "engine", None)
         if engine is not None:
+            db_pool = pool_metrics(engine)
             from sqlalchemy import text
 
             with engine.connect() as conn:
@@ -66,4 +71,5 @@ async def health_check(request: Request) -> dict[str, Any]:
         "version": APP_VERSION,
         "solvers": AVAILABLE_SOLVERS,
         "uptime_seconds": round(uptime, 1),
+        "db_pool": db_pool,
     }
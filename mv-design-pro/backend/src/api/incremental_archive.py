@@ -8,6 +8,10 @@ GET  /projects/{project_id}/export/history     — historia eksportów (timestam
 
 from __future__ import annotations
 
+import io
+import json
+import zipfile
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
@@ -16,17 +20,21 @@ from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFil
 from pydantic import BaseModel, Field
 
 from api.dependencies import get_uow_factory
+from domain.archive_chunks import chunk_archive
 from domain.incremental_archive import (
+    SECTION_NAMES,
     BaseHashMismatchError,
     IncrementalArchiveError,
     IncrementalExportType,
     IncrementalStructureError,
     SectionChangeStatus,
+    apply_chunk_delta,
     apply_incremental_archive,
-    build_incremental_archive,
-    compute_export_result,
+    build_chunk_delta,
+    deserialize_chunk_delta,
     deserialize_incremental,
-    serialize_incremental,
+    is_chunk_delta,
+    serialize_chunk_delta,
 )
 from domain.project_archive import (
     ArchiveError,
@@ -47,6 +55,7 @@ router = APIRouter(prefix="/projects", tags=["incremental-archive"])
 _export_history: dict[str, list[ExportHistoryEntry]] = {}  # type: ignore[name-defined]
 _last_fingerprints: dict[str, ArchiveFingerprints] = {}
 _last_full_archive: dict[str, ProjectArchive] = {}
+_last_chunk_hashes: dict[str, frozenset[str]] = {}
 
 
 # ============================================================================
@@ -144,34 +153,13 @@ def _get_project_archive_via_service(
     with uow_factory() as uow:
         service = ProjectArchiveService(uow.session)
         try:
-            archive_bytes = service.export_project(project_id)
+            return service.build_archive(project_id)
         except ArchiveError as e:
             raise HTTPException(
                 status_code=404,
                 detail=f"Nie znaleziono projektu: {e}",
             )
 
-    # Deserializuj pełne archiwum
-    import io
-    import json
-    import zipfile
-
-    buf = io.BytesIO(archive_bytes)
-    with zipfile.ZipFile(buf, "r") as zf:
-        # Szukaj pliku JSON w archiwum
-        json_files = [n for n in zf.namelist() if n.endswith(".json")]
-        if not json_files:
-            raise HTTPException(
-                status_code=500,
-                detail="Nieprawidłowa struktura archiwum projektu",
-            )
-        content = zf.read(json_files[0]).decode("utf-8")
-
-    from domain.project_archive import dict_to_archive
-
-    data = json.loads(content)
-    return dict_to_archive(data)
-
 
 def _record_export(
     project_id: str,
@@ -208,8 +196,12 @@ def export_incremental(
     """
     Eksportuj przyrostowe archiwum projektu (delta od ostatniego eksportu).
 
-    Jeśli brak poprzedniego eksportu — eksportuje pełne archiwum jako bazę
-    i zwraca pustą deltę (wszystkie sekcje UNCHANGED, bo to pierwszy eksport).
+    Delta na poziomie chunków: zawiera manifest pełnego archiwum oraz tylko
+    te elementy (runy, wyniki, dowody...), których nie było w poprzednim
+    eksporcie.
+
+    Jeśli brak poprzedniego eksportu — bieżący stan staje się bazą
+    i zwracana jest pusta delta (wszystkie sekcje UNCHANGED).
 
     Args:
         project_id: ID projektu.
@@ -221,49 +213,48 @@ def export_incremental(
 
     current_archive = _get_project_archive_via_service(project_id, uow_factory)
 
-    # Pobierz fingerprints z ostatniego eksportu
-    base_fp = _last_fingerprints.get(pid)
-
-    if base_fp is None:
-        # Pierwszy eksport — ustaw bazę i zwróć pustą deltę
-        base_fp = current_archive.fingerprints
+    # Baza: fingerprints i chunki z ostatniego eksportu
+    base_fp = _last_fingerprints.get(pid, current_archive.fingerprints)
+    base_chunks = _last_chunk_hashes.get(pid, frozenset())
 
-    # Zbuduj archiwum przyrostowe
-    now_ts = datetime.now(timezone.utc).isoformat()
-    incremental = build_incremental_archive(
-        base_fp, current_archive, base_timestamp=now_ts
-    )
+    delta = build_chunk_delta(base_fp, base_chunks, current_archive)
+    if pid not in _last_chunk_hashes:
+        # Pierwszy eksport — baza = bieżący stan, pusta delta
+        delta = replace(delta, chunks={})
 
-    # Serializuj
-    delta_bytes = serialize_incremental(incremental)
+    delta_bytes = serialize_chunk_delta(delta)
 
-    # Serializuj pełne archiwum dla porównania rozmiaru
-    import io
-    import json
-    import zipfile
-
-    full_json = json.dumps(
-        archive_to_dict(current_archive), sort_keys=True, indent=2
-    )
+    # Pełne archiwum (kompaktowy JSON w ZIP) dla porównania rozmiaru
     full_buf = io.BytesIO()
     with zipfile.ZipFile(full_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("archive.json", full_json)
-    full_bytes = full_buf.getvalue()
-
-    export_result = compute_export_result(
-        current_archive, incremental, full_bytes, delta_bytes
+        zf.writestr(
+            "archive.json",
+            json.dumps(
+                archive_to_dict(current_archive),
+                sort_keys=True,
+                separators=(",", ":"),
+            ),
+        )
+    size_full = len(full_buf.getvalue())
+    size_delta = len(delta_bytes)
+    savings = (
+        round((size_full - size_delta) / size_full * 100.0, 2)
+        if size_full > 0
+        else 0.0
     )
+    sections_changed = len(delta.changed_sections)
 
     # Aktualizuj stan
     _last_fingerprints[pid] = current_archive.fingerprints
     _last_full_archive[pid] = current_archive
+    _last_chunk_hashes[pid] = delta.manifest.chunk_hashes()
 
     # Zapisz historię
     _record_export(
         pid,
         current_archive.fingerprints.archive_hash,
-        incremental.export_type.value,
-        export_result.sections_changed,
+        IncrementalExportType.DELTA.value,
+        sections_changed,
     )
 
     # Zwróć plik ZIP
@@ -274,12 +265,14 @@ def export_incremental(
             "Content-Disposition": (
                 f'attachment; filename="delta_{project_id}.mvdp-delta.zip"'
             ),
-            "X-Export-Type": incremental.export_type.value,
-            "X-Sections-Changed": str(export_result.sections_changed),
-            "X-Sections-Unchanged": str(export_result.sections_unchanged),
-            "X-Size-Full": str(export_result.size_full_bytes),
-            "X-Size-Delta": str(export_result.size_delta_bytes),
-            "X-Savings-Percent": str(export_result.savings_percent),
+            "X-Export-Type": IncrementalExportType.DELTA.value,
+            "X-Sections-Changed": str(sections_changed),
+            "X-Sections-Unchanged": str(len(SECTION_NAMES) - sections_changed),
+            "X-Chunks-Total": str(len(_last_chunk_hashes[pid])),
+            "X-Chunks-Changed": str(len(delta.chunks)),
+            "X-Size-Full": str(size_full),
+            "X-Size-Delta": str(size_delta),
+            "X-Savings-Percent": str(savings),
         },
     )
 
@@ -321,9 +314,13 @@ async def import_incremental(
     # Odczytaj zawartość
     delta_bytes = await file.read()
 
-    # Deserializuj deltę
+    # Deserializuj deltę (chunkową lub sekcyjną incremental.json)
+    chunked = is_chunk_delta(delta_bytes)
     try:
-        incremental = deserialize_incremental(delta_bytes)
+        if chunked:
+            incremental = deserialize_chunk_delta(delta_bytes)
+        else:
+            incremental = deserialize_incremental(delta_bytes)
     except IncrementalStructureError as e:
         raise HTTPException(
             status_code=400,
@@ -344,22 +341,31 @@ async def import_incremental(
 
     # Nałóż deltę
     try:
-        result_archive = apply_incremental_archive(base_archive, incremental)
+        if chunked:
+            result_archive = apply_chunk_delta(base_archive, incremental)
+            sections_applied = len(incremental.changed_sections)
+        else:
+            result_archive = apply_incremental_archive(base_archive, incremental)
+            sections_applied = sum(
+                1
+                for d in incremental.deltas
+                if d.status != SectionChangeStatus.UNCHANGED
+            )
     except BaseHashMismatchError as e:
         raise HTTPException(
             status_code=409,
             detail=f"Niezgodność hash bazowego archiwum: {e}",
         )
+    except ArchiveError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Błąd archiwum przyrostowego: {e}",
+        )
 
     # Aktualizuj stan
     _last_fingerprints[pid] = result_archive.fingerprints
     _last_full_archive[pid] = result_archive
-
-    sections_applied = sum(
-        1
-        for d in incremental.deltas
-        if d.status != SectionChangeStatus.UNCHANGED
-    )
+    _last_chunk_hashes[pid] = chunk_archive(result_archive)[0].chunk_hashes()
 
     return IncrementalImportResponse(
         status="SUCCESS",
@@ -32,7 +32,9 @@ from api.fault_scenarios import router as fault_scenarios_router
 from api.protection_engine_v1 import router as protection_engine_v1_router
 from api.sld_overrides import router as sld_overrides_router
 from api.switchgear_config import router as switchgear_config_router
+from application.report_rendering import default_report_rendering_service
 from infrastructure.persistence.db import (
+    PoolConfig,
     create_engine_from_url,
     create_session_factory,
     init_db,
@@ -51,13 +53,14 @@ logger = logging.getLogger("mv_design_pro")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     database_url = os.getenv("DATABASE_URL", "sqlite+pysqlite:///./mv_design_pro.db")
-    engine = create_engine_from_url(database_url)
+    engine = create_engine_from_url(database_url, pool=PoolConfig.from_env())
     session_factory = create_session_factory(engine)
     app.state.engine = engine
     app.state.uow_factory = build_uow_factory(session_factory)
     init_db(engine)
     logger.info("MV-DESIGN PRO API started, DB initialized")
     yield
+    default_report_rendering_service().shutdown()
     logger.info("MV-DESIGN PRO API shutting down")
 
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import tempfile
+import zipfile
 from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from api.canonical_run_views import (
@@ -17,6 +20,11 @@ from api.canonical_run_views import (
 )
 from api.dependencies import get_uow_factory
 from application.analysis_run.read_model import canonicalize_json
+from application.report_rendering import (
+    RenderedReport,
+    default_report_rendering_service,
+    iter_chunks,
+)
 from enm.canonical_analysis import (
     CanonicalRun,
     create_run as create_canonical_run,
@@ -28,6 +36,15 @@ from enm.canonical_analysis import (
 
 router = APIRouter(tags=["power-flow"])
 
+# Pakiet raportów do tej wielkości trzymany w pamięci, większy — w pliku
+_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+# Stała data wpisów ZIP: ten sam przebieg daje to samo archiwum
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_MISSING_RENDERER = {
+    "docx": "Eksport DOCX wymaga python-docx. Zainstaluj: pip install python-docx",
+    "pdf": "Eksport PDF wymaga reportlab. Zainstaluj: pip install reportlab",
+}
+
 
 class PowerFlowRunCreateRequest(BaseModel):
     operating_case_id: UUID | None = Field(
@@ -92,45 +109,42 @@ def _build_export_bundle(run_id: UUID) -> dict[str, Any]:
     return build_power_flow_export_bundle(_require_canonical_run(run_id))
 
 
-def _format_catalog_binding(entry: dict[str, Any]) -> str:
-    binding = entry.get("catalog_binding") or {}
-    namespace = binding.get("catalog_namespace") or "-"
-    item_id = binding.get("catalog_item_id") or "-"
-    version = binding.get("catalog_item_version")
-    if version:
-        return f"{namespace}:{item_id} ({version})"
-    return f"{namespace}:{item_id}"
-
-
-def _truncate_catalog_params(value: Any, max_chars: int = 220) -> str:
-    if value is None:
-        return "—"
-    payload = canonicalize_json(value)
-    text = str(payload)
-    if isinstance(payload, (dict, list)):
-        import json
-
-        text = json.dumps(payload, ensure_ascii=False, sort_keys=True)
-    if len(text) <= max_chars:
-        return text
-    return f"{text[:max_chars]}..."
-
-
-def _catalog_context_lines(bundle: dict[str, Any], *, max_items: int = 20) -> list[str]:
-    lines: list[str] = []
-    for entry in (bundle.get("catalog_context") or [])[:max_items]:
-        lines.append(
-            " | ".join(
-                [
-                    str(entry.get("element_id") or "-"),
-                    str(entry.get("element_type") or "-"),
-                    _format_catalog_binding(entry),
-                    str(entry.get("parameter_source") or entry.get("parameter_origin") or "-"),
-                    _truncate_catalog_params(entry.get("materialized_params")),
-                ]
-            )
+def _render_reports(run_id: UUID, formats: list[str]) -> list[RenderedReport]:
+    """Raporty przebiegu z pamięci podręcznej; brakujące renderowane razem."""
+    unknown = sorted(set(formats) - set(_MISSING_RENDERER))
+    if unknown or not formats:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Nieobsługiwane formaty raportu: {', '.join(unknown) or '(brak)'}",
+        )
+    run = _require_canonical_run(run_id)
+    try:
+        return default_report_rendering_service().render_many(
+            [f"power_flow_run_{fmt}" for fmt in formats],
+            run_id=str(run.id),
+            input_hash=run.input_hash,
+            build_payload=lambda: build_power_flow_export_bundle(run),
+            cacheable=run.status == "FINISHED",
         )
-    return lines
+    except ImportError as exc:
+        missing = "docx" if (exc.name or "").startswith("docx") else "pdf"
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=_MISSING_RENDERER[missing],
+        ) from exc
+
+
+def _report_response(report: RenderedReport, run_id: UUID) -> StreamingResponse:
+    return StreamingResponse(
+        report.iter_chunks(),
+        media_type=report.media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="power_flow_run_{run_id}.{report.extension}"'
+            ),
+            "Content-Length": str(len(report.content)),
+        },
+    )
 
 
 @router.get("/projects/{project_id}/power-flow-runs")
@@ -288,272 +302,37 @@ def export_power_flow_run_json(run_id: UUID):
 
 
 @router.get("/power-flow-runs/{run_id}/export/docx")
-def export_power_flow_run_docx(run_id: UUID):
-    from fastapi.responses import Response
-    import json
-    import io
-
-    try:
-        from docx import Document
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Pt
-    except ImportError:
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Eksport DOCX wymaga python-docx. Zainstaluj: pip install python-docx",
-        )
-
-    bundle = _build_export_bundle(run_id)
-    result = bundle["result"]
-    metadata = bundle["metadata"]
-    catalog_context_lines = _catalog_context_lines(bundle)
-    white_box_trace = bundle.get("white_box_trace") or []
-
-    doc = Document()
-    style = doc.styles["Normal"]
-    style.font.name = "Calibri"
-    style.font.size = Pt(11)
-
-    heading = doc.add_heading("Raport rozplywu mocy", level=0)
-    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    status_parts = [
-        f"Status: {'Zbiezny' if result.get('converged') else 'Niezbiezny'}",
-        f"Iteracje: {result.get('iterations_count', '—')}",
-        f"Run: {metadata.get('run_id', '—')[:8]}...",
-    ]
-    subtitle = doc.add_paragraph(" | ".join(status_parts))
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    doc.add_paragraph()
-    doc.add_heading("Podsumowanie", level=1)
-    summary = result.get("summary", {})
-    summary_table = doc.add_table(rows=1, cols=2)
-    summary_table.style = "Table Grid"
-    hdr = summary_table.rows[0].cells
-    hdr[0].text = "Parametr"
-    hdr[1].text = "Wartosc"
-    for cell in hdr:
-        for paragraph in cell.paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
-
-    def add_row(label: str, value: Any) -> None:
-        row = summary_table.add_row().cells
-        row[0].text = label
-        row[1].text = str(value) if value is not None else "—"
-
-    add_row("Status zbieznosci", "Zbiezny" if result.get("converged") else "Niezbiezny")
-    add_row("Liczba iteracji", result.get("iterations_count"))
-    add_row("Wezel bilansujacy", result.get("slack_bus_id"))
-    add_row("Calkowite straty P [MW]", f"{summary.get('total_losses_p_mw', 0):.4g}")
-    add_row("Calkowite straty Q [Mvar]", f"{summary.get('total_losses_q_mvar', 0):.4g}")
-    add_row("Min. napiecie [pu]", f"{summary.get('min_v_pu', 0):.4g}")
-    add_row("Max. napiecie [pu]", f"{summary.get('max_v_pu', 0):.4g}")
-    add_row("Elementy z katalogiem", metadata.get("catalog_context_count"))
-
-    doc.add_paragraph()
-    doc.add_heading("Kontekst katalogowy", level=1)
-    if catalog_context_lines:
-        doc.add_paragraph(
-            "Format: element_id | typ | katalog | pochodzenie parametrow | materialized_params"
-        )
-        for line in catalog_context_lines:
-            doc.add_paragraph(line)
-    else:
-        doc.add_paragraph("Brak jawnego kontekstu katalogowego.")
-
-    doc.add_paragraph()
-    doc.add_heading("White Box", level=1)
-    if white_box_trace:
-        for step in white_box_trace[:12]:
-            title = step.get("title") or step.get("key") or "Krok"
-            doc.add_paragraph(f"{title}: {json.dumps(step, ensure_ascii=False, sort_keys=True)}")
-        if len(white_box_trace) > 12:
-            doc.add_paragraph(f"... oraz {len(white_box_trace) - 12} kolejnych krokow")
-    else:
-        doc.add_paragraph("Brak jawnego sladu White Box.")
-
-    doc.add_paragraph()
-    doc.add_heading("Wyniki wezlowe (szyny)", level=1)
-    bus_results = result.get("bus_results", [])
-    if bus_results:
-        bus_table = doc.add_table(rows=1, cols=5)
-        bus_table.style = "Table Grid"
-        header = bus_table.rows[0].cells
-        header[0].text = "ID szyny"
-        header[1].text = "V [pu]"
-        header[2].text = "Kat [deg]"
-        header[3].text = "P_inj [MW]"
-        header[4].text = "Q_inj [Mvar]"
-        for cell in header:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.bold = True
-        for bus in bus_results[:30]:
-            row = bus_table.add_row().cells
-            row[0].text = str(bus.get("bus_id", "—"))[:16]
-            row[1].text = f"{bus.get('v_pu', 0):.4g}"
-            row[2].text = f"{bus.get('angle_deg', 0):.2f}"
-            row[3].text = f"{bus.get('p_injected_mw', 0):.3g}"
-            row[4].text = f"{bus.get('q_injected_mvar', 0):.3g}"
-        if len(bus_results) > 30:
-            doc.add_paragraph(f"... oraz {len(bus_results) - 30} dodatkowych wezlow")
-    else:
-        doc.add_paragraph("Brak wynikow wezlowych.")
-
-    buffer = io.BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return Response(
-        content=buffer.getvalue(),
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        headers={"Content-Disposition": f'attachment; filename="power_flow_run_{run_id}.docx"'},
-    )
+def export_power_flow_run_docx(run_id: UUID) -> StreamingResponse:
+    return _report_response(_render_reports(run_id, ["docx"])[0], run_id)
 
 
 @router.get("/power-flow-runs/{run_id}/export/pdf")
-def export_power_flow_run_pdf(run_id: UUID):
-    from fastapi.responses import Response
-    import json
-    import io
-
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib.units import mm
-        from reportlab.pdfgen import canvas
-    except ImportError:
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Eksport PDF wymaga reportlab. Zainstaluj: pip install reportlab",
-        )
-
-    bundle = _build_export_bundle(run_id)
-    result = bundle["result"]
-    metadata = bundle["metadata"]
-    catalog_context_lines = _catalog_context_lines(bundle)
-    white_box_trace = bundle.get("white_box_trace") or []
-
-    buffer = io.BytesIO()
-    canvas_obj = canvas.Canvas(buffer, pagesize=A4)
-    page_width, page_height = A4
-    left_margin = 25 * mm
-    top_margin = page_height - 25 * mm
-    y = top_margin
-    line_height = 5 * mm
-
-    canvas_obj.setFont("Helvetica-Bold", 16)
-    title = "Raport rozplywu mocy"
-    canvas_obj.drawString(
-        (page_width - canvas_obj.stringWidth(title, "Helvetica-Bold", 16)) / 2,
-        y,
-        title,
-    )
-    y -= 10 * mm
-
-    canvas_obj.setFont("Helvetica", 10)
-    status_text = (
-        f"Status: {'Zbiezny' if result.get('converged') else 'Niezbiezny'} | "
-        f"Iteracje: {result.get('iterations_count', '—')} | "
-        f"Run: {metadata.get('run_id', '—')[:8]}..."
-    )
-    canvas_obj.drawString(left_margin, y, status_text)
-    y -= 8 * mm
-
-    canvas_obj.setFont("Helvetica-Bold", 14)
-    canvas_obj.drawString(left_margin, y, "Podsumowanie")
-    y -= 6 * mm
-
-    canvas_obj.setFont("Helvetica", 10)
-    summary = result.get("summary", {})
-    summary_lines = [
-        f"Wezel bilansujacy: {result.get('slack_bus_id', '—')}",
-        f"Calkowite straty P: {summary.get('total_losses_p_mw', 0):.4g} MW",
-        f"Calkowite straty Q: {summary.get('total_losses_q_mvar', 0):.4g} Mvar",
-        f"Min. napiecie: {summary.get('min_v_pu', 0):.4g} pu",
-        f"Max. napiecie: {summary.get('max_v_pu', 0):.4g} pu",
-        f"Elementy z katalogiem: {metadata.get('catalog_context_count', 0)}",
-    ]
-    for line in summary_lines:
-        canvas_obj.drawString(left_margin, y, line)
-        y -= line_height
-
-    y -= 5 * mm
-    canvas_obj.setFont("Helvetica-Bold", 12)
-    canvas_obj.drawString(left_margin, y, "Kontekst katalogowy")
-    y -= 5 * mm
-    canvas_obj.setFont("Helvetica", 8)
-    if catalog_context_lines:
-        canvas_obj.drawString(
-            left_margin,
-            y,
-            "Format: element_id | typ | katalog | pochodzenie | materialized_params",
-        )
-        y -= line_height
-        for line in catalog_context_lines:
-            canvas_obj.drawString(left_margin, y, line[:160])
-            y -= line_height
-            if y < 30 * mm:
-                canvas_obj.showPage()
-                y = top_margin
-                canvas_obj.setFont("Helvetica", 8)
-    else:
-        canvas_obj.drawString(left_margin, y, "Brak jawnego kontekstu katalogowego.")
-        y -= line_height
-
-    y -= 5 * mm
-    canvas_obj.setFont("Helvetica-Bold", 12)
-    canvas_obj.drawString(left_margin, y, "White Box")
-    y -= 5 * mm
-    canvas_obj.setFont("Helvetica", 8)
-    if white_box_trace:
-        for step in white_box_trace[:10]:
-            title = step.get("title") or step.get("key") or "Krok"
-            canvas_obj.drawString(
-                left_margin,
-                y,
-                f"{title}: {json.dumps(step, ensure_ascii=False, sort_keys=True)[:150]}",
-            )
-            y -= line_height
-            if y < 30 * mm:
-                canvas_obj.showPage()
-                y = top_margin
-                canvas_obj.setFont("Helvetica", 8)
-        if len(white_box_trace) > 10:
-            canvas_obj.drawString(
-                left_margin,
-                y,
-                f"... oraz {len(white_box_trace) - 10} kolejnych krokow",
+def export_power_flow_run_pdf(run_id: UUID) -> StreamingResponse:
+    return _report_response(_render_reports(run_id, ["pdf"])[0], run_id)
+
+
+@router.get("/power-flow-runs/{run_id}/export/bundle")
+def export_power_flow_run_bundle(
+    run_id: UUID,
+    formats: list[str] = Query(default=["pdf", "docx"]),
+) -> StreamingResponse:
+    """Raporty PDF i DOCX w jednym archiwum ZIP (renderowane współbieżnie)."""
+    reports = _render_reports(run_id, list(dict.fromkeys(formats)))
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+    with zipfile.ZipFile(spool, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for report in reports:
+            info = zipfile.ZipInfo(
+                f"power_flow_run_{run_id}.{report.extension}", date_time=_ZIP_DATE_TIME
             )
-            y -= line_height
-    else:
-        canvas_obj.drawString(left_margin, y, "Brak jawnego sladu White Box.")
-        y -= line_height
-
-    y -= 5 * mm
-    canvas_obj.setFont("Helvetica-Bold", 12)
-    canvas_obj.drawString(left_margin, y, "Wyniki wezlowe (top 20)")
-    y -= 5 * mm
-
-    canvas_obj.setFont("Helvetica", 9)
-    for bus in result.get("bus_results", [])[:20]:
-        text = (
-            f"{str(bus.get('bus_id', '—'))[:12]}: "
-            f"V={bus.get('v_pu', 0):.4g} pu, "
-            f"kat={bus.get('angle_deg', 0):.2f} deg"
-        )
-        canvas_obj.drawString(left_margin, y, text)
-        y -= line_height
-        if y < 30 * mm:
-            canvas_obj.showPage()
-            y = top_margin
-
-    canvas_obj.save()
-    buffer.seek(0)
-    return Response(
-        content=buffer.getvalue(),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="power_flow_run_{run_id}.pdf"'},
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, report.content)
+    spool.seek(0)
+    return StreamingResponse(
+        iter_chunks(spool),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="power_flow_run_{run_id}_reports.zip"'
+        },
     )
 
 
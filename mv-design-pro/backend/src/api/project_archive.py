@@ -8,10 +8,13 @@ POST /projects/import/preview - Podgląd zawartości archiwum
 
 from __future__ import annotations
 
-from typing import Any
+import tempfile
+from collections.abc import Iterator
+from typing import IO, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from api.dependencies import get_uow_factory
@@ -20,6 +23,19 @@ from domain.project_archive import ArchiveError
 
 router = APIRouter(prefix="/projects", tags=["project-archive"])
 
+# Archiwum do tej wielkości trzymane w pamięci, większe — w pliku tymczasowym
+_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+_CHUNK_BYTES = 1024 * 1024
+
+
+def _iter_file(fileobj: IO[bytes]) -> Iterator[bytes]:
+    """Odczyt pliku kawałkami; plik zamykany po wysłaniu."""
+    try:
+        while chunk := fileobj.read(_CHUNK_BYTES):
+            yield chunk
+    finally:
+        fileobj.close()
+
 
 # ============================================================================
 # RESPONSE MODELS
@@ -88,9 +104,12 @@ class PreviewResponse(BaseModel):
 def export_project(
     project_id: UUID,
     uow_factory: Any = Depends(get_uow_factory),
-) -> Response:
+) -> StreamingResponse:
     """
-    Eksportuj projekt do archiwum ZIP.
+    Eksportuj projekt do archiwum ZIP (układ strumieniowy stream-v1).
+
+    Archiwum zapisywane strumieniowo do pliku tymczasowego i wysyłane
+    kawałkami — bez budowania całości w pamięci.
 
     Args:
         project_id: ID projektu do eksportu
@@ -98,17 +117,20 @@ def export_project(
     Returns:
         Plik ZIP z archiwum projektu
     """
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
     with uow_factory() as uow:
         service = ProjectArchiveService(uow.session)
 
         try:
-            archive_bytes = service.export_project(project_id)
+            service.export_project_stream(project_id, spool)
         except ArchiveError as e:
+            spool.close()
             raise HTTPException(status_code=404, detail=str(e))
+    spool.seek(0)
 
     # Zwróć jako plik do pobrania
-    return Response(
-        content=archive_bytes,
+    return StreamingResponse(
+        _iter_file(spool),
         media_type="application/zip",
         headers={
             "Content-Disposition": f'attachment; filename="projekt_{project_id}.mvdp.zip"'
@@ -146,13 +168,11 @@ async def import_project(
             migrated_from_version=None,
         )
 
-    # Odczytaj zawartość pliku
-    archive_bytes = await file.read()
-
+    # UploadFile jest buforowany na dysku — czytamy go strumieniowo
     with uow_factory() as uow:
         service = ProjectArchiveService(uow.session)
-        result = service.import_project(
-            archive_bytes=archive_bytes,
+        result = service.import_project_stream(
+            file.file,
             new_project_name=new_name,
             verify_integrity=verify_integrity,
         )
@@ -23,7 +23,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field, field_validator
 
-from api.dependencies import get_uow_factory
+from api.dependencies import get_read_only_uow_factory, get_uow_factory
 from domain.models import new_project
 from infrastructure.persistence.unit_of_work import UnitOfWork
 
@@ -120,7 +120,7 @@ class ProjectHasDependenciesError(Exception):
 
 @router.get("", response_model=ProjectListResponse)
 def list_projects(
-    uow_factory: Callable[[], UnitOfWork] = Depends(get_uow_factory),
+    uow_factory: Callable[[], UnitOfWork] = Depends(get_read_only_uow_factory),
 ) -> ProjectListResponse:
     """
     Zwraca listę wszystkich aktywnych projektów.
@@ -187,7 +187,7 @@ def create_project(
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(
     project_id: UUID,
-    uow_factory: Callable[[], UnitOfWork] = Depends(get_uow_factory),
+    uow_factory: Callable[[], UnitOfWork] = Depends(get_read_only_uow_factory),
 ) -> ProjectResponse:
     """
     Pobiera projekt po ID.
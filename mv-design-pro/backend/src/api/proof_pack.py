@@ -8,6 +8,7 @@ from uuid import UUID
 _FIXED_ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from api.dependencies import get_uow_factory
@@ -18,6 +19,7 @@ from application.proof_engine.packs.sc_asymmetrical import (
 from application.proof_engine.proof_pack import (
     ProofPackBuilder,
     ProofPackContext,
+    ProjectProofPackBuilder,
     proof_pack_proof_type,
     resolve_mv_design_pro_version,
 )
@@ -58,7 +60,42 @@ def download_proof_pack(
     case_id: UUID,
     run_id: UUID,
     uow_factory=Depends(get_uow_factory),
-) -> Response:
+) -> StreamingResponse:
+    run, proof_payloads = _load_proof_payloads(project_id, case_id, run_id, uow_factory)
+    proof_doc = proof_document_from_dict(proof_payloads[0])
+    context = _pack_context(project_id, case_id, run_id, run)
+    proof_type = proof_pack_proof_type(proof_doc.proof_type)
+    filename = (
+        "mv-design-pro__proofpack__"
+        f"{proof_type}__{project_id}__{case_id}__{run_id}.zip"
+    )
+    return StreamingResponse(
+        ProofPackBuilder(context).stream(proof_doc),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/{project_id}/{case_id}/{run_id}/project-pack")
+def download_project_proof_pack(
+    project_id: UUID,
+    case_id: UUID,
+    run_id: UUID,
+    uow_factory=Depends(get_uow_factory),
+) -> StreamingResponse:
+    """Wszystkie dowody przebiegu w jednym pakiecie, ZIP strumieniowany dowód po dowodzie."""
+    run, proof_payloads = _load_proof_payloads(project_id, case_id, run_id, uow_factory)
+    context = _pack_context(project_id, case_id, run_id, run)
+    proof_docs = (proof_document_from_dict(payload) for payload in proof_payloads)
+    filename = f"mv-design-pro__proofpack__PROJECT__{project_id}__{case_id}__{run_id}.zip"
+    return StreamingResponse(
+        ProjectProofPackBuilder(context).stream(proof_docs),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _load_proof_payloads(project_id: UUID, case_id: UUID, run_id: UUID, uow_factory):
     with uow_factory() as uow:
         run = uow.analysis_runs.get(run_id)
         if run is None:
@@ -73,35 +110,27 @@ def download_proof_pack(
             )
         results = uow.results.list_results(run_id)
 
-    proof_payload = None
-    for result in results:
-        if result.get("result_type") == "proof_document":
-            proof_payload = result.get("payload")
-            break
-
-    if proof_payload is None:
+    proof_payloads = [
+        result.get("payload")
+        for result in results
+        if result.get("result_type") == "proof_document"
+    ]
+    if not proof_payloads:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="ProofDocument not found",
         )
+    return run, proof_payloads
 
-    proof_doc = proof_document_from_dict(proof_payload)
-    snapshot_id = _extract_snapshot_id(run.input_snapshot)
-    context = ProofPackContext(
+
+def _pack_context(project_id: UUID, case_id: UUID, run_id: UUID, run) -> ProofPackContext:
+    return ProofPackContext(
         project_id=str(project_id),
         case_id=str(case_id),
         run_id=str(run_id),
-        snapshot_id=snapshot_id,
+        snapshot_id=_extract_snapshot_id(run.input_snapshot),
         mv_design_pro_version=resolve_mv_design_pro_version(),
     )
-    pack_bytes = ProofPackBuilder(context).build(proof_doc)
-    proof_type = proof_pack_proof_type(proof_doc.proof_type)
-    filename = (
-        "mv-design-pro__proofpack__"
-        f"{proof_type}__{project_id}__{case_id}__{run_id}.zip"
-    )
-    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return Response(content=pack_bytes, media_type="application/zip", headers=headers)
 
 
 def _extract_snapshot_id(payload: dict) -> str:
@@ -6,6 +6,7 @@ REST API endpoints for comparing two protection analysis runs.
 
 Endpoints:
 - POST /protection-comparisons — Create/execute comparison
+- POST /protection-comparisons/n-way — Baseline vs many variants
 - GET /protection-comparisons/{id} — Get comparison metadata
 - GET /protection-comparisons/{id}/results — Get comparison results
 - GET /protection-comparisons/{id}/trace — Get comparison trace
@@ -55,6 +56,19 @@ class CreateProtectionComparisonRequest(BaseModel):
     )
 
 
+class CreateNWayProtectionComparisonRequest(BaseModel):
+    """Request to compare one baseline run against many variants."""
+    baseline_run_id: str = Field(
+        ...,
+        description="UUID bazowego ProtectionRun",
+    )
+    variant_run_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        description="UUID wariantów ProtectionRun (kolejność zachowana)",
+    )
+
+
 class ComparisonRowResponse(BaseModel):
     """Single comparison row."""
     protected_element_ref: str
@@ -119,6 +133,12 @@ class TraceStepResponse(BaseModel):
     outputs: dict[str, Any]
 
 
+class NWayProtectionComparisonResponse(BaseModel):
+    """N-way comparison response (one result per variant)."""
+    baseline_run_id: str
+    comparisons: list[ProtectionComparisonResultResponse]
+
+
 class ProtectionComparisonTraceResponse(BaseModel):
     """Full comparison trace response."""
     comparison_id: str
@@ -230,6 +250,71 @@ def create_protection_comparison(
         ) from e
 
 
+@router.post(
+    "/n-way",
+    status_code=status.HTTP_201_CREATED,
+    response_model=NWayProtectionComparisonResponse,
+    summary="Porównaj wariant bazowy z wieloma wariantami",
+    description="""
+Porównanie N-wariantowe: jeden ProtectionRun bazowy vs wiele wariantów.
+
+Wszystkie wyniki są wczytywane raz i wyrównywane kolumnowo po
+(element chroniony, punkt zwarcia). Każda para (bazowy, wariant) daje
+wynik identyczny z POST /protection-comparisons i trafia do tego samego cache.
+""",
+)
+def create_n_way_protection_comparison(
+    request: CreateNWayProtectionComparisonRequest,
+    uow_factory=Depends(get_uow_factory),
+) -> dict[str, Any]:
+    """
+    Compare a baseline protection run against many variants.
+
+    INVARIANTS:
+    - Read-only: Zero physics calculations, zero state mutations
+    - Same Project: All runs must belong to the same project
+    - Finished Only: All runs must be FINISHED
+    - Deterministic: Results in variant_run_ids order
+    """
+    service = _build_service(uow_factory)
+
+    try:
+        results = service.compare_many(
+            baseline_run_id=request.baseline_run_id,
+            variant_run_ids=request.variant_run_ids,
+        )
+        return {
+            "baseline_run_id": request.baseline_run_id,
+            "comparisons": [result.to_dict() for result in results],
+        }
+
+    except ProtectionRunNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Protection run nie znaleziony: {e.run_id}",
+        ) from e
+    except ProtectionRunNotFinishedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Protection run nie zakończony (status: {e.status}): {e.run_id}",
+        ) from e
+    except ProtectionProjectMismatchError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Runs należą do różnych projektów: {e.run_a_project} vs {e.run_b_project}",
+        ) from e
+    except ProtectionResultNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Wyniki protection nie znalezione dla run: {e.run_id}",
+        ) from e
+    except ProtectionComparisonError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
 @router.get(
     "/{comparison_id}",
     response_model=ProtectionComparisonMetadataResponse,
@@ -34,6 +34,8 @@ from application.analyses.protection.coordination.models import (
     FaultCurrentData,
     OperatingCurrentData,
 )
+from enm.relay_pairs import get_relay_pair_index
+from enm.store import get_enm
 from domain.protection_device import (
     ProtectionDevice,
     ProtectionDeviceType,
@@ -137,6 +139,10 @@ class RunCoordinationRequest(BaseModel):
     config: CoordinationConfigRequest | None = None
     pf_run_id: str | None = None
     sc_run_id: str | None = None
+    case_id: str | None = Field(
+        None,
+        description="Przypadek ENM: pary selektywności z topologii (indeks par przekaźników)",
+    )
 
 
 class CoordinationSummaryResponse(BaseModel):
@@ -223,6 +229,28 @@ def _convert_stage_settings(req: StageSettingsRequest | None) -> OvercurrentStag
     )
 
 
+def _relay_pairs_for_case(
+    case_id: str, devices: tuple[ProtectionDevice, ...]
+) -> tuple[tuple[str, str], ...]:
+    """
+    (upstream, downstream) device ID pairs from the case's relay pair index.
+
+    A device stands for a relay when its id is the relay ref_id, otherwise
+    when its location_element_id is the relay's breaker_ref.
+    """
+    index = get_relay_pair_index(get_enm(case_id).model_dump(mode="json"))
+    device_ids = {str(d.id) for d in devices}
+    by_location: dict[str, str] = {}
+    for device in devices:
+        by_location.setdefault(device.location_element_id, str(device.id))
+    device_by_relay = {
+        relay_ref: relay_ref if relay_ref in device_ids else by_location[breaker_ref]
+        for relay_ref, breaker_ref in index.relay_breakers.items()
+        if relay_ref in device_ids or breaker_ref in by_location
+    }
+    return index.coordination_pairs(device_by_relay)
+
+
 def _convert_device(req: DeviceRequest) -> ProtectionDevice:
     """Convert request device to domain model."""
     settings = OvercurrentProtectionSettings(
@@ -318,6 +346,11 @@ def run_coordination_analysis(
         pf_run_id=request.pf_run_id,
         sc_run_id=request.sc_run_id,
         project_id=str(project_id),
+        relay_pairs=(
+            _relay_pairs_for_case(request.case_id, devices)
+            if request.case_id is not None
+            else None
+        ),
     )
 
     # Run analysis
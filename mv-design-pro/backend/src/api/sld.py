@@ -9,27 +9,40 @@ Production contract:
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from api.canonical_run_views import build_sld_overlay
-from api.dependencies import get_uow_factory
+from api.dependencies import get_read_only_uow_factory
 from application.analysis_run.read_model import canonicalize_json
-from enm.canonical_analysis import get_run as get_canonical_run
+from application.sld.overlay_columnar import (
+    OVERLAY_COLUMNAR_MEDIA_TYPE,
+    OVERLAY_COLUMNAR_VERSION,
+    encode_sld_overlay_columnar,
+    etag_matches,
+    overlay_etag,
+)
+from enm.canonical_analysis import CanonicalRun, get_run as get_canonical_run
+
+OverlayFormat = Literal["json", "columnar"]
 
 
 router = APIRouter()
 
 
-@router.get("/projects/{project_id}/sld/{diagram_id}/overlay")
+@router.get("/projects/{project_id}/sld/{diagram_id}/overlay", response_model=None)
 def get_sld_result_overlay(
     project_id: UUID,
     diagram_id: UUID,
+    request: Request,
+    response: Response,
     run_id: UUID = Query(..., description="Analysis run ID for result overlay"),
-    uow_factory=Depends(get_uow_factory),
-) -> dict[str, Any]:
+    format: OverlayFormat = Query("json", description="json | columnar (packed buffers)"),
+    uow_factory=Depends(get_read_only_uow_factory),
+) -> dict[str, Any] | Response:
     canonical_run = get_canonical_run(run_id)
     if canonical_run is None:
         raise HTTPException(
@@ -48,10 +61,60 @@ def get_sld_result_overlay(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="SLD diagram not found",
         )
-    return canonicalize_json(
-        build_sld_overlay(
-            canonical_run,
-            diagram_id=diagram_id,
-            sld_payload=diagram.get("payload", {}),
-        )
+    sld_payload = diagram.get("payload", {})
+    return sld_overlay_response(
+        request,
+        response,
+        run=canonical_run,
+        diagram_id=diagram_id,
+        sld_payload=sld_payload,
+        overlay_format=format,
+        shape="sld-overlay",
+        build_json=lambda overlay: overlay,
+    )
+
+
+def sld_overlay_response(
+    request: Request,
+    response: Response,
+    *,
+    run: CanonicalRun,
+    diagram_id: UUID,
+    sld_payload: dict[str, Any],
+    overlay_format: OverlayFormat,
+    shape: str,
+    build_json: Callable[[dict[str, Any]], dict[str, Any]],
+) -> dict[str, Any] | Response:
+    """
+    Overlay as JSON or columnar buffers, with a strong ETag.
+
+    The ETag is derived from the overlay inputs (run state + SLD payload),
+    so a matching If-None-Match is answered with 304 before the overlay
+    is built.
+    """
+    etag = overlay_etag(
+        shape,
+        overlay_format,
+        OVERLAY_COLUMNAR_VERSION,
+        run.id,
+        run.input_hash,
+        run.status,
+        run.result_status,
+        diagram_id,
+        sld_payload,
     )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    overlay = canonicalize_json(
+        build_sld_overlay(run, diagram_id=diagram_id, sld_payload=sld_payload)
+    )
+    if overlay_format == "columnar":
+        return Response(
+            content=encode_sld_overlay_columnar(overlay),
+            media_type=OVERLAY_COLUMNAR_MEDIA_TYPE,
+            headers=headers,
+        )
+    response.headers.update(headers)
+    return build_json(overlay)
@@ -140,6 +140,7 @@ class OvercurrentCoordinationAnalyzer:
             devices=input_data.devices,
             fault_currents=fault_by_location,
             trace_steps=trace_steps,
+            relay_pairs=input_data.relay_pairs,
         )
 
         # Step 5: Generate TCC curves
@@ -371,12 +372,16 @@ class OvercurrentCoordinationAnalyzer:
         devices: tuple[Any, ...],
         fault_currents: dict[str, FaultCurrentData],
         trace_steps: list[dict[str, Any]],
+        relay_pairs: tuple[tuple[str, str], ...] | None = None,
     ) -> list[SelectivityCheck]:
         """
         Check selectivity (time grading) between device pairs.
 
-        For each adjacent pair (downstream, upstream), verify:
+        For each pair (downstream, upstream), verify:
         t_upstream - t_downstream >= CTI (Coordination Time Interval)
+
+        Pairs come from relay_pairs (topology relay pair index) when given,
+        otherwise from adjacent devices in the given order.
         """
         checks: list[SelectivityCheck] = []
 
@@ -389,19 +394,31 @@ class OvercurrentCoordinationAnalyzer:
             })
             return checks
 
+        if relay_pairs is None:
+            # Adjacent devices (assuming ordered downstream to upstream)
+            device_pairs = [(devices[i], devices[i + 1]) for i in range(len(devices) - 1)]
+        else:
+            devices_by_id = {str(d.id): d for d in devices}
+            device_pairs = [
+                (devices_by_id[down], devices_by_id[up])
+                for up, down in relay_pairs
+                if up in devices_by_id and down in devices_by_id
+            ]
+
         trace_steps.append({
             "step": "check_selectivity_start",
             "description_pl": "Rozpoczęcie sprawdzania selektywności czasowej",
-            "inputs": {"device_count": len(devices)},
+            "inputs": {
+                "device_count": len(devices),
+                "pair_source": "adjacent" if relay_pairs is None else "relay_pair_index",
+                "pair_count": len(device_pairs),
+            },
             "outputs": {},
         })
 
         min_cti = self.config.get_minimum_grading_margin_s()
 
-        # Compare adjacent devices (assuming ordered downstream to upstream)
-        for i in range(len(devices) - 1):
-            downstream = devices[i]
-            upstream = devices[i + 1]
+        for downstream, upstream in device_pairs:
 
             downstream_id = str(downstream.id)
             upstream_id = str(upstream.id)
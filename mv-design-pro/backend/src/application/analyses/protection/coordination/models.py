@@ -127,6 +127,9 @@ class CoordinationInput:
     pf_run_id: str | None = None
     sc_run_id: str | None = None
     project_id: str | None = None
+    # (upstream_device_id, downstream_device_id) from the topology relay pair
+    # index; None = adjacent devices in given order (downstream → upstream)
+    relay_pairs: tuple[tuple[str, str], ...] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
@@ -138,6 +141,11 @@ class CoordinationInput:
             "pf_run_id": self.pf_run_id,
             "sc_run_id": self.sc_run_id,
             "project_id": self.project_id,
+            "relay_pairs": (
+                [list(pair) for pair in self.relay_pairs]
+                if self.relay_pairs is not None
+                else None
+            ),
         }
 
 
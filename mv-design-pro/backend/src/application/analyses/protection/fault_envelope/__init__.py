@@ -0,0 +1,36 @@
+"""
+Protection Fault Envelope — obwiednia prądów zwarciowych elementów chronionych.
+
+Tabela per snapshot sieci: dla każdego elementu chronionego min/max Ik''
+zwarć 3F/2F/1F na początku i końcu elementu oraz zastępczy prąd cieplny Ith.
+Liczona raz (jedno przejście zwarciowe), współdzielona przez wszystkie
+sprawdzenia zabezpieczeń (sanity checks, dobór I>>).
+
+NIE jest to solver — wzory IEC 60909 z network_model.solvers.short_circuit_core.
+"""
+
+from application.analyses.protection.fault_envelope.models import (
+    FAULT_ENVELOPE_COLUMNS,
+    FaultEnvelopeRow,
+    FaultEnvelopeTable,
+    ProtectedElementSpan,
+)
+from application.analyses.protection.fault_envelope.builder import (
+    build_fault_envelope,
+    clear_fault_envelope_cache,
+    get_fault_envelope,
+    sweep_fault_envelope,
+)
+
+__all__ = [
+    # Models
+    "FAULT_ENVELOPE_COLUMNS",
+    "FaultEnvelopeRow",
+    "FaultEnvelopeTable",
+    "ProtectedElementSpan",
+    # Builder
+    "build_fault_envelope",
+    "sweep_fault_envelope",
+    "get_fault_envelope",
+    "clear_fault_envelope_cache",
+]
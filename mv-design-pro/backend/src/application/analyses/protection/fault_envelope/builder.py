@@ -0,0 +1,277 @@
+"""
+Fault Envelope — Builder.
+
+FLOW:
+1. SWEEP: Jedna macierz Zbus (i Z0) dla całej sieci; wartości dla wszystkich
+   unikalnych węzłów elementów (3F/2F, opcjonalnie 1F; c_min i c_max)
+   odczytywane wektorowo z przekątnej. Węzeł wspólny dla wielu elementów
+   (np. szyny zasilające) liczony jest raz.
+2. REDUCE: Wyniki zwarciowe redukowane do macierzy (węzły × wielkości).
+3. GATHER: Kolumny near/far tabeli budowane przez indeksowanie macierzy
+   wektorami indeksów węzłów (bez pętli po elementach).
+4. CACHE: Tabela przechowywana per snapshot — ponowne sprawdzenia nastaw
+   nie wykonują żadnych obliczeń zwarciowych.
+
+INVARIANTS:
+- Wzory IEC 60909 z short_circuit_core (te same co ShortCircuitIEC60909Solver)
+- DETERMINISTIC: elementy i węzły sortowane, ta sama sieć → identyczna tabela
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Iterable
+
+import numpy as np
+
+from application.analyses.protection.fault_envelope.models import (
+    FAULT_ENVELOPE_COLUMNS,
+    FaultEnvelopeTable,
+    ProtectedElementSpan,
+)
+from network_model.core.graph import NetworkGraph
+from network_model.solvers.short_circuit_core import (
+    ShortCircuitType,
+    build_zbus,
+    voltage_factor_for_fault,
+)
+from network_model.solvers.short_circuit_iec60909 import (
+    C_MAX,
+    C_MIN,
+    ShortCircuitIEC60909Solver,
+    ShortCircuitResult,
+)
+
+
+# Node quantity columns: (3F min, 3F max, 2F min, 2F max, 1F min, 1F max, Ith)
+_NODE_COLUMN: dict[tuple[ShortCircuitType, bool], int] = {
+    (ShortCircuitType.THREE_PHASE, False): 0,
+    (ShortCircuitType.THREE_PHASE, True): 1,
+    (ShortCircuitType.TWO_PHASE, False): 2,
+    (ShortCircuitType.TWO_PHASE, True): 3,
+    (ShortCircuitType.SINGLE_PHASE_GROUND, False): 4,
+    (ShortCircuitType.SINGLE_PHASE_GROUND, True): 5,
+}
+_NODE_ITH = 6
+_NODE_COLUMNS = 7
+
+# Table column → (node column, near/far)
+_GATHER: tuple[tuple[int, bool], ...] = (
+    (0, True), (1, True), (0, False), (1, False),
+    (2, True), (3, True), (2, False), (3, False),
+    (4, True), (5, True), (4, False), (5, False),
+    (_NODE_ITH, True),
+)
+
+FAULT_ENVELOPE_CACHE_SIZE = 8
+
+# Keyed by (snapshot_fingerprint, tk_s, Z0 digest, elements). A snapshot is
+# immutable, so a cached table never goes stale; the Z0 digest separates
+# tables with and without 1F columns (or with a different Z0 matrix).
+_fault_envelope_cache: OrderedDict[
+    tuple[str, float, str | None, tuple[ProtectedElementSpan, ...]], FaultEnvelopeTable
+] = OrderedDict()
+
+
+# =============================================================================
+# Build from short-circuit results
+# =============================================================================
+
+
+def build_fault_envelope(
+    elements: Iterable[ProtectedElementSpan],
+    sc_results: Iterable[ShortCircuitResult],
+    *,
+    snapshot_fingerprint: str,
+    tk_s: float = 1.0,
+) -> FaultEnvelopeTable:
+    """
+    Zbuduj tabelę obwiedni z gotowych wyników zwarciowych.
+
+    Min/max to skrajne wartości Ik'' po wszystkich wariantach (c_min/c_max)
+    obliczonych dla danego węzła i rodzaju zwarcia. Ith = maksymalny Ith
+    zwarcia 3F na początku elementu.
+
+    Args:
+        elements: elementy chronione
+        sc_results: wyniki IEC 60909 (dowolna kolejność, dowolne węzły)
+        snapshot_fingerprint: odcisk snapshotu sieci
+        tk_s: czas trwania zwarcia użyty dla Ith [s]
+
+    Returns:
+        FaultEnvelopeTable z wierszami posortowanymi po element_id
+    """
+    spans = _sorted_spans(elements)
+    node_ids = _unique_node_ids(spans)
+    node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+    node_min = np.full((len(node_ids), _NODE_COLUMNS), np.inf, dtype=np.float64)
+    node_max = np.full((len(node_ids), _NODE_COLUMNS), -np.inf, dtype=np.float64)
+    for result in sc_results:
+        row = node_index.get(result.fault_node_id)
+        if row is None or (result.short_circuit_type, False) not in _NODE_COLUMN:
+            continue
+        col_min = _NODE_COLUMN[(result.short_circuit_type, False)]
+        col_max = _NODE_COLUMN[(result.short_circuit_type, True)]
+        node_min[row, col_min] = min(node_min[row, col_min], result.ikss_a)
+        node_max[row, col_max] = max(node_max[row, col_max], result.ikss_a)
+        if result.short_circuit_type == ShortCircuitType.THREE_PHASE:
+            node_max[row, _NODE_ITH] = max(node_max[row, _NODE_ITH], result.ith_a)
+
+    node_values = np.full((len(node_ids), _NODE_COLUMNS), np.nan, dtype=np.float64)
+    min_cols = [col for (_, is_max), col in _NODE_COLUMN.items() if not is_max]
+    max_cols = [col for (_, is_max), col in _NODE_COLUMN.items() if is_max] + [_NODE_ITH]
+    node_values[:, min_cols] = node_min[:, min_cols]
+    node_values[:, max_cols] = node_max[:, max_cols]
+    node_values[~np.isfinite(node_values)] = np.nan
+
+    return _gather_table(
+        spans, node_index, node_values, snapshot_fingerprint=snapshot_fingerprint, tk_s=tk_s
+    )
+
+
+def _gather_table(
+    spans: tuple[ProtectedElementSpan, ...],
+    node_index: dict[str, int],
+    node_values: np.ndarray,
+    *,
+    snapshot_fingerprint: str,
+    tk_s: float,
+) -> FaultEnvelopeTable:
+    """Kolumny near/far tabeli z macierzy węzłów (indeksowanie wektorowe)."""
+    near = np.array([node_index[span.near_node_id] for span in spans], dtype=np.intp)
+    far = np.array([node_index[span.far_node_id] for span in spans], dtype=np.intp)
+    values = np.empty((len(spans), len(FAULT_ENVELOPE_COLUMNS)), dtype=np.float64)
+    for col, (node_col, is_near) in enumerate(_GATHER):
+        values[:, col] = node_values[near if is_near else far, node_col]
+    values.setflags(write=False)
+
+    return FaultEnvelopeTable(
+        snapshot_fingerprint=snapshot_fingerprint,
+        tk_s=tk_s,
+        element_ids=tuple(span.element_id for span in spans),
+        values=values,
+    )
+
+
+# =============================================================================
+# Batched sweep
+# =============================================================================
+
+
+def sweep_fault_envelope(
+    graph: NetworkGraph,
+    elements: Iterable[ProtectedElementSpan],
+    *,
+    snapshot_fingerprint: str,
+    tk_s: float = 1.0,
+    z0_bus: np.ndarray | None = None,
+) -> FaultEnvelopeTable:
+    """
+    Policz obwiednie wszystkich elementów jednym przejściem zwarciowym.
+
+    Zbus (i Z0) wyznaczane są raz dla całej sieci; Ik'' każdego unikalnego
+    węzła (near/far) odczytywany jest wektorowo z przekątnej dla 3F i 2F
+    przy c_min i c_max, 1F tylko gdy podano macierz Z0. Węzły spoza grafu
+    pozostają bez danych.
+    """
+    spans = _sorted_spans(elements)
+    node_ids = _unique_node_ids(spans)
+    node_values = np.full((len(node_ids), _NODE_COLUMNS), np.nan, dtype=np.float64)
+
+    rows = [i for i, node_id in enumerate(node_ids) if node_id in graph.nodes]
+    if rows:
+        builder, z1_bus = build_zbus(graph)
+        bus_index = builder.node_id_to_index
+        present = [node_ids[i] for i in rows]
+        bus = np.array([bus_index[node_id] for node_id in present], dtype=np.intp)
+        voltage_kv = np.array([graph.nodes[node_id].voltage_level for node_id in present])
+        z_base_ohm = np.array([builder.get_zbase_ohm(node_id) for node_id in present])
+        z1 = z1_bus[bus, bus] * z_base_ohm
+        z_equiv = {
+            ShortCircuitType.THREE_PHASE: z1,
+            ShortCircuitType.TWO_PHASE: z1 + z1,
+        }
+        if z0_bus is not None:
+            z_equiv[ShortCircuitType.SINGLE_PHASE_GROUND] = (
+                z1 + z1 + z0_bus[bus, bus] * z_base_ohm
+            )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for sc_type, z in z_equiv.items():
+                # Ik'' = c · Un · k / |Z| + wkład falowników (niezależny od węzła)
+                ik_per_c = voltage_kv * 1000.0 * voltage_factor_for_fault(sc_type) / np.abs(z)
+                ik_inverters = ShortCircuitIEC60909Solver._compute_inverter_contribution(
+                    graph=graph, fault_node_id=present[0], short_circuit_type=sc_type,
+                )
+                ik_min = C_MIN * ik_per_c + ik_inverters
+                ik_max = C_MAX * ik_per_c + ik_inverters
+                node_values[rows, _NODE_COLUMN[(sc_type, False)]] = ik_min
+                node_values[rows, _NODE_COLUMN[(sc_type, True)]] = ik_max
+                if sc_type == ShortCircuitType.THREE_PHASE:
+                    node_values[rows, _NODE_ITH] = ik_max * math.sqrt(tk_s)
+        node_values[~np.isfinite(node_values)] = np.nan
+
+    node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+    return _gather_table(
+        spans, node_index, node_values, snapshot_fingerprint=snapshot_fingerprint, tk_s=tk_s
+    )
+
+
+def get_fault_envelope(
+    graph: NetworkGraph,
+    elements: Iterable[ProtectedElementSpan],
+    *,
+    snapshot_fingerprint: str,
+    tk_s: float = 1.0,
+    z0_bus: np.ndarray | None = None,
+) -> FaultEnvelopeTable:
+    """
+    Tabela obwiedni dla snapshotu — z cache lub z jednego przejścia zwarciowego.
+
+    Zmiana nastaw zabezpieczeń nie zmienia snapshotu sieci, więc kolejne
+    sprawdzenia korzystają z tej samej tabeli. Klucz uwzględnia skrót
+    macierzy Z0 (tabela bez kolumn 1F nie zastąpi tabeli z Z0).
+    """
+    spans = _sorted_spans(elements)
+    key = (snapshot_fingerprint, tk_s, _z0_digest(z0_bus), spans)
+    table = _fault_envelope_cache.get(key)
+    if table is not None:
+        _fault_envelope_cache.move_to_end(key)
+    else:
+        table = sweep_fault_envelope(
+            graph,
+            spans,
+            snapshot_fingerprint=snapshot_fingerprint,
+            tk_s=tk_s,
+            z0_bus=z0_bus,
+        )
+        _fault_envelope_cache[key] = table
+        while len(_fault_envelope_cache) > FAULT_ENVELOPE_CACHE_SIZE:
+            _fault_envelope_cache.popitem(last=False)
+    return table
+
+
+def clear_fault_envelope_cache() -> None:
+    """Wyczyść cache tabel obwiedni."""
+    _fault_envelope_cache.clear()
+
+
+def _sorted_spans(elements: Iterable[ProtectedElementSpan]) -> tuple[ProtectedElementSpan, ...]:
+    return tuple(sorted(set(elements), key=lambda span: span.element_id))
+
+
+def _unique_node_ids(spans: tuple[ProtectedElementSpan, ...]) -> list[str]:
+    return sorted({span.near_node_id for span in spans} | {span.far_node_id for span in spans})
+
+
+def _z0_digest(z0_bus: np.ndarray | None) -> str | None:
+    """Skrót macierzy Z0 (None = brak Z0, bez kolumn 1F)."""
+    if z0_bus is None:
+        return None
+    matrix = np.ascontiguousarray(z0_bus, dtype=np.complex128)
+    digest = hashlib.sha256(repr(matrix.shape).encode("ascii"))
+    digest.update(matrix.tobytes())
+    return digest.hexdigest()
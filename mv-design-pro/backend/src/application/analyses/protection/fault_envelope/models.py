@@ -0,0 +1,205 @@
+"""
+Fault Envelope — Data Models.
+
+CANONICAL ALIGNMENT:
+- Frozen dataclasses for immutability and determinism
+- Columnar storage (elements × columns) for shared, read-only access
+
+Obwiednia prądów zwarciowych elementu chronionego:
+- min/max Ik'' dla zwarć 3F/2F/1F na początku (near) i końcu (far) elementu
+- zastępczy prąd cieplny Ith (maksymalny, początek elementu)
+
+Brak wartości (brak węzła w sieci, brak Z0 dla 1F) = NaN w tabeli,
+None w wierszu.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+# =============================================================================
+# Columns — stabilna kolejność kolumn tabeli
+# =============================================================================
+
+
+FAULT_ENVELOPE_COLUMNS: tuple[str, ...] = (
+    "ik3_min_near_a",
+    "ik3_max_near_a",
+    "ik3_min_far_a",
+    "ik3_max_far_a",
+    "ik2_min_near_a",
+    "ik2_max_near_a",
+    "ik2_min_far_a",
+    "ik2_max_far_a",
+    "ik1_min_near_a",
+    "ik1_max_near_a",
+    "ik1_min_far_a",
+    "ik1_max_far_a",
+    "ith_a",
+)
+
+_COLUMN_INDEX: dict[str, int] = {name: i for i, name in enumerate(FAULT_ENVELOPE_COLUMNS)}
+
+
+# =============================================================================
+# Protected Element Span
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ProtectedElementSpan:
+    """
+    Element chroniony z węzłami początku i końca.
+
+    Attributes:
+        element_id: identyfikator elementu chronionego
+        near_node_id: węzeł po stronie zabezpieczenia (szyny zasilające)
+        far_node_id: węzeł na końcu elementu
+    """
+    element_id: str
+    near_node_id: str
+    far_node_id: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict."""
+        return {
+            "element_id": self.element_id,
+            "near_node_id": self.near_node_id,
+            "far_node_id": self.far_node_id,
+        }
+
+
+# =============================================================================
+# Fault Envelope Row — widok pojedynczego elementu
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class FaultEnvelopeRow:
+    """
+    Obwiednia prądów zwarciowych jednego elementu chronionego [A].
+
+    None = brak danych (element poza zasięgiem obliczeń zwarciowych).
+    """
+    element_id: str
+    ik3_min_near_a: float | None
+    ik3_max_near_a: float | None
+    ik3_min_far_a: float | None
+    ik3_max_far_a: float | None
+    ik2_min_near_a: float | None
+    ik2_max_near_a: float | None
+    ik2_min_far_a: float | None
+    ik2_max_far_a: float | None
+    ik1_min_near_a: float | None
+    ik1_max_near_a: float | None
+    ik1_min_far_a: float | None
+    ik1_max_far_a: float | None
+    ith_a: float | None
+
+    def line_overcurrent_currents(
+        self,
+        next_protection: FaultEnvelopeRow | None = None,
+    ) -> dict[str, Any]:
+        """
+        Prądy zwarciowe w układzie pól LineOvercurrentSettingInput.
+
+        Args:
+            next_protection: obwiednia elementu za kolejnym zabezpieczeniem
+                (Ik_max w punkcie kolejnego zabezpieczenia); gdy brak —
+                Ik_max 3F na końcu elementu
+
+        Returns:
+            Słownik: ik_max_busbars_a, ik_min_busbars_a,
+            ik_max_next_protection_a, ik_min_2f_busbars_a
+        """
+        if next_protection is not None:
+            ik_max_next = next_protection.ik3_max_near_a
+        else:
+            ik_max_next = self.ik3_max_far_a
+        return {
+            "ik_max_busbars_a": self.ik3_max_near_a or 0.0,
+            "ik_min_busbars_a": self.ik3_min_near_a or 0.0,
+            "ik_max_next_protection_a": ik_max_next or 0.0,
+            "ik_min_2f_busbars_a": self.ik2_min_near_a,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict."""
+        payload: dict[str, Any] = {"element_id": self.element_id}
+        for name in FAULT_ENVELOPE_COLUMNS:
+            payload[name] = getattr(self, name)
+        return payload
+
+
+# =============================================================================
+# Fault Envelope Table — tabela kolumnowa
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class FaultEnvelopeTable:
+    """
+    Obwiednie prądów zwarciowych wszystkich elementów chronionych snapshotu.
+
+    Wiersz = element (kolejność element_ids, posortowana).
+    Kolumna = FAULT_ENVELOPE_COLUMNS.
+
+    Attributes:
+        snapshot_fingerprint: odcisk snapshotu sieci, z którego liczono obwiednie
+        tk_s: czas trwania zwarcia użyty dla Ith [s]
+        element_ids: identyfikatory elementów (posortowane)
+        values: macierz (elementy × kolumny) float64, NaN = brak danych
+    """
+    snapshot_fingerprint: str
+    tk_s: float
+    element_ids: tuple[str, ...]
+    values: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Validate invariants."""
+        expected = (len(self.element_ids), len(FAULT_ENVELOPE_COLUMNS))
+        if self.values.shape != expected:
+            raise ValueError(
+                f"Nieprawidłowy kształt tabeli obwiedni: {self.values.shape} != {expected}"
+            )
+
+    def __len__(self) -> int:
+        return len(self.element_ids)
+
+    def column(self, name: str) -> np.ndarray:
+        """Kolumna tabeli (widok tylko do odczytu)."""
+        try:
+            return self.values[:, _COLUMN_INDEX[name]]
+        except KeyError:
+            raise ValueError(f"Nieznana kolumna obwiedni: {name}") from None
+
+    def row(self, element_id: str) -> FaultEnvelopeRow | None:
+        """Obwiednia elementu lub None, gdy element nie należy do tabeli."""
+        try:
+            index = self.element_ids.index(element_id)
+        except ValueError:
+            return None
+        values = [_optional_float(value) for value in self.values[index].tolist()]
+        return FaultEnvelopeRow(element_id, *values)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict (kolumnowo)."""
+        return {
+            "snapshot_fingerprint": self.snapshot_fingerprint,
+            "tk_s": self.tk_s,
+            "element_ids": list(self.element_ids),
+            "columns": {
+                name: [_optional_float(v) for v in self.column(name).tolist()]
+                for name in FAULT_ENVELOPE_COLUMNS
+            },
+        }
+
+
+def _optional_float(value: float) -> float | None:
+    """Convert a NaN-encoded value back to float | None."""
+    return None if math.isnan(value) else float(value)
@@ -43,10 +43,12 @@ METHODOLOGY (from lecture materials):
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 from uuid import uuid4
 
+from application.analyses.protection.fault_envelope.models import FaultEnvelopeRow
+
 from .models import (
     LineOvercurrentSettingInput,
     LineOvercurrentSettingResult,
@@ -195,6 +197,32 @@ class LineOvercurrentSettingAnalyzer:
             trace_steps=tuple(trace_steps),
         )
 
+    def analyze_with_envelope(
+        self,
+        input_data: LineOvercurrentSettingInput,
+        envelope: FaultEnvelopeRow,
+        next_protection: FaultEnvelopeRow | None = None,
+    ) -> LineOvercurrentSettingResult:
+        """
+        Perform I>> analysis with fault currents taken from a fault envelope.
+
+        Fault current fields of input_data are replaced by the envelope values
+        (Ik max/min 3F and Ik min 2F at busbars, Ik max at next protection).
+        Re-running after a settings change reuses the same envelope — no
+        short-circuit data is fetched or recomputed.
+
+        Args:
+            input_data: LineOvercurrentSettingInput (settings, conductor, SPZ)
+            envelope: Fault envelope row of the protected line
+            next_protection: Fault envelope row of the next downstream element
+
+        Returns:
+            LineOvercurrentSettingResult (same as analyze())
+        """
+        return self.analyze(
+            replace(input_data, **envelope.line_overcurrent_currents(next_protection))
+        )
+
     def _check_selectivity(
         self,
         input_data: LineOvercurrentSettingInput,
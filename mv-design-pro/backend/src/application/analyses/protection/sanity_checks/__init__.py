@@ -5,9 +5,21 @@ CANONICAL API:
     run_sanity_checks(
         functions: list[ProtectionFunctionSummary],
         base_values: BaseValues,
-        element_context: ElementContext
+        element_context: ElementContext,
+        fault_envelope: FaultEnvelopeTable | None = None,
     ) -> list[ProtectionSanityCheckResult]
 
+    run_sanity_checks_for_snapshot(
+        graph: NetworkGraph,
+        elements: Iterable[ElementSanityInput],
+        snapshot_fingerprint: str,
+    ) -> list[ProtectionSanityCheckResult]
+
+FAULT ENVELOPE:
+    Reguły względem prądów zwarciowych czytają wiersz tabeli obwiedni
+    snapshotu (get_fault_envelope) — jedno przejście zwarciowe na snapshot,
+    ponowne sprawdzenia po zmianie nastaw nie liczą zwarć.
+
 DETERMINISM:
     Wyniki sortowane po: element_id, severity (ERROR > WARN > INFO), code.
 
@@ -16,7 +28,14 @@ DETERMINISM:
 
 from __future__ import annotations
 
+from dataclasses import replace
+from typing import TYPE_CHECKING, Iterable
+
 from application.analyses.protection.base_values.models import BaseValues
+from application.analyses.protection.fault_envelope import (
+    FaultEnvelopeTable,
+    get_fault_envelope,
+)
 from application.analyses.protection.sanity_checks.models import (
     ProtectionSanityCheckResult,
     SanityCheckCode,
@@ -27,19 +46,27 @@ from application.analyses.protection.sanity_checks.models import (
 from application.analyses.protection.sanity_checks.rules import (
     ALL_RULES,
     ElementContext,
+    ElementSanityInput,
     ProtectionFunctionSummary,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from network_model.core.graph import NetworkGraph
+
 
 __all__ = [
     # API
     "run_sanity_checks",
+    "run_sanity_checks_for_snapshot",
     # Models
     "ProtectionSanityCheckResult",
     "SanityCheckCode",
     "SanityCheckSeverity",
     "ProtectionFunctionSummary",
     "ElementContext",
+    "ElementSanityInput",
     # Labels
     "SANITY_CHECK_CODE_LABELS_PL",
     "SEVERITY_LABELS_PL",
@@ -50,6 +77,7 @@ def run_sanity_checks(
     functions: list[ProtectionFunctionSummary],
     base_values: BaseValues,
     element_context: ElementContext,
+    fault_envelope: FaultEnvelopeTable | None = None,
 ) -> list[ProtectionSanityCheckResult]:
     """
     Uruchom wszystkie reguly walidacji na funkcjach zabezpieczeniowych.
@@ -58,6 +86,8 @@ def run_sanity_checks(
         functions: lista funkcji zabezpieczeniowych do walidacji
         base_values: rozwiazane wartosci bazowe (Un/In)
         element_context: kontekst elementu (id, typ)
+        fault_envelope: tabela obwiedni snapshotu; gdy kontekst nie ma
+            obwiedni, wiersz elementu jest brany z tabeli
 
     Returns:
         Lista wynikow walidacji, posortowana deterministycznie:
@@ -105,6 +135,12 @@ def run_sanity_checks(
     """
     results: list[ProtectionSanityCheckResult] = []
 
+    if fault_envelope is not None and element_context.fault_envelope is None:
+        element_context = replace(
+            element_context,
+            fault_envelope=fault_envelope.row(element_context.element_id),
+        )
+
     # Uruchom wszystkie reguly
     for rule_fn in ALL_RULES:
         rule_results = rule_fn(functions, base_values, element_context)
@@ -116,6 +152,51 @@ def run_sanity_checks(
     return results
 
 
+def run_sanity_checks_for_snapshot(
+    graph: NetworkGraph,
+    elements: Iterable[ElementSanityInput],
+    *,
+    snapshot_fingerprint: str,
+    tk_s: float = 1.0,
+    z0_bus: np.ndarray | None = None,
+) -> list[ProtectionSanityCheckResult]:
+    """
+    Uruchom sanity checks dla wszystkich elementów chronionych snapshotu.
+
+    Obwiednia zwarciowa pobierana jest raz (get_fault_envelope, cache per
+    snapshot) i wpisywana do ElementContext każdego elementu.
+
+    Args:
+        graph: graf sieci snapshotu
+        elements: elementy chronione z funkcjami i wartościami bazowymi
+        snapshot_fingerprint: odcisk snapshotu sieci (klucz cache obwiedni)
+        tk_s: czas trwania zwarcia dla Ith [s]
+        z0_bus: macierz Z0 (opcjonalna; bez niej brak wartości 1F)
+
+    Returns:
+        Lista wyników walidacji, posortowana jak w run_sanity_checks.
+    """
+    items = tuple(elements)
+    table = get_fault_envelope(
+        graph,
+        (item.span for item in items),
+        snapshot_fingerprint=snapshot_fingerprint,
+        tk_s=tk_s,
+        z0_bus=z0_bus,
+    )
+    results: list[ProtectionSanityCheckResult] = []
+    for item in items:
+        context = ElementContext(
+            element_id=item.span.element_id,
+            element_type=item.element_type,
+        )
+        results.extend(
+            run_sanity_checks(list(item.functions), item.base_values, context, table)
+        )
+    results.sort(key=_sort_key)
+    return results
+
+
 def _sort_key(result: ProtectionSanityCheckResult) -> tuple[str, int, str]:
     """
     Klucz sortowania dla wynikow.
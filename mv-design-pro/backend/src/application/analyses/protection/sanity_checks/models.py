@@ -71,6 +71,8 @@ class SanityCheckCode(str, Enum):
     OC_OVERLAP = "OC_OVERLAP"
     OC_I_GT_TOO_LOW = "OC_I_GT_TOO_LOW"
     OC_I_INST_TOO_LOW = "OC_I_INST_TOO_LOW"
+    OC_I_GT_ABOVE_IK_MIN = "OC_I_GT_ABOVE_IK_MIN"
+    OC_I_INST_ABOVE_IK_MAX = "OC_I_INST_ABOVE_IK_MAX"
 
     # SPZ (79)
     SPZ_NO_TRIP_FUNCTION = "SPZ_NO_TRIP_FUNCTION"
@@ -171,6 +173,8 @@ SANITY_CHECK_CODE_LABELS_PL: dict[SanityCheckCode, str] = {
     SanityCheckCode.OC_OVERLAP: "Nakladanie sie progow I> i I>> (I> >= I>>)",
     SanityCheckCode.OC_I_GT_TOO_LOW: "Prog I> zbyt niski (< 1,0×In)",
     SanityCheckCode.OC_I_INST_TOO_LOW: "Prog I>> zbyt niski (< 1,5×In)",
+    SanityCheckCode.OC_I_GT_ABOVE_IK_MIN: "Prog I> powyzej minimalnego pradu zwarciowego (Ik_min)",
+    SanityCheckCode.OC_I_INST_ABOVE_IK_MAX: "Prog I>> powyzej maksymalnego pradu zwarciowego (Ik_max)",
 
     # SPZ
     SanityCheckCode.SPZ_NO_TRIP_FUNCTION: "SPZ aktywne bez funkcji wyzwalajacej",
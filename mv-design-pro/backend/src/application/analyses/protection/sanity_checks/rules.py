@@ -22,6 +22,8 @@ BINDING RULE SET:
    - ERROR I> >= I>> (p.u.)
    - WARN I> < 1.0×In
    - WARN I>> < 1.5×In
+   - WARN I> >= Ik_min na końcu elementu (obwiednia zwarciowa)
+   - WARN I>> >= Ik_max na początku elementu (obwiednia zwarciowa)
 
 5. SPZ (79):
    - WARN SPZ aktywne bez funkcji wyzwalajacych
@@ -45,6 +47,10 @@ from application.analyses.protection.base_values.models import (
     ProtectionSetpointBasis,
     ProtectionSetpointOperator,
 )
+from application.analyses.protection.fault_envelope.models import (
+    FaultEnvelopeRow,
+    ProtectedElementSpan,
+)
 from application.analyses.protection.sanity_checks.models import (
     ProtectionSanityCheckResult,
     SanityCheckCode,
@@ -105,16 +111,39 @@ class ElementContext:
     Attributes:
         element_id: identyfikator elementu
         element_type: typ elementu (LINE, TRANSFORMER, BUS, BoundaryNode, etc.)
+        fault_envelope: obwiednia prądów zwarciowych elementu (opcjonalna,
+            z tabeli FaultEnvelopeTable snapshotu — bez obliczeń zwarciowych)
     """
     element_id: str
     element_type: str
+    fault_envelope: FaultEnvelopeRow | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to JSON-compatible dict."""
-        return {
+        payload: dict[str, Any] = {
             "element_id": self.element_id,
             "element_type": self.element_type,
         }
+        if self.fault_envelope is not None:
+            payload["fault_envelope"] = self.fault_envelope.to_dict()
+        return payload
+
+
+@dataclass(frozen=True)
+class ElementSanityInput:
+    """
+    Dane wejściowe sprawdzeń jednego elementu chronionego snapshotu.
+
+    Attributes:
+        span: element chroniony z węzłami początku i końca (wiersz obwiedni)
+        element_type: typ elementu (LINE, TRANSFORMER, BUS, BoundaryNode, etc.)
+        functions: funkcje zabezpieczeniowe elementu
+        base_values: rozwiązane wartości bazowe (Un/In)
+    """
+    span: ProtectedElementSpan
+    element_type: str
+    functions: tuple[ProtectionFunctionSummary, ...]
+    base_values: BaseValues
 
 
 # =============================================================================
@@ -154,6 +183,20 @@ def _find_function_by_ansi(
     return None
 
 
+def _primary_current_a(
+    setpoint: ProtectionSetpoint,
+    base_values: BaseValues,
+) -> float | None:
+    """Próg prądowy po stronie pierwotnej [A] (basis IN lub ABS)."""
+    if setpoint.basis == ProtectionSetpointBasis.IN:
+        if setpoint.multiplier is None or not base_values.has_in:
+            return None
+        return setpoint.multiplier * base_values.in_a
+    if setpoint.basis == ProtectionSetpointBasis.ABS:
+        return setpoint.abs_value
+    return None
+
+
 def _has_tripping_function(functions: list[ProtectionFunctionSummary]) -> bool:
     """Sprawdz czy istnieje funkcja wyzwalajaca (overcurrent, earth fault, etc.)."""
     tripping_codes = (
@@ -584,6 +627,71 @@ def check_overcurrent_rules(
     return results
 
 
+# =============================================================================
+# Rule: Overcurrent vs Fault Envelope (50/51)
+# =============================================================================
+
+
+def check_fault_envelope_rules(
+    functions: list[ProtectionFunctionSummary],
+    base_values: BaseValues,
+    ctx: ElementContext,
+) -> list[ProtectionSanityCheckResult]:
+    """
+    Reguły nadprądowe względem obwiedni zwarciowej (50/51):
+    - WARN I> >= Ik_min na końcu elementu (2F, a gdy brak — 3F)
+    - WARN I>> >= Ik_max 3F na początku elementu
+
+    Wymaga ctx.fault_envelope; bez obwiedni reguła nic nie zgłasza.
+    """
+    results: list[ProtectionSanityCheckResult] = []
+
+    envelope = ctx.fault_envelope
+    if envelope is None:
+        return results
+
+    oc_time_fn = _find_function_by_codes(functions, ("OVERCURRENT_TIME",))  # 51 I>
+    oc_inst_fn = _find_function_by_codes(functions, ("OVERCURRENT_INST",))  # 50 I>>
+
+    # WARN: I> >= Ik_min (brak czułości na końcu elementu)
+    if oc_time_fn:
+        i_gt = _primary_current_a(oc_time_fn.setpoint, base_values)
+        ik_min = envelope.ik2_min_far_a or envelope.ik3_min_far_a
+        if i_gt is not None and ik_min and i_gt >= ik_min:
+            results.append(
+                ProtectionSanityCheckResult(
+                    severity=SanityCheckSeverity.WARN,
+                    code=SanityCheckCode.OC_I_GT_ABOVE_IK_MIN,
+                    message_pl=f"Próg I> ({oc_time_fn.setpoint.display_pl}) = {i_gt:.1f} A jest większy lub równy minimalnemu prądowi zwarciowemu na końcu elementu ({ik_min:.1f} A)",
+                    element_id=ctx.element_id,
+                    element_type=ctx.element_type,
+                    function_ansi="51",
+                    function_code="OVERCURRENT_TIME",
+                    evidence={"I>_A": i_gt, "ik_min_far_A": ik_min},
+                )
+            )
+
+    # WARN: I>> >= Ik_max (I>> nigdy nie zadziała)
+    if oc_inst_fn:
+        i_inst = _primary_current_a(oc_inst_fn.setpoint, base_values)
+        ik_max = envelope.ik3_max_near_a
+        if i_inst is not None and ik_max and i_inst >= ik_max:
+            results.append(
+                ProtectionSanityCheckResult(
+                    severity=SanityCheckSeverity.WARN,
+                    code=SanityCheckCode.OC_I_INST_ABOVE_IK_MAX,
+                    message_pl=f"Próg I>> ({oc_inst_fn.setpoint.display_pl}) = {i_inst:.1f} A jest większy lub równy maksymalnemu prądowi zwarciowemu na początku elementu ({ik_max:.1f} A)",
+                    element_id=ctx.element_id,
+                    element_type=ctx.element_type,
+                    function_ansi="50",
+                    function_code="OVERCURRENT_INST",
+                    evidence={"I>>_A": i_inst, "ik_max_near_A": ik_max},
+                )
+            )
+
+    return results
+
+
 # =============================================================================
 # Rule: SPZ (79)
 # =============================================================================
@@ -649,5 +757,6 @@ ALL_RULES = [
     check_frequency_rules,
     check_rocof_rules,
     check_overcurrent_rules,
+    check_fault_envelope_rules,
     check_spz_rules,
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from datetime import datetime
 from typing import Any, Callable
@@ -17,15 +18,22 @@ from application.analysis_run.read_model import (
     get_run_trace,
     minimize_summary,
 )
+from application.report_rendering import (
+    ReportRenderingService,
+    default_report_rendering_service,
+)
 from application.sld.overlay import ResultSldOverlayBuilder
 from infrastructure.persistence.unit_of_work import UnitOfWork
-from network_model.reporting.analysis_run_report_docx import export_analysis_run_to_docx
-from network_model.reporting.analysis_run_report_pdf import export_analysis_run_to_pdf
 
 class AnalysisRunExportService:
-    def __init__(self, uow_factory: Callable[[], UnitOfWork]) -> None:
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        renderer: ReportRenderingService | None = None,
+    ) -> None:
         self._uow_factory = uow_factory
         self._overlay_builder = ResultSldOverlayBuilder()
+        self._renderer = renderer if renderer is not None else default_report_rendering_service()
 
     def export_run_bundle(self, run_id: UUID) -> dict[str, Any]:
         with self._uow_factory() as uow:
@@ -81,18 +89,40 @@ class AnalysisRunExportService:
         return bundle
 
     def export_run_docx(self, run_id: UUID) -> bytes:
-        bundle = self.export_run_bundle(run_id)
-        return self._render_docx(bundle)
+        return self.export_run_reports(run_id, ["analysis_run_docx"])[0]
 
     def export_run_pdf(self, run_id: UUID) -> bytes:
-        bundle = self.export_run_bundle(run_id)
-        return self._render_pdf(bundle)
+        return self.export_run_reports(run_id, ["analysis_run_pdf"])[0]
 
-    def _render_docx(self, bundle: dict[str, Any]) -> bytes:
-        return export_analysis_run_to_docx(bundle)
+    def export_run_reports(self, run_id: UUID, report_types: list[str]) -> list[bytes]:
+        """
+        Rendered reports of a run, cached by (input_hash, context, report type, template).
 
-    def _render_pdf(self, bundle: dict[str, Any]) -> bytes:
-        return export_analysis_run_to_pdf(bundle)
+        The context digest covers the bundle data not fixed by the run: the
+        project and operating-case names and the project's SLD diagrams.
+        """
+        with self._uow_factory() as uow:
+            run = uow.analysis_runs.get(run_id, include_payloads=False)
+            if run is None:
+                raise ValueError(f"AnalysisRun {run_id} not found")
+            project = uow.projects.get(run.project_id)
+            operating_case = uow.cases.get_operating_case(run.operating_case_id)
+            diagrams = uow.sld.list_by_project(run.project_id)
+        context_hash = _report_context_hash(
+            project.name if project is not None else None,
+            operating_case.name if operating_case is not None else None,
+            diagrams,
+        )
+        reports = self._renderer.render_many(
+            report_types,
+            run_id=str(run.id),
+            input_hash=run.input_hash,
+            build_payload=lambda: self.export_run_bundle(run_id),
+            # The bundle shows status and result validity; cache only final runs
+            cacheable=run.results_valid,
+            context_hash=context_hash,
+        )
+        return [report.content for report in reports]
 
     def _build_result_items(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         items = []
@@ -216,6 +246,29 @@ class AnalysisRunExportService:
         return {key: value for key, value in normalized.items() if value is not None}
 
 
+def _report_context_hash(
+    project_name: str | None,
+    operating_case_name: str | None,
+    diagrams: list[dict[str, Any]],
+) -> str:
+    context = {
+        "project": project_name,
+        "operating_case": operating_case_name,
+        "sld": [
+            {
+                "id": str(diagram.get("id")),
+                "name": diagram.get("name"),
+                "payload": diagram.get("payload"),
+            }
+            for diagram in diagrams
+        ],
+    }
+    encoded = json.dumps(
+        canonicalize_json(context), sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def _format_datetime(value: datetime | None) -> str | None:
     if value is None:
         return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 from domain.analysis_run import AnalysisRun
@@ -11,6 +12,8 @@ DETERMINISTIC_LIST_KEYS = {
     "warnings",
 }
 
+_SEARCH_KEYS = ("name", "element_id", "bus_id", "branch_id", "target_id", "target_name")
+
 
 def build_deterministic_id(run: AnalysisRun) -> str:
     return f"{run.analysis_type}:{run.operating_case_id}:{run.input_hash}"
@@ -122,6 +125,45 @@ def _summarize_dict_trace(trace_payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def query_result_rows(
+    rows: Sequence[dict[str, Any]],
+    *,
+    sort: str | None = None,
+    descending: bool = False,
+    search: str | None = None,
+    flag: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Filtered and sorted view of materialized result rows.
+
+    search: case-insensitive substring of the name/id columns; flag: rows
+    carrying that flag. Rows without a value in the sort column come last
+    in both directions; ties keep the canonical row order.
+    """
+    selected = list(rows)
+    if search:
+        needle = search.casefold()
+        selected = [
+            row
+            for row in selected
+            if any(
+                needle in str(row[key]).casefold()
+                for key in _SEARCH_KEYS
+                if row.get(key) is not None
+            )
+        ]
+    if flag:
+        selected = [row for row in selected if flag in (row.get("flags") or [])]
+    if sort is None:
+        return selected
+    if rows and sort not in rows[0]:
+        raise ValueError(f"Nieznana kolumna sortowania: {sort}")
+    present = [row for row in selected if row.get(sort) is not None]
+    missing = [row for row in selected if row.get(sort) is None]
+    present.sort(key=lambda row: row[sort], reverse=descending)
+    return present + missing
+
+
 def _extract_step_name(step: dict[str, Any]) -> str | None:
     return step.get("key") or step.get("title") or step.get("step")
 
@@ -23,7 +23,7 @@ from application.network_model import (
     network_model_id_for_project,
 )
 from application.sld.overlay import ResultSldOverlayBuilder
-from domain.analysis_run import AnalysisRun, new_analysis_run
+from domain.analysis_run import AnalysisRun, AnalysisType, new_analysis_run
 from domain.project_design_mode import ProjectDesignMode
 from domain.validation import ValidationIssue, ValidationReport
 from infrastructure.persistence.unit_of_work import UnitOfWork
@@ -85,56 +85,12 @@ class AnalysisRunService:
         - Result = can be reused from previous run with same input_hash
 
         If a FINISHED run with identical input_hash exists, creates a new run
-        with copied results (immediate finish). Otherwise creates CREATED run.
+        reusing its results by reference (immediate finish). Otherwise
+        creates CREATED run. Same semantics for all analysis types (_create_run).
         """
         operating_case_id = self._resolve_operating_case_id(project_id, operating_case_id)
         snapshot = self._build_power_flow_snapshot(project_id, operating_case_id, options)
-        input_hash = compute_input_hash(snapshot)
-        with self._uow_factory() as uow:
-            # P20a: Check for existing FINISHED run with same input_hash
-            existing = uow.analysis_runs.get_by_deterministic_key(
-                project_id=project_id,
-                operating_case_id=operating_case_id,
-                analysis_type="PF",
-                input_hash=input_hash,
-            )
-
-            # ALWAYS create new run (Run = event, new UUID)
-            run = new_analysis_run(
-                project_id=project_id,
-                operating_case_id=operating_case_id,
-                analysis_type="PF",
-                input_snapshot=snapshot,
-                input_hash=input_hash,
-            )
-            uow.analysis_runs.create(run)
-
-            # If existing FINISHED run found, copy results (result dedup)
-            if existing is not None and existing.status == "FINISHED":
-                from datetime import datetime, timezone
-                now = datetime.now(timezone.utc)
-                # Build dedup trace info
-                dedup_trace = {
-                    "dedup_source_run_id": str(existing.id),
-                    "dedup_reason": "identical_input_hash",
-                }
-                trace_json = existing.trace_json
-                if isinstance(trace_json, dict):
-                    trace_json = {**trace_json, "_dedup": dedup_trace}
-                elif trace_json is None:
-                    trace_json = {"_dedup": dedup_trace}
-
-                run = uow.analysis_runs.update_status(
-                    run.id,
-                    status="FINISHED",
-                    started_at=now,
-                    finished_at=now,
-                    result_summary=existing.result_summary,
-                    trace_json=trace_json,
-                    white_box_trace=existing.white_box_trace,
-                )
-
-        return run
+        return self._create_run("PF", project_id, operating_case_id, snapshot)
 
     def create_short_circuit_run(
         self,
@@ -149,17 +105,7 @@ class AnalysisRunService:
         snapshot = self._build_short_circuit_snapshot(
             project_id, operating_case_id, fault_spec, options
         )
-        input_hash = compute_input_hash(snapshot)
-        with self._uow_factory() as uow:
-            run = new_analysis_run(
-                project_id=project_id,
-                operating_case_id=operating_case_id,
-                analysis_type="short_circuit_sn",
-                input_snapshot=snapshot,
-                input_hash=input_hash,
-            )
-            uow.analysis_runs.create(run)
-        return run
+        return self._create_run("short_circuit_sn", project_id, operating_case_id, snapshot)
 
     def create_fault_loop_run(
         self,
@@ -169,16 +115,50 @@ class AnalysisRunService:
     ) -> AnalysisRun:
         operating_case_id = self._resolve_operating_case_id(project_id, operating_case_id)
         snapshot = self._build_fault_loop_snapshot(project_id, operating_case_id, options)
+        return self._create_run("fault_loop_nn", project_id, operating_case_id, snapshot)
+
+    def _create_run(
+        self,
+        analysis_type: AnalysisType,
+        project_id: UUID,
+        operating_case_id: UUID,
+        snapshot: dict,
+    ) -> AnalysisRun:
+        """Create a run with deterministic-key result deduplication.
+
+        - Run = event (ALWAYS new UUID)
+        - Result = reused from the oldest FINISHED run with the same
+          (project, case, analysis_type, input_hash); the new run is
+          finished immediately and references the source payloads and result
+          rows instead of copying them
+        """
         input_hash = compute_input_hash(snapshot)
         with self._uow_factory() as uow:
+            source_run_id = uow.analysis_runs.find_reusable_run_id(
+                project_id=project_id,
+                operating_case_id=operating_case_id,
+                analysis_type=analysis_type,
+                input_hash=input_hash,
+            )
             run = new_analysis_run(
                 project_id=project_id,
                 operating_case_id=operating_case_id,
-                analysis_type="fault_loop_nn",
+                analysis_type=analysis_type,
                 input_snapshot=snapshot,
                 input_hash=input_hash,
             )
             uow.analysis_runs.create(run)
+            if source_run_id is not None:
+                now = datetime.now(timezone.utc)
+                uow.results.add_result_references(
+                    run_id=run.id,
+                    project_id=project_id,
+                    source_run_id=source_run_id,
+                    created_at=now,
+                )
+                run = uow.analysis_runs.finish_with_reused_results(
+                    run.id, source_run_id, finished_at=now
+                )
         return run
 
     def execute_run(self, run_id: UUID) -> AnalysisRun:
@@ -31,6 +31,7 @@ from domain.execution import (
     RunStatus,
 )
 from application.execution_engine.service import ExecutionEngineService
+from application.pagination import Page, keyset_page
 from application.execution_engine.errors import (
     ExecutionError,
     RunNotFoundError,
@@ -285,6 +286,26 @@ class BatchExecutionService:
         ]
         return list(reversed(batches))
 
+    def list_batches_page(
+        self,
+        study_case_id: UUID,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[BatchJob]:
+        """Keyset page of batches on (created_at, batch_id), newest first."""
+        batches = (
+            self._batches[bid]
+            for bid in self._case_batches.get(study_case_id, [])
+            if bid in self._batches
+        )
+        return keyset_page(
+            batches,
+            key=lambda batch: (batch.created_at, str(batch.batch_id)),
+            limit=limit,
+            cursor=cursor,
+        )
+
     def _get_batch(self, batch_id: UUID) -> BatchJob:
         """Get a batch or raise BatchNotFoundError."""
         batch = self._batches.get(batch_id)
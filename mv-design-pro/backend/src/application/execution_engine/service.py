@@ -65,7 +65,6 @@ from .errors import (
 
 logger = logging.getLogger(__name__)
 
-
 class ExecutionEngineService:
     """
     Canonical execution engine for StudyCase → Run → ResultSet pipeline.
@@ -84,6 +83,8 @@ class ExecutionEngineService:
         self._study_cases: dict[UUID, DomainStudyCase] = {}
         # Run history per study case (study_case_id → list of run_ids)
         self._case_runs: dict[UUID, list[UUID]] = {}
+        # Protection dependency state per study case (incremental re-evaluation)
+        self._protection_states: dict[UUID, Any] = {}
 
     # =========================================================================
     # Study Case Management (thin wrapper for execution context)
@@ -581,6 +582,8 @@ class ExecutionEngineService:
         2. Mark as RUNNING
         3. If current_source provided (PR-27): resolve test points
         4. Call Protection Engine v1 with resolved test points
+           (incremental: only relays changed since the previous protection
+           run of the study case are re-evaluated; result is identical)
         5. Map result → ResultSet (PROTECTION)
         6. Store ResultSet, mark as DONE
         7. On error → mark as FAILED
@@ -598,7 +601,7 @@ class ExecutionEngineService:
         """
         from domain.protection_engine_v1 import (
             ProtectionStudyInputV1,
-            execute_protection_v1,
+            execute_protection_v1_incremental,
         )
         from application.result_mapping.protection_to_resultset_v1 import (
             map_protection_to_resultset_v1,
@@ -641,7 +644,10 @@ class ExecutionEngineService:
                     test_points=resolved_test_points,
                 )
 
-            protection_result = execute_protection_v1(effective_input)
+            protection_result, protection_state = execute_protection_v1_incremental(
+                effective_input,
+                self._protection_states.get(run.study_case_id),
+            )
 
             result_set = map_protection_to_resultset_v1(
                 protection_result=protection_result,
@@ -653,11 +659,13 @@ class ExecutionEngineService:
             updated_run = run.mark_done()
             self._runs[run_id] = updated_run
             self._result_sets[run_id] = result_set
+            self._protection_states[run.study_case_id] = protection_state
 
             logger.info(
-                "Protection run %s completed: relays=%d, sig=%s",
+                "Protection run %s completed: relays=%d, recomputed=%d, sig=%s",
                 run_id,
                 len(protection_result.relay_results),
+                len(protection_state.recomputed_relay_ids),
                 result_set.deterministic_signature[:16],
             )
 
@@ -676,6 +684,10 @@ class ExecutionEngineService:
         """Get a run by ID."""
         return self._get_run(run_id)
 
+    def get_protection_state(self, study_case_id: UUID) -> Any | None:
+        """Get the protection dependency state of the latest protection run."""
+        return self._protection_states.get(study_case_id)
+
     def get_result_set(self, run_id: UUID) -> ResultSet:
         """Get the result set for a run."""
         result_set = self._result_sets.get(run_id)
@@ -1247,6 +1247,7 @@ class NetworkWizardService:
                 connection_node_id=connection_node_id,
                 diagram_id=diagram_id,
                 annotations=annotations,
+                incremental=True,
             )
             payload = rebuilt.to_payload()
             payload["dirty_flag"] = False
@@ -1368,23 +1369,27 @@ class NetworkWizardService:
                 case_id = str(state.get("case_id", "")).strip()
                 if case_id in case_id_map:
                     state["case_id"] = case_id_map[case_id]
+            new_nodes: dict[UUID, dict] = {}
             for node_data in parsed["nodes"]:
                 try:
-                    result = self._upsert_node(uow, project_id, node_data)
+                    result = self._upsert_node(uow, project_id, node_data, new_nodes)
                 except ValueError as exc:
                     errors.append(str(exc))
                     skipped["nodes"] = skipped.get("nodes", 0) + 1
                 else:
                     created, updated = self._bump_counts(result, created, updated, "nodes")
+            uow.network.add_nodes(project_id, new_nodes.values(), commit=False)
 
+            new_branches: dict[UUID, dict] = {}
             for branch_data in parsed["branches"]:
                 try:
-                    result = self._upsert_branch(uow, project_id, branch_data)
+                    result = self._upsert_branch(uow, project_id, branch_data, new_branches)
                 except ValueError as exc:
                     errors.append(str(exc))
                     skipped["branches"] = skipped.get("branches", 0) + 1
                 else:
                     created, updated = self._bump_counts(result, created, updated, "branches")
+            uow.network.add_branches(project_id, new_branches.values(), commit=False)
 
             for case_data in parsed["operating_cases"]:
                 try:
@@ -1533,23 +1538,27 @@ class NetworkWizardService:
             if mode == "replace":
                 uow.network.replace_branches(project_id, [], commit=False)
                 uow.network.replace_nodes(project_id, [], commit=False)
+            new_nodes: dict[UUID, dict] = {}
             for node_data in nodes_payload:
                 try:
-                    result = self._upsert_node(uow, project_id, node_data)
+                    result = self._upsert_node(uow, project_id, node_data, new_nodes)
                 except ValueError as exc:
                     errors.append(str(exc))
                     skipped["nodes"] = skipped.get("nodes", 0) + 1
                 else:
                     created, updated = self._bump_counts(result, created, updated, "nodes")
+            uow.network.add_nodes(project_id, new_nodes.values(), commit=False)
 
+            new_branches: dict[UUID, dict] = {}
             for branch_data in branches_payload:
                 try:
-                    result = self._upsert_branch(uow, project_id, branch_data)
+                    result = self._upsert_branch(uow, project_id, branch_data, new_branches)
                 except ValueError as exc:
                     errors.append(str(exc))
                     skipped["branches"] = skipped.get("branches", 0) + 1
                 else:
                     created, updated = self._bump_counts(result, created, updated, "branches")
+            uow.network.add_branches(project_id, new_branches.values(), commit=False)
             self._mark_sld_dirty(uow, project_id)
             self._invalidate_results(uow, project_id)
 
@@ -2018,7 +2027,14 @@ class NetworkWizardService:
         payload_str = json.dumps(self._canonicalize(payload), sort_keys=True, separators=(",", ":"))
         return uuid5(namespace, payload_str)
 
-    def _upsert_node(self, uow: UnitOfWork, project_id: UUID, node_data: dict) -> str:
+    def _upsert_node(
+        self,
+        uow: UnitOfWork,
+        project_id: UUID,
+        node_data: dict,
+        new_nodes: dict[UUID, dict],
+    ) -> str:
+        """Update an existing node or queue a new one in new_nodes (bulk insert by caller)."""
         if not node_data.get("name"):
             raise ValueError("Node name is required")
         node_id = node_data.get("id")
@@ -2027,7 +2043,6 @@ class NetworkWizardService:
         else:
             node_id = self._deterministic_uuid(project_id, node_data)
         attrs = self._normalize_node_attrs(node_data.get("node_type", ""), node_data.get("attrs") or {})
-        existing = uow.network.get_node(node_id)
         payload = {
             "id": node_id,
             "name": node_data.get("name", ""),
@@ -2035,15 +2050,26 @@ class NetworkWizardService:
             "base_kv": float(node_data.get("base_kv", 0.0)),
             "attrs": attrs,
         }
+        if node_id in new_nodes:
+            new_nodes[node_id] = payload
+            return "updated"
+        existing = uow.network.get_node(node_id)
         if existing is None:
-            uow.network.add_node(project_id, payload, commit=False)
+            new_nodes[node_id] = payload
             return "created"
         if existing["project_id"] != project_id:
             raise ValueError("Node ID belongs to a different project")
         uow.network.update_node(node_id, payload, commit=False)
         return "updated"
 
-    def _upsert_branch(self, uow: UnitOfWork, project_id: UUID, branch_data: dict) -> str:
+    def _upsert_branch(
+        self,
+        uow: UnitOfWork,
+        project_id: UUID,
+        branch_data: dict,
+        new_branches: dict[UUID, dict],
+    ) -> str:
+        """Update an existing branch or queue a new one in new_branches (bulk insert by caller)."""
         if not branch_data.get("name"):
             raise ValueError("Branch name is required")
         if not branch_data.get("from_node_id") or not branch_data.get("to_node_id"):
@@ -2055,7 +2081,6 @@ class NetworkWizardService:
             branch_id = UUID(str(branch_id))
         else:
             branch_id = self._deterministic_uuid(project_id, branch_data)
-        existing = uow.network.get_branch(branch_id)
         payload = {
             "id": branch_id,
             "name": branch_data.get("name", ""),
@@ -2065,8 +2090,12 @@ class NetworkWizardService:
             "in_service": branch_data.get("in_service", True),
             "params": branch_data.get("params") or {},
         }
+        if branch_id in new_branches:
+            new_branches[branch_id] = payload
+            return "updated"
+        existing = uow.network.get_branch(branch_id)
         if existing is None:
-            uow.network.add_branch(project_id, payload, commit=False)
+            new_branches[branch_id] = payload
             return "created"
         if existing["project_id"] != project_id:
             raise ValueError("Branch ID belongs to a different project")
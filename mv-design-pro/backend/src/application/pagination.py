@@ -0,0 +1,154 @@
+"""
+Keyset (cursor) pagination for run, batch and comparison listings.
+
+Listings are ordered newest first by (created_at, id). A page ends with an
+opaque cursor encoding the key of its last item; the next page contains
+items strictly below that key. Unlike offset paging, the cost of a page
+does not grow with its position and concurrent inserts do not shift items
+between pages.
+
+The cursor is URL-safe base64 of the compact JSON [created_at ISO-8601 UTC,
+id]. Clients must treat it as opaque.
+
+Materialized, immutable row sets (result read models) are paged by offset
+instead: rows never move between requests, so an offset cursor is stable.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import heapq
+import json
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+CursorKey = tuple[datetime, str]
+
+
+class InvalidCursorError(ValueError):
+    """Cursor could not be decoded."""
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing; next_cursor is None on the last page."""
+
+    items: tuple[T, ...]
+    next_cursor: str | None
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def encode_cursor(created_at: datetime, item_id: object) -> str:
+    """Opaque cursor for the key (created_at, id)."""
+    raw = json.dumps([_utc(created_at).isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """
+    Key (created_at UTC, id) encoded in a cursor.
+
+    Raises:
+        InvalidCursorError: cursor is not one produced by encode_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return _utc(datetime.fromisoformat(created_at)), str(item_id)
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def keyset_page(
+    items: Iterable[T],
+    *,
+    key: Callable[[T], CursorKey],
+    limit: int,
+    cursor: str | None = None,
+) -> Page[T]:
+    """
+    Page of in-memory items ordered newest first by key.
+
+    Items need not be sorted: only the limit + 1 largest keys strictly below
+    the cursor are selected (heap, no full sort).
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    def sort_key(item: T) -> CursorKey:
+        created_at, item_id = key(item)
+        return _utc(created_at), str(item_id)
+
+    candidates = (
+        item for item in items if after is None or sort_key(item) < after
+    )
+    return page_from_rows(
+        heapq.nlargest(limit + 1, candidates, key=sort_key),
+        key=key,
+        limit=limit,
+    )
+
+
+def page_from_rows(
+    rows: list[T],
+    *,
+    key: Callable[[T], CursorKey],
+    limit: int,
+) -> Page[T]:
+    """
+    Page from up to limit + 1 rows already ordered newest first.
+
+    Repositories fetch one extra row; its presence means another page exists.
+    """
+    items = tuple(rows[:limit])
+    if len(rows) <= limit or not items:
+        return Page(items=items, next_cursor=None)
+    created_at, item_id = key(items[-1])
+    return Page(items=items, next_cursor=encode_cursor(created_at, item_id))
+
+
+def offset_page(items: Sequence[T], *, limit: int, cursor: str | None = None) -> Page[T]:
+    """
+    Page of an immutable, already ordered sequence.
+
+    The cursor encodes the offset of the next page (same opaque base64 form).
+    """
+    start = decode_offset_cursor(cursor) if cursor else 0
+    page_items = tuple(items[start : start + limit])
+    end = start + len(page_items)
+    return Page(
+        items=page_items,
+        next_cursor=encode_offset_cursor(end) if end < len(items) and page_items else None,
+    )
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """Opaque cursor for a row offset."""
+    raw = json.dumps(["offset", offset], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """
+    Row offset encoded in a cursor.
+
+    Raises:
+        InvalidCursorError: cursor is not one produced by encode_offset_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, offset = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+    if kind != "offset" or not isinstance(offset, int) or offset < 0:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return offset
@@ -15,12 +15,13 @@ from __future__ import annotations
 import io
 import json
 import zipfile
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, aliased
 
 from domain.project_archive import (
     ARCHIVE_FORMAT_ID,
@@ -41,13 +42,18 @@ from domain.project_archive import (
     RunsSection,
     SldSection,
     archive_to_dict,
-    canonicalize,
     compute_archive_fingerprints,
     compute_hash,
     dict_to_archive,
     verify_archive_integrity,
 )
 
+from application.project_archive.streaming import (
+    StreamingArchiveReader,
+    StreamingArchiveWriter,
+    is_stream_archive,
+)
+
 if TYPE_CHECKING:
     pass
 
@@ -74,6 +80,17 @@ from infrastructure.persistence.models import (
     StudyRunORM,
     SwitchingStateORM,
 )
+from infrastructure.persistence.bulk import bulk_insert
+from infrastructure.persistence.repositories.analysis_run_repository import (
+    AnalysisRunRepository,
+)
+from infrastructure.persistence.repositories.snapshot_repository import lineage_positions
+
+# Rozmiar strony yield_per przy eksporcie (wiersze lekkie / z dużym JSON)
+_EXPORT_BATCH = 500
+_HEAVY_ROW_BATCH = 16
+# Wiersze na partię executemany przy imporcie wykonań i wyników (duże JSON)
+_RESTORE_BATCH_ROWS = 100
 
 
 class ProjectArchiveService:
@@ -94,7 +111,10 @@ class ProjectArchiveService:
 
     def export_project(self, project_id: UUID) -> bytes:
         """
-        Eksportuj projekt do archiwum ZIP.
+        Eksportuj projekt do archiwum ZIP (układ project.json).
+
+        Całe archiwum budowane w pamięci — dla dużych projektów
+        używaj export_project_stream.
 
         Args:
             project_id: ID projektu do eksportu
@@ -105,10 +125,7 @@ class ProjectArchiveService:
         Raises:
             ArchiveError: gdy projekt nie istnieje lub eksport się nie powiódł
         """
-        # Pobierz projekt
-        project = self._session.get(ProjectORM, project_id)
-        if project is None:
-            raise ArchiveError(f"Projekt o ID {project_id} nie istnieje")
+        project = self._get_project(project_id)
 
         # Zbierz wszystkie dane
         archive = self._collect_project_data(project)
@@ -138,12 +155,48 @@ class ProjectArchiveService:
 
         return zip_buffer.getvalue()
 
-    def _collect_project_data(self, project: ProjectORM) -> ProjectArchive:
-        """Zbierz wszystkie dane projektu."""
-        project_id = project.id
+    def build_archive(self, project_id: UUID) -> ProjectArchive:
+        """
+        Pełne archiwum projektu jako obiekt domenowy (bez serializacji ZIP).
 
-        # Metadane projektu (bez exported_at - dla determinizmu)
-        project_meta_dict = {
+        Używane przez eksport przyrostowy i kopie chunkowane.
+
+        Raises:
+            ArchiveError: gdy projekt nie istnieje
+        """
+        return self._collect_project_data(self._get_project(project_id))
+
+    def export_project_stream(self, project_id: UUID, fileobj: IO[bytes]) -> ArchiveFingerprints:
+        """
+        Eksportuj projekt strumieniowo (układ stream-v1) do obiektu plikowego.
+
+        Wiersze stronicowane z bazy (yield_per) i zapisywane od razu jako
+        osobne człony ZIP; hashe sekcji liczone przyrostowo. Fingerprints
+        identyczne z export_project.
+
+        Raises:
+            ArchiveError: gdy projekt nie istnieje
+        """
+        project = self._get_project(project_id)
+
+        with StreamingArchiveWriter(fileobj) as writer:
+            writer.write_project_meta(self._project_meta_dict(project))
+            for section_name, entries in self._section_entries(project.id).items():
+                writer.write_section(section_name, entries)
+            return writer.finish(
+                project_name=project.name,
+                exported_at=datetime.now(timezone.utc).isoformat(),
+            )
+
+    def _get_project(self, project_id: UUID) -> ProjectORM:
+        project = self._session.get(ProjectORM, project_id)
+        if project is None:
+            raise ArchiveError(f"Projekt o ID {project_id} nie istnieje")
+        return project
+
+    def _project_meta_dict(self, project: ProjectORM) -> dict[str, Any]:
+        """Metadane projektu (bez exported_at - dla determinizmu)."""
+        return {
             "id": str(project.id),
             "name": project.name,
             "description": project.description,
@@ -155,29 +208,40 @@ class ProjectArchiveService:
             "updated_at": project.updated_at.isoformat(),
         }
 
-        # Model sieci
-        network_model_dict = self._collect_network_model(project_id)
-
-        # SLD
-        sld_dict = self._collect_sld(project_id)
-
-        # Cases
-        cases_dict = self._collect_cases(project_id)
-
-        # Runs
-        runs_dict = self._collect_runs(project_id)
-
-        # Results
-        results_dict = self._collect_results(project_id)
-
-        # Proofs
-        proofs_dict = self._collect_proofs(project_id)
+    def _section_entries(self, project_id: UUID) -> dict[str, dict[str, Any]]:
+        """
+        Sekcje archiwum jako leniwe iteratory wierszy.
 
-        # Interpretations (placeholder)
-        interpretations_dict: dict[str, Any] = {"cached": []}
+        Zapytania wykonywane dopiero przy iteracji, po kolei.
+        """
+        return {
+            "network_model": self._network_model_rows(project_id),
+            "sld_diagrams": self._sld_rows(project_id),
+            "cases": self._cases_rows(project_id),
+            "runs": self._runs_rows(project_id),
+            "results": self._results_rows(project_id),
+            "proofs": self._proofs_rows(project_id),
+            # Interpretations (placeholder)
+            "interpretations": {"cached": iter(())},
+            # Issues (placeholder - generowane dynamicznie)
+            "issues": {"snapshot": iter(())},
+        }
 
-        # Issues (placeholder - generowane dynamicznie)
-        issues_dict: dict[str, Any] = {"snapshot": []}
+    def _collect_project_data(self, project: ProjectORM) -> ProjectArchive:
+        """Zbierz wszystkie dane projektu."""
+        project_meta_dict = self._project_meta_dict(project)
+        sections = {
+            name: _materialize(entries)
+            for name, entries in self._section_entries(project.id).items()
+        }
+        network_model_dict = sections["network_model"]
+        sld_dict = sections["sld_diagrams"]
+        cases_dict = sections["cases"]
+        runs_dict = sections["runs"]
+        results_dict = sections["results"]
+        proofs_dict = sections["proofs"]
+        interpretations_dict = sections["interpretations"]
+        issues_dict = sections["issues"]
 
         # Oblicz fingerprints
         fingerprints = compute_archive_fingerprints(
@@ -196,17 +260,7 @@ class ProjectArchiveService:
         return ProjectArchive(
             schema_version=ARCHIVE_SCHEMA_VERSION,
             format_id=ARCHIVE_FORMAT_ID,
-            project_meta=ProjectMeta(
-                id=str(project.id),
-                name=project.name,
-                description=project.description,
-                schema_version=project.schema_version,
-                active_network_snapshot_id=project.active_network_snapshot_id,
-                connection_node_id=str(project.connection_node_id) if project.connection_node_id else None,
-                sources=project.sources_jsonb,
-                created_at=project.created_at.isoformat(),
-                updated_at=project.updated_at.isoformat(),
-            ),
+            project_meta=ProjectMeta(**project_meta_dict),
             network_model=NetworkModelSection(
                 nodes=network_model_dict["nodes"],
                 branches=network_model_dict["branches"],
@@ -248,142 +302,135 @@ class ProjectArchiveService:
             fingerprints=fingerprints,
         )
 
-    def _collect_network_model(self, project_id: UUID) -> dict[str, Any]:
-        """Zbierz model sieci."""
-        # Nodes - sortowane po ID dla determinizmu
+    def _stream(self, stmt: Select[Any], batch: int = _EXPORT_BATCH) -> Iterator[Any]:
+        """
+        Wiersze ORM stronicowane z bazy (yield_per).
+
+        Generator — zapytanie wykonywane dopiero przy pierwszej iteracji.
+        """
+        yield from self._session.execute(stmt.execution_options(yield_per=batch)).scalars()
+
+    def _network_model_rows(self, project_id: UUID) -> dict[str, Iterator[dict[str, Any]]]:
+        """Model sieci — węzły, gałęzie, źródła, odbiory, snapshoty."""
+        # Wszystko sortowane po ID dla determinizmu
         nodes_query = (
             select(NetworkNodeORM)
             .where(NetworkNodeORM.project_id == project_id)
             .order_by(NetworkNodeORM.id)
         )
-        nodes = self._session.execute(nodes_query).scalars().all()
-        nodes_data = [
-            {
-                "id": str(n.id),
-                "name": n.name,
-                "node_type": n.node_type,
-                "base_kv": n.base_kv,
-                "attrs_jsonb": n.attrs_jsonb,
-            }
-            for n in nodes
-        ]
-
-        # Branches
         branches_query = (
             select(NetworkBranchORM)
             .where(NetworkBranchORM.project_id == project_id)
             .order_by(NetworkBranchORM.id)
         )
-        branches = self._session.execute(branches_query).scalars().all()
-        branches_data = [
-            {
-                "id": str(b.id),
-                "name": b.name,
-                "branch_type": b.branch_type,
-                "from_node_id": str(b.from_node_id),
-                "to_node_id": str(b.to_node_id),
-                "in_service": b.in_service,
-                "params_jsonb": b.params_jsonb,
-            }
-            for b in branches
-        ]
-
-        # Sources
         sources_query = (
             select(NetworkSourceORM)
             .where(NetworkSourceORM.project_id == project_id)
             .order_by(NetworkSourceORM.id)
         )
-        sources = self._session.execute(sources_query).scalars().all()
-        sources_data = [
-            {
-                "id": str(s.id),
-                "node_id": str(s.node_id),
-                "source_type": s.source_type,
-                "payload_jsonb": s.payload_jsonb,
-                "in_service": s.in_service,
-            }
-            for s in sources
-        ]
-
-        # Loads
         loads_query = (
             select(NetworkLoadORM)
             .where(NetworkLoadORM.project_id == project_id)
             .order_by(NetworkLoadORM.id)
         )
-        loads = self._session.execute(loads_query).scalars().all()
-        loads_data = [
-            {
-                "id": str(lo.id),
-                "node_id": str(lo.node_id),
-                "payload_jsonb": lo.payload_jsonb,
-                "in_service": lo.in_service,
-            }
-            for lo in loads
-        ]
-
-        # Snapshots
-        snapshots_query = select(NetworkSnapshotORM).order_by(
-            NetworkSnapshotORM.created_at
+        # Snapshoty należące do tego projektu (network_model_id)
+        snapshots_query = (
+            select(NetworkSnapshotORM)
+            .where(NetworkSnapshotORM.network_model_id == str(project_id))
+            .order_by(NetworkSnapshotORM.created_at)
         )
-        snapshots = self._session.execute(snapshots_query).scalars().all()
-        # Filtruj snapshoty należące do tego projektu (sprawdzając network_model_id)
-        snapshots_data = [
-            {
-                "snapshot_id": s.snapshot_id,
-                "parent_snapshot_id": s.parent_snapshot_id,
-                "created_at": s.created_at.isoformat(),
-                "schema_version": s.schema_version,
-                "network_model_id": s.network_model_id,
-                "fingerprint": s.fingerprint,
-                "snapshot_json": s.snapshot_json,
-            }
-            for s in snapshots
-            if s.network_model_id == str(project_id)
-        ]
-
         return {
-            "nodes": nodes_data,
-            "branches": branches_data,
-            "sources": sources_data,
-            "loads": loads_data,
-            "snapshots": snapshots_data,
+            "nodes": (
+                {
+                    "id": str(n.id),
+                    "name": n.name,
+                    "node_type": n.node_type,
+                    "base_kv": n.base_kv,
+                    "attrs_jsonb": n.attrs_jsonb,
+                }
+                for n in self._stream(nodes_query)
+            ),
+            "branches": (
+                {
+                    "id": str(b.id),
+                    "name": b.name,
+                    "branch_type": b.branch_type,
+                    "from_node_id": str(b.from_node_id),
+                    "to_node_id": str(b.to_node_id),
+                    "in_service": b.in_service,
+                    "params_jsonb": b.params_jsonb,
+                }
+                for b in self._stream(branches_query)
+            ),
+            "sources": (
+                {
+                    "id": str(s.id),
+                    "node_id": str(s.node_id),
+                    "source_type": s.source_type,
+                    "payload_jsonb": s.payload_jsonb,
+                    "in_service": s.in_service,
+                }
+                for s in self._stream(sources_query)
+            ),
+            "loads": (
+                {
+                    "id": str(lo.id),
+                    "node_id": str(lo.node_id),
+                    "payload_jsonb": lo.payload_jsonb,
+                    "in_service": lo.in_service,
+                }
+                for lo in self._stream(loads_query)
+            ),
+            "snapshots": (
+                {
+                    "snapshot_id": s.snapshot_id,
+                    "parent_snapshot_id": s.parent_snapshot_id,
+                    "created_at": s.created_at.isoformat(),
+                    "schema_version": s.schema_version,
+                    "network_model_id": s.network_model_id,
+                    "fingerprint": s.fingerprint,
+                    "snapshot_json": s.snapshot_json,
+                }
+                for s in self._stream(snapshots_query, _HEAVY_ROW_BATCH)
+            ),
         }
 
-    def _collect_sld(self, project_id: UUID) -> dict[str, Any]:
-        """Zbierz diagramy SLD."""
-        # Diagrams
+    def _sld_rows(self, project_id: UUID) -> dict[str, Iterator[dict[str, Any]]]:
+        """Diagramy SLD i ich symbole."""
+        diagram_ids = select(SldDiagramORM.id).where(SldDiagramORM.project_id == project_id)
         diagrams_query = (
             select(SldDiagramORM)
             .where(SldDiagramORM.project_id == project_id)
             .order_by(SldDiagramORM.id)
         )
-        diagrams = self._session.execute(diagrams_query).scalars().all()
-        diagrams_data = [
-            {
-                "id": str(d.id),
-                "name": d.name,
-                "sld_jsonb": d.sld_jsonb,
-                "dirty_flag": d.dirty_flag,
-                "created_at": d.created_at.isoformat(),
-                "updated_at": d.updated_at.isoformat(),
-            }
-            for d in diagrams
-        ]
-
-        diagram_ids = [d.id for d in diagrams]
-
-        # Node symbols
-        node_symbols_data = []
-        if diagram_ids:
-            node_symbols_query = (
-                select(SldNodeSymbolORM)
-                .where(SldNodeSymbolORM.diagram_id.in_(diagram_ids))
-                .order_by(SldNodeSymbolORM.id)
-            )
-            node_symbols = self._session.execute(node_symbols_query).scalars().all()
-            node_symbols_data = [
+        node_symbols_query = (
+            select(SldNodeSymbolORM)
+            .where(SldNodeSymbolORM.diagram_id.in_(diagram_ids))
+            .order_by(SldNodeSymbolORM.id)
+        )
+        branch_symbols_query = (
+            select(SldBranchSymbolORM)
+            .where(SldBranchSymbolORM.diagram_id.in_(diagram_ids))
+            .order_by(SldBranchSymbolORM.id)
+        )
+        annotations_query = (
+            select(SldAnnotationORM)
+            .where(SldAnnotationORM.diagram_id.in_(diagram_ids))
+            .order_by(SldAnnotationORM.id)
+        )
+        return {
+            "diagrams": (
+                {
+                    "id": str(d.id),
+                    "name": d.name,
+                    "sld_jsonb": d.sld_jsonb,
+                    "dirty_flag": d.dirty_flag,
+                    "created_at": d.created_at.isoformat(),
+                    "updated_at": d.updated_at.isoformat(),
+                }
+                for d in self._stream(diagrams_query, _HEAVY_ROW_BATCH)
+            ),
+            "node_symbols": (
                 {
                     "id": str(ns.id),
                     "diagram_id": str(ns.diagram_id),
@@ -393,19 +440,9 @@ class ProjectArchiveService:
                     "label": ns.label,
                     "is_connection_node": ns.is_connection_node,
                 }
-                for ns in node_symbols
-            ]
-
-        # Branch symbols
-        branch_symbols_data = []
-        if diagram_ids:
-            branch_symbols_query = (
-                select(SldBranchSymbolORM)
-                .where(SldBranchSymbolORM.diagram_id.in_(diagram_ids))
-                .order_by(SldBranchSymbolORM.id)
-            )
-            branch_symbols = self._session.execute(branch_symbols_query).scalars().all()
-            branch_symbols_data = [
+                for ns in self._stream(node_symbols_query)
+            ),
+            "branch_symbols": (
                 {
                     "id": str(bs.id),
                     "diagram_id": str(bs.diagram_id),
@@ -414,19 +451,9 @@ class ProjectArchiveService:
                     "to_node_id": str(bs.to_node_id),
                     "points_jsonb": bs.points_jsonb,
                 }
-                for bs in branch_symbols
-            ]
-
-        # Annotations
-        annotations_data = []
-        if diagram_ids:
-            annotations_query = (
-                select(SldAnnotationORM)
-                .where(SldAnnotationORM.diagram_id.in_(diagram_ids))
-                .order_by(SldAnnotationORM.id)
-            )
-            annotations = self._session.execute(annotations_query).scalars().all()
-            annotations_data = [
+                for bs in self._stream(branch_symbols_query)
+            ),
+            "annotations": (
                 {
                     "id": str(a.id),
                     "diagram_id": str(a.diagram_id),
@@ -434,82 +461,31 @@ class ProjectArchiveService:
                     "x": a.x,
                     "y": a.y,
                 }
-                for a in annotations
-            ]
-
-        return {
-            "diagrams": diagrams_data,
-            "node_symbols": node_symbols_data,
-            "branch_symbols": branch_symbols_data,
-            "annotations": annotations_data,
+                for a in self._stream(annotations_query)
+            ),
         }
 
-    def _collect_cases(self, project_id: UUID) -> dict[str, Any]:
-        """Zbierz przypadki obliczeniowe."""
-        # Study cases
+    def _cases_rows(self, project_id: UUID) -> dict[str, Any]:
+        """Przypadki obliczeniowe, stany łączników i ustawienia projektu."""
         study_cases_query = (
             select(StudyCaseORM)
             .where(StudyCaseORM.project_id == project_id)
             .order_by(StudyCaseORM.id)
         )
-        study_cases = self._session.execute(study_cases_query).scalars().all()
-        study_cases_data = [
-            {
-                "id": str(sc.id),
-                "name": sc.name,
-                "description": sc.description,
-                "network_snapshot_id": sc.network_snapshot_id,
-                "study_jsonb": sc.study_jsonb,
-                "is_active": sc.is_active,
-                "result_status": sc.result_status,
-                "result_refs_jsonb": sc.result_refs_jsonb,
-                "revision": sc.revision,
-                "created_at": sc.created_at.isoformat(),
-                "updated_at": sc.updated_at.isoformat(),
-            }
-            for sc in study_cases
-        ]
-
-        # Operating cases
         operating_cases_query = (
             select(OperatingCaseORM)
             .where(OperatingCaseORM.project_id == project_id)
             .order_by(OperatingCaseORM.id)
         )
-        operating_cases = self._session.execute(operating_cases_query).scalars().all()
-        operating_cases_data = [
-            {
-                "id": str(oc.id),
-                "name": oc.name,
-                "case_jsonb": oc.case_jsonb,
-                "project_design_mode": oc.project_design_mode,
-                "created_at": oc.created_at.isoformat(),
-                "updated_at": oc.updated_at.isoformat(),
-            }
-            for oc in operating_cases
-        ]
-
-        operating_case_ids = [oc.id for oc in operating_cases]
-
-        # Switching states
-        switching_states_data = []
-        if operating_case_ids:
-            switching_states_query = (
-                select(SwitchingStateORM)
-                .where(SwitchingStateORM.case_id.in_(operating_case_ids))
-                .order_by(SwitchingStateORM.id)
+        switching_states_query = (
+            select(SwitchingStateORM)
+            .where(
+                SwitchingStateORM.case_id.in_(
+                    select(OperatingCaseORM.id).where(OperatingCaseORM.project_id == project_id)
+                )
             )
-            switching_states = self._session.execute(switching_states_query).scalars().all()
-            switching_states_data = [
-                {
-                    "id": str(ss.id),
-                    "case_id": str(ss.case_id),
-                    "element_id": str(ss.element_id),
-                    "element_type": ss.element_type,
-                    "in_service": ss.in_service,
-                }
-                for ss in switching_states
-            ]
+            .order_by(SwitchingStateORM.id)
+        )
 
         # Project settings
         settings_orm = self._session.get(ProjectSettingsORM, project_id)
@@ -523,141 +499,177 @@ class ProjectArchiveService:
             }
 
         return {
-            "study_cases": study_cases_data,
-            "operating_cases": operating_cases_data,
-            "switching_states": switching_states_data,
+            "study_cases": (
+                {
+                    "id": str(sc.id),
+                    "name": sc.name,
+                    "description": sc.description,
+                    "network_snapshot_id": sc.network_snapshot_id,
+                    "study_jsonb": sc.study_jsonb,
+                    "is_active": sc.is_active,
+                    "result_status": sc.result_status,
+                    "result_refs_jsonb": sc.result_refs_jsonb,
+                    "revision": sc.revision,
+                    "created_at": sc.created_at.isoformat(),
+                    "updated_at": sc.updated_at.isoformat(),
+                }
+                for sc in self._stream(study_cases_query)
+            ),
+            "operating_cases": (
+                {
+                    "id": str(oc.id),
+                    "name": oc.name,
+                    "case_jsonb": oc.case_jsonb,
+                    "project_design_mode": oc.project_design_mode,
+                    "created_at": oc.created_at.isoformat(),
+                    "updated_at": oc.updated_at.isoformat(),
+                }
+                for oc in self._stream(operating_cases_query)
+            ),
+            "switching_states": (
+                {
+                    "id": str(ss.id),
+                    "case_id": str(ss.case_id),
+                    "element_id": str(ss.element_id),
+                    "element_type": ss.element_type,
+                    "in_service": ss.in_service,
+                }
+                for ss in self._stream(switching_states_query)
+            ),
             "settings": settings_data,
         }
 
-    def _collect_runs(self, project_id: UUID) -> dict[str, Any]:
-        """Zbierz wykonania analiz."""
-        # Analysis runs
+    def _runs_rows(self, project_id: UUID) -> dict[str, Iterator[dict[str, Any]]]:
+        """Wykonania analiz (z payloadami z analysis_run_blobs), indeks i study runs."""
+        study_runs_query = (
+            select(StudyRunORM)
+            .where(StudyRunORM.project_id == project_id)
+            .order_by(StudyRunORM.started_at)
+        )
+        return {
+            "analysis_runs": self._iter_analysis_runs(project_id),
+            "analysis_runs_index": self._iter_analysis_runs_index(project_id),
+            "study_runs": (
+                {
+                    "id": str(sr.id),
+                    "case_id": str(sr.case_id),
+                    "analysis_type": sr.analysis_type,
+                    "input_hash": sr.input_hash,
+                    "network_snapshot_id": sr.network_snapshot_id,
+                    "solver_version_hash": sr.solver_version_hash,
+                    "result_state": sr.result_state,
+                    "status": sr.status,
+                    "started_at": sr.started_at.isoformat(),
+                    "finished_at": sr.finished_at.isoformat() if sr.finished_at else None,
+                }
+                for sr in self._stream(study_runs_query)
+            ),
+        }
+
+    def _iter_analysis_runs(self, project_id: UUID) -> Iterator[dict[str, Any]]:
+        """Wykonania analiz; payloady dociągane jednym zapytaniem na paczkę."""
+        runs = AnalysisRunRepository(self._session)
         analysis_runs_query = (
             select(AnalysisRunORM)
             .where(AnalysisRunORM.project_id == project_id)
             .order_by(AnalysisRunORM.created_at)
         )
-        analysis_runs = self._session.execute(analysis_runs_query).scalars().all()
-        analysis_runs_data = [
-            {
-                "id": str(ar.id),
-                "operating_case_id": str(ar.operating_case_id),
-                "analysis_type": ar.analysis_type,
-                "status": ar.status,
-                "result_status": ar.result_status,
-                "created_at": ar.created_at.isoformat(),
-                "started_at": ar.started_at.isoformat() if ar.started_at else None,
-                "finished_at": ar.finished_at.isoformat() if ar.finished_at else None,
-                "input_snapshot": ar.input_snapshot,
-                "input_hash": ar.input_hash,
-                "result_summary": ar.result_summary,
-                "trace_json": ar.trace_json,
-                "white_box_trace": ar.white_box_trace,
-                "error_message": ar.error_message,
-            }
-            for ar in analysis_runs
-        ]
-
-        # Analysis runs index
-        run_ids = [str(ar.id) for ar in analysis_runs]
-        analysis_runs_index_data = []
-        if run_ids:
-            index_query = (
-                select(AnalysisRunIndexORM)
-                .where(AnalysisRunIndexORM.run_id.in_(run_ids))
-                .order_by(AnalysisRunIndexORM.created_at_utc)
-            )
-            index_entries = self._session.execute(index_query).scalars().all()
-            analysis_runs_index_data = [
-                {
-                    "run_id": ie.run_id,
-                    "analysis_type": ie.analysis_type,
-                    "case_id": ie.case_id,
-                    "base_snapshot_id": ie.base_snapshot_id,
-                    "primary_artifact_type": ie.primary_artifact_type,
-                    "primary_artifact_id": ie.primary_artifact_id,
-                    "fingerprint": ie.fingerprint,
-                    "created_at_utc": ie.created_at_utc.isoformat(),
-                    "status": ie.status,
-                    "meta_json": ie.meta_json,
+        result = self._session.execute(
+            analysis_runs_query.execution_options(yield_per=_HEAVY_ROW_BATCH)
+        )
+        for batch in result.scalars().partitions():
+            payloads = runs.load_payloads(batch)
+            for ar in batch:
+                yield {
+                    "id": str(ar.id),
+                    "operating_case_id": str(ar.operating_case_id),
+                    "analysis_type": ar.analysis_type,
+                    "status": ar.status,
+                    "result_status": ar.result_status,
+                    "created_at": ar.created_at.isoformat(),
+                    "started_at": ar.started_at.isoformat() if ar.started_at else None,
+                    "finished_at": ar.finished_at.isoformat() if ar.finished_at else None,
+                    "input_snapshot": payloads.get(ar.input_snapshot_ref, {}),
+                    "input_hash": ar.input_hash,
+                    "result_summary": payloads.get(ar.result_summary_ref, {}),
+                    "trace_json": payloads.get(ar.trace_json_ref),
+                    "white_box_trace": payloads.get(ar.white_box_trace_ref),
+                    "error_message": ar.error_message,
                 }
-                for ie in index_entries
-            ]
 
-        # Study runs
-        study_runs_query = (
-            select(StudyRunORM)
-            .where(StudyRunORM.project_id == project_id)
-            .order_by(StudyRunORM.started_at)
+    def _iter_analysis_runs_index(self, project_id: UUID) -> Iterator[dict[str, Any]]:
+        # run_id w indeksie jest tekstem — porównujemy z tekstowymi ID wykonań
+        run_ids = [
+            str(run_id)
+            for run_id in self._session.execute(
+                select(AnalysisRunORM.id).where(AnalysisRunORM.project_id == project_id)
+            ).scalars()
+        ]
+        if not run_ids:
+            return
+        index_query = (
+            select(AnalysisRunIndexORM)
+            .where(AnalysisRunIndexORM.run_id.in_(run_ids))
+            .order_by(AnalysisRunIndexORM.created_at_utc)
         )
-        study_runs = self._session.execute(study_runs_query).scalars().all()
-        study_runs_data = [
-            {
-                "id": str(sr.id),
-                "case_id": str(sr.case_id),
-                "analysis_type": sr.analysis_type,
-                "input_hash": sr.input_hash,
-                "network_snapshot_id": sr.network_snapshot_id,
-                "solver_version_hash": sr.solver_version_hash,
-                "result_state": sr.result_state,
-                "status": sr.status,
-                "started_at": sr.started_at.isoformat(),
-                "finished_at": sr.finished_at.isoformat() if sr.finished_at else None,
+        for ie in self._stream(index_query):
+            yield {
+                "run_id": ie.run_id,
+                "analysis_type": ie.analysis_type,
+                "case_id": ie.case_id,
+                "base_snapshot_id": ie.base_snapshot_id,
+                "primary_artifact_type": ie.primary_artifact_type,
+                "primary_artifact_id": ie.primary_artifact_id,
+                "fingerprint": ie.fingerprint,
+                "created_at_utc": ie.created_at_utc.isoformat(),
+                "status": ie.status,
+                "meta_json": ie.meta_json,
             }
-            for sr in study_runs
-        ]
 
-        return {
-            "analysis_runs": analysis_runs_data,
-            "analysis_runs_index": analysis_runs_index_data,
-            "study_runs": study_runs_data,
-        }
+    def _results_rows(self, project_id: UUID) -> dict[str, Iterator[dict[str, Any]]]:
+        return {"study_results": self._iter_study_results(project_id)}
 
-    def _collect_results(self, project_id: UUID) -> dict[str, Any]:
-        """Zbierz wyniki."""
+    def _iter_study_results(self, project_id: UUID) -> Iterator[dict[str, Any]]:
+        """Wyniki; wiersze-referencje (source_result_id) eksportowane z payloadem źródła."""
+        source = aliased(StudyResultORM)
         results_query = (
-            select(StudyResultORM)
+            select(StudyResultORM, source.result_jsonb)
+            .outerjoin(source, source.id == StudyResultORM.source_result_id)
             .where(StudyResultORM.project_id == project_id)
             .order_by(StudyResultORM.created_at)
+            .execution_options(yield_per=_HEAVY_ROW_BATCH)
         )
-        results = self._session.execute(results_query).scalars().all()
-        results_data = [
-            {
+        for r, source_payload in self._session.execute(results_query):
+            yield {
                 "id": str(r.id),
                 "run_id": str(r.run_id),
                 "result_type": r.result_type,
-                "result_jsonb": r.result_jsonb,
+                "result_jsonb": r.result_jsonb if r.source_result_id is None else source_payload,
                 "created_at": r.created_at.isoformat(),
             }
-            for r in results
-        ]
-
-        return {"study_results": results_data}
 
-    def _collect_proofs(self, project_id: UUID) -> dict[str, Any]:
-        """Zbierz dowody (design specs, proposals, evidence)."""
-        # Najpierw pobierz operating case IDs dla tego projektu
-        operating_cases_query = select(OperatingCaseORM.id).where(
+    def _proofs_rows(self, project_id: UUID) -> dict[str, Iterator[dict[str, Any]]]:
+        """Dowody (design specs, proposals, evidence) przypadków projektu."""
+        operating_case_ids = select(OperatingCaseORM.id).where(
             OperatingCaseORM.project_id == project_id
         )
-        operating_case_ids = [
-            row[0]
-            for row in self._session.execute(operating_cases_query).all()
-        ]
-
-        design_specs_data = []
-        design_proposals_data = []
-        design_evidence_data = []
-
-        if operating_case_ids:
-            # Design specs
-            specs_query = (
-                select(DesignSpecORM)
-                .where(DesignSpecORM.case_id.in_(operating_case_ids))
-                .order_by(DesignSpecORM.created_at)
-            )
-            specs = self._session.execute(specs_query).scalars().all()
-            design_specs_data = [
+        specs_query = (
+            select(DesignSpecORM)
+            .where(DesignSpecORM.case_id.in_(operating_case_ids))
+            .order_by(DesignSpecORM.created_at)
+        )
+        proposals_query = (
+            select(DesignProposalORM)
+            .where(DesignProposalORM.case_id.in_(operating_case_ids))
+            .order_by(DesignProposalORM.created_at)
+        )
+        evidence_query = (
+            select(DesignEvidenceORM)
+            .where(DesignEvidenceORM.case_id.in_(operating_case_ids))
+            .order_by(DesignEvidenceORM.created_at)
+        )
+        return {
+            "design_specs": (
                 {
                     "id": str(s.id),
                     "case_id": str(s.case_id),
@@ -666,17 +678,9 @@ class ProjectArchiveService:
                     "created_at": s.created_at.isoformat(),
                     "updated_at": s.updated_at.isoformat(),
                 }
-                for s in specs
-            ]
-
-            # Design proposals
-            proposals_query = (
-                select(DesignProposalORM)
-                .where(DesignProposalORM.case_id.in_(operating_case_ids))
-                .order_by(DesignProposalORM.created_at)
-            )
-            proposals = self._session.execute(proposals_query).scalars().all()
-            design_proposals_data = [
+                for s in self._stream(specs_query, _HEAVY_ROW_BATCH)
+            ),
+            "design_proposals": (
                 {
                     "id": str(p.id),
                     "case_id": str(p.case_id),
@@ -686,17 +690,9 @@ class ProjectArchiveService:
                     "created_at": p.created_at.isoformat(),
                     "updated_at": p.updated_at.isoformat(),
                 }
-                for p in proposals
-            ]
-
-            # Design evidence
-            evidence_query = (
-                select(DesignEvidenceORM)
-                .where(DesignEvidenceORM.case_id.in_(operating_case_ids))
-                .order_by(DesignEvidenceORM.created_at)
-            )
-            evidence = self._session.execute(evidence_query).scalars().all()
-            design_evidence_data = [
+                for p in self._stream(proposals_query, _HEAVY_ROW_BATCH)
+            ),
+            "design_evidence": (
                 {
                     "id": str(e.id),
                     "case_id": str(e.case_id),
@@ -704,13 +700,8 @@ class ProjectArchiveService:
                     "evidence_json": e.evidence_json,
                     "created_at": e.created_at.isoformat(),
                 }
-                for e in evidence
-            ]
-
-        return {
-            "design_specs": design_specs_data,
-            "design_proposals": design_proposals_data,
-            "design_evidence": design_evidence_data,
+                for e in self._stream(evidence_query, _HEAVY_ROW_BATCH)
+            ),
         }
 
     # ========================================================================
@@ -734,13 +725,39 @@ class ProjectArchiveService:
         Returns:
             Wynik importu z informacjami o statusie
         """
-        warnings: list[str] = []
-        errors: list[str] = []
+        return self.import_project_stream(
+            io.BytesIO(archive_bytes),
+            new_project_name=new_project_name,
+            verify_integrity=verify_integrity,
+        )
 
+    def import_project_stream(
+        self,
+        fileobj: IO[bytes],
+        new_project_name: str | None = None,
+        verify_integrity: bool = True,
+    ) -> ArchiveImportResult:
+        """
+        Importuj projekt z archiwum ZIP w obiekcie plikowym (przewijalnym).
+
+        Obsługuje oba układy: project.json (całość w pamięci) oraz stream-v1
+        (wiersze czytane po jednym: pierwsze przejście weryfikuje hashe,
+        drugie zapisuje do bazy).
+        """
         try:
-            # Rozpakuj ZIP
-            zip_buffer = io.BytesIO(archive_bytes)
-            with zipfile.ZipFile(zip_buffer, "r") as zf:
+            with zipfile.ZipFile(fileobj, "r") as zf:
+                if is_stream_archive(zf):
+                    reader = StreamingArchiveReader(zf)
+                    if verify_integrity:
+                        integrity_errors = reader.verify_integrity()
+                        if integrity_errors:
+                            return ArchiveImportResult(
+                                status=ArchiveImportStatus.FAILED,
+                                project_id=None,
+                                errors=integrity_errors,
+                            )
+                    return self._import_archive(reader.to_archive(), new_project_name)
+
                 if "project.json" not in zf.namelist():
                     return ArchiveImportResult(
                         status=ArchiveImportStatus.FAILED,
@@ -754,51 +771,7 @@ class ProjectArchiveService:
             archive_dict = json.loads(project_json)
             archive = dict_to_archive(archive_dict)
 
-            # Weryfikacja integralności
-            if verify_integrity:
-                integrity_errors = verify_archive_integrity(archive)
-                if integrity_errors:
-                    return ArchiveImportResult(
-                        status=ArchiveImportStatus.FAILED,
-                        project_id=None,
-                        errors=integrity_errors,
-                    )
-
-            # Sprawdź wersję (dla ostrzeżeń o migracji)
-            migrated_from = None
-            if archive.schema_version != ARCHIVE_SCHEMA_VERSION:
-                migrated_from = archive.schema_version
-                warnings.append(
-                    f"Zmigrowano z wersji {archive.schema_version} do {ARCHIVE_SCHEMA_VERSION}"
-                )
-
-            # Zapisz do bazy danych
-            project_id = self._restore_project(archive, new_project_name)
-
-            # Bramka katalogowa po imporcie — sprawdz elementy bez catalog_ref
-            elements_no_catalog = _find_elements_without_catalog(archive)
-            catalog_mapping_needed = len(elements_no_catalog) > 0
-
-            if catalog_mapping_needed:
-                warnings.append(
-                    f"Import wymaga mapowania katalogowego: "
-                    f"{len(elements_no_catalog)} element(ów) bez katalogu"
-                )
-
-            final_status = (
-                ArchiveImportStatus.CATALOG_MAPPING_REQUIRED
-                if catalog_mapping_needed
-                else ArchiveImportStatus.SUCCESS
-            )
-
-            return ArchiveImportResult(
-                status=final_status,
-                project_id=str(project_id),
-                warnings=warnings,
-                migrated_from_version=migrated_from,
-                elements_without_catalog=elements_no_catalog,
-                catalog_mapping_required=catalog_mapping_needed,
-            )
+            return self.import_archive(archive, new_project_name, verify_integrity)
 
         except ArchiveError as e:
             return ArchiveImportResult(
@@ -819,6 +792,70 @@ class ProjectArchiveService:
                 errors=["Nieprawidłowy format archiwum ZIP"],
             )
 
+    def import_archive(
+        self,
+        archive: ProjectArchive,
+        new_project_name: str | None = None,
+        verify_integrity: bool = True,
+    ) -> ArchiveImportResult:
+        """
+        Importuj archiwum już zdeserializowane (np. złożone z chunków).
+
+        Returns:
+            Wynik importu z informacjami o statusie
+        """
+        if verify_integrity:
+            integrity_errors = verify_archive_integrity(archive)
+            if integrity_errors:
+                return ArchiveImportResult(
+                    status=ArchiveImportStatus.FAILED,
+                    project_id=None,
+                    errors=integrity_errors,
+                )
+        return self._import_archive(archive, new_project_name)
+
+    def _import_archive(
+        self, archive: ProjectArchive, new_project_name: str | None
+    ) -> ArchiveImportResult:
+        """Zapis zweryfikowanego archiwum do bazy i bramka katalogowa."""
+        warnings: list[str] = []
+
+        # Sprawdź wersję (dla ostrzeżeń o migracji)
+        migrated_from = None
+        if archive.schema_version != ARCHIVE_SCHEMA_VERSION:
+            migrated_from = archive.schema_version
+            warnings.append(
+                f"Zmigrowano z wersji {archive.schema_version} do {ARCHIVE_SCHEMA_VERSION}"
+            )
+
+        # Zapisz do bazy danych
+        project_id = self._restore_project(archive, new_project_name)
+
+        # Bramka katalogowa po imporcie — sprawdz elementy bez catalog_ref
+        elements_no_catalog = _find_elements_without_catalog(archive)
+        catalog_mapping_needed = len(elements_no_catalog) > 0
+
+        if catalog_mapping_needed:
+            warnings.append(
+                f"Import wymaga mapowania katalogowego: "
+                f"{len(elements_no_catalog)} element(ów) bez katalogu"
+            )
+
+        final_status = (
+            ArchiveImportStatus.CATALOG_MAPPING_REQUIRED
+            if catalog_mapping_needed
+            else ArchiveImportStatus.SUCCESS
+        )
+
+        return ArchiveImportResult(
+            status=final_status,
+            project_id=str(project_id),
+            warnings=warnings,
+            migrated_from_version=migrated_from,
+            elements_without_catalog=elements_no_catalog,
+            catalog_mapping_required=catalog_mapping_needed,
+        )
+
     def _restore_project(
         self, archive: ProjectArchive, new_project_name: str | None
     ) -> UUID:
@@ -848,22 +885,23 @@ class ProjectArchiveService:
         self._session.flush()
 
         # 2. Network nodes - najpierw musimy utworzyć wszystkie węzły
+        node_rows: list[dict[str, Any]] = []
         for node_data in archive.network_model.nodes:
             old_id = node_data["id"]
             new_id = uuid4()
             id_map[old_id] = new_id
 
-            node_orm = NetworkNodeORM(
-                id=new_id,
-                project_id=new_project_id,
-                name=node_data["name"],
-                node_type=node_data["node_type"],
-                base_kv=node_data["base_kv"],
-                attrs_jsonb=node_data["attrs_jsonb"],
+            node_rows.append(
+                {
+                    "id": new_id,
+                    "project_id": new_project_id,
+                    "name": node_data["name"],
+                    "node_type": node_data["node_type"],
+                    "base_kv": node_data["base_kv"],
+                    "attrs_jsonb": node_data["attrs_jsonb"],
+                }
             )
-            self._session.add(node_orm)
-
-        self._session.flush()
+        bulk_insert(self._session, NetworkNodeORM, node_rows)
 
         # Aktualizuj connection_node_id jeśli był ustawiony
         if archive.project_meta.connection_node_id:
@@ -872,56 +910,66 @@ class ProjectArchiveService:
                 project_orm.connection_node_id = connection_new_id
 
         # 3. Network branches
+        branch_rows: list[dict[str, Any]] = []
         for branch_data in archive.network_model.branches:
             old_id = branch_data["id"]
             new_id = uuid4()
             id_map[old_id] = new_id
 
-            branch_orm = NetworkBranchORM(
-                id=new_id,
-                project_id=new_project_id,
-                name=branch_data["name"],
-                branch_type=branch_data["branch_type"],
-                from_node_id=id_map[branch_data["from_node_id"]],
-                to_node_id=id_map[branch_data["to_node_id"]],
-                in_service=branch_data["in_service"],
-                params_jsonb=branch_data["params_jsonb"],
+            branch_rows.append(
+                {
+                    "id": new_id,
+                    "project_id": new_project_id,
+                    "name": branch_data["name"],
+                    "branch_type": branch_data["branch_type"],
+                    "from_node_id": id_map[branch_data["from_node_id"]],
+                    "to_node_id": id_map[branch_data["to_node_id"]],
+                    "in_service": branch_data["in_service"],
+                    "params_jsonb": branch_data["params_jsonb"],
+                }
             )
-            self._session.add(branch_orm)
+        bulk_insert(self._session, NetworkBranchORM, branch_rows)
 
         # 4. Network sources
+        source_rows: list[dict[str, Any]] = []
         for source_data in archive.network_model.sources:
             old_id = source_data["id"]
             new_id = uuid4()
             id_map[old_id] = new_id
 
-            source_orm = NetworkSourceORM(
-                id=new_id,
-                project_id=new_project_id,
-                node_id=id_map[source_data["node_id"]],
-                source_type=source_data["source_type"],
-                payload_jsonb=source_data["payload_jsonb"],
-                in_service=source_data["in_service"],
+            source_rows.append(
+                {
+                    "id": new_id,
+                    "project_id": new_project_id,
+                    "node_id": id_map[source_data["node_id"]],
+                    "source_type": source_data["source_type"],
+                    "payload_jsonb": source_data["payload_jsonb"],
+                    "in_service": source_data["in_service"],
+                }
             )
-            self._session.add(source_orm)
+        bulk_insert(self._session, NetworkSourceORM, source_rows)
 
         # 5. Network loads
+        load_rows: list[dict[str, Any]] = []
         for load_data in archive.network_model.loads:
             old_id = load_data["id"]
             new_id = uuid4()
             id_map[old_id] = new_id
 
-            load_orm = NetworkLoadORM(
-                id=new_id,
-                project_id=new_project_id,
-                node_id=id_map[load_data["node_id"]],
-                payload_jsonb=load_data["payload_jsonb"],
-                in_service=load_data["in_service"],
+            load_rows.append(
+                {
+                    "id": new_id,
+                    "project_id": new_project_id,
+                    "node_id": id_map[load_data["node_id"]],
+                    "payload_jsonb": load_data["payload_jsonb"],
+                    "in_service": load_data["in_service"],
+                }
             )
-            self._session.add(load_orm)
+        bulk_insert(self._session, NetworkLoadORM, load_rows)
 
         # 6. Network snapshots (przechowaj mapowanie snapshot_id)
         snapshot_id_map: dict[str, str] = {}
+        snapshot_orms: list[NetworkSnapshotORM] = []
         for snapshot_data in archive.network_model.snapshots:
             old_snapshot_id = snapshot_data["snapshot_id"]
             # Generuj nowy snapshot_id (hash + timestamp)
@@ -946,6 +994,15 @@ class ProjectArchiveService:
                 fingerprint=snapshot_data["fingerprint"],
                 snapshot_json=updated_snapshot_json,
             )
+            snapshot_orms.append(snapshot_orm)
+
+        positions = lineage_positions(
+            {orm.snapshot_id: orm.parent_snapshot_id for orm in snapshot_orms}
+        )
+        for snapshot_orm in snapshot_orms:
+            snapshot_orm.lineage_root_id, snapshot_orm.lineage_depth = positions[
+                snapshot_orm.snapshot_id
+            ]
             self._session.add(snapshot_orm)
 
         # Aktualizuj active_network_snapshot_id
@@ -1002,20 +1059,21 @@ class ProjectArchiveService:
             self._session.add(sc_orm)
 
         # 9. Switching states
-        for ss_data in archive.cases.switching_states:
-            old_case_id = ss_data["case_id"]
-            new_case_id = id_map.get(old_case_id)
-            if not new_case_id:
-                continue
-
-            ss_orm = SwitchingStateORM(
-                id=uuid4(),
-                case_id=new_case_id,
-                element_id=id_map.get(ss_data["element_id"], UUID(ss_data["element_id"])),
-                element_type=ss_data["element_type"],
-                in_service=ss_data["in_service"],
-            )
-            self._session.add(ss_orm)
+        bulk_insert(
+            self._session,
+            SwitchingStateORM,
+            (
+                {
+                    "id": uuid4(),
+                    "case_id": id_map[ss_data["case_id"]],
+                    "element_id": id_map.get(ss_data["element_id"], UUID(ss_data["element_id"])),
+                    "element_type": ss_data["element_type"],
+                    "in_service": ss_data["in_service"],
+                }
+                for ss_data in archive.cases.switching_states
+                if id_map.get(ss_data["case_id"])
+            ),
+        )
 
         # 10. Project settings
         if archive.cases.settings:
@@ -1055,156 +1113,172 @@ class ProjectArchiveService:
         self._session.flush()
 
         # 12. SLD node symbols
-        for ns_data in archive.sld_diagrams.node_symbols:
-            old_diagram_id = ns_data["diagram_id"]
-            new_diagram_id = id_map.get(old_diagram_id)
-            if not new_diagram_id:
-                continue
-
-            ns_orm = SldNodeSymbolORM(
-                id=uuid4(),
-                diagram_id=new_diagram_id,
-                node_id=id_map.get(ns_data["node_id"], UUID(ns_data["node_id"])),
-                x=ns_data["x"],
-                y=ns_data["y"],
-                label=ns_data.get("label"),
-                is_connection_node=ns_data.get("is_connection_node", False),
-            )
-            self._session.add(ns_orm)
+        bulk_insert(
+            self._session,
+            SldNodeSymbolORM,
+            (
+                {
+                    "id": uuid4(),
+                    "diagram_id": id_map[ns_data["diagram_id"]],
+                    "node_id": id_map.get(ns_data["node_id"], UUID(ns_data["node_id"])),
+                    "x": ns_data["x"],
+                    "y": ns_data["y"],
+                    "label": ns_data.get("label"),
+                    "is_connection_node": ns_data.get("is_connection_node", False),
+                }
+                for ns_data in archive.sld_diagrams.node_symbols
+                if id_map.get(ns_data["diagram_id"])
+            ),
+        )
 
         # 13. SLD branch symbols
-        for bs_data in archive.sld_diagrams.branch_symbols:
-            old_diagram_id = bs_data["diagram_id"]
-            new_diagram_id = id_map.get(old_diagram_id)
-            if not new_diagram_id:
-                continue
-
-            bs_orm = SldBranchSymbolORM(
-                id=uuid4(),
-                diagram_id=new_diagram_id,
-                branch_id=id_map.get(bs_data["branch_id"], UUID(bs_data["branch_id"])),
-                from_node_id=id_map.get(bs_data["from_node_id"], UUID(bs_data["from_node_id"])),
-                to_node_id=id_map.get(bs_data["to_node_id"], UUID(bs_data["to_node_id"])),
-                points_jsonb=bs_data["points_jsonb"],
-            )
-            self._session.add(bs_orm)
+        bulk_insert(
+            self._session,
+            SldBranchSymbolORM,
+            (
+                {
+                    "id": uuid4(),
+                    "diagram_id": id_map[bs_data["diagram_id"]],
+                    "branch_id": id_map.get(bs_data["branch_id"], UUID(bs_data["branch_id"])),
+                    "from_node_id": id_map.get(
+                        bs_data["from_node_id"], UUID(bs_data["from_node_id"])
+                    ),
+                    "to_node_id": id_map.get(bs_data["to_node_id"], UUID(bs_data["to_node_id"])),
+                    "points_jsonb": bs_data["points_jsonb"],
+                }
+                for bs_data in archive.sld_diagrams.branch_symbols
+                if id_map.get(bs_data["diagram_id"])
+            ),
+        )
 
         # 14. SLD annotations
-        for ann_data in archive.sld_diagrams.annotations:
-            old_diagram_id = ann_data["diagram_id"]
-            new_diagram_id = id_map.get(old_diagram_id)
-            if not new_diagram_id:
-                continue
-
-            ann_orm = SldAnnotationORM(
-                id=uuid4(),
-                diagram_id=new_diagram_id,
-                text=ann_data["text"],
-                x=ann_data["x"],
-                y=ann_data["y"],
-            )
-            self._session.add(ann_orm)
+        bulk_insert(
+            self._session,
+            SldAnnotationORM,
+            (
+                {
+                    "id": uuid4(),
+                    "diagram_id": id_map[ann_data["diagram_id"]],
+                    "text": ann_data["text"],
+                    "x": ann_data["x"],
+                    "y": ann_data["y"],
+                }
+                for ann_data in archive.sld_diagrams.annotations
+                if id_map.get(ann_data["diagram_id"])
+            ),
+        )
 
         # 15. Study runs
+        study_run_rows: list[dict[str, Any]] = []
         for sr_data in archive.runs.study_runs:
             old_id = sr_data["id"]
             new_id = uuid4()
             id_map[old_id] = new_id
 
-            sr_orm = StudyRunORM(
-                id=new_id,
-                project_id=new_project_id,
-                case_id=id_map.get(sr_data["case_id"], UUID(sr_data["case_id"])),
-                analysis_type=sr_data["analysis_type"],
-                input_hash=sr_data["input_hash"],
-                network_snapshot_id=snapshot_id_map.get(sr_data["network_snapshot_id"])
-                if sr_data.get("network_snapshot_id")
-                else None,
-                solver_version_hash=sr_data.get("solver_version_hash"),
-                result_state=sr_data["result_state"],
-                status=sr_data["status"],
-                started_at=datetime.fromisoformat(sr_data["started_at"]),
-                finished_at=datetime.fromisoformat(sr_data["finished_at"])
-                if sr_data.get("finished_at")
-                else None,
+            study_run_rows.append(
+                {
+                    "id": new_id,
+                    "project_id": new_project_id,
+                    "case_id": id_map.get(sr_data["case_id"], UUID(sr_data["case_id"])),
+                    "analysis_type": sr_data["analysis_type"],
+                    "input_hash": sr_data["input_hash"],
+                    "network_snapshot_id": snapshot_id_map.get(sr_data["network_snapshot_id"])
+                    if sr_data.get("network_snapshot_id")
+                    else None,
+                    "solver_version_hash": sr_data.get("solver_version_hash"),
+                    "result_state": sr_data["result_state"],
+                    "status": sr_data["status"],
+                    "started_at": datetime.fromisoformat(sr_data["started_at"]),
+                    "finished_at": datetime.fromisoformat(sr_data["finished_at"])
+                    if sr_data.get("finished_at")
+                    else None,
+                }
             )
-            self._session.add(sr_orm)
+        bulk_insert(self._session, StudyRunORM, study_run_rows)
 
-        self._session.flush()
-
-        # 16. Analysis runs
+        # 16. Analysis runs (payloady do analysis_run_blobs; bulk_insert
+        # flushuje bloby partii przed wstawieniem jej wierszy)
+        runs = AnalysisRunRepository(self._session)
+        analysis_run_rows: list[dict[str, Any]] = []
         for ar_data in archive.runs.analysis_runs:
             old_id = ar_data["id"]
             new_id = uuid4()
             id_map[old_id] = new_id
 
-            ar_orm = AnalysisRunORM(
-                id=new_id,
-                project_id=new_project_id,
-                operating_case_id=id_map.get(
-                    ar_data["operating_case_id"], UUID(ar_data["operating_case_id"])
-                ),
-                analysis_type=ar_data["analysis_type"],
-                status=ar_data["status"],
-                result_status=ar_data["result_status"],
-                created_at=datetime.fromisoformat(ar_data["created_at"]),
-                started_at=datetime.fromisoformat(ar_data["started_at"])
-                if ar_data.get("started_at")
-                else None,
-                finished_at=datetime.fromisoformat(ar_data["finished_at"])
-                if ar_data.get("finished_at")
-                else None,
-                input_snapshot=ar_data["input_snapshot"],
-                input_hash=ar_data["input_hash"],
-                result_summary=ar_data["result_summary"],
-                trace_json=ar_data.get("trace_json"),
-                white_box_trace=ar_data.get("white_box_trace"),
-                error_message=ar_data.get("error_message"),
+            analysis_run_rows.append(
+                {
+                    "id": new_id,
+                    "project_id": new_project_id,
+                    "operating_case_id": id_map.get(
+                        ar_data["operating_case_id"], UUID(ar_data["operating_case_id"])
+                    ),
+                    "analysis_type": ar_data["analysis_type"],
+                    "status": ar_data["status"],
+                    "result_status": ar_data["result_status"],
+                    "created_at": datetime.fromisoformat(ar_data["created_at"]),
+                    "started_at": datetime.fromisoformat(ar_data["started_at"])
+                    if ar_data.get("started_at")
+                    else None,
+                    "finished_at": datetime.fromisoformat(ar_data["finished_at"])
+                    if ar_data.get("finished_at")
+                    else None,
+                    "input_snapshot_ref": runs.store_payload(ar_data["input_snapshot"]),
+                    "input_hash": ar_data["input_hash"],
+                    "result_summary_ref": runs.store_payload(ar_data["result_summary"]),
+                    "trace_json_ref": runs.store_payload(ar_data.get("trace_json")),
+                    "white_box_trace_ref": runs.store_payload(ar_data.get("white_box_trace")),
+                    "error_message": ar_data.get("error_message"),
+                }
             )
-            self._session.add(ar_orm)
-
-        self._session.flush()
+            if len(analysis_run_rows) == _RESTORE_BATCH_ROWS:
+                bulk_insert(self._session, AnalysisRunORM, analysis_run_rows)
+                analysis_run_rows = []
+        bulk_insert(self._session, AnalysisRunORM, analysis_run_rows)
 
         # 17. Analysis runs index
-        for idx_data in archive.runs.analysis_runs_index:
-            old_run_id = idx_data["run_id"]
-            # Mapuj run_id - sprawdź czy to UUID czy string hash
-            new_run_id = str(id_map.get(old_run_id, old_run_id))
-
-            idx_orm = AnalysisRunIndexORM(
-                run_id=new_run_id,
-                analysis_type=idx_data["analysis_type"],
-                case_id=str(id_map.get(idx_data["case_id"], idx_data["case_id"]))
-                if idx_data.get("case_id")
-                else None,
-                base_snapshot_id=snapshot_id_map.get(idx_data["base_snapshot_id"])
-                if idx_data.get("base_snapshot_id")
-                else None,
-                primary_artifact_type=idx_data["primary_artifact_type"],
-                primary_artifact_id=idx_data["primary_artifact_id"],
-                fingerprint=idx_data["fingerprint"],
-                created_at_utc=datetime.fromisoformat(idx_data["created_at_utc"]),
-                status=idx_data["status"],
-                meta_json=idx_data.get("meta_json"),
-            )
-            self._session.add(idx_orm)
-
-        # 18. Study results
-        for res_data in archive.results.study_results:
-            old_run_id = res_data["run_id"]
-            new_run_id = id_map.get(old_run_id)
-            if not new_run_id:
-                continue
+        bulk_insert(
+            self._session,
+            AnalysisRunIndexORM,
+            (
+                {
+                    # Mapuj run_id - sprawdź czy to UUID czy string hash
+                    "run_id": str(id_map.get(idx_data["run_id"], idx_data["run_id"])),
+                    "analysis_type": idx_data["analysis_type"],
+                    "case_id": str(id_map.get(idx_data["case_id"], idx_data["case_id"]))
+                    if idx_data.get("case_id")
+                    else None,
+                    "base_snapshot_id": snapshot_id_map.get(idx_data["base_snapshot_id"])
+                    if idx_data.get("base_snapshot_id")
+                    else None,
+                    "primary_artifact_type": idx_data["primary_artifact_type"],
+                    "primary_artifact_id": idx_data["primary_artifact_id"],
+                    "fingerprint": idx_data["fingerprint"],
+                    "created_at_utc": datetime.fromisoformat(idx_data["created_at_utc"]),
+                    "status": idx_data["status"],
+                    "meta_json": idx_data.get("meta_json"),
+                }
+                for idx_data in archive.runs.analysis_runs_index
+            ),
+        )
 
-            res_orm = StudyResultORM(
-                id=uuid4(),
-                run_id=new_run_id,
-                project_id=new_project_id,
-                result_type=res_data["result_type"],
-                result_jsonb=res_data["result_jsonb"],
-                created_at=datetime.fromisoformat(res_data["created_at"]),
-            )
-            self._session.add(res_orm)
+        # 18. Study results (partiami executemany, bez obiektów ORM)
+        bulk_insert(
+            self._session,
+            StudyResultORM,
+            (
+                {
+                    "id": uuid4(),
+                    "run_id": id_map[res_data["run_id"]],
+                    "project_id": new_project_id,
+                    "result_type": res_data["result_type"],
+                    "result_jsonb": res_data["result_jsonb"],
+                    "created_at": datetime.fromisoformat(res_data["created_at"]),
+                }
+                for res_data in archive.results.study_results
+                if id_map.get(res_data["run_id"])
+            ),
+            batch_size=_RESTORE_BATCH_ROWS,
+        )
 
         # 19. Design specs
         for spec_data in archive.proofs.design_specs:
@@ -1298,10 +1372,8 @@ class ProjectArchiveService:
         try:
             zip_buffer = io.BytesIO(archive_bytes)
             with zipfile.ZipFile(zip_buffer, "r") as zf:
-                if "manifest.json" in zf.namelist():
-                    manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
-                else:
-                    manifest = {}
+                if is_stream_archive(zf):
+                    return _preview_stream_archive(StreamingArchiveReader(zf))
 
                 if "project.json" not in zf.namelist():
                     return {
@@ -1356,6 +1428,46 @@ class ProjectArchiveService:
             return {"valid": False, "error": "Nieprawidłowy format archiwum ZIP"}
 
 
+def _preview_stream_archive(reader: StreamingArchiveReader) -> dict[str, Any]:
+    """Podgląd archiwum stream-v1 — liczności z manifestu, bez czytania wierszy."""
+    project_meta = reader.project_meta()
+    return {
+        "valid": True,
+        "format_id": reader.manifest["format_id"],
+        "schema_version": reader.schema_version,
+        "project_name": project_meta["name"],
+        "project_description": project_meta.get("description"),
+        "exported_at": reader.manifest.get("exported_at"),
+        "archive_hash": reader.manifest.get("archive_hash"),
+        "summary": {
+            "nodes_count": reader.count("network_model", "nodes"),
+            "branches_count": reader.count("network_model", "branches"),
+            "sources_count": reader.count("network_model", "sources"),
+            "loads_count": reader.count("network_model", "loads"),
+            "snapshots_count": reader.count("network_model", "snapshots"),
+            "sld_diagrams_count": reader.count("sld_diagrams", "diagrams"),
+            "study_cases_count": reader.count("cases", "study_cases"),
+            "operating_cases_count": reader.count("cases", "operating_cases"),
+            "analysis_runs_count": reader.count("runs", "analysis_runs"),
+            "study_runs_count": reader.count("runs", "study_runs"),
+            "results_count": reader.count("results", "study_results"),
+            "proofs_count": (
+                reader.count("proofs", "design_specs")
+                + reader.count("proofs", "design_proposals")
+                + reader.count("proofs", "design_evidence")
+            ),
+        },
+    }
+
+
+def _materialize(entries: dict[str, Any]) -> dict[str, Any]:
+    """Sekcja z iteratorami wierszy → sekcja z listami (układ project.json)."""
+    return {
+        key: list(value) if isinstance(value, Iterator) else value
+        for key, value in entries.items()
+    }
+
+
 def _find_elements_without_catalog(archive: ProjectArchive) -> list[str]:
     """Znajdz elementy techniczne bez referencji katalogowej.
 
@@ -0,0 +1,374 @@
+"""
+Strumieniowy układ archiwum projektu — P31.
+
+Układ "stream-v1": jeden człon ZIP na listę sekcji (JSON Lines, wiersz po
+wierszu) oraz osobny człon na każde wykonanie analizy i każdy wynik.
+Ani eksport, ani import nie buduje całego archiwum w pamięci — w pamięci
+jest co najwyżej jeden wiersz (jedno wykonanie z jego śladami).
+
+    manifest.json                         format, wersja, fingerprints, liczności
+    project_meta.json                     metadane projektu
+    network_model/nodes.jsonl             wiersz = węzeł
+    cases/settings.json                   wartość skalarna sekcji
+    runs/analysis_runs/000001_<id>.json   jedno wykonanie analizy
+    results/study_results/000001_<id>.json
+
+KANON:
+- Hashe sekcji liczone przyrostowo (SectionHasher) są identyczne z
+  compute_hash sekcji — archive_hash nie zależy od układu archiwum
+- Wiersze w kolejności eksportu (kolejność członów w katalogu ZIP)
+- Wiersze zapisywane jako kanoniczny JSON, ten sam tekst co hashowany
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import IO, Any
+
+from domain.project_archive import (
+    ARCHIVE_FORMAT_ID,
+    ARCHIVE_SCHEMA_VERSION,
+    ArchiveFingerprints,
+    ArchiveStructureError,
+    CasesSection,
+    InterpretationsSection,
+    IssuesSection,
+    NetworkModelSection,
+    ProjectArchive,
+    ProjectMeta,
+    ProofsSection,
+    ResultsSection,
+    RunsSection,
+    SectionHasher,
+    SldSection,
+    canonical_json,
+    compute_hash,
+    fingerprints_from_section_hashes,
+    validate_archive_header,
+)
+
+STREAM_LAYOUT = "stream-v1"
+MANIFEST_MEMBER = "manifest.json"
+PROJECT_META_MEMBER = "project_meta.json"
+
+# Stały znacznik czasu członów ZIP — bajty zależą tylko od treści
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class StreamSection:
+    """Sekcja archiwum w układzie strumieniowym."""
+
+    name: str  # klucz w archive_to_dict
+    fingerprint: str  # klucz w ArchiveFingerprints (bez sufiksu _hash)
+    lists: tuple[str, ...]
+    scalars: tuple[str, ...] = ()
+    per_row: tuple[str, ...] = ()  # listy zapisywane jako człon na wiersz
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return tuple(sorted(self.lists + self.scalars))
+
+
+STREAM_SECTIONS: tuple[StreamSection, ...] = (
+    StreamSection("network_model", "network_model", ("nodes", "branches", "sources", "loads", "snapshots")),
+    StreamSection("sld_diagrams", "sld", ("diagrams", "node_symbols", "branch_symbols", "annotations")),
+    StreamSection(
+        "cases", "cases", ("study_cases", "operating_cases", "switching_states"), scalars=("settings",)
+    ),
+    StreamSection(
+        "runs", "runs", ("analysis_runs", "analysis_runs_index", "study_runs"), per_row=("analysis_runs",)
+    ),
+    StreamSection("results", "results", ("study_results",), per_row=("study_results",)),
+    StreamSection("proofs", "proofs", ("design_specs", "design_proposals", "design_evidence")),
+    StreamSection("interpretations", "interpretations", ("cached",)),
+    StreamSection("issues", "issues", ("snapshot",)),
+)
+
+_SECTIONS_BY_NAME = {section.name: section for section in STREAM_SECTIONS}
+
+
+def is_stream_archive(zf: zipfile.ZipFile) -> bool:
+    """Czy ZIP jest archiwum w układzie strumieniowym (a nie project.json)."""
+    names = set(zf.namelist())
+    return PROJECT_META_MEMBER in names and MANIFEST_MEMBER in names
+
+
+def _list_member(section: str, key: str) -> str:
+    return f"{section}/{key}.jsonl"
+
+
+def _scalar_member(section: str, key: str) -> str:
+    return f"{section}/{key}.json"
+
+
+def _row_prefix(section: str, key: str) -> str:
+    return f"{section}/{key}/"
+
+
+# ============================================================================
+# ZAPIS
+# ============================================================================
+
+
+class StreamingArchiveWriter:
+    """
+    Zapis archiwum do pliku (obiekt plikowy, także nieprzewijalny).
+
+    Sekcje zapisywane po kolei z iteratorów wierszy; hashe liczone w locie.
+    finish() dopisuje manifest z fingerprints i licznościami.
+    """
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        self._zf = zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED)
+        self._section_hashes: dict[str, str] = {}
+        self._counts: dict[str, int] = {}
+
+    def __enter__(self) -> StreamingArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._zf.close()
+
+    def _open(self, name: str) -> IO[bytes]:
+        info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        return self._zf.open(info, "w", force_zip64=True)
+
+    def write_project_meta(self, project_meta: dict[str, Any]) -> str:
+        text = canonical_json(project_meta)
+        with self._open(PROJECT_META_MEMBER) as member:
+            member.write(text.encode("utf-8"))
+        self._section_hashes["project_meta"] = compute_hash(project_meta)
+        return self._section_hashes["project_meta"]
+
+    def write_section(self, section_name: str, entries: Mapping[str, Any]) -> str:
+        """
+        Zapisz sekcję: entries[klucz] to iterowalne wiersze (listy)
+        albo wartość (skalary). Zwraca hash sekcji.
+        """
+        section = _SECTIONS_BY_NAME[section_name]
+        hasher = SectionHasher()
+        for key in section.keys:
+            if key in section.scalars:
+                text = hasher.add_value(key, entries[key])
+                with self._open(_scalar_member(section.name, key)) as member:
+                    member.write(text.encode("utf-8"))
+                continue
+
+            hasher.begin_list(key)
+            count = 0
+            if key in section.per_row:
+                prefix = _row_prefix(section.name, key)
+                for row in entries[key]:
+                    count += 1
+                    text = hasher.add_item(row)
+                    row_id = row.get("id", "") if isinstance(row, dict) else ""
+                    with self._open(f"{prefix}{count:06d}_{row_id}.json") as member:
+                        member.write(text.encode("utf-8"))
+            else:
+                with self._open(_list_member(section.name, key)) as member:
+                    for row in entries[key]:
+                        count += 1
+                        member.write(hasher.add_item(row).encode("utf-8") + b"\n")
+            hasher.end_list()
+            self._counts[f"{section.name}/{key}"] = count
+
+        self._section_hashes[section.fingerprint] = hasher.hexdigest()
+        return self._section_hashes[section.fingerprint]
+
+    def finish(self, *, project_name: str, exported_at: str) -> ArchiveFingerprints:
+        """Dopisz manifest; wymaga zapisanych wszystkich sekcji."""
+        missing = {"project_meta", *(s.fingerprint for s in STREAM_SECTIONS)} - set(self._section_hashes)
+        if missing:
+            raise ArchiveStructureError(f"Nie zapisano sekcji: {', '.join(sorted(missing))}")
+        fingerprints = fingerprints_from_section_hashes(self._section_hashes)
+        manifest = {
+            "format_id": ARCHIVE_FORMAT_ID,
+            "schema_version": ARCHIVE_SCHEMA_VERSION,
+            "layout": STREAM_LAYOUT,
+            "project_name": project_name,
+            "exported_at": exported_at,
+            "archive_hash": fingerprints.archive_hash,
+            "fingerprints": {
+                "project_meta_hash": fingerprints.project_meta_hash,
+                "network_model_hash": fingerprints.network_model_hash,
+                "sld_hash": fingerprints.sld_hash,
+                "cases_hash": fingerprints.cases_hash,
+                "runs_hash": fingerprints.runs_hash,
+                "results_hash": fingerprints.results_hash,
+                "proofs_hash": fingerprints.proofs_hash,
+                "interpretations_hash": fingerprints.interpretations_hash,
+                "issues_hash": fingerprints.issues_hash,
+            },
+            "counts": dict(sorted(self._counts.items())),
+        }
+        with self._open(MANIFEST_MEMBER) as member:
+            member.write(
+                json.dumps(manifest, sort_keys=True, indent=2, ensure_ascii=False).encode("utf-8")
+            )
+        return fingerprints
+
+
+# ============================================================================
+# ODCZYT
+# ============================================================================
+
+
+class MemberRows:
+    """Leniwa, wielokrotnie iterowalna lista wierszy czytana z członów ZIP."""
+
+    def __init__(self, produce: Callable[[], Iterator[dict[str, Any]]]) -> None:
+        self._produce = produce
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self._produce()
+
+
+class StreamingArchiveReader:
+    """Odczyt archiwum strumieniowego; wiersze czytane po jednym."""
+
+    def __init__(self, zf: zipfile.ZipFile) -> None:
+        self._zf = zf
+        try:
+            self.manifest: dict[str, Any] = json.loads(zf.read(MANIFEST_MEMBER).decode("utf-8"))
+        except KeyError:
+            raise ArchiveStructureError(f"Brak pliku {MANIFEST_MEMBER}") from None
+        if self.manifest.get("layout") != STREAM_LAYOUT:
+            raise ArchiveStructureError(f"Nieobsługiwany układ archiwum: {self.manifest.get('layout')}")
+        validate_archive_header(
+            self.manifest.get("format_id", ""), self.manifest.get("schema_version", "")
+        )
+        self._names = set(zf.namelist())
+
+    @property
+    def schema_version(self) -> str:
+        return self.manifest["schema_version"]
+
+    def project_meta(self) -> dict[str, Any]:
+        return json.loads(self._zf.read(PROJECT_META_MEMBER).decode("utf-8"))
+
+    def value(self, section: str, key: str) -> Any:
+        name = _scalar_member(section, key)
+        if name not in self._names:
+            raise ArchiveStructureError(f"Brak członu {name}")
+        return json.loads(self._zf.read(name).decode("utf-8"))
+
+    def rows(self, section: str, key: str) -> Iterator[dict[str, Any]]:
+        if key in _SECTIONS_BY_NAME[section].per_row:
+            prefix = _row_prefix(section, key)
+            for info in self._zf.infolist():
+                if info.filename.startswith(prefix):
+                    yield json.loads(self._zf.read(info).decode("utf-8"))
+            return
+
+        name = _list_member(section, key)
+        if name not in self._names:
+            raise ArchiveStructureError(f"Brak członu {name}")
+        with self._zf.open(name) as member:
+            for line in io.TextIOWrapper(member, encoding="utf-8"):
+                if line.strip():
+                    yield json.loads(line)
+
+    def _lazy(self, section: str, key: str) -> MemberRows:
+        return MemberRows(lambda: self.rows(section, key))
+
+    def stored_fingerprints(self) -> ArchiveFingerprints:
+        fp = self.manifest.get("fingerprints", {})
+        return ArchiveFingerprints(
+            archive_hash=self.manifest.get("archive_hash", ""),
+            project_meta_hash=fp.get("project_meta_hash", ""),
+            network_model_hash=fp.get("network_model_hash", ""),
+            sld_hash=fp.get("sld_hash", ""),
+            cases_hash=fp.get("cases_hash", ""),
+            runs_hash=fp.get("runs_hash", ""),
+            results_hash=fp.get("results_hash", ""),
+            proofs_hash=fp.get("proofs_hash", ""),
+            interpretations_hash=fp.get("interpretations_hash", ""),
+            issues_hash=fp.get("issues_hash", ""),
+        )
+
+    def compute_section_hashes(self) -> dict[str, str]:
+        """Przelicz hashe sekcji, czytając wiersze po jednym."""
+        hashes = {"project_meta": compute_hash(self.project_meta())}
+        for section in STREAM_SECTIONS:
+            hasher = SectionHasher()
+            for key in section.keys:
+                if key in section.scalars:
+                    hasher.add_value(key, self.value(section.name, key))
+                    continue
+                hasher.begin_list(key)
+                for row in self.rows(section.name, key):
+                    hasher.add_item(row)
+                hasher.end_list()
+            hashes[section.fingerprint] = hasher.hexdigest()
+        return hashes
+
+    def verify_integrity(self) -> list[str]:
+        """Odpowiednik verify_archive_integrity (pusta lista = OK)."""
+        computed = self.compute_section_hashes()
+        stored = self.stored_fingerprints()
+        errors: list[str] = []
+        for section, computed_hash in computed.items():
+            stored_hash = getattr(stored, f"{section}_hash")
+            if computed_hash != stored_hash:
+                errors.append(
+                    f"Błąd integralności sekcji '{section}': "
+                    f"oczekiwano {stored_hash}, obliczono {computed_hash}"
+                )
+        if not errors:
+            archive_hash = fingerprints_from_section_hashes(computed).archive_hash
+            if archive_hash != stored.archive_hash:
+                errors.append(
+                    f"Błąd integralności archiwum: "
+                    f"oczekiwano {stored.archive_hash}, obliczono {archive_hash}"
+                )
+        return errors
+
+    def to_archive(self) -> ProjectArchive:
+        """
+        ProjectArchive z leniwymi listami (MemberRows) zamiast list w pamięci.
+
+        Przeznaczone dla _restore_project — każda lista czytana przy iteracji.
+        """
+        pm = self.project_meta()
+        settings = self.value("cases", "settings")
+        return ProjectArchive(
+            schema_version=self.schema_version,
+            format_id=self.manifest["format_id"],
+            project_meta=ProjectMeta(
+                id=pm["id"],
+                name=pm["name"],
+                description=pm.get("description"),
+                schema_version=pm["schema_version"],
+                active_network_snapshot_id=pm.get("active_network_snapshot_id"),
+                connection_node_id=pm.get("connection_node_id"),
+                sources=pm.get("sources", []),
+                created_at=pm["created_at"],
+                updated_at=pm["updated_at"],
+            ),
+            network_model=NetworkModelSection(
+                **{key: self._lazy("network_model", key) for key in _SECTIONS_BY_NAME["network_model"].lists}
+            ),
+            sld_diagrams=SldSection(
+                **{key: self._lazy("sld_diagrams", key) for key in _SECTIONS_BY_NAME["sld_diagrams"].lists}
+            ),
+            cases=CasesSection(
+                **{key: self._lazy("cases", key) for key in _SECTIONS_BY_NAME["cases"].lists},
+                settings=settings,
+            ),
+            runs=RunsSection(**{key: self._lazy("runs", key) for key in _SECTIONS_BY_NAME["runs"].lists}),
+            results=ResultsSection(study_results=self._lazy("results", "study_results")),
+            proofs=ProofsSection(**{key: self._lazy("proofs", key) for key in _SECTIONS_BY_NAME["proofs"].lists}),
+            interpretations=InterpretationsSection(cached=self._lazy("interpretations", "cached")),
+            issues=IssuesSection(snapshot=self._lazy("issues", "snapshot")),
+            fingerprints=self.stored_fingerprints(),
+        )
+
+    def count(self, section: str, key: str) -> int:
+        return int(self.manifest.get("counts", {}).get(f"{section}/{key}", 0))
+
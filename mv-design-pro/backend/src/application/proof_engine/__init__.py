@@ -12,69 +12,166 @@ Moduły:
 - unit_verifier: Weryfikacja jednostek
 - proof_generator: Generator dowodów
 - latex_renderer: Renderer LaTeX
+- batch: Wsadowe (kolumnowe, leniwe) generowanie dowodów
 - proof_inspector: Warstwa przeglądu i eksportu (P11.1d)
 """
 
-from application.proof_engine.types import (
-    EarthingGroundFaultInput,
-    EquationDefinition,
-    EnergyProfilePoint,
-    LoadCurrentsCounterfactualInput,
-    LoadCurrentsInput,
-    LoadElementKind,
-    LossesEnergyInput,
-    LossesEnergyTargetKind,
-    ProtectionProofInput,
-    ProtectionSelectivityInput,
-    ProofDocument,
-    ProofHeader,
-    ProofStep,
-    ProofSummary,
-    ProofType,
-    ProofValue,
-    SymbolDefinition,
-    UnitCheckResult,
-)
-from application.proof_engine.equation_registry import EquationRegistry
-from application.proof_engine.unit_verifier import UnitVerifier
-from application.proof_engine.proof_generator import (
-    LoadFlowBusInput,
-    LoadFlowElementInput,
-    LoadFlowVoltageInput,
-    ProofGenerator,
-)
-from application.proof_engine.latex_renderer import LaTeXRenderer
-from application.proof_engine.proof_pack import (
-    ProofPackBuilder,
-    ProofPackContext,
-    proof_pack_proof_type,
-    resolve_mv_design_pro_version,
-)
+from __future__ import annotations
 
-# P11.1d: Proof Inspector (read-only viewer & export)
-from application.proof_engine.proof_inspector import (
-    # Types
-    CounterfactualRow,
-    CounterfactualView,
-    HeaderView,
-    InspectorView,
-    ProtectionComparisonRow,
-    ProtectionComparisonView,
-    StepView,
-    SummaryView,
-    UnitCheckView,
-    ValueView,
-    # Inspector
-    ProofInspector,
-    inspect,
-    # Exporters
-    ExportResult,
-    InspectorExporter,
-    export_to_json,
-    export_to_pdf,
-    export_to_tex,
-    is_pdf_export_available,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from application.proof_engine.types import (
+        EarthingGroundFaultInput,
+        EquationDefinition,
+        EnergyProfilePoint,
+        LoadCurrentsCounterfactualInput,
+        LoadCurrentsInput,
+        LoadElementKind,
+        LossesEnergyInput,
+        LossesEnergyTargetKind,
+        ProtectionProofInput,
+        ProtectionSelectivityInput,
+        ProofDocument,
+        ProofHeader,
+        ProofStep,
+        ProofSummary,
+        ProofType,
+        ProofValue,
+        SymbolDefinition,
+        UnitCheckResult,
+    )
+    from application.proof_engine.equation_registry import EquationRegistry
+    from application.proof_engine.unit_verifier import UnitVerifier
+    from application.proof_engine.proof_generator import (
+        LoadFlowBusInput,
+        LoadFlowElementInput,
+        LoadFlowVoltageInput,
+        ProofGenerator,
+    )
+    from application.proof_engine.latex_renderer import LaTeXRenderer
+    from application.proof_engine.proof_pack import (
+        PackFileDigest,
+        ProofPackBuilder,
+        ProofPackContext,
+        ProofPackWriter,
+        ProjectProofPackBuilder,
+        proof_pack_proof_type,
+        resolve_mv_design_pro_version,
+    )
+    from application.proof_engine.batch import (
+        SC3FColumns,
+        iter_sc1_proofs,
+        iter_sc3f_proof_packs,
+        iter_sc3f_proofs,
+        iter_vdrop_proofs,
+        proof_artifact_id,
+        stream_sc3f_pack_bundle,
+    )
+    from application.proof_engine.proof_inspector import (
+        # Types
+        CounterfactualRow,
+        CounterfactualView,
+        HeaderView,
+        InspectorView,
+        ProtectionComparisonRow,
+        ProtectionComparisonView,
+        StepView,
+        SummaryView,
+        UnitCheckView,
+        ValueView,
+        # Inspector
+        ProofInspector,
+        inspect,
+        # Exporters
+        ExportResult,
+        InspectorExporter,
+        export_to_json,
+        export_to_pdf,
+        export_to_tex,
+        is_pdf_export_available,
+    )
+
+# Submodules load on first access; the equation registries and proof generator are large
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "application.proof_engine.types": (
+        "EarthingGroundFaultInput",
+        "EquationDefinition",
+        "EnergyProfilePoint",
+        "LoadCurrentsCounterfactualInput",
+        "LoadCurrentsInput",
+        "LoadElementKind",
+        "LossesEnergyInput",
+        "LossesEnergyTargetKind",
+        "ProtectionProofInput",
+        "ProtectionSelectivityInput",
+        "ProofDocument",
+        "ProofHeader",
+        "ProofStep",
+        "ProofSummary",
+        "ProofType",
+        "ProofValue",
+        "SymbolDefinition",
+        "UnitCheckResult",
+    ),
+    "application.proof_engine.equation_registry": (
+        "EquationRegistry",
+    ),
+    "application.proof_engine.unit_verifier": (
+        "UnitVerifier",
+    ),
+    "application.proof_engine.proof_generator": (
+        "LoadFlowBusInput",
+        "LoadFlowElementInput",
+        "LoadFlowVoltageInput",
+        "ProofGenerator",
+    ),
+    "application.proof_engine.latex_renderer": (
+        "LaTeXRenderer",
+    ),
+    "application.proof_engine.proof_pack": (
+        "PackFileDigest",
+        "ProofPackBuilder",
+        "ProofPackContext",
+        "ProofPackWriter",
+        "ProjectProofPackBuilder",
+        "proof_pack_proof_type",
+        "resolve_mv_design_pro_version",
+    ),
+    "application.proof_engine.batch": (
+        "SC3FColumns",
+        "iter_sc1_proofs",
+        "iter_sc3f_proof_packs",
+        "iter_sc3f_proofs",
+        "iter_vdrop_proofs",
+        "proof_artifact_id",
+        "stream_sc3f_pack_bundle",
+    ),
+    "application.proof_engine.proof_inspector": (
+        "CounterfactualRow",
+        "CounterfactualView",
+        "HeaderView",
+        "InspectorView",
+        "ProtectionComparisonRow",
+        "ProtectionComparisonView",
+        "StepView",
+        "SummaryView",
+        "UnitCheckView",
+        "ValueView",
+        "ProofInspector",
+        "inspect",
+        "ExportResult",
+        "InspectorExporter",
+        "export_to_json",
+        "export_to_pdf",
+        "export_to_tex",
+        "is_pdf_export_available",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     # Types
@@ -129,8 +226,32 @@ __all__ = [
     "export_to_tex",
     "is_pdf_export_available",
     # P11.3: Proof Pack
+    "PackFileDigest",
     "ProofPackBuilder",
     "ProofPackContext",
+    "ProofPackWriter",
+    "ProjectProofPackBuilder",
     "proof_pack_proof_type",
     "resolve_mv_design_pro_version",
+    # Batch proofs
+    "SC3FColumns",
+    "iter_sc1_proofs",
+    "iter_sc3f_proof_packs",
+    "iter_sc3f_proofs",
+    "iter_vdrop_proofs",
+    "proof_artifact_id",
+    "stream_sc3f_pack_bundle",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
@@ -0,0 +1,448 @@
+"""
+Batch Proofs — Wsadowe generowanie dowodów dla wszystkich szyn/elementów przebiegu
+
+STATUS: CANONICAL & BINDING
+Reference: P11_1a_MVP_SC3F_AND_VDROP.md, P11_1c_SC_ASYMMETRICAL.md
+
+Zamiast N wywołań generate_sc3f_proof (po jednym SC3FInput na szynę):
+- SC3FColumns: kolumnowy wynik zwarć (jedna tablica na wielkość, wiersz = szyna),
+  konwersje jednostek i wartości pośrednie (|Z_th|, R_th, X_th) liczone
+  wektorowo dla wszystkich szyn naraz,
+- iter_*_proofs: dowody emitowane leniwie (generator) — pakiet dla sieci
+  400-szynowej nie trzyma 400 dokumentów w pamięci,
+- iter_sc3f_proof_packs: dowody i pakiety ZIP budowane we współdzielonej
+  puli procesów (fragmenty kolumn po chunk_size szyn, w toku najwyżej
+  max_workers fragmentów),
+- stream_sc3f_pack_bundle: pakiety wszystkich szyn w jednym ZIP,
+  strumieniowanym pakiet po pakiecie (eksport /analysis-runs/{id}/proof-pack).
+
+INVARIANTS:
+- Dowód z partii == dowód z generate_sc3f_proof dla tego samego wiersza
+  (operacje wektorowe są dokładne: dzielenie, |Z| przez np.hypot, Re/Im)
+- Kolejność dowodów = kolejność wierszy
+- Domyślne artifact_id deterministyczne (uuid5 nad przebiegiem, typem
+  dowodu i elementem) — ponowny eksport daje te same identyfikatory
+- Audyt anti-double-counting raz na partię
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+import numpy as np
+
+from application.proof_engine.equation_registry import AntiDoubleCountingAudit
+from application.proof_engine.proof_generator import (
+    ProofGenerator,
+    SC1Input,
+    SC3FInput,
+    VDROPInput,
+)
+from application.proof_engine.proof_pack import (
+    ProofPackBuilder,
+    ProofPackContext,
+    ProofPackWriter,
+    _ChunkSink,
+)
+from application.proof_engine.types import ProofDocument
+from network_model.solvers.short_circuit_iec60909 import ShortCircuitType
+
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_MAX_WORKERS = 4
+
+# Przestrzeń nazw uuid5 identyfikatorów dowodów wsadowych
+_ARTIFACT_NAMESPACE = uuid5(NAMESPACE_URL, "mv-design-pro/proof-engine/batch")
+
+
+def proof_artifact_id(run_key: str, proof_type: str, element_id: str) -> UUID:
+    """Deterministyczny artifact_id: uuid5 nad (przebieg, typ dowodu, element)."""
+    return uuid5(_ARTIFACT_NAMESPACE, f"{run_key}/{proof_type}/{element_id}")
+
+
+def _input_run_key(project_name: str, case_name: str, run_timestamp: datetime) -> str:
+    """Klucz przebiegu z identyfikacji danych wejściowych (gdy brak run_id)."""
+    return f"{project_name}/{case_name}/{run_timestamp.isoformat()}"
+
+
+# =============================================================================
+# Columnar SC3F input
+# =============================================================================
+
+
+@dataclass(frozen=True, eq=False)
+class SC3FColumns:
+    """
+    Kolumnowe dane SC3F: i-ty element każdej tablicy opisuje i-tą szynę.
+
+    Jednostki jak w SC3FInput (kV, kA, Ω, MVA).
+    """
+
+    project_name: str
+    case_name: str
+    run_timestamp: datetime
+    solver_version: str
+    fault_node_id: tuple[str, ...]
+    fault_type: tuple[str, ...]
+    c_factor: np.ndarray
+    u_n_kv: np.ndarray
+    z_thevenin_ohm: np.ndarray
+    ikss_ka: np.ndarray
+    ip_ka: np.ndarray
+    ith_ka: np.ndarray
+    sk_mva: np.ndarray
+    kappa: np.ndarray
+    rx_ratio: np.ndarray
+    tk_s: np.ndarray
+    m_factor: np.ndarray
+    n_factor: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.fault_node_id)
+
+    @classmethod
+    def from_short_circuit_results(
+        cls,
+        results: Sequence[Any],  # Sequence[ShortCircuitResult]
+        project_name: str = "Projekt",
+        case_name: str = "Przypadek",
+        solver_version: str = "1.0.0",
+        run_timestamp: datetime | None = None,
+    ) -> SC3FColumns:
+        """
+        Kolumny z wyników ShortCircuitResult (jedna konwersja V/A → kV/kA).
+
+        Mapowanie jak SC3FInput.from_short_circuit_result; wspólny znacznik
+        czasu dla całej partii.
+        """
+
+        def column(attr: str, dtype: type = float) -> np.ndarray:
+            return np.fromiter(
+                (getattr(result, attr) for result in results), dtype=dtype, count=len(results)
+            )
+
+        count = len(results)
+        return cls(
+            project_name=project_name,
+            case_name=case_name,
+            run_timestamp=run_timestamp or datetime.utcnow(),
+            solver_version=solver_version,
+            fault_node_id=tuple(result.fault_node_id for result in results),
+            fault_type=tuple(result.short_circuit_type.value for result in results),
+            c_factor=column("c_factor"),
+            u_n_kv=column("un_v") / 1000.0,
+            z_thevenin_ohm=column("zkk_ohm", complex),
+            ikss_ka=column("ikss_a") / 1000.0,
+            ip_ka=column("ip_a") / 1000.0,
+            ith_ka=column("ith_a") / 1000.0,
+            sk_mva=column("sk_mva"),
+            kappa=column("kappa"),
+            rx_ratio=column("rx_ratio"),
+            tk_s=column("tk_s"),
+            m_factor=np.ones(count),
+            n_factor=np.zeros(count),
+        )
+
+    @classmethod
+    def from_short_circuit_payloads(
+        cls,
+        payloads: Sequence[dict[str, Any]],
+        project_name: str = "Projekt",
+        case_name: str = "Przypadek",
+        solver_version: str = "1.0.0",
+        run_timestamp: datetime | None = None,
+    ) -> SC3FColumns:
+        """
+        Kolumny z wyników zapisanych przez ShortCircuitResult.to_dict()
+        (np. raw_result["results"] przebiegu kanonicznego).
+        """
+        results = [
+            SimpleNamespace(
+                **{
+                    **payload,
+                    "short_circuit_type": ShortCircuitType(payload["short_circuit_type"]),
+                    "zkk_ohm": complex(payload["zkk_ohm"]["re"], payload["zkk_ohm"]["im"]),
+                }
+            )
+            for payload in payloads
+        ]
+        return cls.from_short_circuit_results(
+            results,
+            project_name=project_name,
+            case_name=case_name,
+            solver_version=solver_version,
+            run_timestamp=run_timestamp,
+        )
+
+    def row(self, index: int) -> SC3FInput:
+        """Wiersz jako SC3FInput (typy Pythona, nie skalary numpy)."""
+        return SC3FInput(
+            project_name=self.project_name,
+            case_name=self.case_name,
+            fault_node_id=self.fault_node_id[index],
+            fault_type=self.fault_type[index],
+            run_timestamp=self.run_timestamp,
+            solver_version=self.solver_version,
+            c_factor=float(self.c_factor[index]),
+            u_n_kv=float(self.u_n_kv[index]),
+            z_thevenin_ohm=complex(self.z_thevenin_ohm[index]),
+            ikss_ka=float(self.ikss_ka[index]),
+            ip_ka=float(self.ip_ka[index]),
+            ith_ka=float(self.ith_ka[index]),
+            sk_mva=float(self.sk_mva[index]),
+            kappa=float(self.kappa[index]),
+            rx_ratio=float(self.rx_ratio[index]),
+            tk_s=float(self.tk_s[index]),
+            m_factor=float(self.m_factor[index]),
+            n_factor=float(self.n_factor[index]),
+        )
+
+    def slice(self, start: int, stop: int) -> SC3FColumns:
+        """Fragment wierszy [start, stop) — jednostka pracy dla puli procesów."""
+        values: dict[str, Any] = {}
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            values[name] = value[start:stop] if isinstance(value, (tuple, np.ndarray)) else value
+        return SC3FColumns(**values)
+
+
+# =============================================================================
+# Lazy proof generators
+# =============================================================================
+
+
+def iter_sc3f_proofs(
+    columns: SC3FColumns,
+    artifact_ids: Sequence[UUID] | None = None,
+) -> Iterator[ProofDocument]:
+    """
+    Dowody SC3F dla wszystkich wierszy, emitowane leniwie.
+
+    |Z_th|, R_th i X_th liczone wektorowo; kroki dowodu jak w
+    ProofGenerator.generate_sc3f_proof. Bez artifact_ids identyfikatory
+    wyznacza proof_artifact_id z identyfikacji przebiegu i szyny.
+    """
+    if artifact_ids is not None and len(artifact_ids) != len(columns):
+        raise ValueError("artifact_ids musi mieć po jednym ID na wiersz")
+    assert AntiDoubleCountingAudit.verify(), "Anti-Double-Counting audit failed!"
+
+    r_th = columns.z_thevenin_ohm.real
+    x_th = columns.z_thevenin_ohm.imag
+    # hypot jak abs(complex) w CPython; np.abs(complex) różni się na ostatnim bicie
+    z_abs = np.hypot(r_th, x_th)
+    run_key = _input_run_key(columns.project_name, columns.case_name, columns.run_timestamp)
+    for index in range(len(columns)):
+        if artifact_ids is not None:
+            artifact_id = artifact_ids[index]
+        else:
+            artifact_id = proof_artifact_id(
+                run_key, columns.fault_type[index], columns.fault_node_id[index]
+            )
+        yield ProofGenerator._build_sc3f_proof(
+            columns.row(index),
+            artifact_id,
+            z_abs=float(z_abs[index]),
+            r_th=float(r_th[index]),
+            x_th=float(x_th[index]),
+        )
+
+
+def iter_sc1_proofs(
+    inputs: Iterable[SC1Input],
+    artifact_id: UUID | None = None,
+) -> Iterator[ProofDocument]:
+    """
+    Dowody SC1 (1F-Z, 2F, 2F-Z) dla kolejnych danych, emitowane leniwie.
+
+    Arytmetyka zespolona SC1 pozostaje skalarna: dzielenie zespolone numpy
+    i CPython różni się na ostatnim bicie, a dowód musi być identyczny
+    z generate_sc1_proof.
+    """
+    for data in inputs:
+        yield ProofGenerator.generate_sc1_proof(
+            data,
+            artifact_id
+            if artifact_id is not None
+            else proof_artifact_id(
+                _input_run_key(data.project_name, data.case_name, data.run_timestamp),
+                data.fault_type,
+                data.fault_node_id,
+            ),
+        )
+
+
+def iter_vdrop_proofs(
+    inputs: Iterable[VDROPInput],
+    artifact_id: UUID | None = None,
+) -> Iterator[ProofDocument]:
+    """
+    Dowody VDROP dla kolejnych ścieżek źródło → odbiór, emitowane leniwie.
+
+    Bez wersji kolumnowej: dowód VDROP (MVP) ma jeden odcinek, czyli kilka
+    działań zmiennoprzecinkowych; koszt leży w budowie kroków dowodu,
+    a kolumny numpy dodałyby jedynie konwersje typów.
+    """
+    for data in inputs:
+        yield ProofGenerator.generate_vdrop_proof(
+            data,
+            artifact_id
+            if artifact_id is not None
+            else proof_artifact_id(
+                _input_run_key(data.project_name, data.case_name, data.run_timestamp),
+                "VDROP",
+                f"{data.source_bus_id}->{data.target_bus_id}",
+            ),
+        )
+
+
+# =============================================================================
+# Parallel pack export
+# =============================================================================
+
+# Pula współdzielona przez wszystkie eksporty; tworzona przy pierwszym użyciu
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Pula procesów „spawn” (bezpieczny w serwerze wielowątkowym).
+
+    PROOF_PACK_WORKERS nadpisuje liczbę procesów (najwyżej liczba CPU).
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = int(os.environ.get("PROOF_PACK_WORKERS", DEFAULT_MAX_WORKERS))
+            _executor = ProcessPoolExecutor(
+                max_workers=max(1, min(workers, os.cpu_count() or 1)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def shutdown_pack_executor() -> None:
+    """Zamknięcie współdzielonej puli (kolejne eksporty utworzą nową)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _sc3f_pack_chunk(
+    columns: SC3FColumns,
+    context: ProofPackContext,
+    artifact_ids: Sequence[UUID] | None,
+) -> list[tuple[str, bytes]]:
+    """Pakiety ZIP fragmentu kolumn (wykonywane w procesie puli)."""
+    builder = ProofPackBuilder(context)
+    return [
+        (node_id, builder.build(proof))
+        for node_id, proof in zip(columns.fault_node_id, iter_sc3f_proofs(columns, artifact_ids))
+    ]
+
+
+def iter_sc3f_proof_packs(
+    columns: SC3FColumns,
+    context: ProofPackContext,
+    *,
+    artifact_ids: Sequence[UUID] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Pakiety dowodowe SC3F (fault_node_id, ZIP) dla wszystkich szyn.
+
+    Fragmenty po chunk_size szyn przetwarzane we współdzielonej puli
+    procesów; w toku najwyżej max_workers fragmentów, kolejny zlecany po
+    odebraniu najstarszego. Wyniki w kolejności wierszy. Jeden fragment
+    lub max_workers < 2 — bez puli.
+    Argumenty sprawdzane od razu, nie przy pierwszym next().
+    """
+    if artifact_ids is not None and len(artifact_ids) != len(columns):
+        raise ValueError("artifact_ids musi mieć po jednym ID na wiersz")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size musi być dodatni, otrzymano {chunk_size}")
+    return _iter_sc3f_proof_packs(columns, context, artifact_ids, max_workers, chunk_size)
+
+
+def _iter_sc3f_proof_packs(
+    columns: SC3FColumns,
+    context: ProofPackContext,
+    artifact_ids: Sequence[UUID] | None,
+    max_workers: int,
+    chunk_size: int,
+) -> Iterator[tuple[str, bytes]]:
+    chunks = (
+        (
+            columns.slice(start, min(start + chunk_size, len(columns))),
+            context,
+            artifact_ids[start : start + chunk_size] if artifact_ids is not None else None,
+        )
+        for start in range(0, len(columns), chunk_size)
+    )
+    if len(columns) <= chunk_size or max_workers < 2:
+        for chunk in chunks:
+            yield from _sc3f_pack_chunk(*chunk)
+        return
+
+    executor = _get_executor()
+    in_flight: deque[Future[list[tuple[str, bytes]]]] = deque()
+    try:
+        for chunk in chunks:
+            in_flight.append(executor.submit(_sc3f_pack_chunk, *chunk))
+            if len(in_flight) >= max_workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+    except BrokenProcessPool:
+        # Martwa pula nie może obsłużyć kolejnych eksportów
+        shutdown_pack_executor()
+        raise
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def stream_sc3f_pack_bundle(
+    columns: SC3FColumns,
+    context: ProofPackContext,
+    *,
+    artifact_ids: Sequence[UUID] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Pakiety SC3F wszystkich szyn w jednym ZIP (pakiet_dowodowy/<szyna>.zip).
+
+    Bajty oddawane po każdym pakiecie — w pamięci najwyżej max_workers
+    fragmentów (zleconych do puli lub odbieranych), nie cały eksport.
+    """
+    packs = iter_sc3f_proof_packs(
+        columns,
+        context,
+        artifact_ids=artifact_ids,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    )
+    return _stream_pack_bundle(packs)
+
+
+def _stream_pack_bundle(packs: Iterator[tuple[str, bytes]]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with ProofPackWriter(sink) as writer:
+        for node_id, pack in packs:
+            writer.add_file(f"pakiet_dowodowy/{node_id}.zip", pack)
+            yield from sink.drain()
+    yield from sink.drain()
@@ -49,6 +49,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from application.proof_engine.latex_renderer import escape_latex, math_block
 from application.proof_engine.registries.ls_equations import LS_EQUATIONS
 from application.proof_engine.types import EquationDefinition, SymbolDefinition
 
@@ -2414,9 +2415,48 @@ class AntiDoubleCountingAudit:
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class CompiledEquation:
+    """
+    Równanie skompilowane przy zamrożeniu rejestru.
+
+    Stałe fragmenty LaTeX (blok wzoru, nazwa po escape, wpis rejestru równań)
+    budowane są raz — renderer dowodu tylko je wstawia, zamiast składać je
+    dla każdego kroku każdego dowodu.
+    """
+
+    equation: EquationDefinition
+    formula_block: str
+    name_latex: str
+    register_entry: str
+    symbols_by_key: dict[str, SymbolDefinition]
+
+    def symbol_for(self, mapping_key: str) -> SymbolDefinition | None:
+        return self.symbols_by_key.get(mapping_key)
+
+
+def compile_equation(equation: EquationDefinition) -> CompiledEquation:
+    formula_block = math_block(equation.latex.strip())
+    name_latex = escape_latex(equation.name_pl)
+    register_entry = "\n".join([
+        rf"\subsection*{{{escape_latex(equation.equation_id)}: {name_latex}}}",
+        rf"\textit{{{escape_latex(equation.standard_ref)}}}",
+        "",
+        formula_block,
+    ])
+    return CompiledEquation(
+        equation=equation,
+        formula_block=formula_block,
+        name_latex=name_latex,
+        register_entry=register_entry,
+        symbols_by_key={sym.mapping_key: sym for sym in equation.symbols},
+    )
+
+
 class _EquationRegistryStore:
     def __init__(self) -> None:
         self._equations: dict[str, EquationDefinition] = {}
+        self._compiled: dict[str, CompiledEquation] = {}
         self._frozen = False
 
     def merge(self, equations: dict[str, EquationDefinition]) -> None:
@@ -2429,11 +2469,24 @@ class _EquationRegistryStore:
         self._equations.update(equations)
 
     def freeze(self) -> None:
+        self._compiled = {
+            equation_id: compile_equation(equation)
+            for equation_id, equation in self._equations.items()
+        }
         self._frozen = True
 
     def get(self, equation_id: str) -> EquationDefinition | None:
         return self._equations.get(equation_id)
 
+    def compiled(self, equation: EquationDefinition) -> CompiledEquation:
+        """Skompilowane równanie; spoza rejestru — kompilowane na miejscu."""
+        compiled = self._compiled.get(equation.equation_id)
+        if compiled is not None and (
+            compiled.equation is equation or compiled.equation == equation
+        ):
+            return compiled
+        return compile_equation(equation)
+
     def values(self):
         return self._equations.values()
 
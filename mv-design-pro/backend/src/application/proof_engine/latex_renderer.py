@@ -9,15 +9,92 @@ Generuje dokumenty LaTeX z ProofDocument:
 - Bez inline LaTeX
 - Terminologia normowa PN-EN (PL)
 - Obsługa Q(U) (P11.1b) z tabelą counterfactual A/B/Δ
+- Pakiet wielu dowodów w jednym dokumencie (render_batch): wspólna
+  preambuła i rejestr równań
+
+Stałe fragmenty równań kompilowane są przy zamrożeniu rejestru
+(CompiledEquation); escape i formatowanie wartości są memoizowane.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from application.proof_engine.types import ProofDocument, ProofStep, ProofType
 
+_LATEX_ESCAPES = (
+    ("&", r"\&"),
+    ("%", r"\%"),
+    ("$", r"\$"),
+    ("#", r"\#"),
+    ("_", r"\_"),
+    ("{", r"\{"),
+    ("}", r"\}"),
+    ("~", r"\textasciitilde{}"),
+    ("^", r"\textasciicircum{}"),
+)
+
+_MEMO_SIZE = 16384
+
+
+def math_block(latex: str) -> str:
+    """Opakowuje LaTeX w blok $$...$$."""
+    return f"$$\n{latex}\n$$"
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def escape_latex(text: str) -> str:
+    """Escape specjalnych znaków LaTeX (memoizowany)."""
+    for char, replacement in _LATEX_ESCAPES:
+        text = text.replace(char, replacement)
+    return text
+
+
+def format_value_latex(value, unit: str) -> str:
+    """Wartość z jednostką w LaTeX (memoizowana, poza zerami ze znakiem)."""
+    # -0.0 == 0.0 dzielą klucz memo, a formatują się różnie ("-0.0000")
+    if isinstance(value, (int, float, complex)) and value.real == 0:
+        return _format_value_latex(value, unit)
+    return _format_value_latex_memo(value, unit)
+
+
+def format_numeric_value(value) -> str:
+    """Wartość numeryczna (memoizowana, poza zerami ze znakiem)."""
+    if isinstance(value, (int, float, complex)) and value.real == 0:
+        return _format_numeric_value(value)
+    return _format_numeric_value_memo(value)
+
+
+def _format_value_latex(value, unit: str) -> str:
+    if isinstance(value, complex):
+        r = value.real
+        i = value.imag
+        sign = "+" if i >= 0 else "-"
+        return rf"{r:.4f} {sign} j{abs(i):.4f}\,\text{{{unit}}}"
+    elif isinstance(value, (int, float)):
+        return rf"{value:.4f}\,\text{{{unit}}}"
+    else:
+        return rf"{value}\,\text{{{unit}}}"
+
+
+def _format_numeric_value(value) -> str:
+    if isinstance(value, complex):
+        r = value.real
+        i = value.imag
+        sign = "+" if i >= 0 else "-"
+        return f"{r:.4f} {sign} j{abs(i):.4f}"
+    elif isinstance(value, (int, float)):
+        return f"{value:.4f}"
+    else:
+        return str(value)
+
+
+_format_value_latex_memo = lru_cache(maxsize=_MEMO_SIZE, typed=True)(_format_value_latex)
+_format_numeric_value_memo = lru_cache(maxsize=_MEMO_SIZE, typed=True)(_format_numeric_value)
+
 
 class LaTeXRenderer:
     """
@@ -76,14 +153,74 @@ class LaTeXRenderer:
             r"\maketitle",
             r"\tableofcontents",
             r"\newpage",
+            *cls._render_body(doc),
+            r"\end{document}",
+        ]
+        return "\n\n".join(parts)
+
+    @classmethod
+    def render_batch(
+        cls,
+        docs: Sequence[ProofDocument],
+        *,
+        title_pl: str = "Pakiet dowodów",
+    ) -> str:
+        """
+        Renderuje wiele dowodów (np. SC3F dla wszystkich szyn) do jednego dokumentu.
+
+        Preambuła i rejestr równań są wspólne — każde użyte równanie
+        pojawia się raz, a kroki dowodów odsyłają do rejestru. Każdy dowód
+        jest osobną częścią (\\part) z tymi samymi sekcjami co render().
+
+        Raises:
+            ValueError: Pusta lista dowodów
+        """
+        from application.proof_engine.equation_registry import registry
+
+        if not docs:
+            raise ValueError("Brak dowodów do renderowania")
+
+        equations = {
+            step.equation.equation_id: step.equation
+            for doc in docs
+            for step in doc.steps
+        }
+        register = [r"\section*{Rejestr równań}"]
+        register.extend(
+            registry.compiled(equations[equation_id]).register_entry
+            for equation_id in sorted(equations)
+        )
+        created_at = max(doc.created_at for doc in docs)
+
+        parts = [
+            cls.PREAMBLE,
+            rf"""
+\title{{{escape_latex(title_pl)}}}
+\author{{MV-DESIGN-PRO}}
+\date{{{created_at.strftime('%Y-%m-%d %H:%M:%S')}}}
+""",
+            r"\begin{document}",
+            r"\maketitle",
+            r"\tableofcontents",
+            r"\newpage",
+            "\n\n".join(register),
+        ]
+        for doc in docs:
+            parts.append(rf"\part{{{cls._escape(doc.title_pl)}}}")
+            parts.extend(cls._render_body(doc, shared_register=True))
+        parts.append(r"\end{document}")
+        return "\n\n".join(parts)
+
+    @classmethod
+    def _render_body(cls, doc: ProofDocument, *, shared_register: bool = False) -> list[str]:
+        """Sekcje jednego dowodu (bez preambuły i otoczenia dokumentu)."""
+        return [
             cls._render_header(doc),
             cls._render_load_flow_voltage_section(doc),
             cls._render_losses_energy_section(doc),
-            cls._render_steps(doc),
+            cls._render_steps(doc, shared_register=shared_register),
             cls._render_summary(doc),
-            r"\end{document}",
         ]
-        return "\n\n".join(parts)
 
     @classmethod
     def _render_title(cls, doc: ProofDocument) -> str:
@@ -126,23 +263,29 @@ class LaTeXRenderer:
         return "\n".join(lines)
 
     @classmethod
-    def _render_steps(cls, doc: ProofDocument) -> str:
+    def _render_steps(cls, doc: ProofDocument, *, shared_register: bool = False) -> str:
         """Renderuje kroki dowodu."""
         lines = [r"\section{Dowód}"]
 
         for step in sorted(doc.steps, key=lambda s: s.step_number):
-            lines.append(cls._render_step(step))
+            lines.append(cls._render_step(step, shared_register=shared_register))
 
         return "\n\n".join(lines)
 
     @classmethod
-    def _render_step(cls, step: ProofStep) -> str:
+    def _render_step(cls, step: ProofStep, *, shared_register: bool = False) -> str:
         """Renderuje pojedynczy krok dowodu."""
+        from application.proof_engine.equation_registry import registry
+
+        if shared_register:
+            formula = rf"Równanie {escape_latex(step.equation.equation_id)} (rejestr równań)"
+        else:
+            formula = registry.compiled(step.equation).formula_block
         parts = [
             rf"\subsection{{Krok {step.step_number}: {cls._escape(step.title_pl)}}}",
             "",
             r"\textbf{Wzór:}",
-            cls._math_block(step.equation.latex.strip()),
+            formula,
             "",
             r"\textbf{Dane:}",
             r"\begin{itemize}",
@@ -614,48 +757,19 @@ class LaTeXRenderer:
     @staticmethod
     def _math_block(latex: str) -> str:
         """Opakowuje LaTeX w blok $$...$$."""
-        return f"$$\n{latex}\n$$"
+        return math_block(latex)
 
     @classmethod
     def _escape(cls, text: str) -> str:
         """Escape specjalnych znaków LaTeX."""
-        replacements = {
-            "&": r"\&",
-            "%": r"\%",
-            "$": r"\$",
-            "#": r"\#",
-            "_": r"\_",
-            "{": r"\{",
-            "}": r"\}",
-            "~": r"\textasciitilde{}",
-            "^": r"\textasciicircum{}",
-        }
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
-        return text
+        return escape_latex(text)
 
     @classmethod
     def _format_value_latex(cls, val) -> str:
         """Formatuje wartość do LaTeX."""
-        if isinstance(val.value, complex):
-            r = val.value.real
-            i = val.value.imag
-            sign = "+" if i >= 0 else "-"
-            return rf"{r:.4f} {sign} j{abs(i):.4f}\,\text{{{val.unit}}}"
-        elif isinstance(val.value, (int, float)):
-            return rf"{val.value:.4f}\,\text{{{val.unit}}}"
-        else:
-            return rf"{val.value}\,\text{{{val.unit}}}"
+        return format_value_latex(val.value, val.unit)
 
     @classmethod
     def _format_numeric_value(cls, value) -> str:
         """Formatuje wartość numeryczną."""
-        if isinstance(value, complex):
-            r = value.real
-            i = value.imag
-            sign = "+" if i >= 0 else "-"
-            return f"{r:.4f} {sign} j{abs(i):.4f}"
-        elif isinstance(value, (int, float)):
-            return f"{value:.4f}"
-        else:
-            return str(value)
+        return format_numeric_value(value)
@@ -16,30 +16,67 @@ Pakiety dowodowe:
 - Q(U) Regulation: NC RfG compliance
 """
 
-from application.proof_engine.packs.p14_power_flow import (
-    P14PowerFlowInput,
-    P14PowerFlowProof,
-)
-from application.proof_engine.packs.p16_losses import (
-    P16LossesInput,
-    P16LossesProof,
-)
-from application.proof_engine.packs.sc_asymmetrical import (
-    SCAsymmetricalPackInput,
-    SCAsymmetricalPackResult,
-    SCAsymmetricalProofPack,
-)
-from application.proof_engine.packs.protection_settings import (
-    ProtectionSettingsProofInput,
-    ProtectionSettingsProofPack,
-    ProtectionSettingsProofResult,
-)
-from application.proof_engine.packs.qu_regulation import (
-    QUCharacteristicPoint,
-    QURegulationProofInput,
-    QURegulationProofPack,
-    QURegulationProofResult,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from application.proof_engine.packs.p14_power_flow import (
+        P14PowerFlowInput,
+        P14PowerFlowProof,
+    )
+    from application.proof_engine.packs.p16_losses import (
+        P16LossesInput,
+        P16LossesProof,
+    )
+    from application.proof_engine.packs.sc_asymmetrical import (
+        SCAsymmetricalPackInput,
+        SCAsymmetricalPackResult,
+        SCAsymmetricalProofPack,
+    )
+    from application.proof_engine.packs.protection_settings import (
+        ProtectionSettingsProofInput,
+        ProtectionSettingsProofPack,
+        ProtectionSettingsProofResult,
+    )
+    from application.proof_engine.packs.qu_regulation import (
+        QUCharacteristicPoint,
+        QURegulationProofInput,
+        QURegulationProofPack,
+        QURegulationProofResult,
+    )
+
+# Packs load on first access; most pull in the proof generator and equation registries
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "application.proof_engine.packs.p14_power_flow": (
+        "P14PowerFlowInput",
+        "P14PowerFlowProof",
+    ),
+    "application.proof_engine.packs.p16_losses": (
+        "P16LossesInput",
+        "P16LossesProof",
+    ),
+    "application.proof_engine.packs.sc_asymmetrical": (
+        "SCAsymmetricalPackInput",
+        "SCAsymmetricalPackResult",
+        "SCAsymmetricalProofPack",
+    ),
+    "application.proof_engine.packs.protection_settings": (
+        "ProtectionSettingsProofInput",
+        "ProtectionSettingsProofPack",
+        "ProtectionSettingsProofResult",
+    ),
+    "application.proof_engine.packs.qu_regulation": (
+        "QUCharacteristicPoint",
+        "QURegulationProofInput",
+        "QURegulationProofPack",
+        "QURegulationProofResult",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "P14PowerFlowInput",
@@ -57,3 +94,16 @@ __all__ = [
     "QURegulationProofPack",
     "QURegulationProofResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
@@ -30,7 +30,6 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from application.proof_engine.proof_generator import ProofGenerator, SC1Input
 from application.proof_engine.proof_pack import ProofPackBuilder, ProofPackContext
 from application.proof_engine.types import ProofDocument
 
@@ -121,6 +120,9 @@ class SCAsymmetricalProofPack:
         Returns:
             SCAsymmetricalPackResult z trzema dowodami
         """
+        # Generator dowodów (duży moduł) ładowany przy pierwszym pakiecie
+        from application.proof_engine.proof_generator import ProofGenerator, SC1Input
+
         if artifact_id is None:
             artifact_id = uuid4()
 
@@ -516,17 +516,33 @@ class ProofGenerator:
         # Weryfikacja anti-double-counting przed generacją
         assert AntiDoubleCountingAudit.verify(), "Anti-Double-Counting audit failed!"
 
-        if artifact_id is None:
-            artifact_id = uuid4()
+        return cls._build_sc3f_proof(
+            data,
+            artifact_id if artifact_id is not None else uuid4(),
+            z_abs=abs(data.z_thevenin_ohm),
+            r_th=data.z_thevenin_ohm.real,
+            x_th=data.z_thevenin_ohm.imag,
+        )
+
+    @classmethod
+    def _build_sc3f_proof(
+        cls,
+        data: SC3FInput,
+        artifact_id: UUID,
+        *,
+        z_abs: float,
+        r_th: float,
+        x_th: float,
+    ) -> ProofDocument:
+        """
+        Składa dowód SC3F z policzonych wartości pośrednich |Z_th|, R_th, X_th.
 
+        Wspólne dla generate_sc3f_proof i wsadowego iter_sc3f_proofs
+        (tam wartości pośrednie liczone są wektorowo dla wszystkich szyn).
+        """
         steps: list[ProofStep] = []
         step_number = 0
 
-        # Wartości pośrednie do reużycia
-        z_abs = abs(data.z_thevenin_ohm)
-        r_th = data.z_thevenin_ohm.real
-        x_th = data.z_thevenin_ohm.imag
-
         # =====================================================================
         # Krok 1: Impedancja Thevenina (prezentacja wartości z solvera)
         # =====================================================================
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
@@ -7,6 +8,7 @@ import io
 import json
 from pathlib import Path
 import sys
+from typing import IO
 import zipfile
 
 from application.proof_engine.proof_inspector.exporters import (
@@ -18,6 +20,11 @@ from application.proof_engine.proof_inspector.exporters import (
 from application.proof_engine.types import ProofDocument, ProofType
 
 _FIXED_ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+_WRITE_CHUNK_BYTES = 64 * 1024
+
+_MANIFEST_PATH = "proof_pack/manifest.json"
+_SIGNATURE_PATH = "proof_pack/signature.json"
+_PDF_NAME = "proof.pdf"
 
 
 @dataclass(frozen=True)
@@ -29,56 +36,131 @@ class ProofPackContext:
     mv_design_pro_version: str | None = None
 
 
+@dataclass(frozen=True)
+class PackFileDigest:
+    path: str
+    sha256: str
+    bytes: int
+
+    @classmethod
+    def of(cls, path: str, payload: bytes) -> PackFileDigest:
+        return cls(path=path, sha256=_sha256_hex(payload), bytes=len(payload))
+
+    def record(self) -> dict[str, object]:
+        return {"path": self.path, "sha256": self.sha256, "bytes": self.bytes}
+
+
+class ProofPackWriter:
+    """
+    Strumieniowy zapis ZIP pakietu dowodowego do dowolnego ujścia binarnego.
+
+    Każdy plik jest haszowany (SHA-256) w trakcie zapisu, więc w pamięci
+    trzymany jest najwyżej jeden plik. Ujście bez seek() (np. odpowiedź HTTP)
+    dostaje wpisy z deskryptorami danych — ZIP jest poprawny, ale jego bajty
+    różnią się od zapisu do pliku/BytesIO.
+    """
+
+    def __init__(self, sink: IO[bytes]) -> None:
+        self._zip = zipfile.ZipFile(sink, mode="w")
+
+    def __enter__(self) -> ProofPackWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add_directory(self, path: str) -> None:
+        zip_info = _zip_info(path)
+        zip_info.external_attr = 0o40755 << 16
+        with self._zip.open(zip_info, mode="w"):
+            pass
+
+    def add_file(self, path: str, payload: bytes | Iterable[bytes]) -> PackFileDigest:
+        zip_info = _zip_info(path)
+        zip_info.external_attr = 0o100644 << 16
+        digest = hashlib.sha256()
+        size = 0
+        chunks = _iter_chunks(payload) if isinstance(payload, bytes) else payload
+        with self._zip.open(zip_info, mode="w") as member:
+            for chunk in chunks:
+                member.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        return PackFileDigest(path=path, sha256=digest.hexdigest(), bytes=size)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class PackFingerprint:
+    """SHA-256 konkatenacji skrótów plików w kolejności ścieżek, liczony przyrostowo."""
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self._last_path = ""
+
+    def update(self, file_digest: PackFileDigest) -> None:
+        if file_digest.path <= self._last_path:
+            raise ValueError(f"Pliki pakietu poza kolejnością: {file_digest.path}")
+        self._last_path = file_digest.path
+        self._hash.update(file_digest.sha256.encode("utf-8"))
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
 class ProofPackBuilder:
     def __init__(self, context: ProofPackContext) -> None:
         self._context = context
 
     def build(self, proof_doc: ProofDocument) -> bytes:
-        proof_json = _normalize_newlines(export_to_json(proof_doc)).encode("utf-8")
-        proof_tex = _normalize_newlines(export_to_tex(proof_doc)).encode("utf-8")
-        proof_pdf = self._maybe_export_pdf(proof_doc)
-
-        file_entries: dict[str, bytes] = {
-            "proof_pack/proof.json": proof_json,
-            "proof_pack/proof.tex": proof_tex,
-        }
-        if proof_pdf is not None:
-            file_entries["proof_pack/proof.pdf"] = proof_pdf
-
-        manifest = self._build_manifest(proof_doc, file_entries)
-        manifest_bytes = _normalize_newlines(
-            json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
-        ).encode("utf-8")
+        buffer = io.BytesIO()
+        self.write(proof_doc, buffer)
+        return buffer.getvalue()
 
-        signature_bytes = self._build_signature(file_entries, manifest_bytes)
+    def write(self, proof_doc: ProofDocument, sink: IO[bytes]) -> None:
+        for _ in self._write_members(proof_doc, sink):
+            pass
 
-        return self._build_zip(file_entries, manifest_bytes, signature_bytes)
+    def stream(self, proof_doc: ProofDocument) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        for _ in self._write_members(proof_doc, sink):
+            yield from sink.drain()
+        yield from sink.drain()
 
-    def _maybe_export_pdf(self, proof_doc: ProofDocument) -> bytes | None:
-        if not is_pdf_export_available():
-            return None
-        try:
-            return export_to_pdf(proof_doc)
-        except RuntimeError:
-            return None
+    def _write_members(self, proof_doc: ProofDocument, sink: IO[bytes]) -> Iterator[None]:
+        file_entries = _export_proof_files(proof_doc, "proof_pack/")
+        digests = {
+            path: PackFileDigest.of(path, payload) for path, payload in file_entries.items()
+        }
+        manifest_bytes = _dump_json(self._build_manifest(proof_doc, digests))
+        digests[_MANIFEST_PATH] = PackFileDigest.of(_MANIFEST_PATH, manifest_bytes)
+        signature_bytes = self._build_signature(digests)
+
+        # Manifest sortuje się przed plikami dowodu — skróty liczone są przed zapisem
+        entries: dict[str, bytes | None] = {
+            "assets/": None,
+            "proof_pack/": None,
+            _MANIFEST_PATH: manifest_bytes,
+            _SIGNATURE_PATH: signature_bytes,
+            **file_entries,
+        }
+        with ProofPackWriter(sink) as writer:
+            for path in sorted(entries.keys()):
+                payload = entries[path]
+                if payload is None:
+                    writer.add_directory(path)
+                else:
+                    writer.add_file(path, payload)
+                yield
 
     def _build_manifest(
         self,
         proof_doc: ProofDocument,
-        file_entries: dict[str, bytes],
+        digests: dict[str, PackFileDigest],
     ) -> dict[str, object]:
-        files = []
-        for path in sorted(file_entries.keys()):
-            payload = file_entries[path]
-            files.append(
-                {
-                    "path": path,
-                    "sha256": _sha256_hex(payload),
-                    "bytes": len(payload),
-                }
-            )
-
-        latex_engine = "pdflatex" if "proof_pack/proof.pdf" in file_entries else None
+        files = [digests[path].record() for path in sorted(digests.keys())]
+        latex_engine = "pdflatex" if "proof_pack/proof.pdf" in digests else None
 
         return {
             "pack_version": "1.0",
@@ -88,107 +170,222 @@ class ProofPackBuilder:
             "run_id": self._context.run_id,
             "snapshot_id": self._context.snapshot_id,
             "proof_type": proof_pack_proof_type(proof_doc.proof_type),
-            "proof_fingerprint": _sha256_hex(file_entries["proof_pack/proof.json"]),
+            "proof_fingerprint": digests["proof_pack/proof.json"].sha256,
             "files": files,
-            "toolchain": {
-                "mv_design_pro_version": self._context.mv_design_pro_version,
-                "python_version": _python_version(),
-                "latex_engine": latex_engine,
-            },
-            "determinism": {
-                "canonical_json": True,
-                "sorted_zip_entries": True,
-                "stable_newlines": "LF",
-                "notes_pl": (
-                    "Pakiet jest deterministyczny dla identycznych wejść i toolchain."
-                ),
-            },
+            "toolchain": _manifest_toolchain(self._context, latex_engine),
+            "determinism": _DETERMINISM,
         }
 
-    def _build_signature(
-        self,
-        file_entries: dict[str, bytes],
-        manifest_bytes: bytes,
-    ) -> bytes:
-        signature_files = self._signature_files(file_entries, manifest_bytes)
-        pack_fingerprint = _pack_fingerprint(signature_files)
-        latex_engine = "pdflatex" if "proof_pack/proof.pdf" in file_entries else None
-
-        signature_payload = {
-            "schema_version": "1.0",
-            "algorithm": "SHA-256",
-            "pack_fingerprint": pack_fingerprint,
-            "files": signature_files,
-            "toolchain": {
-                "mv_design_pro_version": self._context.mv_design_pro_version,
-                "python_version": sys.version,
-                "latex_engine": latex_engine,
-            },
-            "notes_pl": (
-                "Plik signature.json służy wyłącznie do weryfikacji integralności "
-                "pakietu. Nie jest podpisem kryptograficznym."
-            ),
-        }
+    def _build_signature(self, digests: dict[str, PackFileDigest]) -> bytes:
+        fingerprint = PackFingerprint()
+        signature_files = []
+        for path in sorted(digests.keys()):
+            fingerprint.update(digests[path])
+            signature_files.append(_signature_record(digests[path]))
+        latex_engine = "pdflatex" if "proof_pack/proof.pdf" in digests else None
+        return _signature_bytes(self._context, signature_files, fingerprint, latex_engine)
 
-        return _normalize_newlines(
-            json.dumps(signature_payload, ensure_ascii=False, indent=2, sort_keys=True)
-        ).encode("utf-8")
 
-    def _signature_files(
-        self,
-        file_entries: dict[str, bytes],
-        manifest_bytes: bytes,
-    ) -> list[dict[str, object]]:
-        signature_entries = {
-            "proof_pack/manifest.json": manifest_bytes,
-            **file_entries,
-        }
-        files: list[dict[str, object]] = []
-        for path in sorted(signature_entries.keys()):
-            payload = signature_entries[path]
-            file_record: dict[str, object] = {
-                "path": path,
-                "sha256": _sha256_hex(payload),
-                "bytes": len(payload),
-            }
-            if path == "proof_pack/proof.pdf":
-                file_record["optional"] = True
-            files.append(file_record)
-        return files
+class ProjectProofPackBuilder:
+    """
+    Pakiet dowodowy wielu dowodów (np. wszystkie szyny przebiegu).
 
-    def _build_zip(
-        self,
-        file_entries: dict[str, bytes],
-        manifest_bytes: bytes,
-        signature_bytes: bytes,
-    ) -> bytes:
-        entries = {
-            "assets/": b"",
-            "proof_pack/": b"",
-            "proof_pack/manifest.json": manifest_bytes,
-            "proof_pack/signature.json": signature_bytes,
-            **file_entries,
-        }
+    Dowody zapisywane są strumieniowo w katalogach documents/NNNNNN_TYP/
+    (przed proof_pack/ w kolejności ścieżek), każdy plik haszowany w trakcie
+    zapisu; manifest i signature.json dopisywane na końcu z zebranych
+    skrótów. W pamięci trzymany jest jeden dowód naraz.
+    """
+
+    def __init__(self, context: ProofPackContext) -> None:
+        self._context = context
 
+    def build(self, proof_docs: Iterable[ProofDocument]) -> bytes:
         buffer = io.BytesIO()
-        with zipfile.ZipFile(
-            buffer,
-            mode="w",
-            compression=zipfile.ZIP_DEFLATED,
-            compresslevel=9,
-        ) as zf:
-            for path in sorted(entries.keys()):
-                data = entries[path]
-                is_dir = path.endswith("/")
-                zip_info = zipfile.ZipInfo(path, date_time=_FIXED_ZIP_TIMESTAMP)
-                zip_info.create_system = 0
-                if is_dir:
-                    zip_info.external_attr = 0o40755 << 16
-                else:
-                    zip_info.external_attr = 0o100644 << 16
-                zf.writestr(zip_info, data)
+        self.write(proof_docs, buffer)
         return buffer.getvalue()
 
+    def write(self, proof_docs: Iterable[ProofDocument], sink: IO[bytes]) -> None:
+        for _ in self._write_members(proof_docs, sink):
+            pass
+
+    def stream(self, proof_docs: Iterable[ProofDocument]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        for _ in self._write_members(proof_docs, sink):
+            yield from sink.drain()
+        yield from sink.drain()
+
+    def _write_members(
+        self, proof_docs: Iterable[ProofDocument], sink: IO[bytes]
+    ) -> Iterator[None]:
+        fingerprint = PackFingerprint()
+        signature_files: list[dict[str, object]] = []
+        files: list[dict[str, object]] = []
+        proofs: list[dict[str, object]] = []
+        created_at: datetime | None = None
+        has_pdf = False
+
+        with ProofPackWriter(sink) as writer:
+            writer.add_directory("assets/")
+            writer.add_directory("documents/")
+            for index, proof_doc in enumerate(proof_docs, start=1):
+                proof_type = proof_pack_proof_type(proof_doc.proof_type)
+                directory = f"documents/{index:06d}_{proof_type}/"
+                writer.add_directory(directory)
+                proof_fingerprint = ""
+                for path, payload in sorted(_export_proof_files(proof_doc, directory).items()):
+                    file_digest = writer.add_file(path, payload)
+                    fingerprint.update(file_digest)
+                    files.append(file_digest.record())
+                    signature_files.append(_signature_record(file_digest))
+                    if path.endswith("/proof.json"):
+                        proof_fingerprint = file_digest.sha256
+                    has_pdf = has_pdf or path.endswith(f"/{_PDF_NAME}")
+                proofs.append(
+                    {
+                        "index": index,
+                        "path": directory,
+                        "artifact_id": str(proof_doc.artifact_id),
+                        "proof_type": proof_type,
+                        "proof_fingerprint": proof_fingerprint,
+                    }
+                )
+                if created_at is None or _as_utc(proof_doc.created_at) > created_at:
+                    created_at = _as_utc(proof_doc.created_at)
+                yield
+
+            latex_engine = "pdflatex" if has_pdf else None
+            manifest = {
+                "pack_version": "1.0",
+                "pack_scope": "project",
+                "created_at_utc": _format_datetime_utc(created_at),
+                "project_id": self._context.project_id,
+                "case_id": self._context.case_id,
+                "run_id": self._context.run_id,
+                "snapshot_id": self._context.snapshot_id,
+                "proofs": proofs,
+                "files": files,
+                "toolchain": _manifest_toolchain(self._context, latex_engine),
+                "determinism": _DETERMINISM,
+            }
+            writer.add_directory("proof_pack/")
+            manifest_digest = writer.add_file(_MANIFEST_PATH, _dump_json(manifest))
+            fingerprint.update(manifest_digest)
+            signature_files.append(_signature_record(manifest_digest))
+            writer.add_file(
+                _SIGNATURE_PATH,
+                _signature_bytes(self._context, signature_files, fingerprint, latex_engine),
+            )
+            yield
+
+
+_DETERMINISM: dict[str, object] = {
+    "canonical_json": True,
+    "sorted_zip_entries": True,
+    "stable_newlines": "LF",
+    "notes_pl": (
+        "Pakiet jest deterministyczny dla identycznych wejść i toolchain."
+    ),
+}
+
+
+class _ChunkSink:
+    """Ujście bez seek(): zebrane bajty odbierane kawałkami przez drain()."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        if chunks:
+            yield b"".join(chunks)
+
+
+def _export_proof_files(proof_doc: ProofDocument, directory: str) -> dict[str, bytes]:
+    file_entries = {
+        f"{directory}proof.json": _normalize_newlines(export_to_json(proof_doc)).encode("utf-8"),
+        f"{directory}proof.tex": _normalize_newlines(export_to_tex(proof_doc)).encode("utf-8"),
+    }
+    proof_pdf = _maybe_export_pdf(proof_doc)
+    if proof_pdf is not None:
+        file_entries[f"{directory}{_PDF_NAME}"] = proof_pdf
+    return file_entries
+
+
+def _maybe_export_pdf(proof_doc: ProofDocument) -> bytes | None:
+    if not is_pdf_export_available():
+        return None
+    try:
+        return export_to_pdf(proof_doc)
+    except RuntimeError:
+        return None
+
+
+def _manifest_toolchain(
+    context: ProofPackContext, latex_engine: str | None
+) -> dict[str, object]:
+    return {
+        "mv_design_pro_version": context.mv_design_pro_version,
+        "python_version": _python_version(),
+        "latex_engine": latex_engine,
+    }
+
+
+def _signature_record(file_digest: PackFileDigest) -> dict[str, object]:
+    file_record = file_digest.record()
+    if file_digest.path.endswith(f"/{_PDF_NAME}"):
+        file_record["optional"] = True
+    return file_record
+
+
+def _signature_bytes(
+    context: ProofPackContext,
+    signature_files: list[dict[str, object]],
+    fingerprint: PackFingerprint,
+    latex_engine: str | None,
+) -> bytes:
+    signature_payload = {
+        "schema_version": "1.0",
+        "algorithm": "SHA-256",
+        "pack_fingerprint": fingerprint.hexdigest(),
+        "files": signature_files,
+        "toolchain": {
+            "mv_design_pro_version": context.mv_design_pro_version,
+            "python_version": sys.version,
+            "latex_engine": latex_engine,
+        },
+        "notes_pl": (
+            "Plik signature.json służy wyłącznie do weryfikacji integralności "
+            "pakietu. Nie jest podpisem kryptograficznym."
+        ),
+    }
+    return _dump_json(signature_payload)
+
+
+def _zip_info(path: str) -> zipfile.ZipInfo:
+    zip_info = zipfile.ZipInfo(path, date_time=_FIXED_ZIP_TIMESTAMP)
+    zip_info.create_system = 0
+    return zip_info
+
+
+def _iter_chunks(payload: bytes) -> Iterator[bytes]:
+    view = memoryview(payload)
+    for start in range(0, len(view), _WRITE_CHUNK_BYTES):
+        yield view[start : start + _WRITE_CHUNK_BYTES]
+
+
+def _dump_json(payload: dict[str, object]) -> bytes:
+    return _normalize_newlines(
+        json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+    ).encode("utf-8")
+
 
 def resolve_mv_design_pro_version() -> str | None:
     try:
@@ -231,11 +428,13 @@ def proof_pack_proof_type(proof_type: ProofType) -> str:
 def _format_datetime_utc(value: datetime | None) -> str:
     if value is None:
         return "1970-01-01T00:00:00Z"
+    return _as_utc(value).isoformat().replace("+00:00", "Z")
+
+
+def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
-        value = value.replace(tzinfo=timezone.utc)
-    else:
-        value = value.astimezone(timezone.utc)
-    return value.isoformat().replace("+00:00", "Z")
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
 def _normalize_newlines(text: str) -> str:
@@ -246,10 +445,5 @@ def _sha256_hex(payload: bytes) -> str:
     return hashlib.sha256(payload).hexdigest()
 
 
-def _pack_fingerprint(files: list[dict[str, object]]) -> str:
-    concatenated_hashes = "".join(file_entry["sha256"] for file_entry in files)
-    return hashlib.sha256(concatenated_hashes.encode("utf-8")).hexdigest()
-
-
 def _python_version() -> str:
     return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
@@ -191,20 +191,14 @@ class ProtectionAnalysisService:
                 # Execute evaluation
                 result, trace = self._engine.evaluate(evaluation_input)
 
-                # Store result
-                uow.results.add_result(
+                # Store result and trace (one batched insert)
+                uow.results.add_results(
                     run_id=run.id,
                     project_id=run.project_id,
-                    result_type="protection_result",
-                    payload=result.to_dict(),
-                )
-
-                # Store trace
-                uow.results.add_result(
-                    run_id=run.id,
-                    project_id=run.project_id,
-                    result_type="protection_trace",
-                    payload=trace.to_dict(),
+                    results=[
+                        ("protection_result", result.to_dict()),
+                        ("protection_trace", trace.to_dict()),
+                    ],
                 )
 
                 # Update run to FINISHED
@@ -3,7 +3,8 @@ Protection Comparison Module — P15b SELECTIVITY (A/B)
 
 Backend-only protection comparison service.
 Compares two ProtectionAnalysisRun results to generate
-deterministic ranking of differences.
+deterministic ranking of differences. N-way mode compares one
+baseline against many variants over a columnar aligned matrix.
 
 INVARIANTS:
 - Read-only: Zero physics calculations
@@ -12,10 +13,18 @@ INVARIANTS:
 - Both runs must be FINISHED
 """
 
+from application.protection_comparison.n_way import (
+    AlignedProtectionMatrix,
+    align_protection_results,
+    compute_pair_rows,
+)
 from application.protection_comparison.service import (
     ProtectionComparisonService,
 )
 
 __all__ = [
+    "AlignedProtectionMatrix",
     "ProtectionComparisonService",
+    "align_protection_results",
+    "compute_pair_rows",
 ]
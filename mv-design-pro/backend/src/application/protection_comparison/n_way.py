@@ -0,0 +1,280 @@
+"""
+Protection Comparison N-way — baseline vs many variants
+
+Columnar alignment of ProtectionResult evaluations for comparing one
+baseline run against many variant runs (10+ study case variants).
+
+FLOW:
+1. ALIGN: Every ProtectionResult is loaded once and aligned by
+   (protected_element_ref, fault_target_id) into (runs × keys) arrays
+2. DIFF: State changes and deltas are computed vectorized per pair
+   (baseline row vs variant row of the matrix)
+3. CACHE: Aligned matrices are kept for follow-up drilldowns
+
+INVARIANTS (BINDING):
+1. READ-ONLY: Zero physics calculations, zero state mutations
+2. DETERMINISTIC: Rows are identical to the pairwise A/B comparison
+   (same key order, same state changes, same deltas)
+3. NO NORMATIVE INTERPRETATION: Only factual comparison
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from domain.protection_analysis import ProtectionResult, TripState
+from domain.protection_comparison import ProtectionComparisonRow, StateChange
+
+
+# =============================================================================
+# STATE CODES
+# =============================================================================
+
+# Integer codes of TripState in the aligned matrix (MISSING = no evaluation)
+STATE_CODE_MISSING = -1
+STATE_CODE_TRIPS = 0
+STATE_CODE_NO_TRIP = 1
+STATE_CODE_INVALID = 2
+
+_TRIP_STATE_TO_CODE: dict[TripState, int] = {
+    TripState.TRIPS: STATE_CODE_TRIPS,
+    TripState.NO_TRIP: STATE_CODE_NO_TRIP,
+    TripState.INVALID: STATE_CODE_INVALID,
+}
+
+_CODE_TO_TRIP_STATE_LABEL: dict[int, str] = {
+    STATE_CODE_MISSING: "MISSING",
+    STATE_CODE_TRIPS: TripState.TRIPS.value,
+    STATE_CODE_NO_TRIP: TripState.NO_TRIP.value,
+    STATE_CODE_INVALID: TripState.INVALID.value,
+}
+
+# Integer codes of StateChange produced by the vectorized diff
+_CHANGE_NO_CHANGE = 0
+_CHANGE_TRIP_TO_NO_TRIP = 1
+_CHANGE_NO_TRIP_TO_TRIP = 2
+_CHANGE_INVALID = 3
+
+_CODE_TO_STATE_CHANGE: dict[int, StateChange] = {
+    _CHANGE_NO_CHANGE: StateChange.NO_CHANGE,
+    _CHANGE_TRIP_TO_NO_TRIP: StateChange.TRIP_TO_NO_TRIP,
+    _CHANGE_NO_TRIP_TO_TRIP: StateChange.NO_TRIP_TO_TRIP,
+    _CHANGE_INVALID: StateChange.INVALID_CHANGE,
+}
+
+
+# =============================================================================
+# ALIGNED MATRIX
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class AlignedProtectionMatrix:
+    """
+    Protection evaluations of N runs aligned by (element, fault target).
+
+    Row index = run (order of run_ids, baseline first).
+    Column index = key (sorted (protected_element_ref, fault_target_id)).
+
+    Attributes:
+        run_ids: Run IDs in row order (baseline first)
+        keys: Sorted (protected_element_ref, fault_target_id) pairs
+        device_ids: Device ID per run and key ("" when missing)
+        state_codes: TripState codes, STATE_CODE_MISSING when missing (int8)
+        t_trip_s: Trip times [s], NaN when missing or None (float64)
+        i_fault_a: Fault currents [A], 0.0 when missing (float64)
+        margin_percent: Margins [%], NaN when missing or None (float64)
+    """
+    run_ids: tuple[str, ...]
+    keys: tuple[tuple[str, str], ...]
+    device_ids: tuple[tuple[str, ...], ...]
+    state_codes: np.ndarray
+    t_trip_s: np.ndarray
+    i_fault_a: np.ndarray
+    margin_percent: np.ndarray
+
+    @property
+    def present(self) -> np.ndarray:
+        """Boolean mask (runs × keys) of existing evaluations."""
+        return self.state_codes != STATE_CODE_MISSING
+
+    def run_index(self, run_id: str) -> int:
+        """Row index of a run in the matrix."""
+        return self.run_ids.index(run_id)
+
+    def drilldown(
+        self, protected_element_ref: str, fault_target_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Per-run values for a single (element, fault target) key.
+
+        Returns an empty list when the key is not present in any run.
+        """
+        key = (protected_element_ref, fault_target_id)
+        try:
+            col = self.keys.index(key)
+        except ValueError:
+            return []
+
+        return [
+            {
+                "run_id": run_id,
+                "device_id": self.device_ids[row][col],
+                "trip_state": _CODE_TO_TRIP_STATE_LABEL[int(self.state_codes[row, col])],
+                "t_trip_s": _optional_float(self.t_trip_s[row, col]),
+                "i_fault_a": float(self.i_fault_a[row, col]),
+                "margin_percent": _optional_float(self.margin_percent[row, col]),
+            }
+            for row, run_id in enumerate(self.run_ids)
+        ]
+
+
+def align_protection_results(
+    run_ids: tuple[str, ...],
+    results: tuple[ProtectionResult, ...],
+) -> AlignedProtectionMatrix:
+    """
+    Align evaluations of many ProtectionResults into columnar arrays.
+
+    Args:
+        run_ids: Run IDs in row order (baseline first)
+        results: ProtectionResult per run (same order as run_ids)
+
+    Returns:
+        AlignedProtectionMatrix with sorted key columns
+    """
+    if len(run_ids) != len(results):
+        raise ValueError("run_ids i results muszą mieć tę samą długość")
+
+    key_set: set[tuple[str, str]] = set()
+    for result in results:
+        for evaluation in result.evaluations:
+            key_set.add((evaluation.protected_element_ref, evaluation.fault_target_id))
+    keys = tuple(sorted(key_set))
+    col_by_key = {key: col for col, key in enumerate(keys)}
+
+    n_runs, n_keys = len(run_ids), len(keys)
+    state_codes = np.full((n_runs, n_keys), STATE_CODE_MISSING, dtype=np.int8)
+    t_trip_s = np.full((n_runs, n_keys), np.nan, dtype=np.float64)
+    i_fault_a = np.zeros((n_runs, n_keys), dtype=np.float64)
+    margin_percent = np.full((n_runs, n_keys), np.nan, dtype=np.float64)
+    device_ids: list[tuple[str, ...]] = []
+
+    for row, result in enumerate(results):
+        devices = [""] * n_keys
+        # Last evaluation wins for duplicate keys (same as the A/B index)
+        for evaluation in result.evaluations:
+            col = col_by_key[(evaluation.protected_element_ref, evaluation.fault_target_id)]
+            devices[col] = evaluation.device_id
+            state_codes[row, col] = _TRIP_STATE_TO_CODE[evaluation.trip_state]
+            t_trip_s[row, col] = np.nan if evaluation.t_trip_s is None else evaluation.t_trip_s
+            i_fault_a[row, col] = evaluation.i_fault_a
+            margin_percent[row, col] = (
+                np.nan if evaluation.margin_percent is None else evaluation.margin_percent
+            )
+        device_ids.append(tuple(devices))
+
+    for array in (state_codes, t_trip_s, i_fault_a, margin_percent):
+        array.setflags(write=False)
+
+    return AlignedProtectionMatrix(
+        run_ids=tuple(run_ids),
+        keys=keys,
+        device_ids=tuple(device_ids),
+        state_codes=state_codes,
+        t_trip_s=t_trip_s,
+        i_fault_a=i_fault_a,
+        margin_percent=margin_percent,
+    )
+
+
+# =============================================================================
+# VECTORIZED PAIR DIFF
+# =============================================================================
+
+
+def compute_pair_rows(
+    matrix: AlignedProtectionMatrix,
+    row_a: int,
+    row_b: int,
+) -> tuple[list[ProtectionComparisonRow], int]:
+    """
+    Build comparison rows for one (A, B) pair of the aligned matrix.
+
+    State changes, trip time deltas and fault current deltas are computed
+    over whole arrays; only keys present in A or B produce rows.
+
+    Returns:
+        Tuple of (rows, matched_count) — same contract as the A/B matcher
+    """
+    codes_a = matrix.state_codes[row_a]
+    codes_b = matrix.state_codes[row_b]
+    present_a = codes_a != STATE_CODE_MISSING
+    present_b = codes_b != STATE_CODE_MISSING
+
+    columns = np.flatnonzero(present_a | present_b)
+    matched_count = int(np.count_nonzero(present_a & present_b))
+
+    change = np.full(codes_a.shape, _CHANGE_INVALID, dtype=np.int8)
+    valid = (
+        present_a
+        & present_b
+        & (codes_a != STATE_CODE_INVALID)
+        & (codes_b != STATE_CODE_INVALID)
+    )
+    change[valid & (codes_a == codes_b)] = _CHANGE_NO_CHANGE
+    change[(codes_a == STATE_CODE_TRIPS) & (codes_b == STATE_CODE_NO_TRIP)] = (
+        _CHANGE_TRIP_TO_NO_TRIP
+    )
+    change[(codes_a == STATE_CODE_NO_TRIP) & (codes_b == STATE_CODE_TRIPS)] = (
+        _CHANGE_NO_TRIP_TO_TRIP
+    )
+
+    t_a = matrix.t_trip_s[row_a]
+    t_b = matrix.t_trip_s[row_b]
+    both_trip = (
+        (codes_a == STATE_CODE_TRIPS)
+        & (codes_b == STATE_CODE_TRIPS)
+        & ~np.isnan(t_a)
+        & ~np.isnan(t_b)
+    )
+    delta_t = np.where(both_trip, t_b - t_a, np.nan)
+    delta_i = matrix.i_fault_a[row_b] - matrix.i_fault_a[row_a]
+
+    devices_a = matrix.device_ids[row_a]
+    devices_b = matrix.device_ids[row_b]
+    i_a = matrix.i_fault_a[row_a]
+    i_b = matrix.i_fault_a[row_b]
+    m_a = matrix.margin_percent[row_a]
+    m_b = matrix.margin_percent[row_b]
+
+    rows: list[ProtectionComparisonRow] = []
+    for col in columns.tolist():
+        element_ref, fault_target_id = matrix.keys[col]
+        rows.append(ProtectionComparisonRow(
+            protected_element_ref=element_ref,
+            fault_target_id=fault_target_id,
+            device_id_a=devices_a[col],
+            device_id_b=devices_b[col],
+            trip_state_a=_CODE_TO_TRIP_STATE_LABEL[int(codes_a[col])],
+            trip_state_b=_CODE_TO_TRIP_STATE_LABEL[int(codes_b[col])],
+            t_trip_s_a=_optional_float(t_a[col]),
+            t_trip_s_b=_optional_float(t_b[col]),
+            i_fault_a_a=float(i_a[col]),
+            i_fault_a_b=float(i_b[col]),
+            delta_t_s=_optional_float(delta_t[col]),
+            delta_i_fault_a=float(delta_i[col]),
+            margin_percent_a=_optional_float(m_a[col]),
+            margin_percent_b=_optional_float(m_b[col]),
+            state_change=_CODE_TO_STATE_CHANGE[int(change[col])],
+        ))
+
+    return rows, matched_count
+
+
+def _optional_float(value: Any) -> float | None:
+    """Convert a NaN-encoded array value back to float | None."""
+    return None if np.isnan(value) else float(value)
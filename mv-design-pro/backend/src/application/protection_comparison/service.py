@@ -18,6 +18,9 @@ INVARIANTS (BINDING):
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Callable
 from uuid import UUID
@@ -52,6 +55,11 @@ from domain.protection_comparison import (
     compute_comparison_input_hash,
     new_protection_comparison,
 )
+from application.protection_comparison.n_way import (
+    AlignedProtectionMatrix,
+    align_protection_results,
+    compute_pair_rows,
+)
 from infrastructure.persistence.unit_of_work import UnitOfWork
 
 
@@ -66,6 +74,32 @@ DELAY_CHANGE_THRESHOLD_S = 0.05  # 50ms
 MARGIN_CHANGE_THRESHOLD_PERCENT = 5.0
 
 
+# =============================================================================
+# ALIGNED MATRIX CACHE (N-WAY DRILLDOWNS)
+# =============================================================================
+
+# Max number of aligned matrices kept in memory (least recently used evicted first)
+ALIGNED_MATRIX_CACHE_SIZE = 16
+
+# Keyed by run_ids tuple (baseline first). FINISHED runs are immutable,
+# so a cached matrix never goes stale.
+_aligned_matrix_cache: OrderedDict[tuple[str, ...], AlignedProtectionMatrix] = OrderedDict()
+
+
+def _cached_aligned_matrix(run_ids: tuple[str, ...]) -> AlignedProtectionMatrix | None:
+    matrix = _aligned_matrix_cache.get(run_ids)
+    if matrix is not None:
+        _aligned_matrix_cache.move_to_end(run_ids)
+    return matrix
+
+
+def _store_aligned_matrix(matrix: AlignedProtectionMatrix) -> None:
+    _aligned_matrix_cache[matrix.run_ids] = matrix
+    _aligned_matrix_cache.move_to_end(matrix.run_ids)
+    while len(_aligned_matrix_cache) > ALIGNED_MATRIX_CACHE_SIZE:
+        _aligned_matrix_cache.popitem(last=False)
+
+
 # =============================================================================
 # PROTECTION COMPARISON SERVICE
 # =============================================================================
@@ -80,6 +114,7 @@ class ProtectionComparisonService:
     USAGE:
         service = ProtectionComparisonService(uow_factory)
         result = service.compare(run_a_id, run_b_id)
+        results = service.compare_many(baseline_run_id, [variant_1_id, variant_2_id])
     """
 
     def __init__(self, uow_factory: Callable[[], UnitOfWork]) -> None:
@@ -131,121 +166,25 @@ class ProtectionComparisonService:
             result_a = self._get_protection_result(uow, run_a_id)
             result_b = self._get_protection_result(uow, run_b_id)
 
-            # 5. Initialize trace
-            trace_steps: list[ProtectionComparisonTraceStep] = []
-
-            # 6. Step 1: Match evaluations by (protected_element_ref, fault_target_id)
-            trace_steps.append(ProtectionComparisonTraceStep(
-                step="MATCH_EVALUATIONS",
-                description_pl="Dopasowanie ewaluacji po (element chroniony, punkt zwarcia)",
-                inputs={
-                    "evaluations_a_count": len(result_a.evaluations),
-                    "evaluations_b_count": len(result_b.evaluations),
-                },
-                outputs={},
-            ))
-
+            # 5. Match evaluations by (protected_element_ref, fault_target_id)
             rows, matched_count = self._match_evaluations(
                 result_a.evaluations,
                 result_b.evaluations,
             )
 
-            trace_steps[-1] = ProtectionComparisonTraceStep(
-                step="MATCH_EVALUATIONS",
-                description_pl="Dopasowanie ewaluacji po (element chroniony, punkt zwarcia)",
-                inputs={
-                    "evaluations_a_count": len(result_a.evaluations),
-                    "evaluations_b_count": len(result_b.evaluations),
-                },
-                outputs={
-                    "matched_pairs": matched_count,
-                    "total_rows": len(rows),
-                },
-            )
-
-            # 7. Step 2: Compute deltas and classify changes
-            trace_steps.append(ProtectionComparisonTraceStep(
-                step="COMPUTE_DELTAS",
-                description_pl="Obliczanie różnic czasów i prądów",
-                inputs={"row_count": len(rows)},
-                outputs={},
-            ))
-
-            rows = self._compute_deltas(rows)
-
-            state_change_counts = self._count_state_changes(rows)
-            trace_steps[-1] = ProtectionComparisonTraceStep(
-                step="COMPUTE_DELTAS",
-                description_pl="Obliczanie różnic czasów i prądów",
-                inputs={"row_count": len(rows)},
-                outputs=state_change_counts,
-            )
-
-            # 8. Step 3: Classify state changes
-            trace_steps.append(ProtectionComparisonTraceStep(
-                step="CLASSIFY_CHANGES",
-                description_pl="Klasyfikacja zmian stanów (TRIP_TO_NO_TRIP, NO_TRIP_TO_TRIP, itd.)",
-                inputs={"row_count": len(rows)},
-                outputs=state_change_counts,
-            ))
-
-            # 9. Step 4: Generate issue ranking
-            trace_steps.append(ProtectionComparisonTraceStep(
-                step="RANK_ISSUES",
-                description_pl="Generowanie rankingu problemów wg severity (5→1)",
-                inputs={
-                    "row_count": len(rows),
-                    "delay_threshold_s": DELAY_CHANGE_THRESHOLD_S,
-                    "margin_threshold_percent": MARGIN_CHANGE_THRESHOLD_PERCENT,
-                },
-                outputs={},
-            ))
-
-            ranking = self._generate_ranking(rows)
-
-            severity_counts = self._count_severities(ranking)
-            trace_steps[-1] = ProtectionComparisonTraceStep(
-                step="RANK_ISSUES",
-                description_pl="Generowanie rankingu problemów wg severity (5→1)",
-                inputs={
-                    "row_count": len(rows),
-                    "delay_threshold_s": DELAY_CHANGE_THRESHOLD_S,
-                    "margin_threshold_percent": MARGIN_CHANGE_THRESHOLD_PERCENT,
-                },
-                outputs={
-                    "total_issues": len(ranking),
-                    **severity_counts,
-                },
-            )
-
-            # 10. Build summary
-            summary = self._build_summary(rows, ranking)
-
-            # 11. Build result
-            comparison_id = str(UUID(int=hash((run_a_id, run_b_id, input_hash)) % (2**128)))
-
-            result = ProtectionComparisonResult(
-                comparison_id=comparison_id,
+            # 6. Deltas, ranking, summary and trace
+            result, trace = self._build_comparison(
                 run_a_id=run_a_id,
                 run_b_id=run_b_id,
                 project_id=str(run_a.project_id),
-                rows=tuple(rows),
-                ranking=tuple(ranking),
-                summary=summary,
                 input_hash=input_hash,
+                result_a=result_a,
+                result_b=result_b,
+                rows=rows,
+                matched_count=matched_count,
             )
 
-            # 12. Build trace
-            trace = ProtectionComparisonTrace(
-                comparison_id=comparison_id,
-                run_a_id=run_a_id,
-                run_b_id=run_b_id,
-                library_fingerprint_a=result_a.template_fingerprint,
-                library_fingerprint_b=result_b.template_fingerprint,
-                steps=tuple(trace_steps),
-            )
-
-            # 13. Store comparison in cache
+            # 7. Store comparison in cache
             self._store_comparison(
                 uow,
                 project_id=run_a.project_id,
@@ -258,6 +197,123 @@ class ProtectionComparisonService:
 
         return result
 
+    def compare_many(
+        self,
+        baseline_run_id: str,
+        variant_run_ids: Sequence[str],
+        max_workers: int | None = None,
+    ) -> tuple[ProtectionComparisonResult, ...]:
+        """
+        Compare a baseline run against many variant runs (N-way).
+
+        All ProtectionResults are loaded once and aligned into a columnar
+        matrix (see n_way.AlignedProtectionMatrix). Per-pair deltas are
+        computed vectorized; ranking and summary of each pair run on a
+        worker pool. Every pair is stored exactly like compare(baseline, variant),
+        so follow-up A/B lookups hit the comparison cache.
+
+        Args:
+            baseline_run_id: Baseline protection run ID (A of every pair)
+            variant_run_ids: Variant protection run IDs (B of each pair)
+            max_workers: Worker pool size (None = executor default)
+
+        Returns:
+            ProtectionComparisonResult per variant, in variant_run_ids order
+
+        Raises:
+            Same as compare()
+        """
+        run_ids = self._n_way_run_ids(baseline_run_id, variant_run_ids)
+        if len(run_ids) == 1:
+            return ()
+
+        with self._uow_factory() as uow:
+            # 1-2. Fetch and validate all runs (one result lookup per run)
+            runs, loaded = self._load_n_way_results(uow, run_ids)
+
+            # 3. Align all result sets once (cached for drilldowns)
+            matrix = _cached_aligned_matrix(run_ids)
+            if matrix is None:
+                matrix = align_protection_results(run_ids, loaded)
+                _store_aligned_matrix(matrix)
+
+            # 4. Check comparison cache (one scan for all pairs)
+            input_hashes = {
+                variant_id: compute_comparison_input_hash(baseline_run_id, variant_id)
+                for variant_id in run_ids[1:]
+            }
+            cached = self._get_cached_comparisons(uow, set(input_hashes.values()))
+
+            # 5. Per-pair diff on a worker pool
+            def build_pair(
+                row_b: int,
+            ) -> tuple[ProtectionComparisonResult, ProtectionComparisonTrace]:
+                rows, matched_count = compute_pair_rows(matrix, 0, row_b)
+                return self._build_comparison(
+                    run_a_id=baseline_run_id,
+                    run_b_id=run_ids[row_b],
+                    project_id=project_id,
+                    input_hash=input_hashes[run_ids[row_b]],
+                    result_a=loaded[0],
+                    result_b=loaded[row_b],
+                    rows=rows,
+                    matched_count=matched_count,
+                    deltas_computed=True,
+                )
+
+            pending = [
+                row_b for row_b in range(1, len(run_ids))
+                if input_hashes[run_ids[row_b]] not in cached
+            ]
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                built = dict(zip(pending, pool.map(build_pair, pending)))
+
+            # 6. Store new comparisons (single session, deterministic order)
+            comparisons: list[ProtectionComparisonResult] = []
+            for row_b in range(1, len(run_ids)):
+                variant_id = run_ids[row_b]
+                if row_b not in built:
+                    comparisons.append(cached[input_hashes[variant_id]])
+                    continue
+                result, trace = built[row_b]
+                self._store_comparison(
+                    uow,
+                    project_id=runs[0].project_id,
+                    run_a_id=baseline_run_id,
+                    run_b_id=variant_id,
+                    input_hash=input_hashes[variant_id],
+                    result=result,
+                    trace=trace,
+                )
+                comparisons.append(result)
+
+        return tuple(comparisons)
+
+    def get_aligned_matrix(
+        self,
+        baseline_run_id: str,
+        variant_run_ids: Sequence[str],
+    ) -> AlignedProtectionMatrix:
+        """
+        Get the aligned (runs × keys) matrix for drilldowns.
+
+        Returns the matrix cached by compare_many(); builds and caches it
+        when missing, with the same validation as compare_many().
+
+        Raises:
+            Same as compare()
+        """
+        run_ids = self._n_way_run_ids(baseline_run_id, variant_run_ids)
+        matrix = _cached_aligned_matrix(run_ids)
+        if matrix is not None:
+            return matrix
+
+        with self._uow_factory() as uow:
+            _, results = self._load_n_way_results(uow, run_ids)
+        matrix = align_protection_results(run_ids, results)
+        _store_aligned_matrix(matrix)
+        return matrix
+
     def get_comparison(self, comparison_id: str) -> ProtectionComparisonResult:
         """
         Get a comparison by ID.
@@ -298,6 +354,64 @@ class ProtectionComparisonService:
             pass
         raise ProtectionRunNotFoundError(run_id)
 
+    def _n_way_run_ids(
+        self, baseline_run_id: str, variant_run_ids: Sequence[str]
+    ) -> tuple[str, ...]:
+        """
+        Baseline first, then unique variants in given order (baseline excluded).
+        """
+        run_ids = [baseline_run_id]
+        for variant_id in variant_run_ids:
+            if variant_id not in run_ids:
+                run_ids.append(variant_id)
+        return tuple(run_ids)
+
+    def _load_n_way_results(
+        self, uow: UnitOfWork, run_ids: tuple[str, ...]
+    ) -> tuple[list[ProtectionAnalysisRun], tuple[ProtectionResult, ...]]:
+        """
+        Fetch runs and results of an N-way set; all FINISHED, one project, with results.
+        """
+        runs: list[ProtectionAnalysisRun] = []
+        results: list[ProtectionResult | None] = []
+        for run_id in run_ids:
+            run, result = self._get_protection_run_and_result(uow, run_id)
+            self._validate_run_status(run, run_id)
+            runs.append(run)
+            results.append(result)
+
+        project_id = str(runs[0].project_id)
+        for run in runs[1:]:
+            if str(run.project_id) != project_id:
+                raise ProtectionProjectMismatchError(project_id, str(run.project_id))
+
+        for run_id, result in zip(run_ids, results):
+            if result is None:
+                raise ProtectionResultNotFoundError(run_id)
+        return runs, tuple(r for r in results if r is not None)
+
+    def _get_protection_run_and_result(
+        self, uow: UnitOfWork, run_id: str
+    ) -> tuple[ProtectionAnalysisRun, ProtectionResult | None]:
+        """
+        Get a protection run and its ProtectionResult with one result lookup.
+        """
+        run: ProtectionAnalysisRun | None = None
+        result: ProtectionResult | None = None
+        try:
+            run_uuid = UUID(run_id)
+            for stored in uow.results.list_results(run_uuid):
+                result_type = stored.get("result_type")
+                if result_type == "protection_analysis_run" and run is None:
+                    run = ProtectionAnalysisRun.from_dict(stored.get("payload", {}))
+                elif result_type == "protection_result" and result is None:
+                    result = ProtectionResult.from_dict(stored.get("payload", {}))
+        except (ValueError, TypeError):
+            pass
+        if run is None:
+            raise ProtectionRunNotFoundError(run_id)
+        return run, result
+
     def _validate_run_status(
         self, run: ProtectionAnalysisRun, run_id: str
     ) -> None:
@@ -339,6 +453,27 @@ class ProtectionComparisonService:
             pass
         return None
 
+    def _get_cached_comparisons(
+        self, uow: UnitOfWork, input_hashes: set[str]
+    ) -> dict[str, ProtectionComparisonResult]:
+        """
+        Cached comparison results for many input_hashes (single scan).
+        """
+        found: dict[str, ProtectionComparisonResult] = {}
+        try:
+            for stored in uow.results.list_by_type("protection_comparison"):
+                payload = stored.get("payload", {})
+                input_hash = payload.get("input_hash")
+                if input_hash in input_hashes and input_hash not in found:
+                    comparison = ProtectionComparison.from_dict(payload)
+                    if comparison.result_json is not None:
+                        found[input_hash] = ProtectionComparisonResult.from_dict(
+                            comparison.result_json
+                        )
+        except Exception:
+            pass
+        return found
+
     def _get_comparison_by_id(
         self, uow: UnitOfWork, comparison_id: str
     ) -> ProtectionComparison | None:
@@ -387,6 +522,127 @@ class ProtectionComparisonService:
             payload=comparison.to_dict(),
         )
 
+    def _build_comparison(
+        self,
+        *,
+        run_a_id: str,
+        run_b_id: str,
+        project_id: str,
+        input_hash: str,
+        result_a: ProtectionResult,
+        result_b: ProtectionResult,
+        rows: list[ProtectionComparisonRow],
+        matched_count: int,
+        deltas_computed: bool = False,
+    ) -> tuple[ProtectionComparisonResult, ProtectionComparisonTrace]:
+        """
+        Compute deltas, ranking, summary and trace for matched rows.
+
+        Shared by the A/B comparison and the N-way comparison
+        (which passes rows with deltas already computed vectorized).
+        """
+        # Initialize trace
+        trace_steps: list[ProtectionComparisonTraceStep] = []
+
+        # Step 1: Match evaluations by (protected_element_ref, fault_target_id)
+        trace_steps.append(ProtectionComparisonTraceStep(
+            step="MATCH_EVALUATIONS",
+            description_pl="Dopasowanie ewaluacji po (element chroniony, punkt zwarcia)",
+            inputs={
+                "evaluations_a_count": len(result_a.evaluations),
+                "evaluations_b_count": len(result_b.evaluations),
+            },
+            outputs={
+                "matched_pairs": matched_count,
+                "total_rows": len(rows),
+            },
+        ))
+
+        # Step 2: Compute deltas and classify changes
+        trace_steps.append(ProtectionComparisonTraceStep(
+            step="COMPUTE_DELTAS",
+            description_pl="Obliczanie różnic czasów i prądów",
+            inputs={"row_count": len(rows)},
+            outputs={},
+        ))
+
+        if not deltas_computed:
+            rows = self._compute_deltas(rows)
+
+        state_change_counts = self._count_state_changes(rows)
+        trace_steps[-1] = ProtectionComparisonTraceStep(
+            step="COMPUTE_DELTAS",
+            description_pl="Obliczanie różnic czasów i prądów",
+            inputs={"row_count": len(rows)},
+            outputs=state_change_counts,
+        )
+
+        # Step 3: Classify state changes
+        trace_steps.append(ProtectionComparisonTraceStep(
+            step="CLASSIFY_CHANGES",
+            description_pl="Klasyfikacja zmian stanów (TRIP_TO_NO_TRIP, NO_TRIP_TO_TRIP, itd.)",
+            inputs={"row_count": len(rows)},
+            outputs=state_change_counts,
+        ))
+
+        # Step 4: Generate issue ranking
+        trace_steps.append(ProtectionComparisonTraceStep(
+            step="RANK_ISSUES",
+            description_pl="Generowanie rankingu problemów wg severity (5→1)",
+            inputs={
+                "row_count": len(rows),
+                "delay_threshold_s": DELAY_CHANGE_THRESHOLD_S,
+                "margin_threshold_percent": MARGIN_CHANGE_THRESHOLD_PERCENT,
+            },
+            outputs={},
+        ))
+
+        ranking = self._generate_ranking(rows)
+
+        severity_counts = self._count_severities(ranking)
+        trace_steps[-1] = ProtectionComparisonTraceStep(
+            step="RANK_ISSUES",
+            description_pl="Generowanie rankingu problemów wg severity (5→1)",
+            inputs={
+                "row_count": len(rows),
+                "delay_threshold_s": DELAY_CHANGE_THRESHOLD_S,
+                "margin_threshold_percent": MARGIN_CHANGE_THRESHOLD_PERCENT,
+            },
+            outputs={
+                "total_issues": len(ranking),
+                **severity_counts,
+            },
+        )
+
+        # Build summary
+        summary = self._build_summary(rows, ranking)
+
+        # Build result
+        comparison_id = str(UUID(int=hash((run_a_id, run_b_id, input_hash)) % (2**128)))
+
+        result = ProtectionComparisonResult(
+            comparison_id=comparison_id,
+            run_a_id=run_a_id,
+            run_b_id=run_b_id,
+            project_id=project_id,
+            rows=tuple(rows),
+            ranking=tuple(ranking),
+            summary=summary,
+            input_hash=input_hash,
+        )
+
+        # Build trace
+        trace = ProtectionComparisonTrace(
+            comparison_id=comparison_id,
+            run_a_id=run_a_id,
+            run_b_id=run_b_id,
+            library_fingerprint_a=result_a.template_fingerprint,
+            library_fingerprint_b=result_b.template_fingerprint,
+            steps=tuple(trace_steps),
+        )
+
+        return result, trace
+
     def _is_valid_uuid(self, value: str) -> bool:
         """Check if string is a valid UUID."""
         try:
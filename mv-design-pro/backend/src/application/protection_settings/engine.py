@@ -37,6 +37,11 @@ import math
 from dataclasses import dataclass, field
 from typing import Any
 
+from network_model.solvers.protection_iec60255 import (
+    ThermalWithstandGrid,
+    compute_thermal_withstand_grid,
+)
+
 
 # Thermal density values j_thn [A/mm²] for 1 second (IEC 60909/Hoppel Table 3-4)
 THERMAL_DENSITY = {
@@ -53,6 +58,9 @@ K_BTH_TABLE = {
     "long": 1.20,     # > 70% of total line
 }
 
+# I>> instantaneous trip time in the SPZ cycle [s]
+_SPZ_TRIP_TIME_S = 0.05
+
 
 @dataclass(frozen=True)
 class ProtectionSettingsInput:
@@ -127,6 +135,8 @@ class ThermalWithstandResult:
     is_adequate: bool       # Whether cable withstands the fault
     margin_percent: float   # Safety margin [%]
     trace: list[dict[str, Any]]
+    # Margin surface I_k3,min/I_k3,max × t_fault (and t_SPZ cycle) with worst case
+    margin_surface: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -187,6 +197,7 @@ class ProtectionSettingsResult:
                 "ik_max_a": self.thermal.ik_max_a,
                 "is_adequate": self.thermal.is_adequate,
                 "margin_percent": self.thermal.margin_percent,
+                "margin_surface": self.thermal.margin_surface,
                 "trace": self.thermal.trace,
             },
             "spz": {
@@ -219,8 +230,9 @@ class ProtectionSettingsEngine:
         """
         delayed = ProtectionSettingsEngine._calculate_delayed(inp)
         instantaneous = ProtectionSettingsEngine._calculate_instantaneous(inp)
-        thermal = ProtectionSettingsEngine._check_thermal_withstand(inp)
-        spz = ProtectionSettingsEngine._analyze_spz(inp, instantaneous, thermal)
+        grid = ProtectionSettingsEngine._thermal_withstand_grid(inp)
+        thermal = ProtectionSettingsEngine._check_thermal_withstand(inp, grid)
+        spz = ProtectionSettingsEngine._analyze_spz(inp, instantaneous, thermal, grid)
 
         notes: list[str] = []
         overall_valid = True
@@ -440,22 +452,55 @@ class ProtectionSettingsEngine:
         )
 
     @staticmethod
-    def _check_thermal_withstand(inp: ProtectionSettingsInput) -> ThermalWithstandResult:
+    def _fault_time(inp: ProtectionSettingsInput) -> float:
+        """Total fault time = protection time + breaker time (+70 ms)."""
+        t_fault = inp.t_upstream_s + inp.delta_t_s + 0.07
+        return t_fault if t_fault > 0 else 0.1
+
+    @staticmethod
+    def _spz_cycle_time(inp: ProtectionSettingsInput) -> float:
+        """SPZ cycle: trip + pause + trip (I>> instantaneous ~50 ms)."""
+        return _SPZ_TRIP_TIME_S + inp.spz_pause_s + _SPZ_TRIP_TIME_S
+
+    @staticmethod
+    def _thermal_withstand_grid(
+        inp: ProtectionSettingsInput,
+    ) -> ThermalWithstandGrid | None:
+        """
+        Siatka wytrzymałości cieplnej przewodu — jedno obliczenie tablicowe.
+
+        Wiersze: I_k3,min i I_k3,max na początku linii; kolumny: czas
+        zwarcia t_k oraz (przy SPZ) czas cyklu SPZ. Brak siatki, gdy
+        I_th1s = s * j_thn <= 0.
+        """
+        j_thn = THERMAL_DENSITY.get(inp.conductor_material, 94.0)
+        i_th_1s = inp.cross_section_mm2 * j_thn
+        if i_th_1s <= 0:
+            return None
+        t_clear = [ProtectionSettingsEngine._fault_time(inp)]
+        if inp.spz_enabled:
+            t_clear.append(ProtectionSettingsEngine._spz_cycle_time(inp))
+        return compute_thermal_withstand_grid(
+            i_fault_a=(inp.ik3_min_beginning_a, inp.ik3_max_beginning_a),
+            t_clear_s=t_clear,
+            i_th_1s_a=i_th_1s,
+        )
+
+    @staticmethod
+    def _check_thermal_withstand(
+        inp: ProtectionSettingsInput,
+        grid: ThermalWithstandGrid | None,
+    ) -> ThermalWithstandResult:
         """
         Check thermal withstand of cable/line.
 
-        I_th_dop = s * j_thn / sqrt(t_k)
+        I_th_dop = s * j_thn / sqrt(t_k)  (grid cell I_k3,max × t_k)
         """
         trace: list[dict[str, Any]] = []
 
         j_thn = THERMAL_DENSITY.get(inp.conductor_material, 94.0)
-
-        # Total fault time = protection time + breaker time
-        t_fault = inp.t_upstream_s + inp.delta_t_s + 0.07  # +70ms breaker
-        if t_fault <= 0:
-            t_fault = 0.1
-
-        i_th_dop = inp.cross_section_mm2 * j_thn / math.sqrt(t_fault)
+        t_fault = ProtectionSettingsEngine._fault_time(inp)
+        i_th_dop = float(grid.i_th_dop_a[0]) if grid is not None else 0.0
 
         trace.append({
             "step": "Obliczenie dopuszczalnego prądu cieplnego",
@@ -474,7 +519,7 @@ class ProtectionSettingsEngine:
 
         ik_max = inp.ik3_max_beginning_a
         is_adequate = ik_max <= i_th_dop
-        margin = ((i_th_dop - ik_max) / i_th_dop * 100) if i_th_dop > 0 else 0.0
+        margin = float(grid.margin_percent[1, 0]) if grid is not None else 0.0
 
         trace.append({
             "step": "Sprawdzenie wytrzymałości cieplnej",
@@ -498,6 +543,7 @@ class ProtectionSettingsEngine:
             is_adequate=is_adequate,
             margin_percent=round(margin, 1),
             trace=trace,
+            margin_surface=grid.to_dict() if grid is not None else {},
         )
 
     @staticmethod
@@ -505,6 +551,7 @@ class ProtectionSettingsEngine:
         inp: ProtectionSettingsInput,
         inst: InstantaneousSettings,
         thermal: ThermalWithstandResult,
+        grid: ThermalWithstandGrid | None,
     ) -> SPZAnalysisResult:
         """
         Analyze SPZ (auto-reclose) interaction with I>>.
@@ -528,8 +575,8 @@ class ProtectionSettingsEngine:
             )
 
         # SPZ cycle: trip + pause + trip (if unsuccessful)
-        t_trip = 0.05  # I>> instantaneous ~50ms
-        t_total = t_trip + inp.spz_pause_s + t_trip
+        t_trip = _SPZ_TRIP_TIME_S
+        t_total = ProtectionSettingsEngine._spz_cycle_time(inp)
 
         trace.append({
             "step": "Czas cyklu SPZ",
@@ -542,9 +589,8 @@ class ProtectionSettingsEngine:
             "result": {"t_total_s": round(t_total, 3)},
         })
 
-        # Thermal stress during SPZ cycle
-        j_thn = THERMAL_DENSITY.get(inp.conductor_material, 94.0)
-        i_th_available = inp.cross_section_mm2 * j_thn / math.sqrt(t_total) if t_total > 0 else float("inf")
+        # Thermal stress during SPZ cycle (grid column t_total)
+        i_th_available = float(grid.i_th_dop_a[1]) if grid is not None else 0.0
         i_th_required = inp.ik3_max_beginning_a
 
         spz_allowed = i_th_required <= i_th_available
@@ -17,67 +17,121 @@ AVAILABLE PATTERNS:
 NO CODENAMES IN UI/PROOF.
 """
 
-from .base import (
-    # Types
-    ReferenceVerdict,
-    CheckStatus,
-    # Result class
-    ReferencePatternResult,
-    # Helpers
-    stable_sort_dict,
-    stable_json,
-    compare_results_deterministic,
-    build_check,
-    build_trace_step,
-)
+from __future__ import annotations
 
-from .pattern_line_i_doubleprime_thermal_spz import (
-    # Constants
-    PATTERN_ID,
-    PATTERN_NAME_PL,
-    NARROW_WINDOW_THRESHOLD,
-    PATTERN_A_FIXTURES_SUBDIR,
-    # Validator
-    LineIDoublePrimeReferencePattern,
-    # Public API
-    run_pattern_a,
-    # Fixture utilities
-    load_fixture,
-    fixture_to_input,
-    get_pattern_a_fixtures_dir,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .wzorzec_c_generacja_lokalna import (
-    # Constants
-    PATTERN_C_ID,
-    PATTERN_C_NAME_PL,
-    PATTERN_C_FIXTURES_SUBDIR,
-    PROG_INFORMACYJNY_PCT,
-    PROG_GRANICZNY_PCT,
-    PROG_REZERWY_SELEKTYWNOSCI_PCT,
-    # Types
-    TypGeneracji,
-    ZrodloGeneracji,
-    DaneZwarciowePunktuZabezpieczenia,
-    NastawyZabezpieczen,
-    WzorzecCInput,
-    # Validator
-    WzorzecCGeneracjaLokalna,
-    # Public API
-    run_pattern_c,
-    # Fixture utilities
-    load_fixture_c,
-    fixture_to_input_c,
-    get_pattern_c_fixtures_dir,
-)
+if TYPE_CHECKING:
+    from .base import (
+        # Types
+        ReferenceVerdict,
+        CheckStatus,
+        # Result class
+        ReferencePatternResult,
+        # Helpers
+        stable_sort_dict,
+        stable_json,
+        compare_results_deterministic,
+        build_check,
+        build_trace_step,
+    )
+    from .pattern_line_i_doubleprime_thermal_spz import (
+        # Constants
+        PATTERN_ID,
+        PATTERN_NAME_PL,
+        NARROW_WINDOW_THRESHOLD,
+        PATTERN_A_FIXTURES_SUBDIR,
+        # Validator
+        LineIDoublePrimeReferencePattern,
+        # Public API
+        run_pattern_a,
+        # Fixture utilities
+        load_fixture,
+        fixture_to_input,
+        get_pattern_a_fixtures_dir,
+    )
+    from .wzorzec_c_generacja_lokalna import (
+        # Constants
+        PATTERN_C_ID,
+        PATTERN_C_NAME_PL,
+        PATTERN_C_FIXTURES_SUBDIR,
+        PROG_INFORMACYJNY_PCT,
+        PROG_GRANICZNY_PCT,
+        PROG_REZERWY_SELEKTYWNOSCI_PCT,
+        # Types
+        TypGeneracji,
+        ZrodloGeneracji,
+        DaneZwarciowePunktuZabezpieczenia,
+        NastawyZabezpieczen,
+        WzorzecCInput,
+        # Validator
+        WzorzecCGeneracjaLokalna,
+        # Public API
+        run_pattern_c,
+        # Fixture utilities
+        load_fixture_c,
+        fixture_to_input_c,
+        get_pattern_c_fixtures_dir,
+    )
+    from .reporting import (
+        # Report generators
+        export_reference_pattern_to_docx,
+        export_reference_pattern_to_pdf,
+        # Metadata type
+        ReportMetadata,
+    )
 
-from .reporting import (
-    # Report generators
-    export_reference_pattern_to_docx,
-    export_reference_pattern_to_pdf,
-    # Metadata type
-    ReportMetadata,
-)
+# Submodules load on first access; the report generators pull in python-docx and reportlab
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".base": (
+        "ReferenceVerdict",
+        "CheckStatus",
+        "ReferencePatternResult",
+        "stable_sort_dict",
+        "stable_json",
+        "compare_results_deterministic",
+        "build_check",
+        "build_trace_step",
+    ),
+    ".pattern_line_i_doubleprime_thermal_spz": (
+        "PATTERN_ID",
+        "PATTERN_NAME_PL",
+        "NARROW_WINDOW_THRESHOLD",
+        "PATTERN_A_FIXTURES_SUBDIR",
+        "LineIDoublePrimeReferencePattern",
+        "run_pattern_a",
+        "load_fixture",
+        "fixture_to_input",
+        "get_pattern_a_fixtures_dir",
+    ),
+    ".wzorzec_c_generacja_lokalna": (
+        "PATTERN_C_ID",
+        "PATTERN_C_NAME_PL",
+        "PATTERN_C_FIXTURES_SUBDIR",
+        "PROG_INFORMACYJNY_PCT",
+        "PROG_GRANICZNY_PCT",
+        "PROG_REZERWY_SELEKTYWNOSCI_PCT",
+        "TypGeneracji",
+        "ZrodloGeneracji",
+        "DaneZwarciowePunktuZabezpieczenia",
+        "NastawyZabezpieczen",
+        "WzorzecCInput",
+        "WzorzecCGeneracjaLokalna",
+        "run_pattern_c",
+        "load_fixture_c",
+        "fixture_to_input_c",
+        "get_pattern_c_fixtures_dir",
+    ),
+    ".reporting": (
+        "export_reference_pattern_to_docx",
+        "export_reference_pattern_to_pdf",
+        "ReportMetadata",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     # Types
@@ -123,3 +177,16 @@ __all__ = [
     "export_reference_pattern_to_pdf",
     "ReportMetadata",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
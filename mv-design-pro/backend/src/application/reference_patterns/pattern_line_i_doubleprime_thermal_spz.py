@@ -57,6 +57,7 @@ from application.analyses.protection.line_overcurrent_setting import (
     SPZMode,
     LocalGenerationConfig,
 )
+from application.analyses.protection.fault_envelope import FaultEnvelopeTable
 
 
 # =============================================================================
@@ -205,6 +206,8 @@ class LineIDoublePrimeReferencePattern:
         input_data: LineOvercurrentSettingInput | None = None,
         analysis_result: LineOvercurrentSettingResult | None = None,
         fixture_file: str | None = None,
+        fault_envelope: FaultEnvelopeTable | None = None,
+        next_protection_id: str | None = None,
     ) -> ReferencePatternResult:
         """
         Run reference pattern validation.
@@ -213,6 +216,10 @@ class LineIDoublePrimeReferencePattern:
             input_data: LineOvercurrentSettingInput (if provided, runs FIX-12D)
             analysis_result: Pre-computed FIX-12D result (if provided, skips analysis)
             fixture_file: Fixture filename to load (if provided, loads and runs)
+            fault_envelope: Snapshot fault envelope; when it has a row for the
+                line, fault currents of input_data are taken from it
+            next_protection_id: Element of the next downstream protection
+                (its envelope row gives Ik_max at the next protection)
 
         Returns:
             ReferencePatternResult with verdict, checks, and trace.
@@ -251,7 +258,20 @@ class LineIDoublePrimeReferencePattern:
             ))
 
             analyzer = LineOvercurrentSettingAnalyzer()
-            analysis_result = analyzer.analyze(input_data)
+            envelope = (
+                fault_envelope.row(input_data.line_id) if fault_envelope is not None else None
+            )
+            if envelope is not None:
+                next_protection = (
+                    fault_envelope.row(next_protection_id)
+                    if next_protection_id is not None
+                    else None
+                )
+                analysis_result = analyzer.analyze_with_envelope(
+                    input_data, envelope, next_protection
+                )
+            else:
+                analysis_result = analyzer.analyze(input_data)
 
             trace_steps.append(build_trace_step(
                 step="analysis_completed",
@@ -722,6 +742,8 @@ def run_pattern_a(
     input_data: LineOvercurrentSettingInput | None = None,
     analysis_result: LineOvercurrentSettingResult | None = None,
     fixture_file: str | None = None,
+    fault_envelope: FaultEnvelopeTable | None = None,
+    next_protection_id: str | None = None,
 ) -> ReferencePatternResult:
     """
     Run Reference Pattern A validation.
@@ -732,6 +754,8 @@ def run_pattern_a(
         input_data: LineOvercurrentSettingInput (runs FIX-12D analysis)
         analysis_result: Pre-computed FIX-12D result
         fixture_file: Fixture filename to load
+        fault_envelope: Snapshot fault envelope (fault currents of the line)
+        next_protection_id: Element of the next downstream protection
 
     Returns:
         ReferencePatternResult with verdict, checks, and trace.
@@ -741,4 +765,6 @@ def run_pattern_a(
         input_data=input_data,
         analysis_result=analysis_result,
         fixture_file=fixture_file,
+        fault_envelope=fault_envelope,
+        next_protection_id=next_protection_id,
     )
@@ -0,0 +1,33 @@
+"""Report rendering: cached PDF/DOCX exports and concurrent report bundles."""
+
+from .service import (
+    DOCX_MEDIA_TYPE,
+    PDF_MEDIA_TYPE,
+    REPORT_FORMATS,
+    RenderedReport,
+    ReportCache,
+    ReportFormat,
+    ReportKey,
+    ReportRenderingService,
+    UnknownReportTypeError,
+    default_report_rendering_service,
+    get_report_format,
+    iter_chunks,
+    template_version,
+)
+
+__all__ = [
+    "DOCX_MEDIA_TYPE",
+    "PDF_MEDIA_TYPE",
+    "REPORT_FORMATS",
+    "RenderedReport",
+    "ReportCache",
+    "ReportFormat",
+    "ReportKey",
+    "ReportRenderingService",
+    "UnknownReportTypeError",
+    "default_report_rendering_service",
+    "get_report_format",
+    "iter_chunks",
+    "template_version",
+]
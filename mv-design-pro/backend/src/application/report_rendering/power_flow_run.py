@@ -0,0 +1,290 @@
+"""
+Raporty PDF/DOCX przebiegu rozpływu mocy (pakiet eksportu kanonicznego).
+
+Renderery są funkcjami modułu (pakiet → bajty), więc mogą działać w puli
+procesów usługi ReportRenderingService. Zmiana tego pliku zmienia wersję
+szablonu i unieważnia wpisy pamięci podręcznej raportów.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+from application.analysis_run.read_model import canonicalize_json
+
+
+def export_power_flow_run_to_docx(bundle: dict[str, Any]) -> bytes:
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
+
+    result = bundle["result"]
+    metadata = bundle["metadata"]
+    catalog_context_lines = _catalog_context_lines(bundle)
+    white_box_trace = bundle.get("white_box_trace") or []
+
+    doc = Document()
+    style = doc.styles["Normal"]
+    style.font.name = "Calibri"
+    style.font.size = Pt(11)
+
+    heading = doc.add_heading("Raport rozplywu mocy", level=0)
+    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    status_parts = [
+        f"Status: {'Zbiezny' if result.get('converged') else 'Niezbiezny'}",
+        f"Iteracje: {result.get('iterations_count', '—')}",
+        f"Run: {metadata.get('run_id', '—')[:8]}...",
+    ]
+    subtitle = doc.add_paragraph(" | ".join(status_parts))
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.add_paragraph()
+    doc.add_heading("Podsumowanie", level=1)
+    summary = result.get("summary", {})
+    summary_table = doc.add_table(rows=1, cols=2)
+    summary_table.style = "Table Grid"
+    hdr = summary_table.rows[0].cells
+    hdr[0].text = "Parametr"
+    hdr[1].text = "Wartosc"
+    for cell in hdr:
+        for paragraph in cell.paragraphs:
+            for run in paragraph.runs:
+                run.bold = True
+
+    def add_row(label: str, value: Any) -> None:
+        row = summary_table.add_row().cells
+        row[0].text = label
+        row[1].text = str(value) if value is not None else "—"
+
+    add_row("Status zbieznosci", "Zbiezny" if result.get("converged") else "Niezbiezny")
+    add_row("Liczba iteracji", result.get("iterations_count"))
+    add_row("Wezel bilansujacy", result.get("slack_bus_id"))
+    add_row("Calkowite straty P [MW]", f"{summary.get('total_losses_p_mw', 0):.4g}")
+    add_row("Calkowite straty Q [Mvar]", f"{summary.get('total_losses_q_mvar', 0):.4g}")
+    add_row("Min. napiecie [pu]", f"{summary.get('min_v_pu', 0):.4g}")
+    add_row("Max. napiecie [pu]", f"{summary.get('max_v_pu', 0):.4g}")
+    add_row("Elementy z katalogiem", metadata.get("catalog_context_count"))
+
+    doc.add_paragraph()
+    doc.add_heading("Kontekst katalogowy", level=1)
+    if catalog_context_lines:
+        doc.add_paragraph(
+            "Format: element_id | typ | katalog | pochodzenie parametrow | materialized_params"
+        )
+        for line in catalog_context_lines:
+            doc.add_paragraph(line)
+    else:
+        doc.add_paragraph("Brak jawnego kontekstu katalogowego.")
+
+    doc.add_paragraph()
+    doc.add_heading("White Box", level=1)
+    if white_box_trace:
+        for step in white_box_trace[:12]:
+            title = step.get("title") or step.get("key") or "Krok"
+            doc.add_paragraph(f"{title}: {json.dumps(step, ensure_ascii=False, sort_keys=True)}")
+        if len(white_box_trace) > 12:
+            doc.add_paragraph(f"... oraz {len(white_box_trace) - 12} kolejnych krokow")
+    else:
+        doc.add_paragraph("Brak jawnego sladu White Box.")
+
+    doc.add_paragraph()
+    doc.add_heading("Wyniki wezlowe (szyny)", level=1)
+    bus_results = result.get("bus_results", [])
+    if bus_results:
+        bus_table = doc.add_table(rows=1, cols=5)
+        bus_table.style = "Table Grid"
+        header = bus_table.rows[0].cells
+        header[0].text = "ID szyny"
+        header[1].text = "V [pu]"
+        header[2].text = "Kat [deg]"
+        header[3].text = "P_inj [MW]"
+        header[4].text = "Q_inj [Mvar]"
+        for cell in header:
+            for paragraph in cell.paragraphs:
+                for run in paragraph.runs:
+                    run.bold = True
+        for bus in bus_results[:30]:
+            row = bus_table.add_row().cells
+            row[0].text = str(bus.get("bus_id", "—"))[:16]
+            row[1].text = f"{bus.get('v_pu', 0):.4g}"
+            row[2].text = f"{bus.get('angle_deg', 0):.2f}"
+            row[3].text = f"{bus.get('p_injected_mw', 0):.3g}"
+            row[4].text = f"{bus.get('q_injected_mvar', 0):.3g}"
+        if len(bus_results) > 30:
+            doc.add_paragraph(f"... oraz {len(bus_results) - 30} dodatkowych wezlow")
+    else:
+        doc.add_paragraph("Brak wynikow wezlowych.")
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def export_power_flow_run_to_pdf(bundle: dict[str, Any]) -> bytes:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    result = bundle["result"]
+    metadata = bundle["metadata"]
+    catalog_context_lines = _catalog_context_lines(bundle)
+    white_box_trace = bundle.get("white_box_trace") or []
+
+    buffer = io.BytesIO()
+    canvas_obj = canvas.Canvas(buffer, pagesize=A4)
+    page_width, page_height = A4
+    left_margin = 25 * mm
+    top_margin = page_height - 25 * mm
+    y = top_margin
+    line_height = 5 * mm
+
+    canvas_obj.setFont("Helvetica-Bold", 16)
+    title = "Raport rozplywu mocy"
+    canvas_obj.drawString(
+        (page_width - canvas_obj.stringWidth(title, "Helvetica-Bold", 16)) / 2,
+        y,
+        title,
+    )
+    y -= 10 * mm
+
+    canvas_obj.setFont("Helvetica", 10)
+    status_text = (
+        f"Status: {'Zbiezny' if result.get('converged') else 'Niezbiezny'} | "
+        f"Iteracje: {result.get('iterations_count', '—')} | "
+        f"Run: {metadata.get('run_id', '—')[:8]}..."
+    )
+    canvas_obj.drawString(left_margin, y, status_text)
+    y -= 8 * mm
+
+    canvas_obj.setFont("Helvetica-Bold", 14)
+    canvas_obj.drawString(left_margin, y, "Podsumowanie")
+    y -= 6 * mm
+
+    canvas_obj.setFont("Helvetica", 10)
+    summary = result.get("summary", {})
+    summary_lines = [
+        f"Wezel bilansujacy: {result.get('slack_bus_id', '—')}",
+        f"Calkowite straty P: {summary.get('total_losses_p_mw', 0):.4g} MW",
+        f"Calkowite straty Q: {summary.get('total_losses_q_mvar', 0):.4g} Mvar",
+        f"Min. napiecie: {summary.get('min_v_pu', 0):.4g} pu",
+        f"Max. napiecie: {summary.get('max_v_pu', 0):.4g} pu",
+        f"Elementy z katalogiem: {metadata.get('catalog_context_count', 0)}",
+    ]
+    for line in summary_lines:
+        canvas_obj.drawString(left_margin, y, line)
+        y -= line_height
+
+    y -= 5 * mm
+    canvas_obj.setFont("Helvetica-Bold", 12)
+    canvas_obj.drawString(left_margin, y, "Kontekst katalogowy")
+    y -= 5 * mm
+    canvas_obj.setFont("Helvetica", 8)
+    if catalog_context_lines:
+        canvas_obj.drawString(
+            left_margin,
+            y,
+            "Format: element_id | typ | katalog | pochodzenie | materialized_params",
+        )
+        y -= line_height
+        for line in catalog_context_lines:
+            canvas_obj.drawString(left_margin, y, line[:160])
+            y -= line_height
+            if y < 30 * mm:
+                canvas_obj.showPage()
+                y = top_margin
+                canvas_obj.setFont("Helvetica", 8)
+    else:
+        canvas_obj.drawString(left_margin, y, "Brak jawnego kontekstu katalogowego.")
+        y -= line_height
+
+    y -= 5 * mm
+    canvas_obj.setFont("Helvetica-Bold", 12)
+    canvas_obj.drawString(left_margin, y, "White Box")
+    y -= 5 * mm
+    canvas_obj.setFont("Helvetica", 8)
+    if white_box_trace:
+        for step in white_box_trace[:10]:
+            title = step.get("title") or step.get("key") or "Krok"
+            canvas_obj.drawString(
+                left_margin,
+                y,
+                f"{title}: {json.dumps(step, ensure_ascii=False, sort_keys=True)[:150]}",
+            )
+            y -= line_height
+            if y < 30 * mm:
+                canvas_obj.showPage()
+                y = top_margin
+                canvas_obj.setFont("Helvetica", 8)
+        if len(white_box_trace) > 10:
+            canvas_obj.drawString(
+                left_margin,
+                y,
+                f"... oraz {len(white_box_trace) - 10} kolejnych krokow",
+            )
+            y -= line_height
+    else:
+        canvas_obj.drawString(left_margin, y, "Brak jawnego sladu White Box.")
+        y -= line_height
+
+    y -= 5 * mm
+    canvas_obj.setFont("Helvetica-Bold", 12)
+    canvas_obj.drawString(left_margin, y, "Wyniki wezlowe (top 20)")
+    y -= 5 * mm
+
+    canvas_obj.setFont("Helvetica", 9)
+    for bus in result.get("bus_results", [])[:20]:
+        text = (
+            f"{str(bus.get('bus_id', '—'))[:12]}: "
+            f"V={bus.get('v_pu', 0):.4g} pu, "
+            f"kat={bus.get('angle_deg', 0):.2f} deg"
+        )
+        canvas_obj.drawString(left_margin, y, text)
+        y -= line_height
+        if y < 30 * mm:
+            canvas_obj.showPage()
+            y = top_margin
+
+    canvas_obj.save()
+    return buffer.getvalue()
+
+
+def _format_catalog_binding(entry: dict[str, Any]) -> str:
+    binding = entry.get("catalog_binding") or {}
+    namespace = binding.get("catalog_namespace") or "-"
+    item_id = binding.get("catalog_item_id") or "-"
+    version = binding.get("catalog_item_version")
+    if version:
+        return f"{namespace}:{item_id} ({version})"
+    return f"{namespace}:{item_id}"
+
+
+def _truncate_catalog_params(value: Any, max_chars: int = 220) -> str:
+    if value is None:
+        return "—"
+    payload = canonicalize_json(value)
+    text = str(payload)
+    if isinstance(payload, (dict, list)):
+        text = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}..."
+
+
+def _catalog_context_lines(bundle: dict[str, Any], *, max_items: int = 20) -> list[str]:
+    lines: list[str] = []
+    for entry in (bundle.get("catalog_context") or [])[:max_items]:
+        lines.append(
+            " | ".join(
+                [
+                    str(entry.get("element_id") or "-"),
+                    str(entry.get("element_type") or "-"),
+                    _format_catalog_binding(entry),
+                    str(entry.get("parameter_source") or entry.get("parameter_origin") or "-"),
+                    _truncate_catalog_params(entry.get("materialized_params")),
+                ]
+            )
+        )
+    return lines
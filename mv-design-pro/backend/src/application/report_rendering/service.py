@@ -0,0 +1,415 @@
+"""
+Usługa renderowania raportów PDF/DOCX z pamięcią podręczną.
+
+KANON:
+- Raport jest funkcją danych przebiegu i szablonu: klucz pamięci podręcznej
+  to (input_hash przebiegu, skrót kontekstu, typ raportu, wersja szablonu).
+  Skrót kontekstu obejmuje dane pakietu spoza przebiegu (nazwy projektu
+  i przypadku, schemat SLD nakładki). Wersja szablonu to skrót źródeł
+  modułu renderera i modułów projektu, które importuje — każda zmiana
+  szablonu lub jego pomocników unieważnia wpisy bez podbijania numerów.
+- Do klucza należy też identyfikator przebiegu: raporty drukują run_id,
+  więc dwa przebiegi o tym samym input_hash nie dzielą plików.
+- W pamięci podręcznej lądują tylko raporty przebiegów zakończonych
+  (wywołujący przekazuje cacheable=False dla stanów przejściowych).
+- Pakiet kilku raportów renderowany jest współbieżnie w puli procesów
+  (reportlab/python-docx trzymają GIL); pojedynczy raport — w procesie.
+- Gotowe bajty wysyłane są kawałkami (iter_chunks), bez kopii w BytesIO.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec, resolve_name
+from pathlib import Path
+from typing import IO, Any
+
+PDF_MEDIA_TYPE = "application/pdf"
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Limit pamięci podręcznej (suma rozmiarów plików); najstarsze wpisy wypadają
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+class UnknownReportTypeError(ValueError):
+    """Typ raportu nie jest zarejestrowany w REPORT_FORMATS."""
+
+
+# ============================================================================
+# REJESTR RAPORTÓW
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ReportFormat:
+    """Raport: renderer „moduł:funkcja” (pakiet → bajty) i typ pliku."""
+
+    report_type: str
+    renderer: str
+    media_type: str
+    extension: str
+
+    @property
+    def module(self) -> str:
+        return self.renderer.partition(":")[0]
+
+
+REPORT_FORMATS: dict[str, ReportFormat] = {
+    fmt.report_type: fmt
+    for fmt in (
+        ReportFormat(
+            "analysis_run_pdf",
+            "network_model.reporting.analysis_run_report_pdf:export_analysis_run_to_pdf",
+            PDF_MEDIA_TYPE,
+            "pdf",
+        ),
+        ReportFormat(
+            "analysis_run_docx",
+            "network_model.reporting.analysis_run_report_docx:export_analysis_run_to_docx",
+            DOCX_MEDIA_TYPE,
+            "docx",
+        ),
+        ReportFormat(
+            "power_flow_run_pdf",
+            "application.report_rendering.power_flow_run:export_power_flow_run_to_pdf",
+            PDF_MEDIA_TYPE,
+            "pdf",
+        ),
+        ReportFormat(
+            "power_flow_run_docx",
+            "application.report_rendering.power_flow_run:export_power_flow_run_to_docx",
+            DOCX_MEDIA_TYPE,
+            "docx",
+        ),
+    )
+}
+
+
+def get_report_format(report_type: str) -> ReportFormat:
+    try:
+        return REPORT_FORMATS[report_type]
+    except KeyError:
+        raise UnknownReportTypeError(f"Nieznany typ raportu: {report_type}") from None
+
+
+@lru_cache(maxsize=None)
+def template_version(report_type: str) -> str:
+    """
+    Skrót SHA-256 źródeł renderera i modułów projektu, które importuje.
+
+    Importy śledzone są przechodnio po drzewie źródeł renderera (ast, bez
+    importu modułów); biblioteki spoza projektu nie wchodzą do skrótu.
+    """
+    module = get_report_format(report_type).module
+    spec = find_spec(module)
+    if spec is None or spec.origin is None:
+        raise UnknownReportTypeError(f"Brak modułu renderera raportu: {report_type}")
+    root = Path(spec.origin).parents[module.count(".")]
+    digest = hashlib.sha256()
+    for path in _project_sources(module, root):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _project_sources(module: str, root: Path) -> list[Path]:
+    """Pliki modułu i modułów projektu importowanych przez niego (przechodnio)."""
+    sources: dict[str, Path] = {}
+    visited: set[str] = set()
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        if name in visited:
+            continue
+        visited.add(name)
+        path = _module_path(root, name)
+        if path is None:
+            continue
+        sources[name] = path
+        package = name if path.name == "__init__.py" else name.rpartition(".")[0]
+        for node in ast.walk(ast.parse(path.read_bytes())):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    base = resolve_name("." * node.level + base, package)
+                pending.append(base)
+                pending.extend(f"{base}.{alias.name}" for alias in node.names)
+    return sorted(sources.values())
+
+
+def _module_path(root: Path, name: str) -> Path | None:
+    base = root.joinpath(*name.split("."))
+    for path in (base.with_suffix(".py"), base / "__init__.py"):
+        if path.is_file():
+            return path
+    return None
+
+
+# ============================================================================
+# PAMIĘĆ PODRĘCZNA
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ReportKey:
+    run_id: str
+    input_hash: str
+    report_type: str
+    template_version: str
+    context_hash: str = ""
+
+
+@dataclass(frozen=True)
+class RenderedReport:
+    key: ReportKey
+    content: bytes
+    media_type: str
+    extension: str
+    cached: bool
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        return iter_chunks(self.content, chunk_size)
+
+
+class ReportCache:
+    """LRU wyrenderowanych plików ograniczone sumą bajtów (bezpieczne wątkowo)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[ReportKey, bytes] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: ReportKey) -> bytes | None:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return content
+
+    def put(self, key: ReportKey, content: bytes) -> None:
+        if len(content) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = content
+            self._size += len(content)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# ============================================================================
+# RENDEROWANIE
+# ============================================================================
+
+
+def _render(renderer: str, payload: Mapping[str, Any]) -> bytes:
+    """Wywołanie renderera; funkcja modułu, więc wykonywalna w procesie puli."""
+    module_name, _, function_name = renderer.partition(":")
+    return getattr(import_module(module_name), function_name)(payload)
+
+
+class ReportRenderingService:
+    """
+    Renderowanie raportów przebiegu z pamięcią podręczną i pulą procesów.
+
+    Pula tworzona przy pierwszym pakiecie z co najmniej dwoma brakującymi
+    raportami (kontekst „spawn” — bezpieczny w serwerze wielowątkowym).
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: ReportCache | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._cache = cache if cache is not None else ReportCache()
+        self._max_workers = max(1, max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def cache(self) -> ReportCache:
+        return self._cache
+
+    def key_for(
+        self, report_type: str, *, run_id: str, input_hash: str, context_hash: str = ""
+    ) -> ReportKey:
+        return ReportKey(
+            run_id=run_id,
+            input_hash=input_hash,
+            report_type=report_type,
+            template_version=template_version(report_type),
+            context_hash=context_hash,
+        )
+
+    def render(
+        self,
+        report_type: str,
+        *,
+        run_id: str,
+        input_hash: str,
+        build_payload: Callable[[], Mapping[str, Any]],
+        cacheable: bool = True,
+        context_hash: str = "",
+    ) -> RenderedReport:
+        return self.render_many(
+            [report_type],
+            run_id=run_id,
+            input_hash=input_hash,
+            build_payload=build_payload,
+            cacheable=cacheable,
+            context_hash=context_hash,
+        )[0]
+
+    def render_many(
+        self,
+        report_types: Sequence[str],
+        *,
+        run_id: str,
+        input_hash: str,
+        build_payload: Callable[[], Mapping[str, Any]],
+        cacheable: bool = True,
+        context_hash: str = "",
+    ) -> list[RenderedReport]:
+        """
+        Raporty jednego przebiegu (kolejność jak report_types).
+
+        build_payload wywoływane co najwyżej raz — tylko gdy któregoś
+        raportu brak w pamięci podręcznej. context_hash to skrót danych
+        pakietu spoza przebiegu (pusty, gdy pakiet zależy tylko od niego).
+        """
+        formats = [get_report_format(report_type) for report_type in report_types]
+        keys = [
+            self.key_for(
+                fmt.report_type,
+                run_id=run_id,
+                input_hash=input_hash,
+                context_hash=context_hash,
+            )
+            for fmt in formats
+        ]
+        contents: dict[ReportKey, bytes] = {}
+        if cacheable:
+            for key in keys:
+                content = self._cache.get(key)
+                if content is not None:
+                    contents[key] = content
+        hits = set(contents)
+
+        missing = [(key, fmt) for key, fmt in dict(zip(keys, formats)).items() if key not in hits]
+        if missing:
+            payload = build_payload()
+            contents.update(self._render_missing(missing, payload))
+            if cacheable:
+                for key, _ in missing:
+                    self._cache.put(key, contents[key])
+
+        return [
+            RenderedReport(
+                key=key,
+                content=contents[key],
+                media_type=fmt.media_type,
+                extension=fmt.extension,
+                cached=key in hits,
+            )
+            for key, fmt in zip(keys, formats)
+        ]
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _render_missing(
+        self,
+        missing: list[tuple[ReportKey, ReportFormat]],
+        payload: Mapping[str, Any],
+    ) -> dict[ReportKey, bytes]:
+        if len(missing) < 2 or self._max_workers < 2:
+            return {key: _render(fmt.renderer, payload) for key, fmt in missing}
+        executor = self._get_executor()
+        futures: dict[ReportKey, Future[bytes]] = {
+            key: executor.submit(_render, fmt.renderer, payload) for key, fmt in missing
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+def iter_chunks(
+    source: bytes | IO[bytes], chunk_size: int = STREAM_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """Kawałki bajtów lub pliku (plik zamykany po odczycie)."""
+    if isinstance(source, bytes):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+        return
+    try:
+        while chunk := source.read(chunk_size):
+            yield chunk
+    finally:
+        source.close()
+
+
+@lru_cache(maxsize=1)
+def default_report_rendering_service() -> ReportRenderingService:
+    """
+    Usługa współdzielona przez API.
+
+    REPORT_RENDER_WORKERS i REPORT_CACHE_MAX_MB nadpisują wartości domyślne.
+    """
+    workers = int(os.environ.get("REPORT_RENDER_WORKERS", DEFAULT_MAX_WORKERS))
+    cache_mb = float(
+        os.environ.get("REPORT_CACHE_MAX_MB", DEFAULT_CACHE_MAX_BYTES / (1024 * 1024))
+    )
+    return ReportRenderingService(
+        cache=ReportCache(max_bytes=int(cache_mb * 1024 * 1024)),
+        max_workers=min(workers, os.cpu_count() or 1),
+    )
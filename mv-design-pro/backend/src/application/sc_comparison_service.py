@@ -10,23 +10,36 @@ INVARIANTS:
 - Both ResultSets must have status DONE (verified via Run)
 - ZERO heuristics
 - ZERO severity scoring (separate PR)
+- N-way mode: deltas identical to pairwise build_comparison
 """
 
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
+
+import numpy as np
 
 from domain.execution import (
     ExecutionAnalysisType,
+    ResultSet,
     RunStatus,
 )
 from domain.sc_comparison import (
+    SC_GLOBAL_DELTA_KEYS,
+    NumericDelta,
     ShortCircuitComparison,
     build_comparison,
+    compute_comparison_input_hash,
 )
 from application.execution_engine.service import ExecutionEngineService
+from application.pagination import Page, keyset_page
 from application.execution_engine.errors import (
     ResultSetNotFoundError,
     RunNotFoundError,
@@ -34,6 +47,9 @@ from application.execution_engine.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Max number of aligned run sets kept per service (least recently used evicted first)
+ALIGNED_RESULTS_CACHE_SIZE = 16
+
 
 class ComparisonError(Exception):
     """Base exception for comparison errors."""
@@ -82,18 +98,242 @@ class RunNotDoneError(ComparisonError):
         self.status = status
 
 
+# ---------------------------------------------------------------------------
+# N-way alignment (columnar)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class AlignedScResults:
+    """
+    SC ResultSets of N runs aligned by element_ref into columnar arrays.
+
+    Row index = run (order of run_ids, base first).
+    Column index = element_ref (sorted) or global key (SC_GLOBAL_DELTA_KEYS).
+
+    Attributes:
+        run_ids: Run IDs in row order (base first)
+        element_refs: Sorted union of element_refs over all runs
+        element_types: Element type per run and element_ref ("" when missing)
+        element_present: Element result exists (runs × refs, bool)
+        value_keys: Sorted union of per-element value keys
+        values: Numeric values per key (runs × refs, float64)
+        value_present: Value exists and is numeric per key (runs × refs, bool)
+        global_values: Global values (runs × SC_GLOBAL_DELTA_KEYS, float64)
+        global_present: Global value exists (runs × SC_GLOBAL_DELTA_KEYS, bool)
+        signatures: deterministic_signature per run
+    """
+
+    run_ids: tuple[UUID, ...]
+    element_refs: tuple[str, ...]
+    element_types: tuple[tuple[str, ...], ...]
+    element_present: np.ndarray
+    value_keys: tuple[str, ...]
+    values: dict[str, np.ndarray]
+    value_present: dict[str, np.ndarray]
+    global_values: np.ndarray
+    global_present: np.ndarray
+    signatures: tuple[str, ...]
+
+    def element_values(self, element_ref: str) -> list[dict[str, Any]]:
+        """Per-run numeric values of a single element (drilldown)."""
+        try:
+            col = self.element_refs.index(element_ref)
+        except ValueError:
+            return []
+        return [
+            {
+                "run_id": str(run_id),
+                "element_type": self.element_types[row][col],
+                "values": {
+                    key: float(self.values[key][row, col])
+                    for key in self.value_keys
+                    if self.value_present[key][row, col]
+                },
+            }
+            for row, run_id in enumerate(self.run_ids)
+            if self.element_present[row, col]
+        ]
+
+
+def align_sc_result_sets(
+    run_ids: Sequence[UUID],
+    result_sets: Sequence[ResultSet],
+) -> AlignedScResults:
+    """
+    Align element and global results of many SC ResultSets.
+
+    Non-numeric values are marked as not present (same as build_comparison,
+    which only diffs int/float values).
+    """
+    refs = sorted({
+        er.element_ref for rs in result_sets for er in rs.element_results
+    })
+    col_by_ref = {ref: col for col, ref in enumerate(refs)}
+    value_keys = sorted({
+        key for rs in result_sets for er in rs.element_results for key in er.values
+    })
+
+    n_runs, n_refs = len(result_sets), len(refs)
+    element_present = np.zeros((n_runs, n_refs), dtype=bool)
+    values = {key: np.zeros((n_runs, n_refs), dtype=np.float64) for key in value_keys}
+    value_present = {key: np.zeros((n_runs, n_refs), dtype=bool) for key in value_keys}
+    global_values = np.zeros((n_runs, len(SC_GLOBAL_DELTA_KEYS)), dtype=np.float64)
+    global_present = np.zeros((n_runs, len(SC_GLOBAL_DELTA_KEYS)), dtype=bool)
+    element_types: list[tuple[str, ...]] = []
+
+    for row, rs in enumerate(result_sets):
+        types = [""] * n_refs
+        # Last element result wins for duplicate refs (same as build_comparison)
+        by_ref = {er.element_ref: er for er in rs.element_results}
+        for ref, er in by_ref.items():
+            col = col_by_ref[ref]
+            types[col] = er.element_type
+            element_present[row, col] = True
+            for key, value in er.values.items():
+                if isinstance(value, (int, float)):
+                    values[key][row, col] = float(value)
+                    value_present[key][row, col] = True
+        element_types.append(tuple(types))
+
+        for g, key in enumerate(SC_GLOBAL_DELTA_KEYS):
+            if key in rs.global_results:
+                global_values[row, g] = float(rs.global_results[key])
+                global_present[row, g] = True
+
+    return AlignedScResults(
+        run_ids=tuple(run_ids),
+        element_refs=tuple(refs),
+        element_types=tuple(element_types),
+        element_present=element_present,
+        value_keys=tuple(value_keys),
+        values=values,
+        value_present=value_present,
+        global_values=global_values,
+        global_present=global_present,
+        signatures=tuple(rs.deterministic_signature for rs in result_sets),
+    )
+
+
+def _delta_arrays(
+    base: np.ndarray, other: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized compute_numeric_delta: (abs, rel, rel_defined)."""
+    abs_delta = other - base
+    rel_defined = base != 0.0
+    rel_delta = np.divide(
+        abs_delta, base, out=np.zeros_like(abs_delta), where=rel_defined
+    )
+    return abs_delta, rel_delta, rel_defined
+
+
+def _numeric_delta_at(
+    base: np.ndarray,
+    other: np.ndarray,
+    abs_delta: np.ndarray,
+    rel_delta: np.ndarray,
+    rel_defined: np.ndarray,
+    index: int,
+) -> NumericDelta:
+    return NumericDelta(
+        base=float(base[index]),
+        other=float(other[index]),
+        abs=float(abs_delta[index]),
+        rel=float(rel_delta[index]) if rel_defined[index] else None,
+    )
+
+
+def build_comparison_from_aligned(
+    aligned: AlignedScResults,
+    *,
+    other_row: int,
+    study_case_id: UUID,
+    analysis_type: ExecutionAnalysisType,
+    base_scenario_id: UUID,
+    other_scenario_id: UUID,
+) -> ShortCircuitComparison:
+    """
+    Build a ShortCircuitComparison (base row 0 vs other_row) from aligned arrays.
+
+    Output is identical to domain build_comparison() for the same pair.
+    """
+    input_hash = compute_comparison_input_hash(
+        base_signature=aligned.signatures[0],
+        other_signature=aligned.signatures[other_row],
+        analysis_type=analysis_type,
+    )
+
+    # Global deltas
+    g_base = aligned.global_values[0]
+    g_other = aligned.global_values[other_row]
+    g_abs, g_rel, g_rel_defined = _delta_arrays(g_base, g_other)
+    g_both = aligned.global_present[0] & aligned.global_present[other_row]
+    deltas_global: dict[str, NumericDelta] = {
+        key: _numeric_delta_at(g_base, g_other, g_abs, g_rel, g_rel_defined, g)
+        for g, key in enumerate(SC_GLOBAL_DELTA_KEYS)
+        if g_both[g]
+    }
+
+    # Per-element deltas: one vectorized pass per value key
+    both_elements = aligned.element_present[0] & aligned.element_present[other_row]
+    element_deltas: dict[int, dict[str, Any]] = {
+        col: {} for col in np.flatnonzero(both_elements).tolist()
+    }
+    for key in aligned.value_keys:
+        base = aligned.values[key][0]
+        other = aligned.values[key][other_row]
+        mask = (
+            both_elements
+            & aligned.value_present[key][0]
+            & aligned.value_present[key][other_row]
+        )
+        if not mask.any():
+            continue
+        abs_delta, rel_delta, rel_defined = _delta_arrays(base, other)
+        for col in np.flatnonzero(mask).tolist():
+            element_deltas[col][key] = _numeric_delta_at(
+                base, other, abs_delta, rel_delta, rel_defined, col
+            ).to_dict()
+
+    deltas_by_source: list[dict[str, Any]] = []
+    deltas_by_branch: list[dict[str, Any]] = []
+    base_types = aligned.element_types[0]
+    for col, value_deltas in element_deltas.items():
+        entry = {"element_ref": aligned.element_refs[col], "deltas": value_deltas}
+        if base_types[col] in ("Branch", "branch", "BRANCH"):
+            deltas_by_branch.append(entry)
+        else:
+            # Sources and other element types (same rule as build_comparison)
+            deltas_by_source.append(entry)
+
+    return ShortCircuitComparison(
+        comparison_id=uuid4(),
+        study_case_id=study_case_id,
+        analysis_type=analysis_type,
+        base_scenario_id=base_scenario_id,
+        other_scenario_id=other_scenario_id,
+        created_at=datetime.now(timezone.utc),
+        input_hash=input_hash,
+        deltas_global=deltas_global,
+        deltas_by_source=tuple(deltas_by_source),
+        deltas_by_branch=tuple(deltas_by_branch),
+    )
+
+
 class ScComparisonService:
     """
     Service for computing short-circuit result comparisons.
 
     Validates inputs, extracts ResultSets, and delegates delta
-    computation to the domain layer.
+    computation to the domain layer. N-way comparisons (one base vs
+    many variants) run over aligned columnar arrays, cached per run set.
     """
 
     def __init__(self, engine: ExecutionEngineService) -> None:
         self._engine = engine
         self._comparisons: dict[UUID, ShortCircuitComparison] = {}
         self._case_comparisons: dict[UUID, list[UUID]] = {}
+        self._aligned: OrderedDict[tuple[UUID, ...], AlignedScResults] = OrderedDict()
 
     def compute_comparison(
         self,
@@ -188,6 +428,112 @@ class ScComparisonService:
 
         return comparison
 
+    def compute_comparisons_many(
+        self,
+        *,
+        study_case_id: UUID,
+        base_run_id: UUID,
+        base_scenario_id: UUID,
+        others: Sequence[tuple[UUID, UUID]],
+        max_workers: int | None = None,
+    ) -> list[ShortCircuitComparison]:
+        """
+        Compare one base SC ResultSet against many variants (N-way).
+
+        Every ResultSet is loaded once and aligned by element_ref into
+        columnar arrays; deltas are computed vectorized per pair on a
+        worker pool. Each comparison equals compute_comparison() for the
+        same pair and is stored the same way.
+
+        Args:
+            study_case_id: Expected study case for all runs.
+            base_run_id: Run ID for the base (reference) result.
+            base_scenario_id: Scenario ID for the base result.
+            others: (run_id, scenario_id) per variant, in output order.
+            max_workers: Worker pool size (None = executor default).
+
+        Returns:
+            ShortCircuitComparison per variant, in `others` order.
+
+        Raises:
+            Same as compute_comparison().
+        """
+        run_ids = (base_run_id, *(run_id for run_id, _ in others))
+
+        # Validate all runs against the base run
+        base_run = self._engine.get_run(base_run_id)
+        if base_run.status != RunStatus.DONE:
+            raise RunNotDoneError(str(base_run_id), base_run.status.value)
+        if base_run.study_case_id != study_case_id:
+            raise StudyCaseMismatchError(
+                str(study_case_id),
+                str(base_run.study_case_id),
+            )
+        for run_id in run_ids[1:]:
+            other_run = self._engine.get_run(run_id)
+            if other_run.status != RunStatus.DONE:
+                raise RunNotDoneError(str(run_id), other_run.status.value)
+            if base_run.analysis_type != other_run.analysis_type:
+                raise AnalysisTypeMismatchError(
+                    base_run.analysis_type.value,
+                    other_run.analysis_type.value,
+                )
+            if base_run.study_case_id != other_run.study_case_id:
+                raise StudyCaseMismatchError(
+                    str(base_run.study_case_id),
+                    str(other_run.study_case_id),
+                )
+
+        aligned = self.get_aligned_results(run_ids)
+
+        def build_pair(row: int) -> ShortCircuitComparison:
+            return build_comparison_from_aligned(
+                aligned,
+                other_row=row,
+                study_case_id=study_case_id,
+                analysis_type=base_run.analysis_type,
+                base_scenario_id=base_scenario_id,
+                other_scenario_id=others[row - 1][1],
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            comparisons = list(pool.map(build_pair, range(1, len(run_ids))))
+
+        # Store (deterministic order)
+        case_list = self._case_comparisons.setdefault(study_case_id, [])
+        for comparison in comparisons:
+            self._comparisons[comparison.comparison_id] = comparison
+            case_list.append(comparison.comparison_id)
+
+        logger.info(
+            "N-way comparison computed: base=%s variants=%d elements=%d",
+            base_run_id,
+            len(comparisons),
+            len(aligned.element_refs),
+        )
+
+        return comparisons
+
+    def get_aligned_results(self, run_ids: Sequence[UUID]) -> AlignedScResults:
+        """
+        Get aligned columnar results for a run set (base first).
+
+        Cached per run set (LRU, ALIGNED_RESULTS_CACHE_SIZE sets) —
+        ResultSets are immutable, so follow-up drilldowns reuse the same
+        arrays without reloading.
+        """
+        key = tuple(run_ids)
+        aligned = self._aligned.get(key)
+        if aligned is None:
+            result_sets = [self._engine.get_result_set(run_id) for run_id in key]
+            aligned = align_sc_result_sets(key, result_sets)
+            self._aligned[key] = aligned
+            while len(self._aligned) > ALIGNED_RESULTS_CACHE_SIZE:
+                self._aligned.popitem(last=False)
+        else:
+            self._aligned.move_to_end(key)
+        return aligned
+
     def get_comparison(self, comparison_id: UUID) -> ShortCircuitComparison:
         """Get a comparison by ID."""
         comparison = self._comparisons.get(comparison_id)
@@ -204,3 +550,23 @@ class ScComparisonService:
             if cid in self._comparisons
         ]
         return list(reversed(comparisons))
+
+    def list_comparisons_page(
+        self,
+        study_case_id: UUID,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[ShortCircuitComparison]:
+        """Keyset page of comparisons on (created_at, comparison_id), newest first."""
+        comparisons = (
+            self._comparisons[cid]
+            for cid in self._case_comparisons.get(study_case_id, [])
+            if cid in self._comparisons
+        )
+        return keyset_page(
+            comparisons,
+            key=lambda comparison: (comparison.created_at, str(comparison.comparison_id)),
+            limit=limit,
+            cursor=cursor,
+        )
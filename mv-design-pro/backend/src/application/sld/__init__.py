@@ -18,6 +18,7 @@ from .dtos import (
     SldSwitchSymbolDTO,
 )
 from .layout import build_auto_layout_diagram
+from .layout_engine import SldLayoutEngine, shared_sld_layout_engine
 from .overlay import ResultSldOverlayBuilder, ResultStatus
 
 __all__ = [
@@ -26,9 +27,11 @@ __all__ = [
     "SldAnnotationDTO",
     "SldBranchSymbolDTO",
     "SldDiagramDTO",
+    "SldLayoutEngine",
     "SldNodeSymbolDTO",
     "SldOperatingMode",
     "SldResultStatus",
     "SldSwitchSymbolDTO",
     "build_auto_layout_diagram",
+    "shared_sld_layout_engine",
 ]
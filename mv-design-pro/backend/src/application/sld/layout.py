@@ -41,6 +41,7 @@ def build_auto_layout_diagram(
     annotations: Iterable[dict] | None = None,
     switches: Iterable[dict] | None = None,
     vertical: bool = False,
+    incremental: bool = False,
 ) -> SldDiagram:
     """
     Build deterministic auto-layout SLD diagram.
@@ -54,6 +55,10 @@ def build_auto_layout_diagram(
     - CLOSED switches contribute to topology (adjacency)
     - OPEN switches do not connect nodes in layout
     - Both are visible in SLD with appropriate symbols
+
+    incremental=True reuses the shared SldLayoutEngine: positions are
+    identical, but only the part of the diagram affected by the topology
+    change since the last layout of this diagram is recomputed.
     """
     nodes = list(nodes)
     branches = list(branches)
@@ -104,10 +109,18 @@ def build_auto_layout_diagram(
             adjacency[from_node_id].add(to_node_id)
             adjacency[to_node_id].add(from_node_id)
 
-    positions = _layout_positions(
-        adjacency, node_ids, connection_node_id,
-        x_spacing=x_spacing, y_spacing=y_spacing, vertical=vertical,
-    )
+    if incremental:
+        from application.sld.layout_engine import shared_sld_layout_engine
+
+        positions = shared_sld_layout_engine(x_spacing, y_spacing, vertical).positions(
+            adjacency, connection_node_id, scope=diagram_uuid
+        )
+    else:
+        positions = _layout_positions(
+            adjacency, node_ids, connection_node_id,
+            x_spacing=x_spacing, y_spacing=y_spacing, vertical=vertical,
+        )
+    node_names = {node["id"]: node.get("name") for node in nodes}
 
     # Create node symbols with in_service state
     node_symbols = []
@@ -119,7 +132,7 @@ def build_auto_layout_diagram(
                 node_id=node_id,
                 x=x,
                 y=y,
-                label=_label_for_node(node_id, nodes),
+                label=node_names.get(node_id),
                 in_service=node_in_service.get(node_id, True),
             )
         )
@@ -271,12 +284,5 @@ def _sorted_ids(node_ids: Iterable[UUID]) -> list[UUID]:
     return sorted(node_ids, key=lambda item: str(item))
 
 
-def _label_for_node(node_id: UUID, nodes: Iterable[dict]) -> str | None:
-    for node in nodes:
-        if node.get("id") == node_id:
-            return node.get("name")
-    return None
-
-
 def _symbol_uuid(diagram_id: UUID, prefix: str, entity_id: UUID) -> UUID:
     return uuid5(diagram_id, f"{prefix}:{entity_id}")
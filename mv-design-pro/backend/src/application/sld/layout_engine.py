@@ -0,0 +1,459 @@
+"""
+Incremental SLD Auto-Layout Engine.
+
+Per sld_rules.md § F.6 (Deterministic Display): positions produced here are
+identical to a full rebuild by build_auto_layout_diagram — the engine only
+avoids recomputing what a topology change cannot affect.
+
+Invariants of the full layout that make this possible:
+- A node's level is its BFS distance from the component root (neighbor
+  ordering affects visit order, never the distance).
+- Component roots: connection node first, then the smallest node ID of every
+  other component; components are placed in that order.
+- Within a level, nodes are ordered by ID; a component's width is its
+  largest level, and each component is offset by the widths before it.
+
+Cache:
+- Layout states (per-component level maps + positions) are keyed by the
+  layout hash of the topology; an unchanged topology is a cache hit.
+- A changed topology is diffed against the previous state of the same scope
+  (e.g. diagram ID). Insertions into one component relax BFS distances from
+  the new edges only and re-place the touched levels; removals, merges and
+  root changes rebuild just the affected components.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import threading
+from bisect import insort
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from uuid import UUID
+
+from application.sld.layout import _bfs_levels, _sorted_ids
+
+DEFAULT_MAX_STATES = 32
+
+Position = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class _ComponentLayout:
+    root: UUID
+    levels: dict[UUID, int]
+    # level → node IDs sorted by str(ID)
+    members: dict[int, list[UUID]]
+
+    @classmethod
+    def from_levels(cls, root: UUID, levels: dict[UUID, int]) -> _ComponentLayout:
+        members: dict[int, list[UUID]] = {}
+        for node_id, level in levels.items():
+            members.setdefault(level, []).append(node_id)
+        for level_nodes in members.values():
+            level_nodes.sort(key=str)
+        return cls(root=root, levels=levels, members=members)
+
+    @property
+    def width(self) -> int:
+        return max(len(level_nodes) for level_nodes in self.members.values())
+
+
+@dataclass(frozen=True)
+class _LayoutState:
+    adjacency: dict[UUID, frozenset[UUID]]
+    connection_node_id: UUID | None
+    components: tuple[_ComponentLayout, ...]
+    component_of: dict[UUID, int]
+    offsets: tuple[float, ...]
+    positions: dict[UUID, Position]
+
+
+def compute_layout_hash(
+    adjacency: Mapping[UUID, Iterable[UUID]],
+    connection_node_id: UUID | None,
+) -> str:
+    """Deterministic SHA-256 of the layout topology (nodes, edges, root)."""
+    keys = {node_id: _id_bytes(node_id) for node_id in adjacency}
+    edges = sorted(
+        {
+            min(keys[node_id], keys[neighbor]) + max(keys[node_id], keys[neighbor])
+            for node_id, neighbors in adjacency.items()
+            for neighbor in neighbors
+        }
+    )
+    digest = hashlib.sha256()
+    digest.update(_id_bytes(connection_node_id) if connection_node_id is not None else b"-")
+    digest.update(len(keys).to_bytes(8, "big"))
+    digest.update(b"".join(sorted(keys.values())))
+    digest.update(b"".join(edges))
+    return digest.hexdigest()
+
+
+class SldLayoutEngine:
+    """
+    Incremental, cached equivalent of layout._layout_positions.
+
+    One engine per spacing/orientation; safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        x_spacing: float = 200.0,
+        y_spacing: float = 120.0,
+        vertical: bool = False,
+        max_states: int = DEFAULT_MAX_STATES,
+    ) -> None:
+        self._x_spacing = x_spacing
+        self._y_spacing = y_spacing
+        self._vertical = vertical
+        self._max_states = max(1, max_states)
+        self._states: OrderedDict[str, _LayoutState] = OrderedDict()
+        self._latest_by_scope: dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "incremental": 0, "full": 0, "relaid_nodes": 0}
+
+    def positions(
+        self,
+        adjacency: Mapping[UUID, Iterable[UUID]],
+        connection_node_id: UUID | None,
+        *,
+        scope: Hashable = None,
+        layout_hash: str | None = None,
+    ) -> dict[UUID, Position]:
+        """Positions for the topology; reuses the previous state of `scope`."""
+        frozen = {node_id: frozenset(neighbors) for node_id, neighbors in adjacency.items()}
+        key = layout_hash or compute_layout_hash(frozen, connection_node_id)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+                self._latest_by_scope[scope] = key
+                self._stats["hits"] += 1
+                return dict(state.positions)
+            previous_key = self._latest_by_scope.get(scope)
+            previous = self._states.get(previous_key) if previous_key else None
+
+        if previous is not None and previous.connection_node_id == connection_node_id:
+            state, relaid = self._update(previous, frozen)
+            kind = "incremental"
+        else:
+            state, relaid = self._full(frozen, connection_node_id)
+            kind = "full"
+
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self._max_states:
+                self._states.popitem(last=False)
+            self._latest_by_scope[scope] = key
+            self._stats[kind] += 1
+            self._stats["relaid_nodes"] += relaid
+        return dict(state.positions)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "states": len(self._states)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+            self._latest_by_scope.clear()
+
+    # ------------------------------------------------------------------
+    # Full and incremental component layout
+    # ------------------------------------------------------------------
+
+    def _full(
+        self,
+        adjacency: dict[UUID, frozenset[UUID]],
+        connection_node_id: UUID | None,
+    ) -> tuple[_LayoutState, int]:
+        components = _components_for(adjacency, adjacency.keys(), connection_node_id)
+        return self._place(adjacency, connection_node_id, components, None, set())
+
+    def _update(
+        self,
+        previous: _LayoutState,
+        adjacency: dict[UUID, frozenset[UUID]],
+    ) -> tuple[_LayoutState, int]:
+        connection_node_id = previous.connection_node_id
+        old_adjacency = previous.adjacency
+        component_of = previous.component_of
+
+        removed_nodes = old_adjacency.keys() - adjacency.keys()
+        added_edges: set[tuple[UUID, UUID]] = set()
+        dirty: set[int] = set()
+        for node_id in removed_nodes:
+            dirty.add(component_of[node_id])
+        for node_id, neighbors in adjacency.items():
+            old_neighbors = old_adjacency.get(node_id)
+            if old_neighbors is None or neighbors == old_neighbors:
+                continue
+            if old_neighbors - neighbors:
+                dirty.add(component_of[node_id])
+            for neighbor in neighbors - old_neighbors:
+                added_edges.add(_edge(node_id, neighbor))
+        added_nodes = adjacency.keys() - old_adjacency.keys()
+        for node_id in added_nodes:
+            for neighbor in adjacency[node_id]:
+                added_edges.add(_edge(node_id, neighbor))
+
+        # Group additions with the components they touch
+        groups = _UnionFind()
+        for index in dirty:
+            groups.add(("component", index))
+        for node_id in added_nodes:
+            groups.add(("node", node_id))
+        for from_node_id, to_node_id in added_edges:
+            groups.union(
+                _token(from_node_id, component_of, added_nodes),
+                _token(to_node_id, component_of, added_nodes),
+            )
+
+        components = list(previous.components)
+        replaced: set[int] = set()
+        rebuild_nodes: set[UUID] = set()
+        touched_levels: dict[int, set[int]] = {}
+        for group in groups.groups():
+            indices = {value for kind, value in group if kind == "component"}
+            new_nodes = {value for kind, value in group if kind == "node"}
+            if len(indices) == 1 and not indices & dirty:
+                (index,) = indices
+                component = components[index]
+                root_kept = component.root == connection_node_id or all(
+                    str(node_id) > str(component.root) for node_id in new_nodes
+                )
+                if root_kept and connection_node_id not in new_nodes:
+                    edges = [
+                        edge
+                        for edge in added_edges
+                        if _token(edge[0], component_of, added_nodes) in group
+                    ]
+                    components[index], levels = _relax(component, adjacency, edges)
+                    touched_levels[index] = levels
+                    continue
+            replaced |= indices
+            rebuild_nodes |= new_nodes
+            for index in indices:
+                rebuild_nodes |= components[index].levels.keys() - removed_nodes
+
+        kept = [
+            component for index, component in enumerate(components) if index not in replaced
+        ]
+        rebuilt = _components_for(adjacency, rebuild_nodes, connection_node_id)
+        ordered = _order_components(kept + rebuilt, connection_node_id)
+
+        relaid_levels = {
+            id(components[index]): levels for index, levels in touched_levels.items()
+        }
+        return self._place(
+            adjacency,
+            connection_node_id,
+            ordered,
+            previous,
+            {id(component) for component in rebuilt},
+            relaid_levels,
+        )
+
+    def _place(
+        self,
+        adjacency: dict[UUID, frozenset[UUID]],
+        connection_node_id: UUID | None,
+        components: list[_ComponentLayout],
+        previous: _LayoutState | None,
+        new_components: set[int],
+        relaid_levels: dict[int, set[int]] | None = None,
+    ) -> tuple[_LayoutState, int]:
+        relaid_levels = relaid_levels or {}
+        spread = self._x_spacing if self._vertical else self._y_spacing
+        previous_offsets: dict[UUID, float] = {}
+        if previous is not None:
+            previous_offsets = {
+                component.root: offset
+                for component, offset in zip(previous.components, previous.offsets)
+            }
+
+        positions: dict[UUID, Position] = {}
+        component_of: dict[UUID, int] = {}
+        offsets: list[float] = []
+        relaid = 0
+        current_offset = 0.0
+        for index, component in enumerate(components):
+            offsets.append(current_offset)
+            component_of.update(dict.fromkeys(component.levels, index))
+            reuse = (
+                previous is not None
+                and id(component) not in new_components
+                and previous_offsets.get(component.root) == current_offset
+            )
+            levels_to_place = relaid_levels.get(id(component)) if reuse else None
+            for level, level_nodes in component.members.items():
+                if reuse and (levels_to_place is None or level not in levels_to_place):
+                    for node_id in level_nodes:
+                        positions[node_id] = previous.positions[node_id]
+                    continue
+                relaid += len(level_nodes)
+                for position_index, node_id in enumerate(level_nodes):
+                    positions[node_id] = self._position(current_offset, level, position_index)
+            current_offset += component.width * spread + spread
+
+        state = _LayoutState(
+            adjacency=adjacency,
+            connection_node_id=connection_node_id,
+            components=tuple(components),
+            component_of=component_of,
+            offsets=tuple(offsets),
+            positions=positions,
+        )
+        return state, relaid
+
+    def _position(self, offset: float, level: int, index: int) -> Position:
+        if self._vertical:
+            # SLD mode: Y=depth (top→bottom), X=spread (left→right)
+            return (offset + index * self._x_spacing, level * self._y_spacing)
+        # Legacy mode: X=depth, Y=spread
+        return (level * self._x_spacing, offset + index * self._y_spacing)
+
+
+@lru_cache(maxsize=None)
+def shared_sld_layout_engine(
+    x_spacing: float = 200.0,
+    y_spacing: float = 120.0,
+    vertical: bool = False,
+) -> SldLayoutEngine:
+    """Process-wide engine for the given spacing/orientation."""
+    return SldLayoutEngine(x_spacing=x_spacing, y_spacing=y_spacing, vertical=vertical)
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+
+class _UnionFind:
+    def __init__(self) -> None:
+        self._parent: dict[tuple[str, object], tuple[str, object]] = {}
+
+    def add(self, item: tuple[str, object]) -> None:
+        self._parent.setdefault(item, item)
+
+    def find(self, item: tuple[str, object]) -> tuple[str, object]:
+        self.add(item)
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[item] != root:
+            self._parent[item], item = root, self._parent[item]
+        return root
+
+    def union(self, first: tuple[str, object], second: tuple[str, object]) -> None:
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root != second_root:
+            self._parent[second_root] = first_root
+
+    def groups(self) -> list[set[tuple[str, object]]]:
+        grouped: dict[tuple[str, object], set[tuple[str, object]]] = {}
+        for item in list(self._parent):
+            grouped.setdefault(self.find(item), set()).add(item)
+        return list(grouped.values())
+
+
+def _id_bytes(node_id: UUID) -> bytes:
+    if isinstance(node_id, UUID):
+        return node_id.bytes
+    return hashlib.sha256(str(node_id).encode("utf-8")).digest()[:16]
+
+
+def _edge(first: UUID, second: UUID) -> tuple[UUID, UUID]:
+    return (first, second) if str(first) <= str(second) else (second, first)
+
+
+def _token(
+    node_id: UUID, component_of: dict[UUID, int], added_nodes: set[UUID]
+) -> tuple[str, object]:
+    if node_id in added_nodes:
+        return ("node", node_id)
+    return ("component", component_of[node_id])
+
+
+def _components_for(
+    adjacency: dict[UUID, frozenset[UUID]],
+    node_ids: Iterable[UUID],
+    connection_node_id: UUID | None,
+) -> list[_ComponentLayout]:
+    """Full BFS layout of the components covering node_ids (as in _layout_positions)."""
+    node_ids = set(node_ids)
+    visited: set[UUID] = set()
+    components: list[_ComponentLayout] = []
+    if connection_node_id in node_ids:
+        components.append(
+            _ComponentLayout.from_levels(
+                connection_node_id, _bfs_levels(adjacency, connection_node_id, visited)
+            )
+        )
+    for node_id in _sorted_ids(node_ids):
+        if node_id not in visited:
+            components.append(
+                _ComponentLayout.from_levels(node_id, _bfs_levels(adjacency, node_id, visited))
+            )
+    return components
+
+
+def _order_components(
+    components: list[_ComponentLayout], connection_node_id: UUID | None
+) -> list[_ComponentLayout]:
+    return sorted(
+        components,
+        key=lambda component: (component.root != connection_node_id, str(component.root)),
+    )
+
+
+def _relax(
+    component: _ComponentLayout,
+    adjacency: dict[UUID, frozenset[UUID]],
+    added_edges: list[tuple[UUID, UUID]],
+) -> tuple[_ComponentLayout, set[int]]:
+    """
+    Apply edge insertions to one component: BFS distances can only shrink,
+    so relax from the new edges outward (Dijkstra on unit weights).
+    """
+    levels = dict(component.levels)
+    queue: list[tuple[int, str, UUID]] = []
+    for from_node_id, to_node_id in added_edges:
+        for source, target in ((from_node_id, to_node_id), (to_node_id, from_node_id)):
+            if source in levels:
+                heapq.heappush(queue, (levels[source] + 1, str(target), target))
+
+    changed: dict[UUID, int | None] = {}
+    while queue:
+        level, _, node_id = heapq.heappop(queue)
+        current = levels.get(node_id)
+        if current is not None and current <= level:
+            continue
+        changed.setdefault(node_id, current)
+        levels[node_id] = level
+        for neighbor in adjacency[node_id]:
+            neighbor_level = levels.get(neighbor)
+            if neighbor_level is None or neighbor_level > level + 1:
+                heapq.heappush(queue, (level + 1, str(neighbor), neighbor))
+
+    members = dict(component.members)
+    touched: set[int] = set()
+    for node_id, old_level in changed.items():
+        if old_level is not None:
+            members[old_level] = [item for item in members[old_level] if item != node_id]
+            touched.add(old_level)
+        new_level = levels[node_id]
+        if new_level not in touched:
+            members[new_level] = list(members.get(new_level, []))
+        insort(members[new_level], node_id, key=str)
+        touched.add(new_level)
+    for level in [level for level in touched if not members[level]]:
+        del members[level]
+        touched.discard(level)
+    return _ComponentLayout(root=component.root, levels=levels, members=members), touched
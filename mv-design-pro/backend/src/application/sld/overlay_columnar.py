@@ -0,0 +1,210 @@
+"""
+Columnar SLD overlay payload — compact binary alternative to overlay JSON.
+
+Layout (little-endian):
+    b"MVOV" | u16 format version | u16 reserved | u32 header length
+    | header JSON (UTF-8) | zero padding to 8 bytes | column buffers
+
+The header holds the element-id table of every section (nodes, branches)
+and a directory of typed columns: ``float32`` for measurements (None → NaN)
+and ``uint8`` for statuses (index into ``status_codes``; 0 = none).
+Column offsets are relative to the first buffer byte and 4-byte aligned, so
+a browser can map them straight onto Float32Array/Uint8Array views.
+
+This is APPLICATION LAYER — presentation encoding only, no physics.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+OVERLAY_COLUMNAR_MEDIA_TYPE = "application/vnd.mv-design-pro.sld-overlay+columnar"
+OVERLAY_COLUMNAR_VERSION = 1
+
+_MAGIC = b"MVOV"
+_PREAMBLE = struct.Struct("<4sHHI")
+_ALIGNMENT = 8
+
+# (section, element-id keys in priority order, float32 columns, uint8 status columns)
+_SECTIONS: tuple[tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...]], ...] = (
+    (
+        "nodes",
+        ("node_id", "bus_id"),
+        ("u_pu", "u_kv", "angle_deg", "ikss_ka", "sk_mva"),
+        ("voltage_status", "ev_status"),
+    ),
+    (
+        "branches",
+        ("branch_id",),
+        ("p_mw", "q_mvar", "i_a", "loading_pct"),
+        ("ev_status",),
+    ),
+)
+_STATUS_CODES = ("", "PASS", "WARNING", "FAIL", "NOT_COMPUTED")
+_HEADER_FIELDS = ("diagram_id", "run_id", "result_status", "overall_ev_status")
+
+
+class OverlayFormatError(ValueError):
+    """Payload is not a columnar SLD overlay of a supported version."""
+
+
+def encode_sld_overlay_columnar(overlay: Mapping[str, Any]) -> bytes:
+    """
+    Encode an overlay dict (``nodes``/``buses`` + ``branches`` rows) as columns.
+
+    Accepts the canonical API overlay, SldOverlayData.to_dict() and the
+    results-inspector DTO; columns absent from every row are omitted.
+    """
+    status_codes = list(_STATUS_CODES)
+    status_index = {status: code for code, status in enumerate(status_codes)}
+    sections: list[dict[str, Any]] = []
+    buffers: list[bytes] = []
+    offset = 0
+
+    for name, id_keys, float_columns, status_columns in _SECTIONS:
+        rows: Sequence[Mapping[str, Any]] = overlay.get(name) or (
+            overlay.get("buses") or [] if name == "nodes" else []
+        )
+        section: dict[str, Any] = {
+            "name": name,
+            "count": len(rows),
+            "element_ids": [_element_id(row, id_keys) for row in rows],
+            "columns": [],
+        }
+        if any("symbol_id" in row for row in rows):
+            section["symbol_ids"] = [str(row.get("symbol_id") or "") for row in rows]
+
+        for column in _present(rows, float_columns):
+            values = array(
+                "f", (math.nan if row.get(column) is None else row[column] for row in rows)
+            )
+            offset = _append(buffers, section, column, "float32", _little_endian(values), offset)
+        for column in _present(rows, status_columns):
+            codes = bytearray()
+            for row in rows:
+                status = row.get(column)
+                if status is None:
+                    codes.append(0)
+                    continue
+                if status not in status_index:
+                    status_index[status] = len(status_codes)
+                    status_codes.append(status)
+                codes.append(status_index[status])
+            offset = _append(buffers, section, column, "uint8", bytes(codes), offset)
+        sections.append(section)
+
+    header = {
+        **{field: _json_scalar(overlay.get(field)) for field in _HEADER_FIELDS},
+        "status_codes": status_codes,
+        "sections": sections,
+    }
+    header_bytes = json.dumps(
+        header, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+    preamble = _PREAMBLE.pack(_MAGIC, OVERLAY_COLUMNAR_VERSION, 0, len(header_bytes))
+    padding = -(len(preamble) + len(header_bytes)) % _ALIGNMENT
+    return b"".join([preamble, header_bytes, b"\0" * padding, *buffers])
+
+
+def decode_sld_overlay_columnar(data: bytes) -> dict[str, Any]:
+    """Decode into overlay rows (``nodes``, ``branches``); float32 precision."""
+    if len(data) < _PREAMBLE.size:
+        raise OverlayFormatError("Payload too short for columnar overlay")
+    magic, version, _, header_length = _PREAMBLE.unpack_from(data)
+    if magic != _MAGIC or version != OVERLAY_COLUMNAR_VERSION:
+        raise OverlayFormatError(f"Unsupported columnar overlay (version={version})")
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(data[_PREAMBLE.size : header_end].decode("utf-8"))
+    body = memoryview(data)[header_end + (-header_end % _ALIGNMENT) :]
+    status_codes = header["status_codes"]
+
+    overlay: dict[str, Any] = {field: header.get(field) for field in _HEADER_FIELDS}
+    for section in header["sections"]:
+        rows: list[dict[str, Any]] = [
+            {"element_id": element_id} for element_id in section["element_ids"]
+        ]
+        for row, symbol_id in zip(rows, section.get("symbol_ids", [])):
+            row["symbol_id"] = symbol_id
+        for column in section["columns"]:
+            raw = body[column["offset"] : column["offset"] + column["length"]]
+            if column["dtype"] == "float32":
+                values = array("f", bytes(raw))
+                if sys.byteorder == "big":
+                    values.byteswap()
+                for row, value in zip(rows, values):
+                    row[column["name"]] = None if value != value else value
+            else:
+                for row, code in zip(rows, bytes(raw)):
+                    row[column["name"]] = status_codes[code] or None
+        overlay[section["name"]] = rows
+    return overlay
+
+
+def overlay_etag(*parts: object) -> str:
+    """Strong ETag over the inputs that fully determine an overlay payload."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (dict, list)):
+            part = json.dumps(part, sort_keys=True, separators=(",", ":"), default=str)
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """RFC 9110 If-None-Match: weak comparison, ``*`` or a comma-separated list."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in {_strip_weak(candidate) for candidate in candidates}
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _element_id(row: Mapping[str, Any], keys: tuple[str, ...]) -> str:
+    for key in keys:
+        if row.get(key) is not None:
+            return str(row[key])
+    return ""
+
+
+def _present(rows: Iterable[Mapping[str, Any]], columns: tuple[str, ...]) -> list[str]:
+    rows = list(rows)
+    return [column for column in columns if any(column in row for row in rows)]
+
+
+def _append(
+    buffers: list[bytes],
+    section: dict[str, Any],
+    name: str,
+    dtype: str,
+    payload: bytes,
+    offset: int,
+) -> int:
+    section["columns"].append(
+        {"name": name, "dtype": dtype, "offset": offset, "length": len(payload)}
+    )
+    padding = -len(payload) % 4
+    buffers.append(payload + b"\0" * padding)
+    return offset + len(payload) + padding
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _json_scalar(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
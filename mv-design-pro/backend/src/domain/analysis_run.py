@@ -28,6 +28,7 @@ class AnalysisRun:
     trace_json: dict | list | None = None
     white_box_trace: list[dict] | None = None
     error_message: str | None = None
+    result_source_run_id: UUID | None = None  # results reused from this run (dedup)
 
     @property
     def results_valid(self) -> bool:
@@ -0,0 +1,273 @@
+"""
+Archive Chunks — adresowanie treścią (content-addressed) archiwum projektu.
+
+Archiwum dzielone jest na chunki: każdy element ciężkich list (run, wynik,
+dowód, snapshot, diagram) to osobny chunk, pozostałe klucze sekcji —
+po jednym chunku na klucz. Chunk identyfikuje SHA-256 jego kanonicznego
+JSON; manifest zawiera uporządkowane hashe chunków każdej sekcji.
+
+Niezmieniony element ma ten sam hash w kolejnych eksportach, więc delta
+(przyrostowa lub kopia zapasowa) przenosi wyłącznie chunki, których
+odbiorca jeszcze nie posiada.
+
+KANON:
+- NOT-A-SOLVER — zero obliczeń fizycznych
+- Deterministyczny — te same dane = te same chunki i manifest
+- Weryfikacja hash każdego chunka i fingerprints po złożeniu
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import zipfile
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from typing import IO, Any
+
+from domain.project_archive import (
+    ARCHIVE_FORMAT_ID,
+    ArchiveError,
+    ArchiveFingerprints,
+    ArchiveIntegrityError,
+    ArchiveStructureError,
+    ProjectArchive,
+    archive_to_dict,
+    canonical_json,
+    dict_to_archive,
+    verify_archive_integrity,
+)
+
+
+# ============================================================================
+# STAŁE
+# ============================================================================
+
+CHUNK_MANIFEST_FORMAT_ID = "MV-DESIGN-PRO-CHUNKS"
+CHUNK_MANIFEST_SCHEMA_VERSION = "1.0.0"
+CHUNK_MANIFEST_MEMBER = "chunk_manifest.json"
+
+CHUNKED_SECTION_NAMES: tuple[str, ...] = (
+    "project_meta",
+    "network_model",
+    "sld_diagrams",
+    "cases",
+    "runs",
+    "results",
+    "proofs",
+    "interpretations",
+    "issues",
+)
+
+# Listy dzielone na chunki per element (pozostałe klucze: chunk per klucz)
+ELEMENT_CHUNKED_LISTS: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("network_model", "snapshots"),
+        ("sld_diagrams", "diagrams"),
+        ("runs", "analysis_runs"),
+        ("runs", "study_runs"),
+        ("results", "study_results"),
+        ("proofs", "design_specs"),
+        ("proofs", "design_proposals"),
+        ("proofs", "design_evidence"),
+        ("interpretations", "cached"),
+    }
+)
+
+# Stała data członów ZIP — identyczne dane = identyczne bajty manifestu
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+# ============================================================================
+# MODELE DANYCH
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ChunkManifest:
+    """
+    Manifest archiwum podzielonego na chunki.
+
+    sections: {sekcja: {klucz: hash chunka | lista hashy elementów}}.
+    Lista hashy występuje dla kluczy z ELEMENT_CHUNKED_LISTS.
+    """
+
+    schema_version: str
+    fingerprints: ArchiveFingerprints
+    sections: dict[str, dict[str, str | list[str]]]
+
+    def chunk_hashes(self) -> frozenset[str]:
+        """Zbiór wszystkich (unikalnych) hashy chunków manifestu."""
+        hashes: set[str] = set()
+        for entries in self.sections.values():
+            for ref in entries.values():
+                if isinstance(ref, list):
+                    hashes.update(ref)
+                else:
+                    hashes.add(ref)
+        return frozenset(hashes)
+
+
+# ============================================================================
+# DZIELENIE / SKŁADANIE
+# ============================================================================
+
+
+def chunk_hash(data: bytes) -> str:
+    """Hash chunka (SHA-256 jego bajtów)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode_chunk(value: object, chunks: dict[str, bytes]) -> str:
+    data = canonical_json(value).encode("utf-8")
+    digest = chunk_hash(data)
+    chunks.setdefault(digest, data)
+    return digest
+
+
+def chunk_archive(archive: ProjectArchive) -> tuple[ChunkManifest, dict[str, bytes]]:
+    """
+    Podziel archiwum na chunki.
+
+    Returns:
+        (manifest, {hash: kanoniczny JSON chunka}) — identyczne elementy
+        (także w obrębie jednego archiwum) dają jeden chunk.
+    """
+    archive_dict = archive_to_dict(archive)
+    chunks: dict[str, bytes] = {}
+    sections: dict[str, dict[str, str | list[str]]] = {}
+
+    for section_name in CHUNKED_SECTION_NAMES:
+        section = archive_dict.get(section_name, {})
+        entries: dict[str, str | list[str]] = {}
+        for key in sorted(section):
+            value = section[key]
+            if (section_name, key) in ELEMENT_CHUNKED_LISTS and isinstance(value, list):
+                entries[key] = [_encode_chunk(item, chunks) for item in value]
+            else:
+                entries[key] = _encode_chunk(value, chunks)
+        sections[section_name] = entries
+
+    manifest = ChunkManifest(
+        schema_version=archive.schema_version,
+        fingerprints=archive.fingerprints,
+        sections=sections,
+    )
+    return manifest, chunks
+
+
+def assemble_archive(
+    manifest: ChunkManifest, chunks: Mapping[str, bytes]
+) -> ProjectArchive:
+    """
+    Złóż archiwum z manifestu i chunków.
+
+    Raises:
+        ArchiveStructureError: brak chunka wskazanego w manifeście
+        ArchiveIntegrityError: hash chunka się nie zgadza
+        ArchiveError: złożone sekcje nie zgadzają się z fingerprints manifestu
+    """
+    decoded: dict[str, object] = {}
+
+    def load(digest: str) -> object:
+        if digest not in decoded:
+            data = chunks.get(digest)
+            if data is None:
+                raise ArchiveStructureError(f"Brak chunka {digest}")
+            actual = chunk_hash(data)
+            if actual != digest:
+                raise ArchiveIntegrityError("chunk", digest, actual)
+            decoded[digest] = json.loads(data)
+        return decoded[digest]
+
+    archive_dict: dict[str, Any] = {
+        "format_id": ARCHIVE_FORMAT_ID,
+        "schema_version": manifest.schema_version,
+        "fingerprints": asdict(manifest.fingerprints),
+    }
+    for section_name, entries in manifest.sections.items():
+        archive_dict[section_name] = {
+            key: [load(digest) for digest in ref] if isinstance(ref, list) else load(ref)
+            for key, ref in entries.items()
+        }
+
+    archive = dict_to_archive(archive_dict)
+    errors = verify_archive_integrity(archive)
+    if errors:
+        raise ArchiveError("; ".join(errors))
+    return archive
+
+
+# ============================================================================
+# SERIALIZACJA MANIFESTU
+# ============================================================================
+
+
+def manifest_to_dict(manifest: ChunkManifest) -> dict[str, object]:
+    """Konwersja manifestu do dict (do JSON)."""
+    return {
+        "format_id": CHUNK_MANIFEST_FORMAT_ID,
+        "manifest_version": CHUNK_MANIFEST_SCHEMA_VERSION,
+        "schema_version": manifest.schema_version,
+        "fingerprints": asdict(manifest.fingerprints),
+        "sections": manifest.sections,
+    }
+
+
+def dict_to_manifest(data: dict[str, Any]) -> ChunkManifest:
+    """
+    Konwersja dict (z JSON) do manifestu.
+
+    Raises:
+        ArchiveStructureError: nieprawidłowy format lub brak pól manifestu
+    """
+    if data.get("format_id") != CHUNK_MANIFEST_FORMAT_ID:
+        raise ArchiveStructureError(
+            f"Nieprawidłowy identyfikator manifestu chunków: {data.get('format_id')}"
+        )
+    try:
+        return ChunkManifest(
+            schema_version=data["schema_version"],
+            fingerprints=ArchiveFingerprints(**data["fingerprints"]),
+            sections=data["sections"],
+        )
+    except (KeyError, TypeError) as exc:
+        raise ArchiveStructureError(f"Niekompletny manifest chunków: {exc}") from exc
+
+
+def write_zip_member(zf: zipfile.ZipFile, name: str, data: bytes | str) -> None:
+    """Zapisz człon ZIP ze stałą datą (deterministyczne bajty)."""
+    info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    zf.writestr(info, data)
+
+
+def serialize_chunk_manifest(manifest: ChunkManifest) -> bytes:
+    """Manifest jako ZIP z członem chunk_manifest.json (kompaktowy JSON)."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        write_zip_member(zf, CHUNK_MANIFEST_MEMBER, canonical_json(manifest_to_dict(manifest)))
+    return buf.getvalue()
+
+
+def read_chunk_manifest(data: bytes | IO[bytes]) -> ChunkManifest | None:
+    """
+    Odczytaj manifest z ZIP (bajty lub plik); None gdy ZIP jest zwykłym
+    archiwum projektu.
+
+    Raises:
+        ArchiveStructureError: dane nie są archiwum ZIP lub manifest jest uszkodzony
+    """
+    try:
+        source = io.BytesIO(data) if isinstance(data, bytes) else data
+        with zipfile.ZipFile(source, "r") as zf:
+            if CHUNK_MANIFEST_MEMBER not in zf.namelist():
+                return None
+            raw = zf.read(CHUNK_MANIFEST_MEMBER)
+    except zipfile.BadZipFile as exc:
+        raise ArchiveStructureError("Plik nie jest prawidłowym archiwum ZIP") from exc
+    try:
+        return dict_to_manifest(json.loads(raw))
+    except json.JSONDecodeError as exc:
+        raise ArchiveStructureError(f"Nieprawidłowy JSON manifestu chunków: {exc}") from exc
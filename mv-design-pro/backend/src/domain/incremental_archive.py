@@ -23,6 +23,14 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+from domain.archive_chunks import (
+    ChunkManifest,
+    assemble_archive,
+    chunk_archive,
+    dict_to_manifest,
+    manifest_to_dict,
+    write_zip_member,
+)
 from domain.project_archive import (
     ArchiveFingerprints,
     ArchiveError,
@@ -41,6 +49,8 @@ from domain.project_archive import (
 
 INCREMENTAL_FORMAT_ID = "MV-DESIGN-PRO-INCREMENTAL"
 INCREMENTAL_SCHEMA_VERSION = "1.0.0"
+CHUNK_DELTA_MEMBER = "chunk_delta.json"
+CHUNK_DELTA_CHUNKS_DIR = "chunks/"
 
 # Mapowanie nazw sekcji na pola ArchiveFingerprints i klucze dict
 SECTION_NAMES: tuple[str, ...] = (
@@ -174,6 +184,21 @@ class IncrementalArchive:
     deterministic_signature: str
 
 
+@dataclass(frozen=True)
+class ChunkDelta:
+    """
+    Delta na poziomie chunków (element: run, wynik, dowód...).
+
+    manifest opisuje pełne nowe archiwum; chunks zawiera wyłącznie chunki
+    nieobecne w archiwum bazowym. Zmiana jednego runu = jeden nowy chunk.
+    """
+
+    base_archive_hash: str
+    manifest: ChunkManifest
+    chunks: dict[str, bytes]
+    changed_sections: tuple[str, ...]
+
+
 @dataclass(frozen=True)
 class IncrementalExportResult:
     """Wynik operacji eksportu przyrostowego."""
@@ -611,7 +636,7 @@ def serialize_incremental(archive: IncrementalArchive) -> bytes:
     """
     archive_dict = _incremental_to_dict(archive)
     json_str = json.dumps(
-        archive_dict, sort_keys=True, indent=2, ensure_ascii=False
+        archive_dict, sort_keys=True, separators=(",", ":"), ensure_ascii=False
     )
 
     buf = io.BytesIO()
@@ -668,6 +693,151 @@ def _is_compatible_version(version: str) -> bool:
         return False
 
 
+# ============================================================================
+# DELTA NA POZIOMIE CHUNKÓW
+# ============================================================================
+
+
+def build_chunk_delta(
+    base_fingerprints: ArchiveFingerprints,
+    base_chunk_hashes: frozenset[str],
+    current_archive: ProjectArchive,
+) -> ChunkDelta:
+    """
+    Zbuduj deltę chunków względem archiwum bazowego.
+
+    Args:
+        base_fingerprints: Fingerprints bazowego archiwum.
+        base_chunk_hashes: Hashe chunków bazowego archiwum
+            (ChunkManifest.chunk_hashes() poprzedniego eksportu).
+        current_archive: Bieżące pełne archiwum projektu.
+
+    Returns:
+        ChunkDelta z manifestem i chunkami, których baza nie posiada.
+    """
+    manifest, chunks = chunk_archive(current_archive)
+    changed = tuple(
+        name
+        for name in SECTION_NAMES
+        if _get_fingerprint_hash(base_fingerprints, name)
+        != _get_fingerprint_hash(current_archive.fingerprints, name)
+    )
+    return ChunkDelta(
+        base_archive_hash=base_fingerprints.archive_hash,
+        manifest=manifest,
+        chunks={
+            digest: data
+            for digest, data in sorted(chunks.items())
+            if digest not in base_chunk_hashes
+        },
+        changed_sections=changed,
+    )
+
+
+def apply_chunk_delta(
+    base_archive: ProjectArchive,
+    delta: ChunkDelta,
+) -> ProjectArchive:
+    """
+    Nałóż deltę chunków na bazowe archiwum.
+
+    Raises:
+        BaseHashMismatchError: Hash bazowego archiwum nie zgadza się.
+        ArchiveError: Brak chunka lub niezgodność hash po złożeniu.
+    """
+    if base_archive.fingerprints.archive_hash != delta.base_archive_hash:
+        raise BaseHashMismatchError(
+            expected=delta.base_archive_hash,
+            got=base_archive.fingerprints.archive_hash,
+        )
+    _, base_chunks = chunk_archive(base_archive)
+    base_chunks.update(delta.chunks)
+    return assemble_archive(delta.manifest, base_chunks)
+
+
+def serialize_chunk_delta(delta: ChunkDelta) -> bytes:
+    """
+    Serializuj ChunkDelta do ZIP.
+
+    Format: chunk_delta.json (manifest + metadane) oraz chunks/<hash>
+    z kanonicznym JSON każdego nowego chunka.
+    """
+    header = {
+        "format_id": INCREMENTAL_FORMAT_ID,
+        "schema_version": INCREMENTAL_SCHEMA_VERSION,
+        "base_archive_hash": delta.base_archive_hash,
+        "changed_sections": list(delta.changed_sections),
+        "manifest": manifest_to_dict(delta.manifest),
+    }
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        write_zip_member(
+            zf,
+            CHUNK_DELTA_MEMBER,
+            json.dumps(header, sort_keys=True, separators=(",", ":")),
+        )
+        for digest, data in sorted(delta.chunks.items()):
+            write_zip_member(zf, f"{CHUNK_DELTA_CHUNKS_DIR}{digest}", data)
+    return buf.getvalue()
+
+
+def is_chunk_delta(data: bytes) -> bool:
+    """Czy bajty to delta chunków (a nie incremental.json)."""
+    try:
+        with zipfile.ZipFile(io.BytesIO(data), "r") as zf:
+            return CHUNK_DELTA_MEMBER in zf.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def deserialize_chunk_delta(data: bytes) -> ChunkDelta:
+    """
+    Deserializuj ChunkDelta z bytes (ZIP).
+
+    Raises:
+        IncrementalStructureError: Nieprawidłowa struktura pliku.
+    """
+    try:
+        with zipfile.ZipFile(io.BytesIO(data), "r") as zf:
+            names = zf.namelist()
+            if CHUNK_DELTA_MEMBER not in names:
+                raise IncrementalStructureError(
+                    f"Brak pliku {CHUNK_DELTA_MEMBER} w archiwum ZIP"
+                )
+            header = json.loads(zf.read(CHUNK_DELTA_MEMBER))
+            chunks = {
+                name[len(CHUNK_DELTA_CHUNKS_DIR):]: zf.read(name)
+                for name in names
+                if name.startswith(CHUNK_DELTA_CHUNKS_DIR)
+            }
+    except zipfile.BadZipFile:
+        raise IncrementalStructureError(
+            "Plik nie jest prawidłowym archiwum ZIP"
+        )
+    except json.JSONDecodeError as e:
+        raise IncrementalStructureError(
+            f"Nieprawidłowy JSON w archiwum: {e}"
+        )
+
+    if header.get("format_id") != INCREMENTAL_FORMAT_ID:
+        raise IncrementalStructureError(
+            f"Nieprawidłowy identyfikator formatu: {header.get('format_id')}"
+        )
+    version = header.get("schema_version", "")
+    if not _is_compatible_version(version):
+        raise IncrementalVersionError(INCREMENTAL_SCHEMA_VERSION, version)
+    for key in ("base_archive_hash", "manifest"):
+        if key not in header:
+            raise IncrementalStructureError(f"Brak wymaganego pola: {key}")
+
+    return ChunkDelta(
+        base_archive_hash=header["base_archive_hash"],
+        manifest=dict_to_manifest(header["manifest"]),
+        chunks=chunks,
+        changed_sections=tuple(header.get("changed_sections", ())),
+    )
+
+
 # ============================================================================
 # FUNKCJE POMOCNICZE DLA API
 # ============================================================================
@@ -261,11 +261,77 @@ def canonicalize(value: Any) -> Any:
     return value
 
 
+def canonical_json(data: object) -> str:
+    """Kanoniczny JSON (ASCII) — dokładnie ten tekst jest hashowany."""
+    return json.dumps(canonicalize(data), sort_keys=True, separators=(",", ":"))
+
+
 def compute_hash(data: Any) -> str:
     """Oblicz deterministyczny hash SHA-256 dla danych."""
-    canonical = canonicalize(data)
-    json_str = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+    return hashlib.sha256(canonical_json(data).encode("utf-8")).hexdigest()
+
+
+class SectionHasher:
+    """
+    Przyrostowy odpowiednik compute_hash dla sekcji archiwum.
+
+    Sekcja to słownik {klucz: lista wierszy | wartość}. Klucze podawane są
+    rosnąco, wiersze w kolejności eksportu; wynik jest identyczny
+    z compute_hash(sekcja), ale sekcja nie jest budowana w pamięci.
+    """
+
+    def __init__(self) -> None:
+        self._sha = hashlib.sha256(b"{")
+        self._last_key: str | None = None
+        self._in_list = False
+        self._first_item = True
+
+    def _open_key(self, key: str) -> None:
+        if self._in_list:
+            raise ValueError(f"Lista '{self._last_key}' nie została zamknięta")
+        if self._last_key is not None:
+            if key <= self._last_key:
+                raise ValueError(f"Klucz '{key}' poza kolejnością (po '{self._last_key}')")
+            self._sha.update(b",")
+        self._sha.update(json.dumps(key).encode("utf-8") + b":")
+        self._last_key = key
+
+    def add_value(self, key: str, value: object) -> str:
+        """Dodaj wartość skalarną; zwraca jej kanoniczny JSON."""
+        self._open_key(key)
+        text = canonical_json(value)
+        self._sha.update(text.encode("utf-8"))
+        return text
+
+    def begin_list(self, key: str) -> None:
+        self._open_key(key)
+        self._sha.update(b"[")
+        self._in_list = True
+        self._first_item = True
+
+    def add_item(self, item: object) -> str:
+        """Dodaj wiersz bieżącej listy; zwraca jego kanoniczny JSON."""
+        if not self._in_list:
+            raise ValueError("Wiersz poza listą")
+        text = canonical_json(item)
+        if not self._first_item:
+            self._sha.update(b",")
+        self._sha.update(text.encode("utf-8"))
+        self._first_item = False
+        return text
+
+    def end_list(self) -> None:
+        if not self._in_list:
+            raise ValueError("Brak otwartej listy")
+        self._sha.update(b"]")
+        self._in_list = False
+
+    def hexdigest(self) -> str:
+        if self._in_list:
+            raise ValueError(f"Lista '{self._last_key}' nie została zamknięta")
+        final = self._sha.copy()
+        final.update(b"}")
+        return final.hexdigest()
 
 
 def compute_archive_fingerprints(
@@ -280,42 +346,49 @@ def compute_archive_fingerprints(
     issues: dict[str, Any],
 ) -> ArchiveFingerprints:
     """Oblicz fingerprints dla wszystkich sekcji archiwum."""
-    project_meta_hash = compute_hash(project_meta)
-    network_model_hash = compute_hash(network_model)
-    sld_hash = compute_hash(sld)
-    cases_hash = compute_hash(cases)
-    runs_hash = compute_hash(runs)
-    results_hash = compute_hash(results)
-    proofs_hash = compute_hash(proofs)
-    interpretations_hash = compute_hash(interpretations)
-    issues_hash = compute_hash(issues)
+    return fingerprints_from_section_hashes(
+        {
+            "project_meta": compute_hash(project_meta),
+            "network_model": compute_hash(network_model),
+            "sld": compute_hash(sld),
+            "cases": compute_hash(cases),
+            "runs": compute_hash(runs),
+            "results": compute_hash(results),
+            "proofs": compute_hash(proofs),
+            "interpretations": compute_hash(interpretations),
+            "issues": compute_hash(issues),
+        }
+    )
+
 
+def fingerprints_from_section_hashes(section_hashes: dict[str, str]) -> ArchiveFingerprints:
+    """Fingerprints z gotowych hashy sekcji (np. liczonych przez SectionHasher)."""
     # Hash całego archiwum to hash wszystkich hash'y
     archive_hash = compute_hash(
         {
-            "project_meta": project_meta_hash,
-            "network_model": network_model_hash,
-            "sld": sld_hash,
-            "cases": cases_hash,
-            "runs": runs_hash,
-            "results": results_hash,
-            "proofs": proofs_hash,
-            "interpretations": interpretations_hash,
-            "issues": issues_hash,
+            "project_meta": section_hashes["project_meta"],
+            "network_model": section_hashes["network_model"],
+            "sld": section_hashes["sld"],
+            "cases": section_hashes["cases"],
+            "runs": section_hashes["runs"],
+            "results": section_hashes["results"],
+            "proofs": section_hashes["proofs"],
+            "interpretations": section_hashes["interpretations"],
+            "issues": section_hashes["issues"],
         }
     )
 
     return ArchiveFingerprints(
         archive_hash=archive_hash,
-        project_meta_hash=project_meta_hash,
-        network_model_hash=network_model_hash,
-        sld_hash=sld_hash,
-        cases_hash=cases_hash,
-        runs_hash=runs_hash,
-        results_hash=results_hash,
-        proofs_hash=proofs_hash,
-        interpretations_hash=interpretations_hash,
-        issues_hash=issues_hash,
+        project_meta_hash=section_hashes["project_meta"],
+        network_model_hash=section_hashes["network_model"],
+        sld_hash=section_hashes["sld"],
+        cases_hash=section_hashes["cases"],
+        runs_hash=section_hashes["runs"],
+        results_hash=section_hashes["results"],
+        proofs_hash=section_hashes["proofs"],
+        interpretations_hash=section_hashes["interpretations"],
+        issues_hash=section_hashes["issues"],
     )
 
 
@@ -414,16 +487,8 @@ def dict_to_archive(data: dict[str, Any]) -> ProjectArchive:
         if key not in data:
             raise ArchiveStructureError(f"Brak wymaganej sekcji: {key}")
 
-    # Walidacja format_id
-    if data["format_id"] != ARCHIVE_FORMAT_ID:
-        raise ArchiveStructureError(
-            f"Nieprawidłowy identyfikator formatu: {data['format_id']}"
-        )
-
-    # Walidacja wersji (obsługujemy migracje)
     schema_version = data["schema_version"]
-    if not _is_compatible_version(schema_version):
-        raise ArchiveVersionError(ARCHIVE_SCHEMA_VERSION, schema_version)
+    validate_archive_header(data["format_id"], schema_version)
 
     pm = data["project_meta"]
     nm = data["network_model"]
@@ -503,6 +568,14 @@ def dict_to_archive(data: dict[str, Any]) -> ProjectArchive:
     )
 
 
+def validate_archive_header(format_id: str, schema_version: str) -> None:
+    """Walidacja identyfikatora formatu i wersji schematu (obsługujemy migracje)."""
+    if format_id != ARCHIVE_FORMAT_ID:
+        raise ArchiveStructureError(f"Nieprawidłowy identyfikator formatu: {format_id}")
+    if not _is_compatible_version(schema_version):
+        raise ArchiveVersionError(ARCHIVE_SCHEMA_VERSION, schema_version)
+
+
 def _is_compatible_version(version: str) -> bool:
     """Sprawdź czy wersja schematu jest kompatybilna."""
     # Parsowanie wersji semantycznej
@@ -646,80 +646,207 @@ def execute_protection_v1(
     Returns:
         ProtectionResultSetV1 with deterministic signature
     """
-    relay_results: list[RelayResultV1] = []
-
     # Sort relays and test points for determinism
     sorted_relays = sorted(study_input.relays, key=lambda r: r.relay_id)
     sorted_test_points = sorted(study_input.test_points, key=lambda tp: tp.point_id)
 
-    for relay in sorted_relays:
-        test_point_results: list[TestPointResult] = []
+    relay_results = [
+        _evaluate_relay(relay, sorted_test_points) for relay in sorted_relays
+    ]
+    fragments = [_canonical_json(rr.to_dict()) for rr in relay_results]
+
+    return _build_result_set(relay_results, fragments)
+
+
+def _evaluate_relay(
+    relay: RelayV1,
+    sorted_test_points: list[TestPoint],
+) -> RelayResultV1:
+    """Evaluate one relay against all (sorted) test points."""
+    test_point_results: list[TestPointResult] = []
+
+    for tp in sorted_test_points:
+        # Convert primary current to secondary via CT
+        i_secondary = relay.ct_ratio.to_secondary(tp.i_a_primary)
 
-        for tp in sorted_test_points:
-            # Convert primary current to secondary via CT
-            i_secondary = relay.ct_ratio.to_secondary(tp.i_a_primary)
+        # Evaluate function 51 (required)
+        f51_result, f51_trace = function_51_evaluate(
+            i_a_secondary=i_secondary,
+            settings=relay.f51,
+        )
 
-            # Evaluate function 51 (required)
-            f51_result, f51_trace = function_51_evaluate(
+        # Evaluate function 50 (optional)
+        f50_result: Function50Result | None = None
+        f50_trace: dict[str, Any] = {}
+        if relay.f50 is not None:
+            f50_result, f50_trace = function_50_evaluate(
                 i_a_secondary=i_secondary,
-                settings=relay.f51,
+                settings=relay.f50,
             )
 
-            # Evaluate function 50 (optional)
-            f50_result: Function50Result | None = None
-            f50_trace: dict[str, Any] = {}
-            if relay.f50 is not None:
-                f50_result, f50_trace = function_50_evaluate(
-                    i_a_secondary=i_secondary,
-                    settings=relay.f50,
-                )
-
-            # Build trace
-            trace: dict[str, Any] = {
-                "relay_id": relay.relay_id,
-                "test_point_id": tp.point_id,
-                "i_a_primary": round(tp.i_a_primary, 6),
-                "i_a_secondary": round(i_secondary, 6),
-                "ct_ratio": relay.ct_ratio.to_dict(),
-            }
-            trace["f51"] = f51_trace
-            if f50_trace:
-                trace["f50"] = f50_trace
-
-            # Build function results
-            func_results = TestPointFunctionResults(
-                f50=f50_result,
-                f51=f51_result,
-            )
+        # Build trace
+        trace: dict[str, Any] = {
+            "relay_id": relay.relay_id,
+            "test_point_id": tp.point_id,
+            "i_a_primary": round(tp.i_a_primary, 6),
+            "i_a_secondary": round(i_secondary, 6),
+            "ct_ratio": relay.ct_ratio.to_dict(),
+        }
+        trace["f51"] = f51_trace
+        if f50_trace:
+            trace["f50"] = f50_trace
+
+        # Build function results
+        func_results = TestPointFunctionResults(
+            f50=f50_result,
+            f51=f51_result,
+        )
 
-            test_point_results.append(TestPointResult(
-                point_id=tp.point_id,
-                i_a_secondary=round(i_secondary, 6),
-                function_results=func_results,
-                trace=trace,
-            ))
+        test_point_results.append(TestPointResult(
+            point_id=tp.point_id,
+            i_a_secondary=round(i_secondary, 6),
+            function_results=func_results,
+            trace=trace,
+        ))
 
-        # Sort test point results by point_id
-        sorted_tp_results = sorted(test_point_results, key=lambda t: t.point_id)
+    # Sort test point results by point_id
+    sorted_tp_results = sorted(test_point_results, key=lambda t: t.point_id)
 
-        relay_results.append(RelayResultV1(
-            relay_id=relay.relay_id,
-            attached_cb_id=relay.attached_cb_id,
-            per_test_point=tuple(sorted_tp_results),
-        ))
+    return RelayResultV1(
+        relay_id=relay.relay_id,
+        attached_cb_id=relay.attached_cb_id,
+        per_test_point=tuple(sorted_tp_results),
+    )
 
-    # Sort relay results by relay_id
-    sorted_relay_results = sorted(relay_results, key=lambda r: r.relay_id)
 
-    # Compute deterministic signature
-    sig_data = {
-        "analysis_type": "PROTECTION",
-        "relay_results": [rr.to_dict() for rr in sorted_relay_results],
-    }
-    sig_json = json.dumps(sig_data, sort_keys=True, separators=(",", ":"))
+def _canonical_json(data: dict[str, Any] | list[dict[str, Any]]) -> str:
+    """Canonical JSON (sorted keys, compact separators)."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _build_result_set(
+    relay_results: list[RelayResultV1],
+    fragments: list[str],
+) -> ProtectionResultSetV1:
+    """Assemble the result set from relay results sorted by relay_id.
+
+    The signature is SHA-256 of the canonical JSON of
+    {"analysis_type": "PROTECTION", "relay_results": [...]}. It is assembled
+    from per-relay canonical JSON fragments, which yields exactly the same
+    bytes as serializing the whole payload at once.
+    """
+    sig_json = (
+        '{"analysis_type":"PROTECTION","relay_results":['
+        + ",".join(fragments)
+        + "]}"
+    )
     signature = hashlib.sha256(sig_json.encode("utf-8")).hexdigest()
 
     return ProtectionResultSetV1(
-        relay_results=tuple(sorted_relay_results),
+        relay_results=tuple(relay_results),
         deterministic_signature=signature,
     )
+
+
+# =============================================================================
+# PROTECTION ENGINE V1 — INCREMENTAL (DEPENDENCY-TRACKED) MODE
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ProtectionEvaluationStateV1:
+    """Dependency state of a finished evaluation (incremental mode).
+
+    A relay result depends only on the relay itself (CT ratio, 50/51
+    settings) and on the test points. Unchanged relays are reused as-is.
+
+    Attributes:
+        test_points_hash: SHA-256 of the sorted test points
+        relay_input_hashes: relay_id → SHA-256 of the relay configuration
+        relay_result_hashes: relay_id → SHA-256 of the relay result JSON
+        relay_results: relay_id → RelayResultV1
+        relay_result_json: relay_id → canonical JSON of the relay result
+        recomputed_relay_ids: Relays evaluated in this pass (sorted)
+    """
+    test_points_hash: str
+    relay_input_hashes: dict[str, str]
+    relay_result_hashes: dict[str, str]
+    relay_results: dict[str, RelayResultV1]
+    relay_result_json: dict[str, str]
+    recomputed_relay_ids: tuple[str, ...] = ()
+
+
+def execute_protection_v1_incremental(
+    study_input: ProtectionStudyInputV1,
+    previous: ProtectionEvaluationStateV1 | None = None,
+) -> tuple[ProtectionResultSetV1, ProtectionEvaluationStateV1]:
+    """Execute Protection Engine v1 re-evaluating only changed relays.
+
+    Relays whose configuration hash matches the previous state (and the
+    test points are unchanged) reuse their previous result. The returned
+    ProtectionResultSetV1 is identical to execute_protection_v1().
+
+    Args:
+        study_input: Complete input with relays and test points
+        previous: State of the previous evaluation (None = full run)
+
+    Returns:
+        Tuple of (ProtectionResultSetV1, new ProtectionEvaluationStateV1)
+    """
+    sorted_relays = sorted(study_input.relays, key=lambda r: r.relay_id)
+    sorted_test_points = sorted(study_input.test_points, key=lambda tp: tp.point_id)
+
+    tp_hash = hashlib.sha256(
+        _canonical_json([tp.to_dict() for tp in sorted_test_points]).encode("utf-8")
+    ).hexdigest()
+    if previous is not None and previous.test_points_hash != tp_hash:
+        previous = None
+
+    # Duplicate relay IDs cannot be tracked per relay — nothing is reused
+    relay_ids = [relay.relay_id for relay in sorted_relays]
+    trackable = len(set(relay_ids)) == len(relay_ids)
+    if not trackable:
+        previous = None
+
+    input_hashes: dict[str, str] = {}
+    result_hashes: dict[str, str] = {}
+    results: dict[str, RelayResultV1] = {}
+    result_json: dict[str, str] = {}
+    ordered_results: list[RelayResultV1] = []
+    fragments: list[str] = []
+    recomputed: list[str] = []
+
+    for relay in sorted_relays:
+        relay_id = relay.relay_id
+        input_hash = hashlib.sha256(
+            _canonical_json(relay.to_dict()).encode("utf-8")
+        ).hexdigest()
+
+        if previous is not None and previous.relay_input_hashes.get(relay_id) == input_hash:
+            relay_result = previous.relay_results[relay_id]
+            fragment = previous.relay_result_json[relay_id]
+            result_hash = previous.relay_result_hashes[relay_id]
+        else:
+            relay_result = _evaluate_relay(relay, sorted_test_points)
+            fragment = _canonical_json(relay_result.to_dict())
+            result_hash = hashlib.sha256(fragment.encode("utf-8")).hexdigest()
+            recomputed.append(relay_id)
+
+        ordered_results.append(relay_result)
+        fragments.append(fragment)
+        if trackable:
+            input_hashes[relay_id] = input_hash
+            result_hashes[relay_id] = result_hash
+            results[relay_id] = relay_result
+            result_json[relay_id] = fragment
+
+    result_set = _build_result_set(ordered_results, fragments)
+    state = ProtectionEvaluationStateV1(
+        test_points_hash=tp_hash,
+        relay_input_hashes=input_hashes,
+        relay_result_hashes=result_hashes,
+        relay_results=results,
+        relay_result_json=result_json,
+        recomputed_relay_ids=tuple(sorted(recomputed)),
+    )
+    return result_set, state
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import hashlib
@@ -88,13 +89,74 @@ class CanonicalRun:
         }
 
 
+@dataclass(frozen=True)
+class TraceIndex:
+    """
+    Lookup structures over a run's white-box trace, built once per run.
+
+    Positions refer to run.white_box_trace. Steps are enriched with catalog
+    context only when served (a page at a time), never up front.
+    """
+
+    step_count: int
+    catalog_context: list[dict[str, Any]]
+    catalog_context_by_element: dict[str, dict[str, Any]]
+    selection_index: dict[str, int]
+    steps_by_element: dict[str, tuple[int, ...]]
+    steps_by_target: dict[str, tuple[int, ...]]
+    steps_by_key: dict[str, tuple[int, ...]]
+
+    def positions(
+        self,
+        *,
+        element_id: str | None = None,
+        target_id: str | None = None,
+        key: str | None = None,
+    ) -> Sequence[int]:
+        """Trace positions of the steps matching every given filter, in order."""
+        selected: Sequence[int] | None = None
+        for index, value in (
+            (self.steps_by_element, element_id),
+            (self.steps_by_target, target_id),
+            (self.steps_by_key, key),
+        ):
+            if value is None:
+                continue
+            matches = index.get(value, ())
+            if selected is None:
+                selected = matches
+            else:
+                allowed = set(matches)
+                selected = tuple(position for position in selected if position in allowed)
+        return range(self.step_count) if selected is None else selected
+
+
+@dataclass(frozen=True)
+class ResultsReadModel:
+    """
+    Result projections of one run, materialized once at run completion.
+
+    Read-only: the results index and row tables served by the API are
+    taken from here instead of re-shaping raw_result on every request.
+    """
+
+    run_id: UUID
+    results_index: dict[str, Any]
+    bus_results: dict[str, Any]
+    branch_results: dict[str, Any]
+    short_circuit_results: dict[str, Any]
+    trace_index: TraceIndex
+
+
 _runs: dict[UUID, CanonicalRun] = {}
 _case_runs: dict[str, list[UUID]] = {}
+_read_models: dict[UUID, ResultsReadModel] = {}
 
 
 def reset_canonical_runs() -> None:
     _runs.clear()
     _case_runs.clear()
+    _read_models.clear()
 
 
 def has_run(run_id: UUID) -> bool:
@@ -108,7 +170,7 @@ def get_run(run_id: UUID) -> CanonicalRun | None:
 def list_runs_for_case(case_id: str) -> list[CanonicalRun]:
     run_ids = _case_runs.get(case_id, [])
     runs = [_runs[run_id] for run_id in run_ids if run_id in _runs]
-    return sorted(runs, key=lambda run: run.created_at, reverse=True)
+    return sorted(runs, key=lambda run: (run.created_at, str(run.id)), reverse=True)
 
 
 def list_runs_for_project(project_id: str, *, analysis_type: str | None = None) -> list[CanonicalRun]:
@@ -117,7 +179,7 @@ def list_runs_for_project(project_id: str, *, analysis_type: str | None = None)
         for run in _runs.values()
         if run.project_id == project_id and (analysis_type is None or run.analysis_type == analysis_type)
     ]
-    return sorted(runs, key=lambda run: run.created_at, reverse=True)
+    return sorted(runs, key=lambda run: (run.created_at, str(run.id)), reverse=True)
 
 
 def create_run(
@@ -188,12 +250,13 @@ def execute_run(run_id: UUID) -> CanonicalRun:
             raise ValueError(f"Unsupported analysis type: {run.analysis_type}")
         run.status = "FINISHED"
         run.finished_at = datetime.now(timezone.utc)
-        return run
+        _read_models[run.id] = _materialize_read_model(run)
     except Exception as exc:
         run.status = "FAILED"
         run.error_message = str(exc)
         run.finished_at = datetime.now(timezone.utc)
-        return run
+        _read_models.pop(run.id, None)
+    return run
 
 
 def run_short_circuit_now(*, case_id: str, project_id: str | None = None, options: dict[str, Any] | None = None) -> CanonicalRun:
@@ -455,6 +518,34 @@ def _build_power_flow_trace_steps(solution) -> list[dict[str, Any]]:
     return steps
 
 
+def get_results_read_model(run: CanonicalRun) -> ResultsReadModel:
+    """
+    Materialized result projections of a run.
+
+    Completed runs are immutable, so their read model is built once and
+    shared: finished runs materialize it in ``execute_run``, failed runs on
+    first request. In-progress runs get a fresh, uncached one.
+    """
+    read_model = _read_models.get(run.id)
+    if read_model is not None:
+        return read_model
+    read_model = _materialize_read_model(run)
+    if run.status in {"FINISHED", "FAILED"}:
+        _read_models[run.id] = read_model
+    return read_model
+
+
+def _materialize_read_model(run: CanonicalRun) -> ResultsReadModel:
+    return ResultsReadModel(
+        run_id=run.id,
+        results_index=build_results_index(run),
+        bus_results=build_bus_results(run),
+        branch_results=build_branch_results(run),
+        short_circuit_results=build_short_circuit_results(run),
+        trace_index=_build_trace_index(run),
+    )
+
+
 def build_results_index(run: CanonicalRun) -> dict[str, Any]:
     raw_result = run.raw_result or {}
     tables: list[dict[str, Any]] = []
@@ -819,113 +910,168 @@ def _enrich_trace_steps_with_catalog_context(
     catalog_context: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     context_by_element = _build_catalog_context_index(catalog_context)
-    enriched_steps: list[dict[str, Any]] = []
-
-    for step in steps:
-        enriched = dict(step)
-        candidate_ids = [
-            step.get("element_id"),
-            step.get("target_id"),
-            step.get("solver_ref"),
-        ]
-        catalog_entry = next(
-            (
-                context_by_element[str(candidate)]
-                for candidate in candidate_ids
-                if candidate is not None and str(candidate) in context_by_element
-            ),
-            None,
-        )
-        if catalog_entry is not None:
-            enriched["catalog_context_entry"] = dict(catalog_entry)
-            enriched.setdefault("element_id", catalog_entry.get("element_id"))
-            enriched.setdefault("element_type", catalog_entry.get("element_type"))
-            enriched.setdefault("catalog_binding", catalog_entry.get("catalog_binding"))
-            enriched.setdefault("source_catalog", catalog_entry.get("source_catalog"))
-            enriched.setdefault("source_catalog_label", catalog_entry.get("source_catalog_label"))
-            enriched.setdefault("parameter_origin", catalog_entry.get("parameter_origin"))
-            enriched.setdefault("parameter_source", catalog_entry.get("parameter_source"))
-            enriched.setdefault("source_mode", catalog_entry.get("source_mode"))
-            enriched.setdefault("materialized_params", catalog_entry.get("materialized_params"))
-            enriched.setdefault("manual_overrides", catalog_entry.get("manual_overrides"))
-            enriched.setdefault("overrides", catalog_entry.get("overrides"))
-            enriched.setdefault("manual_override_count", catalog_entry.get("manual_override_count"))
-            enriched.setdefault("has_manual_overrides", catalog_entry.get("has_manual_overrides"))
-
-        primary_element_ref = (
-            enriched.get("element_id")
-            or (catalog_entry.get("element_id") if catalog_entry is not None else None)
-        )
-        primary_element_type = (
-            enriched.get("element_type")
-            or (catalog_entry.get("element_type") if catalog_entry is not None else None)
-        )
-        related_elements: list[dict[str, Any]] = []
-        seen_related: set[tuple[str, str]] = set()
-
-        def register_related(
-            element_ref: object | None,
-            element_type: object | None,
-            role: str,
-        ) -> None:
-            if element_ref is None:
-                return
-            ref_value = str(element_ref)
-            key = (ref_value, role)
-            if key in seen_related:
-                return
-            seen_related.add(key)
-            payload = {
-                "element_ref": ref_value,
-                "role": role,
-            }
-            if element_type is not None:
-                payload["element_type"] = str(element_type)
-            related_elements.append(payload)
+    return [_enrich_trace_step(step, context_by_element) for step in steps]
 
-        register_related(primary_element_ref, primary_element_type, "PRIMARY_MODEL")
-        register_related(enriched.get("target_id"), primary_element_type, "SOLVER_TARGET")
-        register_related(enriched.get("solver_ref"), None, "SOLVER_REF")
 
-        selection_refs: list[str] = []
-        for candidate in [primary_element_ref]:
-            if candidate is None:
-                continue
-            candidate_ref = str(candidate)
-            if candidate_ref not in selection_refs:
-                selection_refs.append(candidate_ref)
+def _trace_step_catalog_entry(
+    step: dict[str, Any],
+    context_by_element: dict[str, dict[str, Any]],
+) -> dict[str, Any] | None:
+    candidate_ids = [
+        step.get("element_id"),
+        step.get("target_id"),
+        step.get("solver_ref"),
+    ]
+    return next(
+        (
+            context_by_element[str(candidate)]
+            for candidate in candidate_ids
+            if candidate is not None and str(candidate) in context_by_element
+        ),
+        None,
+    )
 
-        if primary_element_ref is not None:
-            enriched["primary_element_ref"] = str(primary_element_ref)
-        if primary_element_type is not None:
-            enriched["primary_element_type"] = str(primary_element_type)
-        enriched["related_elements"] = related_elements
-        enriched["selection_refs"] = selection_refs
-        enriched_steps.append(enriched)
 
-    return enriched_steps
+def _trace_step_primary_ref(
+    step: dict[str, Any],
+    context_by_element: dict[str, dict[str, Any]],
+) -> str | None:
+    """primary_element_ref of the enriched step, without enriching it."""
+    catalog_entry = _trace_step_catalog_entry(step, context_by_element)
+    primary_element_ref = step.get("element_id") or (
+        catalog_entry.get("element_id") if catalog_entry is not None else None
+    )
+    return str(primary_element_ref) if primary_element_ref is not None else None
+
+
+def _enrich_trace_step(
+    step: dict[str, Any],
+    context_by_element: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    enriched = dict(step)
+    catalog_entry = _trace_step_catalog_entry(step, context_by_element)
+    if catalog_entry is not None:
+        enriched["catalog_context_entry"] = dict(catalog_entry)
+        enriched.setdefault("element_id", catalog_entry.get("element_id"))
+        enriched.setdefault("element_type", catalog_entry.get("element_type"))
+        enriched.setdefault("catalog_binding", catalog_entry.get("catalog_binding"))
+        enriched.setdefault("source_catalog", catalog_entry.get("source_catalog"))
+        enriched.setdefault("source_catalog_label", catalog_entry.get("source_catalog_label"))
+        enriched.setdefault("parameter_origin", catalog_entry.get("parameter_origin"))
+        enriched.setdefault("parameter_source", catalog_entry.get("parameter_source"))
+        enriched.setdefault("source_mode", catalog_entry.get("source_mode"))
+        enriched.setdefault("materialized_params", catalog_entry.get("materialized_params"))
+        enriched.setdefault("manual_overrides", catalog_entry.get("manual_overrides"))
+        enriched.setdefault("overrides", catalog_entry.get("overrides"))
+        enriched.setdefault("manual_override_count", catalog_entry.get("manual_override_count"))
+        enriched.setdefault("has_manual_overrides", catalog_entry.get("has_manual_overrides"))
+
+    primary_element_ref = (
+        enriched.get("element_id")
+        or (catalog_entry.get("element_id") if catalog_entry is not None else None)
+    )
+    primary_element_type = (
+        enriched.get("element_type")
+        or (catalog_entry.get("element_type") if catalog_entry is not None else None)
+    )
+    related_elements: list[dict[str, Any]] = []
+    seen_related: set[tuple[str, str]] = set()
+
+    def register_related(
+        element_ref: object | None,
+        element_type: object | None,
+        role: str,
+    ) -> None:
+        if element_ref is None:
+            return
+        ref_value = str(element_ref)
+        key = (ref_value, role)
+        if key in seen_related:
+            return
+        seen_related.add(key)
+        payload = {
+            "element_ref": ref_value,
+            "role": role,
+        }
+        if element_type is not None:
+            payload["element_type"] = str(element_type)
+        related_elements.append(payload)
+
+    register_related(primary_element_ref, primary_element_type, "PRIMARY_MODEL")
+    register_related(enriched.get("target_id"), primary_element_type, "SOLVER_TARGET")
+    register_related(enriched.get("solver_ref"), None, "SOLVER_REF")
+
+    selection_refs: list[str] = []
+    for candidate in [primary_element_ref]:
+        if candidate is None:
+            continue
+        candidate_ref = str(candidate)
+        if candidate_ref not in selection_refs:
+            selection_refs.append(candidate_ref)
+
+    if primary_element_ref is not None:
+        enriched["primary_element_ref"] = str(primary_element_ref)
+    if primary_element_type is not None:
+        enriched["primary_element_type"] = str(primary_element_type)
+    enriched["related_elements"] = related_elements
+    enriched["selection_refs"] = selection_refs
+    return enriched
 
 
-def _build_trace_selection_index(steps: list[dict[str, Any]]) -> dict[str, int]:
+def _build_trace_index(run: CanonicalRun) -> TraceIndex:
+    catalog_context = _build_snapshot_catalog_context(run.snapshot or {})
+    context_by_element = _build_catalog_context_index(catalog_context)
     selection_index: dict[str, int] = {}
-    for index, step in enumerate(steps):
-        for selection_ref in step.get("selection_refs") or []:
-            if selection_ref is None:
-                continue
-            selection_key = str(selection_ref)
-            selection_index.setdefault(selection_key, index)
-    return selection_index
+    by_element: dict[str, list[int]] = {}
+    by_target: dict[str, list[int]] = {}
+    by_key: dict[str, list[int]] = {}
+    for index, step in enumerate(run.white_box_trace):
+        primary_ref = _trace_step_primary_ref(step, context_by_element)
+        if primary_ref is not None:
+            selection_index.setdefault(primary_ref, index)
+            by_element.setdefault(primary_ref, []).append(index)
+        if step.get("target_id") is not None:
+            by_target.setdefault(str(step["target_id"]), []).append(index)
+        if step.get("key") is not None:
+            by_key.setdefault(str(step["key"]), []).append(index)
+
+    def frozen(index: dict[str, list[int]]) -> dict[str, tuple[int, ...]]:
+        return {ref: tuple(positions) for ref, positions in index.items()}
+
+    return TraceIndex(
+        step_count=len(run.white_box_trace),
+        catalog_context=catalog_context,
+        catalog_context_by_element=context_by_element,
+        selection_index=selection_index,
+        steps_by_element=frozen(by_element),
+        steps_by_target=frozen(by_target),
+        steps_by_key=frozen(by_key),
+    )
+
+
+def get_trace_index(run: CanonicalRun) -> TraceIndex:
+    return get_results_read_model(run).trace_index
+
+
+def enrich_trace_steps(run: CanonicalRun, positions: Sequence[int]) -> list[dict[str, Any]]:
+    """Steps at the given trace positions, enriched with catalog context."""
+    context_by_element = get_trace_index(run).catalog_context_by_element
+    return [
+        _enrich_trace_step(run.white_box_trace[position], context_by_element)
+        for position in positions
+    ]
 
 
 def build_extended_trace(run: CanonicalRun) -> dict[str, Any]:
-    catalog_context = _build_snapshot_catalog_context(run.snapshot or {})
+    trace_index = get_trace_index(run)
+    catalog_context = trace_index.catalog_context
     enriched_steps = _enrich_trace_steps_with_catalog_context(list(run.white_box_trace), catalog_context)
     return {
         "run_id": str(run.id),
         "snapshot_id": run.snapshot_hash,
         "input_hash": run.input_hash,
         "white_box_trace": enriched_steps,
-        "selection_index": _build_trace_selection_index(enriched_steps),
+        "selection_index": dict(trace_index.selection_index),
         "catalog_context": catalog_context,
         "catalog_context_by_element": _build_catalog_context_index(catalog_context),
         "catalog_context_summary": _build_catalog_context_summary(catalog_context),
@@ -938,7 +1084,7 @@ def build_execution_result_set(run: CanonicalRun) -> dict[str, Any]:
     element_results: list[dict[str, Any]] = []
     global_results: dict[str, Any] = {}
     if run.analysis_type == "short_circuit_sn":
-        short_circuit_rows = build_short_circuit_results(run).get("rows", [])
+        short_circuit_rows = get_results_read_model(run).short_circuit_results.get("rows", [])
         for item in short_circuit_rows:
             element_results.append(
                 {
@@ -960,7 +1106,7 @@ def build_execution_result_set(run: CanonicalRun) -> dict[str, Any]:
         }
     elif run.analysis_type == "PF":
         result_v1 = ((run.raw_result or {}).get("result_v1") or {})
-        for row in build_bus_results(run).get("rows", []):
+        for row in get_results_read_model(run).bus_results.get("rows", []):
             element_results.append(
                 {
                     "element_ref": row.get("element_id") or row.get("bus_id"),
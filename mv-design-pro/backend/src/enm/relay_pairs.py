@@ -0,0 +1,474 @@
+"""
+Indeks par przekaźników (upstream/downstream) — wyprowadzony z topologii ENM.
+
+Dla każdego przekaźnika (protection_assignment → breaker_ref) wyznacza
+uporządkowaną ścieżkę przekaźników w kierunku źródła (najbliższy pierwszy)
+oraz pary (upstream, downstream) dla koordynacji zabezpieczeń.
+
+Topologia: drzewo BFS od szyn źródłowych po zamkniętych gałęziach
+i transformatorach (ta sama projekcja co compute_topology_summary).
+Wyłącznik, który nie jest krawędzią drzewa (otwarty, równoległy, pętla,
+wyspa bez źródła), daje przekaźnik nielokalizowany (brak par).
+
+Cache: indeks kluczowany odciskiem (fingerprint) topologii + przypisań
+zabezpieczeń. Po zapisaniu ENM z operacją attach_protection /
+detach_protection warstwa API woła sync_relay_pair_index, który aktualizuje
+indeks przyrostowo — drzewo topologii jest współdzielone, przeliczane są
+tylko ścieżki przekaźników poniżej zmienionego wyłącznika. Operacje
+topologiczne (topology_ops) pozostają czystymi funkcjami ENM → ENM.
+
+Odbiorcy: GET /api/cases/{case_id}/enm/relay-pairs oraz analiza koordynacji
+(pary selektywności z coordination_pairs zamiast kolejności urządzeń).
+
+DETERMINISTYCZNE: ten sam ENM → identyczny indeks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Mapping, TypeVar
+
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _sha256_canonical(data: Any) -> str:
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compute_topology_fingerprint(enm: dict[str, Any]) -> str:
+    """Odcisk części topologicznej ENM (szyny, gałęzie, transformatory, źródła)."""
+    return _sha256_canonical({
+        "buses": sorted(b.get("ref_id", "") for b in enm.get("buses", [])),
+        "branches": sorted(
+            [
+                b.get("ref_id", ""),
+                b.get("type", ""),
+                b.get("from_bus_ref", ""),
+                b.get("to_bus_ref", ""),
+                b.get("status", ""),
+            ]
+            for b in enm.get("branches", [])
+        ),
+        "transformers": sorted(
+            [t.get("ref_id", ""), t.get("hv_bus_ref", ""), t.get("lv_bus_ref", "")]
+            for t in enm.get("transformers", [])
+        ),
+        "sources": sorted(s.get("bus_ref", "") for s in enm.get("sources", [])),
+    })
+
+
+def compute_protection_fingerprint(enm: dict[str, Any]) -> str:
+    """Odcisk przypisań zabezpieczeń (ref_id, breaker_ref, aktywność)."""
+    return _sha256_canonical(sorted(
+        [pa.get("ref_id", ""), pa.get("breaker_ref") or "", _is_enabled(pa)]
+        for pa in enm.get("protection_assignments", [])
+    ))
+
+
+def compute_relay_index_fingerprint(enm: dict[str, Any]) -> str:
+    """Odcisk indeksu par przekaźników (topologia + zabezpieczenia)."""
+    return _combine_fingerprints(
+        compute_topology_fingerprint(enm), compute_protection_fingerprint(enm),
+    )
+
+
+def _combine_fingerprints(topology_fp: str, protection_fp: str) -> str:
+    return hashlib.sha256(f"{topology_fp}:{protection_fp}".encode("utf-8")).hexdigest()
+
+
+def _is_enabled(pa: dict[str, Any]) -> bool:
+    # topology_ops używa "is_enabled", domain_operations_v2 — "enabled"
+    return pa.get("is_enabled", True) is not False and pa.get("enabled", True) is not False
+
+
+# ---------------------------------------------------------------------------
+# Source tree (topology only)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SourceTree:
+    """Drzewo BFS od szyn źródłowych (tylko topologia, bez zabezpieczeń).
+
+    Attributes:
+        topology_fingerprint: Odcisk topologii, z której zbudowano drzewo
+        parent_bus: bus_ref → szyna nadrzędna (bliżej źródła)
+        parent_edge: bus_ref → ref_id krawędzi do szyny nadrzędnej
+        depth: bus_ref → głębokość (0 = szyna źródłowa)
+        edge_child: ref_id krawędzi drzewa → szyna po stronie odbioru
+    """
+
+    topology_fingerprint: str
+    parent_bus: dict[str, str]
+    parent_edge: dict[str, str]
+    depth: dict[str, int]
+    edge_child: dict[str, str]
+
+    def edges_to_source(self, bus_ref: str) -> list[str]:
+        """Krawędzie od szyny do źródła (najbliższa pierwsza)."""
+        edges: list[str] = []
+        current = bus_ref
+        while current in self.parent_edge:
+            edges.append(self.parent_edge[current])
+            current = self.parent_bus[current]
+        return edges
+
+
+def build_source_tree(enm: dict[str, Any]) -> SourceTree:
+    """Zbuduj drzewo BFS od szyn źródłowych po zamkniętych gałęziach."""
+    adj: dict[str, list[tuple[str, str]]] = {}
+    for b in enm.get("branches", []):
+        if b.get("status") == "open":
+            continue
+        fr = b.get("from_bus_ref", "")
+        to = b.get("to_bus_ref", "")
+        ref = b.get("ref_id", "")
+        adj.setdefault(fr, []).append((to, ref))
+        adj.setdefault(to, []).append((fr, ref))
+    for t in enm.get("transformers", []):
+        hv = t.get("hv_bus_ref", "")
+        lv = t.get("lv_bus_ref", "")
+        ref = t.get("ref_id", "")
+        adj.setdefault(hv, []).append((lv, ref))
+        adj.setdefault(lv, []).append((hv, ref))
+
+    parent_bus: dict[str, str] = {}
+    parent_edge: dict[str, str] = {}
+    depth: dict[str, int] = {}
+    edge_child: dict[str, str] = {}
+
+    source_bus_refs = sorted({s.get("bus_ref", "") for s in enm.get("sources", [])})
+    for src_bus in source_bus_refs:
+        if not src_bus or src_bus in depth:
+            continue
+        depth[src_bus] = 0
+        queue: deque[str] = deque([src_bus])
+        while queue:
+            current = queue.popleft()
+            for neighbor, via in sorted(adj.get(current, [])):
+                if neighbor in depth:
+                    continue
+                depth[neighbor] = depth[current] + 1
+                parent_bus[neighbor] = current
+                parent_edge[neighbor] = via
+                edge_child[via] = neighbor
+                queue.append(neighbor)
+
+    return SourceTree(
+        topology_fingerprint=compute_topology_fingerprint(enm),
+        parent_bus=parent_bus,
+        parent_edge=parent_edge,
+        depth=depth,
+        edge_child=edge_child,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Relay pair index
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RelayPairIndex:
+    """Indeks par przekaźników upstream/downstream.
+
+    Attributes:
+        fingerprint: Odcisk (topologia + zabezpieczenia)
+        relay_breakers: relay_ref → breaker_ref (aktywne przekaźniki)
+        relay_bus: relay_ref → szyna chroniona (strona odbioru wyłącznika)
+        upstream_paths: relay_ref → przekaźniki w kierunku źródła (najbliższy pierwszy)
+        pairs: Pary (upstream_ref, downstream_ref) sąsiednich stopni, posortowane
+        unlocated: Przekaźniki bez lokalizacji w drzewie (posortowane)
+    """
+
+    fingerprint: str
+    relay_breakers: dict[str, str]
+    relay_bus: dict[str, str]
+    upstream_paths: dict[str, tuple[str, ...]]
+    pairs: tuple[tuple[str, str], ...]
+    unlocated: tuple[str, ...]
+
+    def path_to_source(self, relay_ref: str) -> tuple[str, ...]:
+        """Przekaźnik i wszystkie przekaźniki nadrzędne (kolejność do źródła)."""
+        if relay_ref not in self.upstream_paths:
+            return ()
+        return (relay_ref, *self.upstream_paths[relay_ref])
+
+    def upstream_of(self, relay_ref: str) -> tuple[str, ...]:
+        """Bezpośrednio nadrzędne przekaźniki (najbliższy stopień)."""
+        return tuple(up for up, down in self.pairs if down == relay_ref)
+
+    def downstream_of(self, relay_ref: str) -> tuple[str, ...]:
+        """Bezpośrednio podrzędne przekaźniki."""
+        return tuple(down for up, down in self.pairs if up == relay_ref)
+
+    def coordination_pairs(self, settings_by_ref: Mapping[str, T]) -> tuple[tuple[T, T], ...]:
+        """Pary (upstream, downstream) ustawień dla run_protection_coordination.
+
+        Pary, dla których brak ustawień któregoś przekaźnika, są pomijane.
+        """
+        return tuple(
+            (settings_by_ref[up], settings_by_ref[down])
+            for up, down in self.pairs
+            if up in settings_by_ref and down in settings_by_ref
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "relays": [
+                {
+                    "relay_ref": ref,
+                    "breaker_ref": self.relay_breakers[ref],
+                    "bus_ref": self.relay_bus[ref],
+                    "path_to_source": list(self.upstream_paths[ref]),
+                }
+                for ref in sorted(self.upstream_paths)
+            ],
+            "pairs": [list(p) for p in self.pairs],
+            "unlocated": list(self.unlocated),
+        }
+
+
+def _active_assignments(enm: dict[str, Any]) -> dict[str, str]:
+    return {
+        pa.get("ref_id", ""): pa.get("breaker_ref") or ""
+        for pa in enm.get("protection_assignments", [])
+        if pa.get("ref_id") and _is_enabled(pa)
+    }
+
+
+def _relays_by_breaker(relay_breakers: Mapping[str, str]) -> dict[str, list[str]]:
+    result: dict[str, list[str]] = {}
+    for relay_ref in sorted(relay_breakers):
+        result.setdefault(relay_breakers[relay_ref], []).append(relay_ref)
+    return result
+
+
+def _upstream_path(
+    tree: SourceTree, by_breaker: Mapping[str, list[str]], bus_ref: str
+) -> tuple[str, ...]:
+    """Przekaźniki na krawędziach nad szyną nadrzędną wyłącznika."""
+    path: list[str] = []
+    for edge in tree.edges_to_source(tree.parent_bus[bus_ref]):
+        path.extend(by_breaker.get(edge, ()))
+    return tuple(path)
+
+
+def _pairs_from_paths(
+    relay_breakers: Mapping[str, str], upstream_paths: Mapping[str, tuple[str, ...]]
+) -> tuple[tuple[str, str], ...]:
+    pairs: list[tuple[str, str]] = []
+    for relay_ref, path in upstream_paths.items():
+        if not path:
+            continue
+        nearest_breaker = relay_breakers[path[0]]
+        for up in path:
+            if relay_breakers[up] != nearest_breaker:
+                break
+            pairs.append((up, relay_ref))
+    return tuple(sorted(pairs))
+
+
+def _assemble(
+    fingerprint: str,
+    relay_breakers: dict[str, str],
+    relay_bus: dict[str, str],
+    upstream_paths: dict[str, tuple[str, ...]],
+) -> RelayPairIndex:
+    located = {ref: relay_breakers[ref] for ref in upstream_paths}
+    return RelayPairIndex(
+        fingerprint=fingerprint,
+        relay_breakers=located,
+        relay_bus={ref: relay_bus[ref] for ref in sorted(upstream_paths)},
+        upstream_paths={ref: upstream_paths[ref] for ref in sorted(upstream_paths)},
+        pairs=_pairs_from_paths(located, upstream_paths),
+        unlocated=tuple(sorted(set(relay_breakers) - set(upstream_paths))),
+    )
+
+
+def build_relay_pair_index(
+    enm: dict[str, Any], tree: SourceTree | None = None
+) -> RelayPairIndex:
+    """Zbuduj pełny indeks par przekaźników dla ENM.
+
+    Args:
+        enm: ENM jako dict (model_dump)
+        tree: Drzewo źródeł (opcjonalnie, gdy topologia już przeliczona)
+    """
+    if tree is None:
+        tree = build_source_tree(enm)
+    relay_breakers = _active_assignments(enm)
+    by_breaker = _relays_by_breaker(relay_breakers)
+
+    relay_bus: dict[str, str] = {}
+    upstream_paths: dict[str, tuple[str, ...]] = {}
+    for relay_ref, breaker_ref in relay_breakers.items():
+        bus_ref = tree.edge_child.get(breaker_ref)
+        if bus_ref is None:
+            continue
+        relay_bus[relay_ref] = bus_ref
+        upstream_paths[relay_ref] = _upstream_path(tree, by_breaker, bus_ref)
+
+    return _assemble(
+        _combine_fingerprints(tree.topology_fingerprint, compute_protection_fingerprint(enm)),
+        relay_breakers,
+        relay_bus,
+        upstream_paths,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cache (fingerprint-keyed, incremental attach/detach)
+# ---------------------------------------------------------------------------
+
+
+class RelayPairIndexCache:
+    """Cache indeksów par przekaźników kluczowany odciskiem ENM.
+
+    Drzewa topologii są współdzielone między indeksami o tej samej
+    topologii; zmiana samych przypisań zabezpieczeń nie przelicza BFS.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self._max_entries = max_entries
+        self._trees: dict[str, SourceTree] = {}
+        self._indexes: dict[str, RelayPairIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def clear(self) -> None:
+        self._trees.clear()
+        self._indexes.clear()
+
+    def get(self, enm: dict[str, Any]) -> RelayPairIndex:
+        """Indeks dla ENM (z cache lub przeliczony)."""
+        topology_fp = compute_topology_fingerprint(enm)
+        fingerprint = _combine_fingerprints(topology_fp, compute_protection_fingerprint(enm))
+        index = self._indexes.get(fingerprint)
+        if index is not None:
+            return index
+        index = build_relay_pair_index(enm, self._tree(enm, topology_fp))
+        self._store(index)
+        return index
+
+    def on_protection_attached(
+        self, enm_before: dict[str, Any], enm_after: dict[str, Any], relay_ref: str
+    ) -> None:
+        """Aktualizacja przyrostowa po attach_protection (tylko gdy indeks w cache)."""
+        previous = self._previous(enm_before)
+        if previous is None:
+            return
+        index, tree = previous
+        relay_breakers = _active_assignments(enm_after)
+        by_breaker = _relays_by_breaker(relay_breakers)
+        relay_bus = dict(index.relay_bus)
+        upstream_paths = dict(index.upstream_paths)
+
+        breaker_ref = relay_breakers.get(relay_ref)
+        bus_ref = tree.edge_child.get(breaker_ref) if breaker_ref else None
+        if bus_ref is not None:
+            relay_bus[relay_ref] = bus_ref
+            upstream_paths[relay_ref] = _upstream_path(tree, by_breaker, bus_ref)
+            # Tylko przekaźniki poniżej nowego wyłącznika zmieniają ścieżkę
+            for other_ref, other_bus in index.relay_bus.items():
+                if breaker_ref in tree.edges_to_source(tree.parent_bus[other_bus]):
+                    upstream_paths[other_ref] = _upstream_path(tree, by_breaker, other_bus)
+
+        self._store(_assemble(
+            _combine_fingerprints(
+                tree.topology_fingerprint, compute_protection_fingerprint(enm_after)
+            ),
+            relay_breakers,
+            relay_bus,
+            upstream_paths,
+        ))
+
+    def on_protection_detached(
+        self, enm_before: dict[str, Any], enm_after: dict[str, Any], relay_ref: str
+    ) -> None:
+        """Aktualizacja przyrostowa po detach_protection (tylko gdy indeks w cache)."""
+        previous = self._previous(enm_before)
+        if previous is None:
+            return
+        index, tree = previous
+        relay_breakers = _active_assignments(enm_after)
+        relay_bus = {ref: bus for ref, bus in index.relay_bus.items() if ref != relay_ref}
+        upstream_paths = {
+            ref: tuple(up for up in path if up != relay_ref)
+            for ref, path in index.upstream_paths.items()
+            if ref != relay_ref
+        }
+        self._store(_assemble(
+            _combine_fingerprints(
+                tree.topology_fingerprint, compute_protection_fingerprint(enm_after)
+            ),
+            relay_breakers,
+            relay_bus,
+            upstream_paths,
+        ))
+
+    def _previous(
+        self, enm_before: dict[str, Any]
+    ) -> tuple[RelayPairIndex, SourceTree] | None:
+        if not self._indexes:
+            return None
+        topology_fp = compute_topology_fingerprint(enm_before)
+        tree = self._trees.get(topology_fp)
+        if tree is None:
+            return None
+        index = self._indexes.get(
+            _combine_fingerprints(topology_fp, compute_protection_fingerprint(enm_before))
+        )
+        if index is None:
+            return None
+        return index, tree
+
+    def _tree(self, enm: dict[str, Any], topology_fp: str) -> SourceTree:
+        tree = self._trees.get(topology_fp)
+        if tree is None:
+            tree = build_source_tree(enm)
+            self._trees[topology_fp] = tree
+        return tree
+
+    def _store(self, index: RelayPairIndex) -> None:
+        self._indexes[index.fingerprint] = index
+        while len(self._indexes) > self._max_entries:
+            del self._indexes[next(iter(self._indexes))]
+        while len(self._trees) > self._max_entries:
+            del self._trees[next(iter(self._trees))]
+
+
+# Process-wide cache used by the ENM and protection coordination APIs
+RELAY_PAIR_INDEX_CACHE = RelayPairIndexCache()
+
+
+def get_relay_pair_index(enm: dict[str, Any]) -> RelayPairIndex:
+    """Indeks par przekaźników dla ENM (z process-wide cache)."""
+    return RELAY_PAIR_INDEX_CACHE.get(enm)
+
+
+def sync_relay_pair_index(
+    op: str, enm_before: dict[str, Any], enm_after: dict[str, Any], relay_ref: str | None
+) -> None:
+    """Przenieś zapisaną operację na zabezpieczeniach do process-wide cache.
+
+    Tylko attach_protection / detach_protection; inne operacje zmieniają
+    odcisk, więc kolejne get_relay_pair_index przeliczy indeks.
+    """
+    if not relay_ref:
+        return
+    if op == "attach_protection":
+        RELAY_PAIR_INDEX_CACHE.on_protection_attached(enm_before, enm_after, relay_ref)
+    elif op == "detach_protection":
+        RELAY_PAIR_INDEX_CACHE.on_protection_detached(enm_before, enm_after, relay_ref)
@@ -9,7 +9,6 @@ from __future__ import annotations
 
 from typing import Literal
 
-import networkx as nx
 from pydantic import BaseModel
 
 from .fix_actions import FixAction
@@ -631,6 +630,8 @@ class ENMValidator:
     def _check_graph_connectivity(
         self, enm: EnergyNetworkModel, issues: list[ValidationIssue]
     ) -> None:
+        import networkx as nx
+
         g = nx.Graph()
         bus_refs = {b.ref_id for b in enm.buses}
         for ref in bus_refs:
@@ -16,18 +16,40 @@ KANON:
 from __future__ import annotations
 
 import hashlib
+import io
 import logging
 import os
 import shutil
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
+from domain.archive_chunks import (
+    ChunkManifest,
+    read_chunk_manifest,
+    serialize_chunk_manifest,
+)
+from infrastructure.cloud_transfer import (
+    TransferConfig,
+    TransferState,
+    TransferStateStore,
+    byte_ranges,
+    hash_file_prefix,
+    iter_file_parts,
+    ordered_parallel_map,
+)
+
 logger = logging.getLogger("mv_design_pro.cloud_backup")
 
+# Rozmiar zakresu odczytu przy sprawdzaniu manifestu kopii
+_MANIFEST_READ_BYTES = 64 * 1024
+
 
 # ============================================================================
 # BŁĘDY
@@ -139,6 +161,9 @@ class CloudBackupResult:
     timestamp: str | None = None  # ISO 8601
     size_bytes: int | None = None
     error_pl: str | None = None
+    # Kopie chunkowane: liczba chunków manifestu / faktycznie przesłanych
+    chunks_total: int | None = None
+    chunks_uploaded: int | None = None
 
 
 @dataclass(frozen=True)
@@ -184,6 +209,18 @@ def generate_backup_key(
     return f"{prefix}/{project_id}/{safe_timestamp}_{hash_short}.mvdp.zip"
 
 
+def generate_chunk_key(prefix: str, project_id: str, chunk_hash: str) -> str:
+    """
+    Klucz chunka (content-addressed, współdzielony przez kopie projektu).
+
+    Format: {prefix}/chunks/{project_id}/{chunk_hash}
+
+    Poza katalogiem {prefix}/{project_id}/ — listowanie kopii nie obejmuje
+    chunków.
+    """
+    return f"{prefix}/chunks/{project_id}/{chunk_hash}"
+
+
 def _normalize_key(key: str) -> str:
     """
     Znormalizuj klucz storage do formatu POSIX (separator '/').
@@ -212,6 +249,60 @@ def extract_project_id_from_key(key: str) -> str:
     return ""
 
 
+# ============================================================================
+# CHUNKI — BLOKADA PROJEKTU I ODCZYT MANIFESTU
+# ============================================================================
+
+# Blokada per projekt: upload_chunked i prune_chunks nie przeplatają się
+# (prune mógłby usunąć chunk, który upload uznał za obecny, zanim zapisze
+# manifest). Dotyczy procesu serwera API.
+_chunk_locks: dict[str, threading.Lock] = {}
+_chunk_locks_guard = threading.Lock()
+
+
+def _project_chunk_lock(project_id: str) -> threading.Lock:
+    with _chunk_locks_guard:
+        return _chunk_locks.setdefault(project_id, threading.Lock())
+
+
+class _RangeReader(io.RawIOBase):
+    """
+    Obiekt storage jako plik tylko do odczytu, czytany zakresami.
+
+    ZipFile czyta katalog centralny z końca pliku i wybrane człony, więc
+    sprawdzenie manifestu nie pobiera całego archiwum.
+    """
+
+    def __init__(self, provider: CloudBackupProvider, key: str, size: int) -> None:
+        self._provider = provider
+        self._key = key
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._size}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        data = self._provider._read_range(self._key, self._position, end - 1)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 # ============================================================================
 # INTERFEJS DOSTAWCY (ABC)
 # ============================================================================
@@ -293,6 +384,325 @@ class CloudBackupProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    def _list_chunk_hashes(self, project_id: str) -> set[str]:
+        """Hashe chunków projektu obecnych w storage."""
+        ...
+
+    @abstractmethod
+    def _put_chunk(self, project_id: str, chunk_hash: str, data: bytes) -> None:
+        """Zapisz chunk pod kluczem generate_chunk_key."""
+        ...
+
+    @abstractmethod
+    def _get_chunk(self, project_id: str, chunk_hash: str) -> bytes:
+        """Odczytaj chunk; CloudBackupNotFoundError gdy brak."""
+        ...
+
+    @abstractmethod
+    def _delete_chunk(self, project_id: str, chunk_hash: str) -> None:
+        """Usuń chunk."""
+        ...
+
+    @abstractmethod
+    def upload_file(
+        self,
+        path: Path,
+        project_id: str,
+        archive_hash: str,
+        timestamp: str | None = None,
+        metadata: dict[str, str] | None = None,
+        *,
+        key: str | None = None,
+        content_type: str = "application/zip",
+    ) -> CloudBackupResult:
+        """
+        Prześlij archiwum z pliku — częściami, ze wznawianiem.
+
+        Hash liczony strumieniowo w trakcie przesyłania; niezgodność
+        przerywa transfer (success=False). Przerwany transfer (wyjątek)
+        zostawia stan i kolejne wywołanie z tym samym archive_hash
+        wznawia go od ostatniej ukończonej części.
+
+        key: docelowy klucz obiektu (np. chunk); domyślnie klucz kopii
+        z generate_backup_key.
+        """
+        ...
+
+    @abstractmethod
+    def _resolve_key(self, backup_id: str, project_id: str) -> str:
+        """Klucz obiektu kopii; CloudBackupNotFoundError gdy brak."""
+        ...
+
+    @abstractmethod
+    def _object_size(self, key: str) -> int:
+        """Rozmiar obiektu w bajtach."""
+        ...
+
+    @abstractmethod
+    def _read_range(self, key: str, start: int, end: int) -> bytes:
+        """Bajty obiektu z zakresu [start, end] (włącznie)."""
+        ...
+
+    def download_file(
+        self,
+        backup_id: str,
+        project_id: str,
+        destination: Path,
+        expected_hash: str | None = None,
+    ) -> CloudBackupResult:
+        """
+        Pobierz kopię do pliku — równoległe zakresy, ze wznawianiem.
+
+        Części zapisywane są kolejno do {destination}.part; istniejący plik
+        .part (przerwane pobieranie) jest kontynuowany. SHA-256 liczony
+        strumieniowo; bez expected_hash weryfikowany jest skrót hash
+        zapisany w backup_id.
+
+        Raises:
+            CloudBackupNotFoundError: Kopia nie istnieje
+            CloudBackupIntegrityError: Hash nie zgadza się (plik .part usuwany)
+        """
+        key = self._resolve_key(backup_id, project_id)
+        size = self._object_size(key)
+        part_path = destination.with_name(destination.name + ".part")
+        offset, sha = hash_file_prefix(part_path)
+        if offset > size:
+            part_path.unlink()
+            offset, sha = hash_file_prefix(part_path)
+
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            with part_path.open("ab") as out:
+                for data in ordered_parallel_map(
+                    lambda bounds: self._read_range(key, *bounds),
+                    byte_ranges(offset, size, self._transfer.part_size),
+                    self._transfer.max_workers,
+                ):
+                    out.write(data)
+                    sha.update(data)
+        except OSError as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd zapisu pobieranej kopii: {exc}"
+            ) from exc
+
+        digest = sha.hexdigest()
+        expected = expected_hash or backup_id.rsplit("_", maxsplit=1)[-1]
+        if not digest.startswith(expected):
+            part_path.unlink(missing_ok=True)
+            raise CloudBackupIntegrityError(
+                f"Błąd integralności kopii zapasowej: "
+                f"oczekiwano {expected}, otrzymano {digest}"
+            )
+        os.replace(part_path, destination)
+
+        logger.info(
+            "Kopia zapasowa pobrana do pliku: project=%s, backup=%s, bajty=%d",
+            project_id,
+            backup_id,
+            size,
+        )
+        return CloudBackupResult(
+            success=True,
+            url=f"file://{destination.resolve()}",
+            hash=digest,
+            size_bytes=size,
+        )
+
+    def _transfer_state(
+        self,
+        project_id: str,
+        archive_hash: str,
+        timestamp: str | None,
+        key: str | None = None,
+    ) -> TransferState:
+        """Stan wznawianego uploadu lub nowy (z kluczem docelowym)."""
+        state = self._transfer_states.load(project_id, archive_hash)
+        if state is None:
+            ts = self._make_timestamp(timestamp)
+            state = TransferState(
+                project_id=project_id,
+                archive_hash=archive_hash,
+                key=key or generate_backup_key(
+                    prefix=self._config.prefix,
+                    project_id=project_id,
+                    timestamp=ts,
+                    archive_hash=archive_hash,
+                ),
+                timestamp=ts,
+            )
+        return state
+
+    def _upload_via_file(
+        self,
+        data: bytes,
+        project_id: str,
+        data_hash: str,
+        timestamp: str | None = None,
+        metadata: dict[str, str] | None = None,
+        *,
+        key: str | None = None,
+        content_type: str = "application/zip",
+    ) -> CloudBackupResult:
+        """
+        Dane powyżej multipart_threshold przez upload_file (części, wznawianie).
+
+        Plik tymczasowy nazwany hashem — ponowienie po przerwaniu odtwarza
+        te same bajty i wznawia transfer ze stanu (project_id, data_hash).
+        """
+        with tempfile.TemporaryDirectory(prefix="mvdp-upload-") as tmp_dir:
+            path = Path(tmp_dir) / data_hash
+            path.write_bytes(data)
+            return self.upload_file(
+                path,
+                project_id,
+                data_hash,
+                timestamp,
+                metadata,
+                key=key,
+                content_type=content_type,
+            )
+
+    def _hash_mismatch_result(self, expected: str, actual: str) -> CloudBackupResult:
+        return CloudBackupResult(
+            success=False,
+            error_pl=(
+                f"Hash archiwum nie zgadza się: "
+                f"oczekiwano {expected}, otrzymano {actual}"
+            ),
+        )
+
+    def upload_chunked(
+        self,
+        manifest: ChunkManifest,
+        chunks: Mapping[str, bytes],
+        project_id: str,
+        timestamp: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> CloudBackupResult:
+        """
+        Prześlij kopię podzieloną na chunki (deduplikacja po hash).
+
+        Przesyłane są tylko chunki, których storage jeszcze nie ma; manifest
+        zapisywany jest na końcu jako zwykła kopia (.mvdp.zip), więc przerwany
+        upload nie zostawia manifestu wskazującego brakujące chunki. Chunki
+        i manifest od multipart_threshold idą przez upload_file (części
+        równolegle, wznawianie).
+
+        Returns:
+            CloudBackupResult; size_bytes = bajty faktycznie przesłane
+            (manifest + nowe chunki)
+        """
+        with _project_chunk_lock(project_id):
+            wanted = manifest.chunk_hashes()
+            missing = sorted(wanted - self._list_chunk_hashes(project_id))
+            for digest in missing:
+                if digest not in chunks:
+                    raise CloudBackupUploadError(
+                        f"Brak danych chunka {digest} do przesłania"
+                    )
+                self._verify_hash(chunks[digest], digest)
+
+            # Małe chunki — równolegle pojedynczymi żądaniami; duże — kolejno
+            # przez upload_file (każdy i tak wysyła części równolegle)
+            threshold = self._transfer.multipart_threshold
+            small = [d for d in missing if len(chunks[d]) < threshold]
+            large = [d for d in missing if len(chunks[d]) >= threshold]
+
+            def put(digest: str) -> int:
+                self._put_chunk(project_id, digest, chunks[digest])
+                return len(chunks[digest])
+
+            uploaded_bytes = sum(
+                ordered_parallel_map(put, small, self._transfer.max_workers)
+            )
+            for digest in large:
+                chunk_result = self._upload_via_file(
+                    chunks[digest],
+                    project_id,
+                    digest,
+                    key=generate_chunk_key(self._config.prefix, project_id, digest),
+                    content_type="application/json",
+                )
+                if not chunk_result.success:
+                    return chunk_result
+                uploaded_bytes += len(chunks[digest])
+
+            manifest_bytes = serialize_chunk_manifest(manifest)
+            manifest_hash = compute_file_hash(manifest_bytes)
+            if len(manifest_bytes) >= threshold:
+                result = self._upload_via_file(
+                    manifest_bytes, project_id, manifest_hash, timestamp, metadata
+                )
+            else:
+                result = self.upload(
+                    manifest_bytes, project_id, manifest_hash, timestamp, metadata
+                )
+            if not result.success:
+                return result
+
+        logger.info(
+            "Kopia chunkowana: project=%s, chunki=%d/%d, bajty=%d",
+            project_id,
+            len(missing),
+            len(wanted),
+            uploaded_bytes,
+        )
+        return replace(
+            result,
+            size_bytes=len(manifest_bytes) + uploaded_bytes,
+            chunks_total=len(wanted),
+            chunks_uploaded=len(missing),
+        )
+
+    def fetch_chunks(
+        self, manifest: ChunkManifest, project_id: str
+    ) -> dict[str, bytes]:
+        """
+        Pobierz wszystkie chunki manifestu (z weryfikacją hash).
+
+        Raises:
+            CloudBackupNotFoundError: Brak chunka w storage
+            CloudBackupIntegrityError: Hash chunka nie zgadza się
+        """
+        chunks: dict[str, bytes] = {}
+        for digest in sorted(manifest.chunk_hashes()):
+            data = self._get_chunk(project_id, digest)
+            self._verify_hash(data, digest)
+            chunks[digest] = data
+        return chunks
+
+    def prune_chunks(self, project_id: str) -> int:
+        """
+        Usuń chunki nieużywane przez żadną kopię projektu.
+
+        delete_backup usuwa tylko manifest (chunki są współdzielone);
+        endpoint DELETE /projects/{id}/backups/{backup_id} woła prune_chunks
+        zaraz po nim. Działa pod blokadą projektu wspólną z upload_chunked,
+        a z każdej kopii czyta tylko katalog ZIP i człon manifestu.
+
+        Returns:
+            Liczba usuniętych chunków
+        """
+        with _project_chunk_lock(project_id):
+            live: set[str] = set()
+            for entry in self.list_backups(project_id):
+                manifest = self._read_manifest(entry)
+                if manifest is not None:
+                    live |= manifest.chunk_hashes()
+            orphaned = sorted(self._list_chunk_hashes(project_id) - live)
+            for digest in orphaned:
+                self._delete_chunk(project_id, digest)
+        return len(orphaned)
+
+    def _read_manifest(self, entry: CloudBackupEntry) -> ChunkManifest | None:
+        """Manifest chunków kopii (None dla zwykłego archiwum) bez pobierania całości."""
+        size = entry.size_bytes or self._object_size(entry.key)
+        reader = io.BufferedReader(
+            _RangeReader(self, entry.key, size), buffer_size=_MANIFEST_READ_BYTES
+        )
+        return read_chunk_manifest(reader)
+
     def _make_timestamp(self, timestamp: str | None) -> str:
         """Utwórz timestamp ISO 8601 (UTC)."""
         if timestamp is not None:
@@ -330,13 +740,19 @@ class LocalBackupProvider(CloudBackupProvider):
     Używany jako fallback w środowisku deweloperskim i w testach.
     """
 
-    def __init__(self, config: CloudBackupConfig) -> None:
+    def __init__(
+        self,
+        config: CloudBackupConfig,
+        transfer: TransferConfig | None = None,
+    ) -> None:
         if config.backend != CloudBackendType.LOCAL:
             raise CloudBackupConfigError(
                 "LocalBackupProvider wymaga backendu LOCAL."
             )
         self._config = config
         self._root = Path(config.bucket_name)
+        self._transfer = transfer or TransferConfig()
+        self._transfer_states = TransferStateStore(self._transfer.state_dir)
 
     def upload(
         self,
@@ -510,6 +926,145 @@ class LocalBackupProvider(CloudBackupProvider):
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
+    def upload_file(
+        self,
+        path: Path,
+        project_id: str,
+        archive_hash: str,
+        timestamp: str | None = None,
+        metadata: dict[str, str] | None = None,
+        *,
+        key: str | None = None,
+        content_type: str = "application/zip",
+    ) -> CloudBackupResult:
+        state = self._transfer_state(project_id, archive_hash, timestamp, key)
+        self._transfer_states.save(state)
+        file_path = self._root / state.key
+        part_path = file_path.with_name(file_path.name + ".part")
+
+        # Wznowienie: dopisywanie za już skopiowaną częścią
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            offset, sha = hash_file_prefix(part_path)
+            with path.open("rb") as src, part_path.open("ab") as out:
+                src.seek(offset)
+                for data in iter_file_parts(src, self._transfer.part_size):
+                    out.write(data)
+                    sha.update(data)
+        except PermissionError as exc:
+            raise CloudBackupPermissionError(
+                f"Brak uprawnień do zapisu: {file_path}"
+            ) from exc
+        except OSError as exc:
+            raise CloudBackupUploadError(
+                f"Błąd zapisu pliku kopii zapasowej: {exc}"
+            ) from exc
+
+        actual_hash = sha.hexdigest()
+        if actual_hash != archive_hash:
+            part_path.unlink(missing_ok=True)
+            self._transfer_states.clear(project_id, archive_hash)
+            return self._hash_mismatch_result(archive_hash, actual_hash)
+
+        os.replace(part_path, file_path)
+        self._transfer_states.clear(project_id, archive_hash)
+        if metadata:
+            import json
+            file_path.with_suffix(".meta.json").write_text(
+                json.dumps(metadata, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+
+        logger.info(
+            "Kopia zapasowa przesłana z pliku: project=%s, key=%s, hash=%s",
+            project_id,
+            state.key,
+            archive_hash[:12],
+        )
+        return CloudBackupResult(
+            success=True,
+            url=f"file://{file_path.resolve()}",
+            hash=archive_hash,
+            timestamp=state.timestamp,
+            size_bytes=file_path.stat().st_size,
+        )
+
+    def _resolve_key(self, backup_id: str, project_id: str) -> str:
+        key = self._find_key(backup_id, project_id)
+        if key is None:
+            raise CloudBackupNotFoundError(
+                f"Kopia zapasowa nie znaleziona: "
+                f"project={project_id}, backup={backup_id}"
+            )
+        return key
+
+    def _object_size(self, key: str) -> int:
+        return (self._root / key).stat().st_size
+
+    def _read_range(self, key: str, start: int, end: int) -> bytes:
+        try:
+            with (self._root / key).open("rb") as f:
+                f.seek(start)
+                return f.read(end - start + 1)
+        except OSError as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd odczytu pliku kopii zapasowej: {exc}"
+            ) from exc
+
+    def _chunk_path(self, project_id: str, chunk_hash: str) -> Path:
+        return self._root / generate_chunk_key(
+            self._config.prefix, project_id, chunk_hash
+        )
+
+    def _list_chunk_hashes(self, project_id: str) -> set[str]:
+        chunk_dir = self._root / generate_chunk_key(
+            self._config.prefix, project_id, ""
+        )
+        if not chunk_dir.exists():
+            return set()
+        return {
+            path.name
+            for path in chunk_dir.iterdir()
+            if path.is_file()
+            and not path.name.startswith(".")
+            and not path.name.endswith(".part")
+        }
+
+    def _put_chunk(self, project_id: str, chunk_hash: str, data: bytes) -> None:
+        path = self._chunk_path(project_id, chunk_hash)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Zapis przez plik tymczasowy — przerwany zapis nie zostawia
+            # niepełnego chunka pod docelową nazwą
+            tmp_path = path.with_name(f".{chunk_hash}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except PermissionError as exc:
+            raise CloudBackupPermissionError(
+                f"Brak uprawnień do zapisu: {path}"
+            ) from exc
+        except OSError as exc:
+            raise CloudBackupUploadError(
+                f"Błąd zapisu chunka kopii zapasowej: {exc}"
+            ) from exc
+
+    def _get_chunk(self, project_id: str, chunk_hash: str) -> bytes:
+        path = self._chunk_path(project_id, chunk_hash)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError as exc:
+            raise CloudBackupNotFoundError(
+                f"Chunk kopii zapasowej nie znaleziony: "
+                f"project={project_id}, chunk={chunk_hash}"
+            ) from exc
+        except OSError as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd odczytu chunka kopii zapasowej: {exc}"
+            ) from exc
+
+    def _delete_chunk(self, project_id: str, chunk_hash: str) -> None:
+        self._chunk_path(project_id, chunk_hash).unlink(missing_ok=True)
+
     def _find_key(
         self, backup_id: str, project_id: str
     ) -> str | None:
@@ -551,12 +1106,15 @@ class S3BackupProvider(CloudBackupProvider):
         self,
         config: CloudBackupConfig,
         s3_client: Any | None = None,
+        transfer: TransferConfig | None = None,
     ) -> None:
         if config.backend != CloudBackendType.S3:
             raise CloudBackupConfigError(
                 "S3BackupProvider wymaga backendu S3."
             )
         self._config = config
+        self._transfer = transfer or TransferConfig()
+        self._transfer_states = TransferStateStore(self._transfer.state_dir)
 
         if s3_client is not None:
             self._client = s3_client
@@ -743,6 +1301,245 @@ class S3BackupProvider(CloudBackupProvider):
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
+    def upload_file(
+        self,
+        path: Path,
+        project_id: str,
+        archive_hash: str,
+        timestamp: str | None = None,
+        metadata: dict[str, str] | None = None,
+        *,
+        key: str | None = None,
+        content_type: str = "application/zip",
+    ) -> CloudBackupResult:
+        """
+        Multipart upload: części wysyłane równolegle, ETagi zapisywane
+        w stanie po każdej części; wznowienie pomija części potwierdzone
+        przez list_parts.
+        """
+        size = path.stat().st_size
+        if key is None and size < self._transfer.multipart_threshold:
+            return self.upload(
+                path.read_bytes(), project_id, archive_hash, timestamp, metadata
+            )
+
+        state = self._transfer_state(project_id, archive_hash, timestamp, key)
+        bucket = self._config.bucket_name
+        try:
+            if state.upload_id is not None:
+                state.parts = self._confirmed_parts(state)
+            if state.upload_id is None:
+                extra_args: dict[str, Any] = {"ContentType": content_type}
+                if metadata:
+                    extra_args["Metadata"] = metadata
+                response = self._client.create_multipart_upload(
+                    Bucket=bucket, Key=state.key, **extra_args
+                )
+                state.upload_id = response["UploadId"]
+                state.parts = {}
+            self._transfer_states.save(state)
+
+            sha = hashlib.sha256()
+
+            def pending_parts() -> Iterator[tuple[int, bytes]]:
+                with path.open("rb") as f:
+                    for number, data in enumerate(
+                        iter_file_parts(f, self._transfer.part_size), start=1
+                    ):
+                        sha.update(data)
+                        if number not in state.parts:
+                            yield number, data
+
+            def upload_part(part: tuple[int, bytes]) -> tuple[int, str]:
+                number, data = part
+                response = self._client.upload_part(
+                    Bucket=bucket,
+                    Key=state.key,
+                    UploadId=state.upload_id,
+                    PartNumber=number,
+                    Body=data,
+                )
+                return number, response["ETag"]
+
+            for number, etag in ordered_parallel_map(
+                upload_part, pending_parts(), self._transfer.max_workers
+            ):
+                state.parts[number] = etag
+                self._transfer_states.save(state)
+
+            actual_hash = sha.hexdigest()
+            if actual_hash != archive_hash:
+                self._client.abort_multipart_upload(
+                    Bucket=bucket, Key=state.key, UploadId=state.upload_id
+                )
+                self._transfer_states.clear(project_id, archive_hash)
+                return self._hash_mismatch_result(archive_hash, actual_hash)
+
+            self._client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=state.key,
+                UploadId=state.upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": number, "ETag": etag}
+                        for number, etag in sorted(state.parts.items())
+                    ]
+                },
+            )
+        except CloudBackupError:
+            raise
+        except Exception as exc:
+            exc_name = type(exc).__name__
+            if "AccessDenied" in exc_name or "Forbidden" in str(exc):
+                raise CloudBackupPermissionError(
+                    f"Brak uprawnień do bucket'a: {bucket}"
+                ) from exc
+            raise CloudBackupUploadError(
+                f"Błąd przesyłania multipart do S3 "
+                f"(transfer można wznowić): {exc}"
+            ) from exc
+
+        self._transfer_states.clear(project_id, archive_hash)
+        logger.info(
+            "Kopia zapasowa S3 (multipart): project=%s, key=%s, części=%d",
+            project_id,
+            state.key,
+            len(state.parts),
+        )
+        return CloudBackupResult(
+            success=True,
+            url=f"s3://{bucket}/{state.key}",
+            hash=archive_hash,
+            timestamp=state.timestamp,
+            size_bytes=size,
+        )
+
+    def _confirmed_parts(self, state: TransferState) -> dict[int, str]:
+        """
+        Części potwierdzone przez S3; upload wygasły/przerwany po stronie
+        serwera — upload_id zerowany (nowy upload od początku).
+        """
+        confirmed: dict[int, str] = {}
+        kwargs: dict[str, Any] = {
+            "Bucket": self._config.bucket_name,
+            "Key": state.key,
+            "UploadId": state.upload_id,
+        }
+        try:
+            while True:
+                response = self._client.list_parts(**kwargs)
+                for part in response.get("Parts", []):
+                    confirmed[part["PartNumber"]] = part["ETag"]
+                if not response.get("IsTruncated"):
+                    break
+                kwargs["PartNumberMarker"] = response["NextPartNumberMarker"]
+        except Exception as exc:
+            logger.info(
+                "Nie można wznowić uploadu S3 %s (%s) — nowy upload",
+                state.key,
+                exc,
+            )
+            state.upload_id = None
+            return {}
+        return {
+            number: etag
+            for number, etag in confirmed.items()
+            if state.parts.get(number) == etag
+        }
+
+    def _resolve_key(self, backup_id: str, project_id: str) -> str:
+        return self._build_key_from_id(backup_id, project_id)
+
+    def _object_size(self, key: str) -> int:
+        try:
+            response = self._client.head_object(
+                Bucket=self._config.bucket_name, Key=key
+            )
+        except Exception as exc:
+            if "404" in str(exc) or "NoSuchKey" in type(exc).__name__:
+                raise CloudBackupNotFoundError(
+                    f"Kopia zapasowa nie znaleziona w S3: {key}"
+                ) from exc
+            raise CloudBackupDownloadError(
+                f"Błąd odczytu metadanych z S3: {exc}"
+            ) from exc
+        return int(response["ContentLength"])
+
+    def _read_range(self, key: str, start: int, end: int) -> bytes:
+        try:
+            response = self._client.get_object(
+                Bucket=self._config.bucket_name,
+                Key=key,
+                Range=f"bytes={start}-{end}",
+            )
+            return response["Body"].read()
+        except Exception as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd pobierania zakresu z S3: {exc}"
+            ) from exc
+
+    def _list_chunk_hashes(self, project_id: str) -> set[str]:
+        list_prefix = generate_chunk_key(self._config.prefix, project_id, "")
+        hashes: set[str] = set()
+        kwargs: dict[str, Any] = {
+            "Bucket": self._config.bucket_name,
+            "Prefix": list_prefix,
+        }
+        try:
+            while True:
+                response = self._client.list_objects_v2(**kwargs)
+                for obj in response.get("Contents", []):
+                    hashes.add(obj["Key"][len(list_prefix):])
+                if not response.get("IsTruncated"):
+                    break
+                kwargs["ContinuationToken"] = response["NextContinuationToken"]
+        except Exception as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd listowania chunków S3: {exc}"
+            ) from exc
+        return hashes
+
+    def _put_chunk(self, project_id: str, chunk_hash: str, data: bytes) -> None:
+        try:
+            self._client.put_object(
+                Bucket=self._config.bucket_name,
+                Key=generate_chunk_key(self._config.prefix, project_id, chunk_hash),
+                Body=data,
+                ContentType="application/json",
+            )
+        except Exception as exc:
+            raise CloudBackupUploadError(
+                f"Błąd przesyłania chunka do S3: {exc}"
+            ) from exc
+
+    def _get_chunk(self, project_id: str, chunk_hash: str) -> bytes:
+        try:
+            response = self._client.get_object(
+                Bucket=self._config.bucket_name,
+                Key=generate_chunk_key(self._config.prefix, project_id, chunk_hash),
+            )
+            return response["Body"].read()
+        except self._client.exceptions.NoSuchKey:
+            raise CloudBackupNotFoundError(
+                f"Chunk kopii zapasowej nie znaleziony w S3: "
+                f"project={project_id}, chunk={chunk_hash}"
+            )
+        except Exception as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd pobierania chunka z S3: {exc}"
+            ) from exc
+
+    def _delete_chunk(self, project_id: str, chunk_hash: str) -> None:
+        try:
+            self._client.delete_object(
+                Bucket=self._config.bucket_name,
+                Key=generate_chunk_key(self._config.prefix, project_id, chunk_hash),
+            )
+        except Exception as exc:
+            raise CloudBackupUploadError(
+                f"Błąd usuwania chunka z S3: {exc}"
+            ) from exc
+
     def _build_key_from_id(
         self, backup_id: str, project_id: str
     ) -> str:
@@ -770,12 +1567,15 @@ class GCSBackupProvider(CloudBackupProvider):
         self,
         config: CloudBackupConfig,
         storage_client: Any | None = None,
+        transfer: TransferConfig | None = None,
     ) -> None:
         if config.backend != CloudBackendType.GCS:
             raise CloudBackupConfigError(
                 "GCSBackupProvider wymaga backendu GCS."
             )
         self._config = config
+        self._transfer = transfer or TransferConfig()
+        self._transfer_states = TransferStateStore(self._transfer.state_dir)
 
         if storage_client is not None:
             self._client = storage_client
@@ -964,6 +1764,143 @@ class GCSBackupProvider(CloudBackupProvider):
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
+    def upload_file(
+        self,
+        path: Path,
+        project_id: str,
+        archive_hash: str,
+        timestamp: str | None = None,
+        metadata: dict[str, str] | None = None,
+        *,
+        key: str | None = None,
+        content_type: str = "application/zip",
+    ) -> CloudBackupResult:
+        """
+        Resumable upload GCS: biblioteka wysyła plik częściami chunk_size
+        (pamięć ograniczona do jednej części) i ponawia nieudane części
+        w ramach sesji. Hash liczony strumieniowo przed wysłaniem.
+        """
+        size, sha = hash_file_prefix(path)
+        actual_hash = sha.hexdigest()
+        if actual_hash != archive_hash:
+            return self._hash_mismatch_result(archive_hash, actual_hash)
+
+        ts = self._make_timestamp(timestamp)
+        key = key or generate_backup_key(
+            prefix=self._config.prefix,
+            project_id=project_id,
+            timestamp=ts,
+            archive_hash=archive_hash,
+        )
+        try:
+            blob = self._bucket.blob(key)
+            # chunk_size musi być wielokrotnością 256 KiB
+            quantum = 256 * 1024
+            blob.chunk_size = -(-self._transfer.part_size // quantum) * quantum
+            if metadata:
+                blob.metadata = metadata
+            with path.open("rb") as f:
+                blob.upload_from_file(f, size=size, content_type=content_type)
+        except Exception as exc:
+            exc_str = str(exc)
+            if "403" in exc_str or "Forbidden" in exc_str:
+                raise CloudBackupPermissionError(
+                    f"Brak uprawnień do bucket'a GCS: "
+                    f"{self._config.bucket_name}"
+                ) from exc
+            raise CloudBackupUploadError(
+                f"Błąd przesyłania do GCS: {exc}"
+            ) from exc
+
+        logger.info(
+            "Kopia zapasowa GCS (resumable): project=%s, key=%s",
+            project_id,
+            key,
+        )
+        return CloudBackupResult(
+            success=True,
+            url=f"gs://{self._config.bucket_name}/{key}",
+            hash=archive_hash,
+            timestamp=ts,
+            size_bytes=size,
+        )
+
+    def _resolve_key(self, backup_id: str, project_id: str) -> str:
+        return self._build_key_from_id(backup_id, project_id)
+
+    def _object_size(self, key: str) -> int:
+        try:
+            blob = self._bucket.get_blob(key)
+        except Exception as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd odczytu metadanych z GCS: {exc}"
+            ) from exc
+        if blob is None:
+            raise CloudBackupNotFoundError(
+                f"Kopia zapasowa nie znaleziona w GCS: {key}"
+            )
+        return int(blob.size or 0)
+
+    def _read_range(self, key: str, start: int, end: int) -> bytes:
+        try:
+            return self._bucket.blob(key).download_as_bytes(start=start, end=end)
+        except Exception as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd pobierania zakresu z GCS: {exc}"
+            ) from exc
+
+    def _list_chunk_hashes(self, project_id: str) -> set[str]:
+        list_prefix = generate_chunk_key(self._config.prefix, project_id, "")
+        try:
+            return {
+                blob.name[len(list_prefix):]
+                for blob in self._client.list_blobs(
+                    self._config.bucket_name, prefix=list_prefix
+                )
+            }
+        except Exception as exc:
+            raise CloudBackupDownloadError(
+                f"Błąd listowania chunków GCS: {exc}"
+            ) from exc
+
+    def _put_chunk(self, project_id: str, chunk_hash: str, data: bytes) -> None:
+        try:
+            blob = self._bucket.blob(
+                generate_chunk_key(self._config.prefix, project_id, chunk_hash)
+            )
+            blob.upload_from_string(data, content_type="application/json")
+        except Exception as exc:
+            raise CloudBackupUploadError(
+                f"Błąd przesyłania chunka do GCS: {exc}"
+            ) from exc
+
+    def _get_chunk(self, project_id: str, chunk_hash: str) -> bytes:
+        try:
+            blob = self._bucket.blob(
+                generate_chunk_key(self._config.prefix, project_id, chunk_hash)
+            )
+            return blob.download_as_bytes()
+        except Exception as exc:
+            exc_str = str(exc)
+            if "404" in exc_str or "Not Found" in exc_str:
+                raise CloudBackupNotFoundError(
+                    f"Chunk kopii zapasowej nie znaleziony w GCS: "
+                    f"project={project_id}, chunk={chunk_hash}"
+                )
+            raise CloudBackupDownloadError(
+                f"Błąd pobierania chunka z GCS: {exc}"
+            ) from exc
+
+    def _delete_chunk(self, project_id: str, chunk_hash: str) -> None:
+        try:
+            self._bucket.blob(
+                generate_chunk_key(self._config.prefix, project_id, chunk_hash)
+            ).delete()
+        except Exception as exc:
+            raise CloudBackupUploadError(
+                f"Błąd usuwania chunka z GCS: {exc}"
+            ) from exc
+
     def _build_key_from_id(
         self, backup_id: str, project_id: str
     ) -> str:
@@ -984,6 +1921,7 @@ def create_backup_provider(
     *,
     s3_client: Any | None = None,
     gcs_client: Any | None = None,
+    transfer: TransferConfig | None = None,
 ) -> CloudBackupProvider:
     """
     Utwórz dostawcę kopii zapasowych na podstawie konfiguracji.
@@ -992,6 +1930,7 @@ def create_backup_provider(
         config: Konfiguracja backendu
         s3_client: Opcjonalny klient S3 (do testów / DI)
         gcs_client: Opcjonalny klient GCS (do testów / DI)
+        transfer: Parametry transferu częściowego (domyślnie TransferConfig())
 
     Returns:
         CloudBackupProvider odpowiedni dla podanego backendu
@@ -1000,11 +1939,13 @@ def create_backup_provider(
         CloudBackupConfigError: Nieobsługiwany typ backendu
     """
     if config.backend == CloudBackendType.LOCAL:
-        return LocalBackupProvider(config)
+        return LocalBackupProvider(config, transfer=transfer)
     elif config.backend == CloudBackendType.S3:
-        return S3BackupProvider(config, s3_client=s3_client)
+        return S3BackupProvider(config, s3_client=s3_client, transfer=transfer)
     elif config.backend == CloudBackendType.GCS:
-        return GCSBackupProvider(config, storage_client=gcs_client)
+        return GCSBackupProvider(
+            config, storage_client=gcs_client, transfer=transfer
+        )
     else:
         raise CloudBackupConfigError(
             f"Nieobsługiwany typ backendu: {config.backend}"
@@ -0,0 +1,194 @@
+"""
+Cloud Transfer — warstwa transferu częściowego dla kopii zapasowych.
+
+- Podział pliku na części (part_size), równoległe wysyłanie/pobieranie
+  z ograniczoną liczbą części w pamięci (max_workers × part_size)
+- Stan transferu (klucz, upload_id, ukończone części) zapisywany po każdej
+  części — przerwany transfer wznawiany jest od miejsca przerwania
+- Strumieniowy SHA-256 liczony podczas transferu (bez ładowania całości)
+
+KANON:
+- Infrastructure layer — zero logiki biznesowej
+- NOT-A-SOLVER
+- 100% PL messages
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# ============================================================================
+# KONFIGURACJA (FROZEN)
+# ============================================================================
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+_HASH_BLOCK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TransferConfig:
+    """
+    Parametry transferu częściowego.
+
+    part_size: rozmiar części (S3 wymaga ≥ 5 MiB poza ostatnią częścią)
+    multipart_threshold: poniżej — pojedyncze żądanie
+    max_workers: równoległe części (jednocześnie w pamięci)
+    state_dir: katalog stanu wznawiania; None = stan tylko w pamięci procesu
+    """
+
+    part_size: int = DEFAULT_PART_SIZE
+    multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD
+    max_workers: int = 4
+    state_dir: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.part_size <= 0:
+            raise ValueError("Rozmiar części musi być dodatni.")
+        if self.max_workers <= 0:
+            raise ValueError("Liczba równoległych części musi być dodatnia.")
+
+
+# ============================================================================
+# STAN WZNAWIANIA
+# ============================================================================
+
+
+@dataclass
+class TransferState:
+    """Stan przerwanego uploadu (mutowalny — aktualizowany po każdej części)."""
+
+    project_id: str
+    archive_hash: str
+    key: str
+    timestamp: str
+    upload_id: str | None = None
+    # numer części → ETag (multipart S3)
+    parts: dict[int, str] = field(default_factory=dict)
+
+
+class TransferStateStore:
+    """
+    Magazyn stanów transferu, klucz: (project_id, archive_hash).
+
+    Z katalogiem — pliki JSON (przetrwają restart procesu), bez — słownik.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self._dir = Path(directory) if directory else None
+        self._memory: dict[tuple[str, str], TransferState] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, project_id: str, archive_hash: str) -> Path:
+        assert self._dir is not None
+        name = hashlib.sha256(f"{project_id}/{archive_hash}".encode()).hexdigest()
+        return self._dir / f"{name}.transfer.json"
+
+    def load(self, project_id: str, archive_hash: str) -> TransferState | None:
+        with self._lock:
+            if self._dir is None:
+                return self._memory.get((project_id, archive_hash))
+            path = self._path(project_id, archive_hash)
+            if not path.exists():
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["parts"] = {int(n): etag for n, etag in data.get("parts", {}).items()}
+            return TransferState(**data)
+
+    def save(self, state: TransferState) -> None:
+        with self._lock:
+            if self._dir is None:
+                self._memory[(state.project_id, state.archive_hash)] = state
+                return
+            self._dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(state.project_id, state.archive_hash)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(asdict(state), sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, path)
+
+    def clear(self, project_id: str, archive_hash: str) -> None:
+        with self._lock:
+            if self._dir is None:
+                self._memory.pop((project_id, archive_hash), None)
+                return
+            self._path(project_id, archive_hash).unlink(missing_ok=True)
+
+
+# ============================================================================
+# NARZĘDZIA
+# ============================================================================
+
+
+def iter_file_parts(fileobj: IO[bytes], part_size: int) -> Iterator[bytes]:
+    """Kolejne części pliku (ostatnia może być krótsza)."""
+    while True:
+        data = fileobj.read(part_size)
+        if not data:
+            return
+        yield data
+
+
+def hash_file_prefix(path: Path) -> tuple[int, hashlib._Hash]:
+    """
+    (rozmiar, SHA-256 w toku) istniejącego pliku częściowego.
+
+    Brak pliku = (0, pusty hash). Hash można kontynuować update().
+    """
+    sha = hashlib.sha256()
+    if not path.exists():
+        return 0, sha
+    size = 0
+    with path.open("rb") as f:
+        for block in iter_file_parts(f, _HASH_BLOCK):
+            sha.update(block)
+            size += len(block)
+    return size, sha
+
+
+def byte_ranges(start: int, size: int, part_size: int) -> list[tuple[int, int]]:
+    """Zakresy [początek, koniec] (włącznie) od start do size."""
+    return [
+        (offset, min(offset + part_size, size) - 1)
+        for offset in range(start, size, part_size)
+    ]
+
+
+def ordered_parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> Iterator[R]:
+    """
+    Równoległe fn(item) z wynikami w kolejności wejścia.
+
+    W toku jest co najwyżej max_workers zadań — pamięć ograniczona do
+    max_workers wyników (np. części pliku).
+    """
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: deque[Future[R]] = deque()
+        for item in iterator:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= max_workers:
+                break
+        while pending:
+            result = pending.popleft().result()
+            next_item = next(iterator, _EXHAUSTED)
+            if next_item is not _EXHAUSTED:
+                pending.append(pool.submit(fn, next_item))
+            yield result
+
+
+_EXHAUSTED = object()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from itertools import islice
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from infrastructure.persistence.models import Base
+
+# Rows per INSERT executemany; bounds driver memory and parameter lists
+BULK_BATCH_SIZE = 500
+
+
+def bulk_insert(
+    session: Session,
+    model: type[Base],
+    rows: Iterable[Mapping[str, object]],
+    *,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """
+    Insert rows (attribute name → value) with one executemany per batch.
+
+    ORM-enabled insert(): column types (GUID, DeterministicJSON) and Python
+    defaults still apply, but no ORM objects are built and the identity map
+    is bypassed. Pending objects are flushed first, so rows may reference
+    parents added with session.add() in the same unit of work.
+
+    Returns:
+        Number of inserted rows.
+    """
+    iterator = iter(rows)
+    count = 0
+    while batch := [dict(row) for row in islice(iterator, batch_size)]:
+        session.flush()
+        session.execute(insert(model), batch)
+        count += len(batch)
+    return count
@@ -1,20 +1,95 @@
 from __future__ import annotations
 
+import json
+import os
+import threading
+import weakref
+from collections.abc import Mapping
 from contextlib import contextmanager
-from typing import Iterator
+from dataclasses import dataclass
+from typing import Any, Iterator
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import (
+    Connection,
+    Engine,
+    MetaData,
+    Table,
+    create_engine,
+    event,
+    inspect,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from .models import Base
+from .models import AnalysisRunORM, Base, NetworkSnapshotORM, StudyResultORM
 
 
-def create_engine_from_url(url: str, *, echo: bool = False) -> Engine:
-    return create_engine(url, echo=echo, future=True)
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool settings.
 
+    pool_size/max_overflow/pool_timeout apply to queue pools (PostgreSQL,
+    file SQLite); in-memory SQLite keeps its single-connection pool.
+    pool_recycle closes connections older than N seconds (-1 = never);
+    pool_pre_ping checks a connection on checkout and replaces dead ones.
+    """
 
-def create_session_factory(engine: Engine) -> sessionmaker[Session]:
-    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> PoolConfig:
+        """Settings from DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+        DB_POOL_RECYCLE and DB_POOL_PRE_PING (defaults for missing keys)."""
+        env = os.environ if environ is None else environ
+        default = cls()
+        return cls(
+            pool_size=int(env.get("DB_POOL_SIZE", default.pool_size)),
+            max_overflow=int(env.get("DB_MAX_OVERFLOW", default.max_overflow)),
+            pool_timeout=float(env.get("DB_POOL_TIMEOUT", default.pool_timeout)),
+            pool_recycle=int(env.get("DB_POOL_RECYCLE", default.pool_recycle)),
+            pool_pre_ping=env.get("DB_POOL_PRE_PING", str(default.pool_pre_ping)).lower()
+            in {"1", "true", "yes"},
+        )
+
+
+def create_engine_from_url(
+    url: str, *, echo: bool = False, pool: PoolConfig | None = None
+) -> Engine:
+    """Engine with pool settings; pool=None keeps SQLAlchemy defaults."""
+    if pool is None:
+        return create_engine(url, echo=echo, future=True)
+    options: dict[str, Any] = {
+        "pool_pre_ping": pool.pool_pre_ping,
+        "pool_recycle": pool.pool_recycle,
+    }
+    if not _is_memory_sqlite(url):
+        options.update(
+            poolclass=QueuePool,
+            pool_size=pool.pool_size,
+            max_overflow=pool.max_overflow,
+            pool_timeout=pool.pool_timeout,
+        )
+    engine = create_engine(url, echo=echo, future=True, **options)
+    _track_pool_events(engine)
+    return engine
+
+
+def create_session_factory(
+    engine: Engine, *, read_only: bool = False
+) -> sessionmaker[Session]:
+    """Session factory; read_only sessions never autoflush."""
+    return sessionmaker(
+        bind=engine, expire_on_commit=False, autoflush=not read_only, class_=Session
+    )
 
 
 @contextmanager
@@ -32,3 +107,262 @@ def session_scope(session_factory: sessionmaker[Session]) -> Iterator[Session]:
 
 def init_db(engine: Engine) -> None:
     Base.metadata.create_all(engine)
+    upgrade_analysis_runs(engine)
+    upgrade_network_snapshots(engine)
+    upgrade_study_results(engine)
+    upgrade_indexes(engine)
+
+
+# ============================================================================
+# LEGACY SCHEMA UPGRADE
+# ============================================================================
+
+# Inline payload columns of analysis_runs before analysis_run_blobs
+_LEGACY_RUN_PAYLOADS: dict[str, str] = {
+    "input_snapshot": "input_snapshot_ref",
+    "result_summary": "result_summary_ref",
+    "trace_json": "trace_json_ref",
+    "white_box_trace": "white_box_trace_ref",
+}
+_UPGRADE_BATCH = 200
+
+
+def upgrade_analysis_runs(engine: Engine) -> bool:
+    """
+    Move inline run payloads of a pre-blob database into analysis_run_blobs.
+
+    create_all never alters existing tables, so an analysis_runs table with
+    input_snapshot/result_summary/trace_json/white_box_trace columns is
+    upgraded in place: missing columns are added, payloads are stored as
+    blobs and referenced by *_ref, the inline columns are dropped and the
+    indexes are rebuilt to the current definitions. Returns True when an
+    upgrade ran; a current schema is left untouched.
+    """
+    from sqlalchemy.orm import Session
+
+    from .repositories.analysis_run_repository import AnalysisRunRepository
+
+    columns = {c["name"] for c in inspect(engine).get_columns("analysis_runs")}
+    legacy = [name for name in _LEGACY_RUN_PAYLOADS if name in columns]
+    if not legacy:
+        return False
+
+    table = AnalysisRunORM.__table__
+    with engine.begin() as conn:
+        _add_missing_columns(conn, table)
+        runs_table = Table("analysis_runs", MetaData(), autoload_with=conn)
+        session = Session(bind=conn)
+        runs = AnalysisRunRepository(session)
+        run_ids = conn.execute(select(runs_table.c.id).order_by(runs_table.c.id)).scalars().all()
+        for start in range(0, len(run_ids), _UPGRADE_BATCH):
+            batch = conn.execute(
+                select(runs_table.c.id, *(runs_table.c[name] for name in legacy)).where(
+                    runs_table.c.id.in_(run_ids[start : start + _UPGRADE_BATCH])
+                )
+            ).all()
+            for row in batch:
+                refs = {
+                    _LEGACY_RUN_PAYLOADS[name]: runs.store_payload(
+                        _legacy_payload(getattr(row, name))
+                    )
+                    for name in legacy
+                }
+                session.flush()
+                conn.execute(runs_table.update().where(runs_table.c.id == row.id).values(**refs))
+
+        for name in legacy:
+            conn.execute(text(f"ALTER TABLE analysis_runs DROP COLUMN {name}"))
+        _sync_indexes(conn, table)
+    return True
+
+
+def upgrade_network_snapshots(engine: Engine) -> bool:
+    """
+    Materialize snapshot lineage (root, depth) in a pre-lineage database.
+
+    Adds lineage_root_id/lineage_depth and their indexes when missing and
+    backfills rows whose root is NULL from the parent chain, so the
+    (root, depth) range lookup of find_common_ancestor sees legacy rows.
+    Returns True when the schema or any row was changed.
+    """
+    from .repositories.snapshot_repository import lineage_positions
+
+    table = NetworkSnapshotORM.__table__
+    with engine.begin() as conn:
+        changed = bool(_add_missing_columns(conn, table))
+        changed = _sync_indexes(conn, table) or changed
+        pending = conn.execute(
+            select(table.c.snapshot_id).where(table.c.lineage_root_id.is_(None)).limit(1)
+        ).first()
+        if pending is None:
+            return changed
+
+        rows = conn.execute(
+            select(
+                table.c.snapshot_id,
+                table.c.parent_snapshot_id,
+                table.c.lineage_root_id,
+                table.c.lineage_depth,
+            )
+        ).all()
+        positions = lineage_positions({row.snapshot_id: row.parent_snapshot_id for row in rows})
+        for row in rows:
+            root, depth = positions[row.snapshot_id]
+            if (row.lineage_root_id, row.lineage_depth) == (root, depth):
+                continue
+            conn.execute(
+                table.update()
+                .where(table.c.snapshot_id == row.snapshot_id)
+                .values(lineage_root_id=root, lineage_depth=depth)
+            )
+    return True
+
+
+def upgrade_study_results(engine: Engine) -> bool:
+    """
+    Allow deduplicated reference rows in a pre-dedup study_results table.
+
+    Adds source_result_id and drops NOT NULL from result_jsonb (a reference
+    row has no payload of its own). SQLite cannot alter a column constraint,
+    so there the table is rebuilt from the model and the rows are copied.
+    Returns True when an upgrade ran.
+    """
+    table = StudyResultORM.__table__
+    columns = {c["name"]: c for c in inspect(engine).get_columns(table.name)}
+    if "source_result_id" in columns and columns["result_jsonb"]["nullable"]:
+        return False
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            legacy_name = f"{table.name}_legacy"
+            conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {legacy_name}"))
+            table.create(conn)
+            copied = ", ".join(name for name in table.columns.keys() if name in columns)
+            conn.execute(
+                text(
+                    f"INSERT INTO {table.name} ({copied}) SELECT {copied} FROM {legacy_name}"
+                )
+            )
+            conn.execute(text(f"DROP TABLE {legacy_name}"))
+        else:
+            _add_missing_columns(conn, table)
+            conn.execute(text(f"ALTER TABLE {table.name} ALTER COLUMN result_jsonb DROP NOT NULL"))
+        _sync_indexes(conn, table)
+    return True
+
+
+def upgrade_indexes(engine: Engine) -> bool:
+    """
+    Bring the indexes of every model table in line with the model.
+
+    create_all skips indexes of tables that already exist, so indexes added
+    later (e.g. the keyset indexes of analysis_runs/analysis_runs_index) are
+    created here. Returns True when any index was created or rebuilt.
+    """
+    changed = False
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            changed = _sync_indexes(conn, table) or changed
+    return changed
+
+
+def _add_missing_columns(conn: Connection, table: Table) -> list[str]:
+    """
+    ALTER TABLE ADD COLUMN for model columns missing in the database.
+
+    NOT NULL columns with a scalar default are added with that server
+    default so existing rows stay valid; others are added as nullable.
+    """
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    added: list[str] = []
+    for column in table.columns:
+        if column.name in existing:
+            continue
+        ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+        ddl += column.type.compile(dialect=conn.dialect)
+        default = column.default
+        if not column.nullable and default is not None and default.is_scalar:
+            value = literal(default.arg).compile(
+                dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+            )
+            ddl += f" NOT NULL DEFAULT {value}"
+        conn.execute(text(ddl))
+        added.append(column.name)
+    return added
+
+
+def _sync_indexes(conn: Connection, table: Table) -> bool:
+    """Create missing indexes and rebuild those whose columns differ from the model."""
+    existing = {ix["name"]: ix["column_names"] for ix in inspect(conn).get_indexes(table.name)}
+    changed = False
+    for index in table.indexes:
+        if existing.get(index.name) == [c.name for c in index.columns]:
+            continue
+        if index.name in existing:
+            conn.execute(text(f"DROP INDEX {index.name}"))
+        index.create(conn)
+        changed = True
+    return changed
+
+
+def _legacy_payload(value: Any) -> Any:
+    """Inline payload as stored: JSON text on SQLite, decoded JSON on PostgreSQL."""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+# ============================================================================
+# POOL METRICS
+# ============================================================================
+
+# Engine → event counters (weak: disposed engines drop out)
+_pool_counters: weakref.WeakKeyDictionary[Engine, dict[str, int]] = weakref.WeakKeyDictionary()
+_pool_counters_lock = threading.Lock()
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def _track_pool_events(engine: Engine) -> None:
+    counters = {"connects": 0, "checkouts": 0, "invalidations": 0}
+    with _pool_counters_lock:
+        _pool_counters[engine] = counters
+
+    def bump(name: str):
+        def listener(*_args: object) -> None:
+            with _pool_counters_lock:
+                counters[name] += 1
+
+        return listener
+
+    # Listening on the engine keeps counting after engine.dispose() recreates the pool
+    event.listen(engine, "connect", bump("connects"))
+    event.listen(engine, "checkout", bump("checkouts"))
+    event.listen(engine, "invalidate", bump("invalidations"))
+
+
+def pool_metrics(engine: Engine) -> dict[str, Any]:
+    """
+    Snapshot of the engine's connection pool.
+
+    Gauges (size, checked_in, checked_out, overflow) for queue pools;
+    counters (connects, checkouts, invalidations) for engines created with
+    a PoolConfig.
+    """
+    pool = engine.pool
+    metrics: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    with _pool_counters_lock:
+        counters = _pool_counters.get(engine)
+        if counters is not None:
+            metrics.update(counters)
+    return metrics
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from infrastructure.persistence.time_utils import ensure_utc
+
+
+def keyset_before(
+    created_col: ColumnElement[datetime],
+    id_col: ColumnElement[object],
+    created_at: datetime,
+    item_id: object,
+) -> ColumnElement[bool]:
+    """
+    Rows strictly below (created_at, item_id) in newest-first order.
+
+    Expanded form of the row-value comparison (created, id) < (:c, :i), so
+    the (…, created, id) index is range-scanned on every backend.
+    """
+    created_at = ensure_utc(created_at)
+    return or_(
+        created_col < created_at,
+        and_(created_col == created_at, id_col < item_id),
+    )
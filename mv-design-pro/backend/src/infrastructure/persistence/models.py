@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -12,6 +14,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
@@ -22,6 +25,11 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 from sqlalchemy.types import TypeDecorator
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is a core dependency
+    np = None
+
 
 class Base(DeclarativeBase):
     pass
@@ -66,18 +74,71 @@ def _canonicalize(value: Any) -> Any:
         return [_canonicalize(item) for item in value]
     if isinstance(value, set):
         return sorted((_canonicalize(item) for item in value), key=_stable_sort_key)
-    try:
-        import numpy as np
-
+    if np is not None:
         if isinstance(value, np.ndarray):
             return _canonicalize(value.tolist())
         if isinstance(value, np.generic):
             return value.item()
-    except ImportError:
-        pass
     return value
 
 
+def _canonical_default(value: Any) -> Any:
+    """json.dumps hook for the few types the encoder does not handle natively."""
+    if isinstance(value, set):
+        return _canonicalize(value)
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_canonical_encoder = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), default=_canonical_default
+)
+
+
+def canonical_json_dumps(value: Any) -> str:
+    """
+    Canonical JSON text of a value in a single pass of the C encoder
+    (json's _json accelerator; encoders that format floats or non-ASCII
+    text differently would change stored bytes and hashes).
+
+    Byte-identical to json.dumps(_canonicalize(value), sort_keys=True,
+    separators=(",", ":")): keys are sorted by the encoder, tuples and
+    ndarrays become lists, sets are sorted as in _canonicalize.
+    """
+    return _canonical_encoder.encode(value)
+
+
+@dataclass(frozen=True)
+class CanonicalJSON:
+    """
+    Payload already in canonical form, tagged by its producer with the
+    canonical JSON text and its SHA-256.
+
+    On text storage DeterministicJSON binds the precomputed text as-is (no
+    re-canonicalization, no re-encoding). Build with CanonicalJSON.of() so
+    value, text and hash always agree.
+    """
+
+    value: Any
+    text: str
+    sha256: str
+
+    @classmethod
+    def of(cls, value: Any) -> CanonicalJSON:
+        if isinstance(value, CanonicalJSON):
+            return value
+        text = canonical_json_dumps(value)
+        return cls(
+            value=value,
+            text=text,
+            sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        )
+
+
 class DeterministicJSON(TypeDecorator[Any]):
     impl = Text
     cache_ok = True
@@ -90,10 +151,13 @@ class DeterministicJSON(TypeDecorator[Any]):
     def process_bind_param(self, value: Any, dialect):
         if value is None:
             return None
-        canonical = _canonicalize(value)
+        if isinstance(value, CanonicalJSON):
+            if dialect.name == "postgresql":
+                return _canonicalize(value.value)
+            return value.text
         if dialect.name == "postgresql":
-            return canonical
-        return json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+            return _canonicalize(value)
+        return canonical_json_dumps(value)
 
     def process_result_value(self, value: Any, dialect):
         if value is None:
@@ -178,11 +242,21 @@ class NetworkSnapshotORM(Base):
     Network Snapshot ORM model — P10a first-class object.
 
     P10a: Snapshot has deterministic fingerprint for change detection.
+
+    lineage_root_id / lineage_depth are materialized on insert (root has
+    depth 0), so a lineage is one (root, depth ≤ n) range and disjoint
+    histories are detected without walking parents.
     """
     __tablename__ = "network_snapshots"
+    __table_args__ = (
+        Index("ix_network_snapshots_parent", "parent_snapshot_id"),
+        Index("ix_network_snapshots_lineage", "lineage_root_id", "lineage_depth"),
+    )
 
     snapshot_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     parent_snapshot_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lineage_root_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lineage_depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     schema_version: Mapped[str | None] = mapped_column(String(50))
     network_model_id: Mapped[str | None] = mapped_column(String(64))
@@ -400,10 +474,49 @@ class ScenarioORM(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
+class AnalysisRunBlobORM(Base):
+    """
+    Content-addressed payload of an analysis run (input snapshot, result
+    summary, traces), keyed by SHA-256 of its canonical JSON.
+
+    Identical payloads are stored once and shared by every run that
+    references them. The payload column is deferred: existence checks and
+    size queries never load the JSON.
+    """
+
+    __tablename__ = "analysis_run_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[Any] = mapped_column(DeterministicJSON(), nullable=False, deferred=True)
+
+
 class AnalysisRunORM(Base):
+    """
+    Analysis run metadata row.
+
+    Heavy payloads live in analysis_run_blobs; the row keeps only their
+    content hashes (*_ref). None = payload absent. A deduplicated run shares
+    the refs of result_source_run_id.
+
+    ix_analysis_runs_input_hash covers the deterministic-key dedup lookup
+    (key columns + status + ordering + id), so it is answered from the index;
+    ix_analysis_runs_project_created serves keyset listing pages.
+    """
+
     __tablename__ = "analysis_runs"
     __table_args__ = (
-        Index("ix_analysis_runs_input_hash", "input_hash"),
+        Index(
+            "ix_analysis_runs_input_hash",
+            "input_hash",
+            "project_id",
+            "operating_case_id",
+            "analysis_type",
+            "status",
+            "created_at",
+            "id",
+        ),
+        Index("ix_analysis_runs_project_created", "project_id", "created_at", "id"),
     )
 
     id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
@@ -417,16 +530,21 @@ class AnalysisRunORM(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    input_snapshot: Mapped[dict[str, Any]] = mapped_column(DeterministicJSON(), nullable=False)
     input_hash: Mapped[str] = mapped_column(String(128), nullable=False)
-    result_summary: Mapped[dict[str, Any]] = mapped_column(
-        DeterministicJSON(), nullable=False, default=dict
+    input_snapshot_ref: Mapped[str] = mapped_column(
+        String(64), ForeignKey("analysis_run_blobs.content_hash"), nullable=False
     )
-    trace_json: Mapped[dict[str, Any] | list[dict[str, Any]] | None] = mapped_column(
-        DeterministicJSON(), nullable=True
+    result_summary_ref: Mapped[str] = mapped_column(
+        String(64), ForeignKey("analysis_run_blobs.content_hash"), nullable=False
     )
-    white_box_trace: Mapped[list[dict[str, Any]] | None] = mapped_column(
-        DeterministicJSON(), nullable=True
+    trace_json_ref: Mapped[str | None] = mapped_column(
+        String(64), ForeignKey("analysis_run_blobs.content_hash"), nullable=True
+    )
+    white_box_trace_ref: Mapped[str | None] = mapped_column(
+        String(64), ForeignKey("analysis_run_blobs.content_hash"), nullable=True
+    )
+    result_source_run_id: Mapped[UUID | None] = mapped_column(
+        GUID(), ForeignKey("analysis_runs.id"), nullable=True
     )
     error_message: Mapped[str | None] = mapped_column(Text)
 
@@ -438,7 +556,8 @@ class AnalysisRunIndexORM(Base):
         Index("ix_analysis_runs_index_case_id", "case_id"),
         Index("ix_analysis_runs_index_base_snapshot_id", "base_snapshot_id"),
         Index("ix_analysis_runs_index_fingerprint", "fingerprint"),
-        Index("ix_analysis_runs_index_created_at_utc", "created_at_utc"),
+        Index("ix_analysis_runs_index_created_at_utc", "created_at_utc", "run_id"),
+        Index("ix_analysis_runs_index_case_created", "case_id", "created_at_utc", "run_id"),
     )
 
     run_id: Mapped[str] = mapped_column(String(64), primary_key=True)
@@ -483,13 +602,23 @@ class StudyRunORM(Base):
 
 
 class StudyResultORM(Base):
+    """
+    Result payload of a run.
+
+    A reference row (deduplicated run) has no payload of its own:
+    result_jsonb is NULL and source_result_id points to the row holding it.
+    """
+
     __tablename__ = "study_results"
 
     id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
     run_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("study_runs.id"), nullable=False)
     project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
     result_type: Mapped[str] = mapped_column(String(100), nullable=False)
-    result_jsonb: Mapped[dict[str, Any]] = mapped_column(DeterministicJSON(), nullable=False)
+    result_jsonb: Mapped[dict[str, Any] | None] = mapped_column(DeterministicJSON(), nullable=True)
+    source_result_id: Mapped[UUID | None] = mapped_column(
+        GUID(), ForeignKey("study_results.id"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
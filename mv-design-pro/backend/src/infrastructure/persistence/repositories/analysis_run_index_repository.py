@@ -4,9 +4,24 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from application.analyses.run_index import AnalysisRunIndexEntry
+from application.pagination import Page, decode_cursor, page_from_rows
+from infrastructure.persistence.keyset import keyset_before
 from infrastructure.persistence.models import AnalysisRunIndexORM
 from infrastructure.persistence.time_utils import ensure_utc
 
+# Listing projection: every column except the meta_json payload
+_SUMMARY_COLUMNS = (
+    AnalysisRunIndexORM.run_id,
+    AnalysisRunIndexORM.analysis_type,
+    AnalysisRunIndexORM.case_id,
+    AnalysisRunIndexORM.base_snapshot_id,
+    AnalysisRunIndexORM.primary_artifact_type,
+    AnalysisRunIndexORM.primary_artifact_id,
+    AnalysisRunIndexORM.fingerprint,
+    AnalysisRunIndexORM.created_at_utc,
+    AnalysisRunIndexORM.status,
+)
+
 
 class AnalysisRunIndexRepository:
     def __init__(self, session: Session) -> None:
@@ -41,23 +56,58 @@ class AnalysisRunIndexRepository:
         limit: int = 50,
         offset: int = 0,
     ) -> list[AnalysisRunIndexEntry]:
-        stmt = select(AnalysisRunIndexORM)
+        stmt = self._filtered(select(AnalysisRunIndexORM), case_id, analysis_type)
+        stmt = stmt.limit(limit).offset(offset)
+        rows = self._session.execute(stmt).scalars().all()
+        return [self._to_domain(row) for row in rows]
+
+    def list_page(
+        self,
+        *,
+        case_id: str | None = None,
+        analysis_type: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        include_meta: bool = False,
+    ) -> Page[AnalysisRunIndexEntry]:
+        """
+        Keyset page on (created_at_utc, run_id), newest first.
+
+        Without include_meta only summary columns are selected (meta_json=None).
+        """
+        columns = _SUMMARY_COLUMNS
+        if include_meta:
+            columns = (*columns, AnalysisRunIndexORM.meta_json)
+        stmt = self._filtered(select(*columns), case_id, analysis_type)
+        if cursor:
+            created_at, run_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                keyset_before(
+                    AnalysisRunIndexORM.created_at_utc,
+                    AnalysisRunIndexORM.run_id,
+                    created_at,
+                    run_id,
+                )
+            )
+        rows = self._session.execute(stmt.limit(limit + 1)).all()
+        return page_from_rows(
+            [self._to_domain(row) for row in rows],
+            key=lambda entry: (entry.created_at_utc, entry.run_id),
+            limit=limit,
+        )
+
+    @staticmethod
+    def _filtered(stmt, case_id: str | None, analysis_type: str | None):
         if case_id:
             stmt = stmt.where(AnalysisRunIndexORM.case_id == case_id)
         if analysis_type:
             stmt = stmt.where(AnalysisRunIndexORM.analysis_type == analysis_type)
-        stmt = (
-            stmt.order_by(
-                AnalysisRunIndexORM.created_at_utc.desc(),
-                AnalysisRunIndexORM.run_id.desc(),
-            )
-            .limit(limit)
-            .offset(offset)
+        return stmt.order_by(
+            AnalysisRunIndexORM.created_at_utc.desc(),
+            AnalysisRunIndexORM.run_id.desc(),
         )
-        rows = self._session.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
 
-    def _to_domain(self, row: AnalysisRunIndexORM) -> AnalysisRunIndexEntry:
+    def _to_domain(self, row) -> AnalysisRunIndexEntry:
         return AnalysisRunIndexEntry(
             run_id=row.run_id,
             analysis_type=row.analysis_type,
@@ -68,5 +118,5 @@ class AnalysisRunIndexRepository:
             fingerprint=row.fingerprint,
             created_at_utc=ensure_utc(row.created_at_utc),
             status=row.status,
-            meta_json=row.meta_json,
+            meta_json=getattr(row, "meta_json", None),
         )
@@ -1,5 +1,15 @@
+"""
+AnalysisRun repository.
+
+Run rows hold metadata only; input snapshot, result summary and traces are
+stored in the content-addressed analysis_run_blobs table and referenced by
+SHA-256. Single-run reads (get) hydrate payloads; listing and deterministic
+key lookups return metadata-only runs unless include_payloads=True.
+"""
+
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -7,11 +17,46 @@ from uuid import UUID
 from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from application.pagination import (
+    InvalidCursorError,
+    Page,
+    decode_cursor,
+    page_from_rows,
+)
 from domain.analysis_run import AnalysisRun
-from infrastructure.persistence.models import AnalysisRunORM
+from infrastructure.persistence.keyset import keyset_before
+from infrastructure.persistence.models import (
+    AnalysisRunBlobORM,
+    AnalysisRunORM,
+    CanonicalJSON,
+)
 from infrastructure.persistence.time_utils import ensure_utc
 
 
+_PAYLOAD_REFS: tuple[str, ...] = (
+    "input_snapshot_ref",
+    "result_summary_ref",
+    "trace_json_ref",
+    "white_box_trace_ref",
+)
+
+# Listing projection: metadata columns only (no payload refs)
+_METADATA_COLUMNS = (
+    AnalysisRunORM.id,
+    AnalysisRunORM.project_id,
+    AnalysisRunORM.operating_case_id,
+    AnalysisRunORM.analysis_type,
+    AnalysisRunORM.status,
+    AnalysisRunORM.result_status,
+    AnalysisRunORM.created_at,
+    AnalysisRunORM.started_at,
+    AnalysisRunORM.finished_at,
+    AnalysisRunORM.input_hash,
+    AnalysisRunORM.error_message,
+    AnalysisRunORM.result_source_run_id,
+)
+
+
 class AnalysisRunRepository:
     def __init__(self, session: Session) -> None:
         self._session = session
@@ -28,28 +73,75 @@ class AnalysisRunRepository:
                 created_at=ensure_utc(run.created_at),
                 started_at=ensure_utc(run.started_at),
                 finished_at=ensure_utc(run.finished_at),
-                input_snapshot=run.input_snapshot,
                 input_hash=run.input_hash,
-                result_summary=run.result_summary,
-                trace_json=run.trace_json,
-                white_box_trace=run.white_box_trace,
+                input_snapshot_ref=self.store_payload(run.input_snapshot),
+                result_summary_ref=self.store_payload(run.result_summary),
+                trace_json_ref=self.store_payload(run.trace_json),
+                white_box_trace_ref=self.store_payload(run.white_box_trace),
                 error_message=run.error_message,
             )
         )
         self._session.commit()
 
-    def get(self, run_id: UUID) -> AnalysisRun | None:
+    def get(self, run_id: UUID, *, include_payloads: bool = True) -> AnalysisRun | None:
         stmt = select(AnalysisRunORM).where(AnalysisRunORM.id == run_id)
         row = self._session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(row) if row else None
+        if row is None:
+            return None
+        return self._to_domain(row, self.load_payloads([row]) if include_payloads else None)
 
     def list_by_project(
-        self, project_id: UUID, filters: dict[str, Any] | None = None
+        self,
+        project_id: UUID,
+        filters: dict[str, Any] | None = None,
+        *,
+        include_payloads: bool = False,
     ) -> list[AnalysisRun]:
-        stmt = (
-            select(AnalysisRunORM)
-            .where(AnalysisRunORM.project_id == project_id)
-            .order_by(AnalysisRunORM.created_at.desc(), AnalysisRunORM.id.desc())
+        """
+        Runs of a project, newest first.
+
+        Metadata only by default (payload fields keep their empty defaults);
+        include_payloads=True hydrates all payloads with one blob query.
+        """
+        stmt = self._filtered(select(AnalysisRunORM), project_id, filters)
+        rows = self._session.execute(stmt).scalars().all()
+        payloads = self.load_payloads(rows) if include_payloads else None
+        return [self._to_domain(row, payloads) for row in rows]
+
+    def list_page_by_project(
+        self,
+        project_id: UUID,
+        filters: dict[str, Any] | None = None,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[AnalysisRun]:
+        """
+        Keyset page of a project's runs on (created_at, id), newest first.
+
+        Projection-only: metadata columns are selected, payload refs are not.
+        """
+        stmt = self._filtered(select(*_METADATA_COLUMNS), project_id, filters)
+        if cursor:
+            created_at, run_id = decode_cursor(cursor)
+            try:
+                after_id = UUID(run_id)
+            except ValueError as exc:
+                raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+            stmt = stmt.where(
+                keyset_before(AnalysisRunORM.created_at, AnalysisRunORM.id, created_at, after_id)
+            )
+        rows = self._session.execute(stmt.limit(limit + 1)).all()
+        return page_from_rows(
+            [self._to_domain(row) for row in rows],
+            key=lambda run: (run.created_at, run.id),
+            limit=limit,
+        )
+
+    @staticmethod
+    def _filtered(stmt, project_id: UUID, filters: dict[str, Any] | None):
+        stmt = stmt.where(AnalysisRunORM.project_id == project_id).order_by(
+            AnalysisRunORM.created_at.desc(), AnalysisRunORM.id.desc()
         )
         filters = filters or {}
         if analysis_type := filters.get("analysis_type"):
@@ -58,8 +150,7 @@ class AnalysisRunRepository:
             stmt = stmt.where(AnalysisRunORM.status == status)
         if operating_case_id := filters.get("operating_case_id"):
             stmt = stmt.where(AnalysisRunORM.operating_case_id == operating_case_id)
-        rows = self._session.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
+        return stmt
 
     def get_by_deterministic_key(
         self,
@@ -67,16 +158,85 @@ class AnalysisRunRepository:
         operating_case_id: UUID,
         analysis_type: str,
         input_hash: str,
+        *,
+        include_payloads: bool = False,
     ) -> AnalysisRun | None:
+        """Oldest run with identical deterministic key (metadata only by default)."""
         stmt = (
             select(AnalysisRunORM)
             .where(AnalysisRunORM.project_id == project_id)
             .where(AnalysisRunORM.operating_case_id == operating_case_id)
             .where(AnalysisRunORM.analysis_type == analysis_type)
             .where(AnalysisRunORM.input_hash == input_hash)
+            .order_by(AnalysisRunORM.created_at, AnalysisRunORM.id)
+            .limit(1)
         )
         row = self._session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(row) if row else None
+        if row is None:
+            return None
+        return self._to_domain(row, self.load_payloads([row]) if include_payloads else None)
+
+    def find_reusable_run_id(
+        self,
+        project_id: UUID,
+        operating_case_id: UUID,
+        analysis_type: str,
+        input_hash: str,
+    ) -> UUID | None:
+        """
+        Oldest FINISHED run with identical deterministic key.
+
+        The input hash identifies the solver input completely, so results are
+        reusable regardless of the source run's result_status.
+
+        Covering query: every referenced column is in
+        ix_analysis_runs_input_hash, so no run row and no payload is read.
+        """
+        stmt = (
+            select(AnalysisRunORM.id)
+            .where(AnalysisRunORM.input_hash == input_hash)
+            .where(AnalysisRunORM.project_id == project_id)
+            .where(AnalysisRunORM.operating_case_id == operating_case_id)
+            .where(AnalysisRunORM.analysis_type == analysis_type)
+            .where(AnalysisRunORM.status == "FINISHED")
+            .order_by(AnalysisRunORM.created_at, AnalysisRunORM.id)
+            .limit(1)
+        )
+        return self._session.execute(stmt).scalar_one_or_none()
+
+    def finish_with_reused_results(
+        self,
+        run_id: UUID,
+        source_run_id: UUID,
+        *,
+        finished_at: datetime,
+    ) -> AnalysisRun:
+        """
+        Finish a run with the results of source_run_id, by reference.
+
+        Payload refs are copied (no JSON is read or written); the run records
+        result_source_run_id, from which the `_dedup` entry of trace_json is
+        derived when payloads are hydrated.
+        """
+        source = self._session.execute(
+            select(
+                AnalysisRunORM.result_summary_ref,
+                AnalysisRunORM.trace_json_ref,
+                AnalysisRunORM.white_box_trace_ref,
+            ).where(AnalysisRunORM.id == source_run_id)
+        ).one()
+        row = self._session.execute(
+            select(AnalysisRunORM).where(AnalysisRunORM.id == run_id)
+        ).scalar_one()
+        row.status = "FINISHED"
+        row.started_at = ensure_utc(finished_at)
+        row.finished_at = ensure_utc(finished_at)
+        row.result_summary_ref = source.result_summary_ref
+        row.trace_json_ref = source.trace_json_ref
+        row.white_box_trace_ref = source.white_box_trace_ref
+        row.result_source_run_id = source_run_id
+        self._session.commit()
+        return self._to_domain(row, self.load_payloads([row]))
 
     def update_status(
         self,
@@ -100,13 +260,13 @@ class AnalysisRunRepository:
         if error_message is not None or status == "FAILED":
             row.error_message = error_message
         if result_summary is not None:
-            row.result_summary = result_summary
+            row.result_summary_ref = self.store_payload(result_summary)
         if trace_json is not None:
-            row.trace_json = trace_json
+            row.trace_json_ref = self.store_payload(trace_json)
         if white_box_trace is not None:
-            row.white_box_trace = white_box_trace
+            row.white_box_trace_ref = self.store_payload(white_box_trace)
         self._session.commit()
-        return self._to_domain(row)
+        return self._to_domain(row, self.load_payloads([row]))
 
     def mark_results_outdated(self, project_id: UUID, *, commit: bool = True) -> int:
         stmt = (
@@ -140,8 +300,38 @@ class AnalysisRunRepository:
             self._session.commit()
         return int(result.rowcount or 0)
 
-    def _to_domain(self, row: AnalysisRunORM) -> AnalysisRun:
-        return AnalysisRun(
+    def store_payload(self, payload: Any) -> str | None:
+        """Store payload once under its content hash; returns the hash."""
+        if payload is None:
+            return None
+        blob = CanonicalJSON.of(payload)
+        if self._session.get(AnalysisRunBlobORM, blob.sha256) is None:
+            self._session.add(
+                AnalysisRunBlobORM(
+                    content_hash=blob.sha256,
+                    size_bytes=len(blob.text.encode("utf-8")),
+                    payload=blob,
+                )
+            )
+        return blob.sha256
+
+    def load_payloads(self, rows: list[AnalysisRunORM]) -> dict[str, Any]:
+        """Payloads referenced by rows, one query for all distinct hashes."""
+        refs = {
+            ref for row in rows for name in _PAYLOAD_REFS
+            if (ref := getattr(row, name)) is not None
+        }
+        if not refs:
+            return {}
+        stmt = select(AnalysisRunBlobORM.content_hash, AnalysisRunBlobORM.payload).where(
+            AnalysisRunBlobORM.content_hash.in_(sorted(refs))
+        )
+        return {content_hash: payload for content_hash, payload in self._session.execute(stmt)}
+
+    def _to_domain(
+        self, row, payloads: dict[str, Any] | None = None
+    ) -> AnalysisRun:
+        base = AnalysisRun(
             id=row.id,
             project_id=row.project_id,
             operating_case_id=row.operating_case_id,
@@ -151,10 +341,33 @@ class AnalysisRunRepository:
             created_at=ensure_utc(row.created_at),
             started_at=ensure_utc(row.started_at),
             finished_at=ensure_utc(row.finished_at),
-            input_snapshot=row.input_snapshot,
             input_hash=row.input_hash,
-            result_summary=row.result_summary,
-            trace_json=row.trace_json,
-            white_box_trace=row.white_box_trace,
             error_message=row.error_message,
+            result_source_run_id=row.result_source_run_id,
         )
+        if payloads is None:
+            return base
+        return replace(
+            base,
+            input_snapshot=payloads.get(row.input_snapshot_ref, {}),
+            result_summary=payloads.get(row.result_summary_ref, {}),
+            trace_json=_with_dedup_trace(
+                payloads.get(row.trace_json_ref), row.result_source_run_id
+            ),
+            white_box_trace=payloads.get(row.white_box_trace_ref),
+        )
+
+
+def _with_dedup_trace(trace_json: Any, source_run_id: UUID | None) -> Any:
+    """trace_json of a reused run carries `_dedup` (source run, reason)."""
+    if source_run_id is None:
+        return trace_json
+    dedup_trace = {
+        "dedup_source_run_id": str(source_run_id),
+        "dedup_reason": "identical_input_hash",
+    }
+    if isinstance(trace_json, dict):
+        return {**trace_json, "_dedup": dedup_trace}
+    if trace_json is None:
+        return {"_dedup": dedup_trace}
+    return trace_json
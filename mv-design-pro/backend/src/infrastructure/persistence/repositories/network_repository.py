@@ -6,28 +6,41 @@ from uuid import UUID
 from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
+from infrastructure.persistence.bulk import bulk_insert
 from infrastructure.persistence.models import NetworkBranchORM, NetworkNodeORM
 
 
+def _node_row(project_id: UUID, node: dict) -> dict:
+    return {
+        "id": node["id"],
+        "project_id": project_id,
+        "name": node["name"],
+        "node_type": node["node_type"],
+        "base_kv": node["base_kv"],
+        "attrs_jsonb": node.get("attrs", {}),
+    }
+
+
+def _branch_row(project_id: UUID, branch: dict) -> dict:
+    return {
+        "id": branch["id"],
+        "project_id": project_id,
+        "name": branch["name"],
+        "branch_type": branch["branch_type"],
+        "from_node_id": branch["from_node_id"],
+        "to_node_id": branch["to_node_id"],
+        "in_service": branch.get("in_service", True),
+        "params_jsonb": branch.get("params", {}),
+    }
+
+
 class NetworkRepository:
     def __init__(self, session: Session) -> None:
         self._session = session
 
     def replace_nodes(self, project_id: UUID, nodes: Iterable[dict], *, commit: bool = True) -> None:
         self._session.execute(delete(NetworkNodeORM).where(NetworkNodeORM.project_id == project_id))
-        for node in nodes:
-            self._session.add(
-                NetworkNodeORM(
-                    id=node["id"],
-                    project_id=project_id,
-                    name=node["name"],
-                    node_type=node["node_type"],
-                    base_kv=node["base_kv"],
-                    attrs_jsonb=node.get("attrs", {}),
-                )
-            )
-        if commit:
-            self._session.commit()
+        self.add_nodes(project_id, nodes, commit=commit)
 
     def replace_branches(
         self, project_id: UUID, branches: Iterable[dict], *, commit: bool = True
@@ -35,32 +48,33 @@ class NetworkRepository:
         self._session.execute(
             delete(NetworkBranchORM).where(NetworkBranchORM.project_id == project_id)
         )
-        for branch in branches:
-            self._session.add(
-                NetworkBranchORM(
-                    id=branch["id"],
-                    project_id=project_id,
-                    name=branch["name"],
-                    branch_type=branch["branch_type"],
-                    from_node_id=branch["from_node_id"],
-                    to_node_id=branch["to_node_id"],
-                    in_service=branch.get("in_service", True),
-                    params_jsonb=branch.get("params", {}),
-                )
-            )
+        self.add_branches(project_id, branches, commit=commit)
+
+    def add_nodes(self, project_id: UUID, nodes: Iterable[dict], *, commit: bool = True) -> int:
+        """Bulk insert of new nodes (executemany); returns the number of rows."""
+        count = bulk_insert(
+            self._session, NetworkNodeORM, (_node_row(project_id, node) for node in nodes)
+        )
+        if commit:
+            self._session.commit()
+        return count
+
+    def add_branches(
+        self, project_id: UUID, branches: Iterable[dict], *, commit: bool = True
+    ) -> int:
+        """Bulk insert of new branches (executemany); returns the number of rows."""
+        count = bulk_insert(
+            self._session,
+            NetworkBranchORM,
+            (_branch_row(project_id, branch) for branch in branches),
+        )
         if commit:
             self._session.commit()
+        return count
 
     def add_node(self, project_id: UUID, node: dict, *, commit: bool = True) -> None:
         self._session.add(
-            NetworkNodeORM(
-                id=node["id"],
-                project_id=project_id,
-                name=node["name"],
-                node_type=node["node_type"],
-                base_kv=node["base_kv"],
-                attrs_jsonb=node.get("attrs", {}),
-            )
+            NetworkNodeORM(**_node_row(project_id, node))
         )
         if commit:
             self._session.commit()
@@ -114,16 +128,7 @@ class NetworkRepository:
 
     def add_branch(self, project_id: UUID, branch: dict, *, commit: bool = True) -> None:
         self._session.add(
-            NetworkBranchORM(
-                id=branch["id"],
-                project_id=project_id,
-                name=branch["name"],
-                branch_type=branch["branch_type"],
-                from_node_id=branch["from_node_id"],
-                to_node_id=branch["to_node_id"],
-                in_service=branch.get("in_service", True),
-                params_jsonb=branch.get("params", {}),
-            )
+            NetworkBranchORM(**_branch_row(project_id, branch))
         )
         if commit:
             self._session.commit()
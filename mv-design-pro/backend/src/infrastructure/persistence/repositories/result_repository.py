@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
 
+from infrastructure.persistence.bulk import bulk_insert
 from infrastructure.persistence.models import StudyResultORM
 
 
@@ -38,21 +40,93 @@ class ResultRepository:
         self._session.commit()
         return result_id
 
+    def add_results(
+        self,
+        *,
+        run_id: UUID,
+        project_id: UUID,
+        results: Iterable[tuple[str, dict]],
+        created_at: datetime | None = None,
+        commit: bool = True,
+    ) -> list[UUID]:
+        """
+        Store several (result_type, payload) results of one run with a single
+        executemany instead of one INSERT (and commit) per result.
+        """
+        created_at = created_at or datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid4(),
+                "run_id": run_id,
+                "project_id": project_id,
+                "result_type": result_type,
+                "result_jsonb": payload,
+                "created_at": created_at,
+            }
+            for result_type, payload in results
+        ]
+        bulk_insert(self._session, StudyResultORM, rows)
+        if commit:
+            self._session.commit()
+        return [row["id"] for row in rows]
+
+    def add_result_references(
+        self,
+        *,
+        run_id: UUID,
+        project_id: UUID,
+        source_run_id: UUID,
+        created_at: datetime | None = None,
+    ) -> list[UUID]:
+        """
+        Attach the results of source_run_id to run_id without copying payloads.
+
+        Each new row references the row that holds the payload (references
+        of references are resolved to the original).
+        """
+        created_at = created_at or datetime.now(timezone.utc)
+        stmt = (
+            select(
+                func.coalesce(StudyResultORM.source_result_id, StudyResultORM.id),
+                StudyResultORM.result_type,
+            )
+            .where(StudyResultORM.run_id == source_run_id)
+            .order_by(StudyResultORM.created_at, StudyResultORM.id)
+        )
+        rows = [
+            {
+                "id": uuid4(),
+                "run_id": run_id,
+                "project_id": project_id,
+                "result_type": result_type,
+                "result_jsonb": None,
+                "source_result_id": source_result_id,
+                "created_at": created_at,
+            }
+            for source_result_id, result_type in self._session.execute(stmt).all()
+        ]
+        bulk_insert(self._session, StudyResultORM, rows)
+        result_ids = [row["id"] for row in rows]
+        self._session.commit()
+        return result_ids
+
     def list_results(self, run_id: UUID) -> list[dict]:
+        source = aliased(StudyResultORM)
         stmt = (
-            select(StudyResultORM)
+            select(StudyResultORM, source.result_jsonb)
+            .outerjoin(source, source.id == StudyResultORM.source_result_id)
             .where(StudyResultORM.run_id == run_id)
             .order_by(StudyResultORM.created_at, StudyResultORM.id)
         )
-        rows = self._session.execute(stmt).scalars().all()
+        rows = self._session.execute(stmt).all()
         return [
             {
                 "id": row.id,
                 "run_id": row.run_id,
                 "project_id": row.project_id,
                 "result_type": row.result_type,
-                "payload": row.result_jsonb,
+                "payload": row.result_jsonb if row.source_result_id is None else source_payload,
                 "created_at": row.created_at,
             }
-            for row in rows
+            for row, source_payload in rows
         ]
@@ -6,6 +6,7 @@ from uuid import UUID, uuid4, uuid5
 from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
+from infrastructure.persistence.bulk import bulk_insert
 from infrastructure.persistence.models import (
     SldAnnotationORM,
     SldBranchSymbolORM,
@@ -14,6 +15,10 @@ from infrastructure.persistence.models import (
 )
 
 
+def _as_uuid(value: UUID | str) -> UUID:
+    return UUID(value) if isinstance(value, str) else value
+
+
 class SldRepository:
     def __init__(self, session: Session) -> None:
         self._session = session
@@ -168,50 +173,50 @@ class SldRepository:
         self._session.execute(
             delete(SldAnnotationORM).where(SldAnnotationORM.diagram_id == diagram_id)
         )
-        for node in payload.get("nodes", []):
-            self._session.add(
-                SldNodeSymbolORM(
-                    id=UUID(node["id"]) if isinstance(node.get("id"), str) else node["id"],
-                    diagram_id=diagram_id,
-                    node_id=UUID(node["node_id"])
-                    if isinstance(node.get("node_id"), str)
-                    else node["node_id"],
-                    x=float(node.get("x", 0.0)),
-                    y=float(node.get("y", 0.0)),
-                    label=node.get("label"),
+        bulk_insert(
+            self._session,
+            SldNodeSymbolORM,
+            (
+                {
+                    "id": _as_uuid(node["id"]),
+                    "diagram_id": diagram_id,
+                    "node_id": _as_uuid(node["node_id"]),
+                    "x": float(node.get("x", 0.0)),
+                    "y": float(node.get("y", 0.0)),
+                    "label": node.get("label"),
                     # NOTE: is_connection_node is deprecated and always False.
                     # BoundaryNode – węzeł przyłączenia is interpretation, not stored data.
-                    is_connection_node=False,
-                )
-            )
-        for branch in payload.get("branches", []):
-            self._session.add(
-                SldBranchSymbolORM(
-                    id=UUID(branch["id"])
-                    if isinstance(branch.get("id"), str)
-                    else branch["id"],
-                    diagram_id=diagram_id,
-                    branch_id=UUID(branch["branch_id"])
-                    if isinstance(branch.get("branch_id"), str)
-                    else branch["branch_id"],
-                    from_node_id=UUID(branch["from_node_id"])
-                    if isinstance(branch.get("from_node_id"), str)
-                    else branch["from_node_id"],
-                    to_node_id=UUID(branch["to_node_id"])
-                    if isinstance(branch.get("to_node_id"), str)
-                    else branch["to_node_id"],
-                    points_jsonb=list(branch.get("points") or []),
-                )
-            )
-        for annotation in payload.get("annotations", []):
-            self._session.add(
-                SldAnnotationORM(
-                    id=UUID(annotation["id"])
-                    if isinstance(annotation.get("id"), str)
-                    else annotation["id"],
-                    diagram_id=diagram_id,
-                    text=str(annotation.get("text", "")),
-                    x=float(annotation.get("x", 0.0)),
-                    y=float(annotation.get("y", 0.0)),
-                )
-            )
+                    "is_connection_node": False,
+                }
+                for node in payload.get("nodes", [])
+            ),
+        )
+        bulk_insert(
+            self._session,
+            SldBranchSymbolORM,
+            (
+                {
+                    "id": _as_uuid(branch["id"]),
+                    "diagram_id": diagram_id,
+                    "branch_id": _as_uuid(branch["branch_id"]),
+                    "from_node_id": _as_uuid(branch["from_node_id"]),
+                    "to_node_id": _as_uuid(branch["to_node_id"]),
+                    "points_jsonb": list(branch.get("points") or []),
+                }
+                for branch in payload.get("branches", [])
+            ),
+        )
+        bulk_insert(
+            self._session,
+            SldAnnotationORM,
+            (
+                {
+                    "id": _as_uuid(annotation["id"]),
+                    "diagram_id": diagram_id,
+                    "text": str(annotation.get("text", "")),
+                    "x": float(annotation.get("x", 0.0)),
+                    "y": float(annotation.get("y", 0.0)),
+                }
+                for annotation in payload.get("annotations", [])
+            ),
+        )
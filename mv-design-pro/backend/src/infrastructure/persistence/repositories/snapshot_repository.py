@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Mapping
 from datetime import datetime, timezone
 
-from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, literal, select
+from sqlalchemy.orm import Session, aliased
 
 from infrastructure.persistence.models import NetworkSnapshotORM
 from network_model.core.snapshot import NetworkSnapshot, SnapshotMeta
 
+# Lineage listings select metadata columns only (never snapshot_json)
+_META_COLUMNS = (
+    NetworkSnapshotORM.snapshot_id,
+    NetworkSnapshotORM.parent_snapshot_id,
+    NetworkSnapshotORM.created_at,
+    NetworkSnapshotORM.schema_version,
+    NetworkSnapshotORM.network_model_id,
+    NetworkSnapshotORM.fingerprint,
+)
+
 
 class SnapshotRepository:
     def __init__(self, session: Session) -> None:
@@ -18,10 +30,13 @@ class SnapshotRepository:
         payload = snapshot.to_dict()
         meta = snapshot.meta
         created_at = _parse_created_at(meta.created_at)
+        root_id, depth = self._lineage_position(meta.snapshot_id, meta.parent_snapshot_id)
         self._session.add(
             NetworkSnapshotORM(
                 snapshot_id=meta.snapshot_id,
                 parent_snapshot_id=meta.parent_snapshot_id,
+                lineage_root_id=root_id,
+                lineage_depth=depth,
                 created_at=created_at,
                 schema_version=meta.schema_version,
                 network_model_id=meta.network_model_id,
@@ -62,19 +77,95 @@ class SnapshotRepository:
         return NetworkSnapshot.from_dict(payload)
 
     def list_lineage(self, snapshot_id: str) -> list[SnapshotMeta]:
+        """
+        Ancestors of snapshot_id followed by the snapshot itself (root first).
+
+        One recursive-CTE query over metadata columns; SQLite builds without
+        recursive CTEs read the materialized lineage range instead.
+        """
+        if not _supports_recursive_cte(self._session):
+            return self._list_lineage_by_range(snapshot_id)
+        lineage = self._lineage_cte(snapshot_id, "lineage")
+        stmt = select(*(lineage.c[col.key] for col in _META_COLUMNS)).order_by(
+            lineage.c.hop.desc()
+        )
+        return [_meta_from_row(row) for row in self._session.execute(stmt)]
+
+    def find_common_ancestor(self, snapshot_a: str, snapshot_b: str) -> SnapshotMeta | None:
+        """
+        Nearest snapshot present in both lineages (a snapshot is its own
+        ancestor); None for disjoint histories.
+        """
+        if not _supports_recursive_cte(self._session):
+            lineage_b = {meta.snapshot_id for meta in self._list_lineage_by_range(snapshot_b)}
+            for meta in reversed(self._list_lineage_by_range(snapshot_a)):
+                if meta.snapshot_id in lineage_b:
+                    return meta
+            return None
+        lineage_a = self._lineage_cte(snapshot_a, "lineage_a")
+        lineage_b = self._lineage_cte(snapshot_b, "lineage_b")
+        stmt = (
+            select(*(lineage_a.c[col.key] for col in _META_COLUMNS))
+            .join(lineage_b, lineage_b.c.snapshot_id == lineage_a.c.snapshot_id)
+            .order_by(lineage_a.c.hop)
+            .limit(1)
+        )
+        row = self._session.execute(stmt).one_or_none()
+        return _meta_from_row(row) if row is not None else None
+
+    def _lineage_cte(self, snapshot_id: str, name: str):
+        """Recursive CTE: snapshot_id (hop 0) and its ancestors (hop = distance)."""
+        lineage = (
+            select(*_META_COLUMNS, literal(0).label("hop"))
+            .where(NetworkSnapshotORM.snapshot_id == snapshot_id)
+            .cte(name, recursive=True)
+        )
+        parent = aliased(NetworkSnapshotORM)
+        return lineage.union_all(
+            select(
+                *(getattr(parent, col.key) for col in _META_COLUMNS),
+                (lineage.c.hop + 1).label("hop"),
+            ).join(lineage, parent.snapshot_id == lineage.c.parent_snapshot_id)
+        )
+
+    def _list_lineage_by_range(self, snapshot_id: str) -> list[SnapshotMeta]:
+        """Fallback: fetch the (root, depth ≤ n) range in one query, walk parents in memory."""
+        position = self._session.execute(
+            select(NetworkSnapshotORM.lineage_root_id, NetworkSnapshotORM.lineage_depth).where(
+                NetworkSnapshotORM.snapshot_id == snapshot_id
+            )
+        ).one_or_none()
+        if position is None:
+            return []
+        stmt = select(*_META_COLUMNS).where(
+            NetworkSnapshotORM.lineage_root_id == position.lineage_root_id,
+            NetworkSnapshotORM.lineage_depth <= position.lineage_depth,
+        )
+        rows = {row.snapshot_id: row for row in self._session.execute(stmt)}
         lineage: list[SnapshotMeta] = []
         current_id: str | None = snapshot_id
-        while current_id is not None:
-            stmt = select(NetworkSnapshotORM).where(
-                NetworkSnapshotORM.snapshot_id == current_id
-            )
-            row = self._session.execute(stmt).scalar_one_or_none()
-            if row is None:
-                break
+        while current_id is not None and current_id in rows:
+            row = rows.pop(current_id)
             lineage.append(_meta_from_row(row))
             current_id = row.parent_snapshot_id
         return list(reversed(lineage))
 
+    def _lineage_position(
+        self, snapshot_id: str, parent_snapshot_id: str | None
+    ) -> tuple[str, int]:
+        """(root, depth) of a new snapshot from its parent's stored position."""
+        if parent_snapshot_id is None:
+            return snapshot_id, 0
+        parent = self._session.execute(
+            select(NetworkSnapshotORM.lineage_root_id, NetworkSnapshotORM.lineage_depth).where(
+                NetworkSnapshotORM.snapshot_id == parent_snapshot_id
+            )
+        ).one_or_none()
+        if parent is None:
+            # Parent not stored: the chain is rooted at the missing parent id
+            return parent_snapshot_id, 1
+        return parent.lineage_root_id or parent_snapshot_id, parent.lineage_depth + 1
+
     # P10a: Fingerprint-based operations
     def get_fingerprint(self, snapshot_id: str) -> str | None:
         """P10a: Get the fingerprint for a snapshot."""
@@ -105,6 +196,42 @@ def _parse_created_at(value: str) -> datetime:
     return parsed
 
 
+def lineage_positions(parents: Mapping[str, str | None]) -> dict[str, tuple[str, int]]:
+    """
+    (root, depth) for a batch of snapshots given {snapshot_id: parent_id}.
+
+    Used when snapshots are inserted in bulk (archive import); parents outside
+    the batch root the chain at the missing parent id, like add_snapshot.
+    """
+    positions: dict[str, tuple[str, int]] = {}
+    for snapshot_id in parents:
+        chain: list[str] = []
+        current: str | None = snapshot_id
+        while current is not None and current not in positions and current not in chain:
+            chain.append(current)
+            current = parents.get(current)
+        if current is None:
+            root = chain.pop()
+            positions[root] = (root, 0)
+            depth = 0
+        elif current in positions:
+            root, depth = positions[current]
+        else:
+            # Cycle (corrupt data): every member becomes its own root
+            positions.update((member, (member, 0)) for member in chain)
+            continue
+        for member in reversed(chain):
+            depth += 1
+            positions[member] = (root, depth)
+    return {snapshot_id: positions[snapshot_id] for snapshot_id in parents}
+
+
+def _supports_recursive_cte(session: Session) -> bool:
+    if session.get_bind().dialect.name != "sqlite":
+        return True
+    return sqlite3.sqlite_version_info >= (3, 8, 3)
+
+
 def _meta_from_row(row: NetworkSnapshotORM) -> SnapshotMeta:
     """P10a: Include fingerprint in metadata."""
     return SnapshotMeta(
@@ -28,51 +28,84 @@ from infrastructure.persistence.repositories.sld_repository import SldRepository
 from infrastructure.persistence.repositories.study_run_repository import StudyRunRepository
 
 
+_REPOSITORIES: dict[str, type] = {
+    "projects": ProjectRepository,
+    "network": NetworkRepository,
+    "cases": CaseRepository,
+    "wizard": NetworkWizardRepository,
+    "sld": SldRepository,
+    "results": ResultRepository,
+    "analysis_runs": AnalysisRunRepository,
+    "analysis_runs_index": AnalysisRunIndexRepository,
+    "snapshots": SnapshotRepository,
+    "study_runs": StudyRunRepository,  # P10a
+    "design_specs": DesignSpecRepository,
+    "design_proposals": DesignProposalRepository,
+    "design_evidence": DesignEvidenceRepository,
+}
+
+
+class ReadOnlyUnitOfWorkError(RuntimeError):
+    """Commit requested on a read-only UnitOfWork."""
+
+
 class UnitOfWork(AbstractContextManager["UnitOfWork"]):
     """
     Unit of Work pattern for transactional operations.
 
     P10a: Added study_runs repository for Run lifecycle management.
+
+    Repositories are built on first attribute access, so a request pays only
+    for the repositories it uses. read_only=True (GET endpoints): no
+    autoflush, the transaction is rolled back on exit and commit() raises.
     """
 
-    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+    projects: ProjectRepository
+    network: NetworkRepository
+    cases: CaseRepository
+    wizard: NetworkWizardRepository
+    sld: SldRepository
+    results: ResultRepository
+    analysis_runs: AnalysisRunRepository
+    analysis_runs_index: AnalysisRunIndexRepository
+    snapshots: SnapshotRepository
+    study_runs: StudyRunRepository  # P10a
+    design_specs: DesignSpecRepository
+    design_proposals: DesignProposalRepository
+    design_evidence: DesignEvidenceRepository
+
+    def __init__(
+        self, session_factory: sessionmaker[Session], *, read_only: bool = False
+    ) -> None:
         self._session_factory = session_factory
+        self.read_only = read_only
         self.session: Session | None = None
-        self.projects: ProjectRepository | None = None
-        self.network: NetworkRepository | None = None
-        self.cases: CaseRepository | None = None
-        self.wizard: NetworkWizardRepository | None = None
-        self.sld: SldRepository | None = None
-        self.results: ResultRepository | None = None
-        self.analysis_runs: AnalysisRunRepository | None = None
-        self.analysis_runs_index: AnalysisRunIndexRepository | None = None
-        self.snapshots: SnapshotRepository | None = None
-        self.study_runs: StudyRunRepository | None = None  # P10a
-        self.design_specs: DesignSpecRepository | None = None
-        self.design_proposals: DesignProposalRepository | None = None
-        self.design_evidence: DesignEvidenceRepository | None = None
+
+    def __getattr__(self, name: str):
+        # Called only for attributes not set yet: build the repository lazily
+        repository_cls = _REPOSITORIES.get(name)
+        if repository_cls is None:
+            raise AttributeError(name)
+        session = self.__dict__.get("session")
+        if session is None:
+            return None
+        repository = repository_cls(session)
+        setattr(self, name, repository)
+        return repository
 
     def __enter__(self) -> "UnitOfWork":
+        # Repositories of a previous session must not be reused
+        for name in _REPOSITORIES:
+            self.__dict__.pop(name, None)
         self.session = self._session_factory()
-        self.projects = ProjectRepository(self.session)
-        self.network = NetworkRepository(self.session)
-        self.cases = CaseRepository(self.session)
-        self.wizard = NetworkWizardRepository(self.session)
-        self.sld = SldRepository(self.session)
-        self.results = ResultRepository(self.session)
-        self.analysis_runs = AnalysisRunRepository(self.session)
-        self.analysis_runs_index = AnalysisRunIndexRepository(self.session)
-        self.snapshots = SnapshotRepository(self.session)
-        self.study_runs = StudyRunRepository(self.session)  # P10a
-        self.design_specs = DesignSpecRepository(self.session)
-        self.design_proposals = DesignProposalRepository(self.session)
-        self.design_evidence = DesignEvidenceRepository(self.session)
+        if self.read_only:
+            self.session.autoflush = False
         return self
 
     def __exit__(self, exc_type, exc, tb) -> bool:
         if self.session is None:
             return False
-        if exc_type is None:
+        if exc_type is None and not self.read_only:
             self.session.commit()
         else:
             self.session.rollback()
@@ -81,6 +114,8 @@ class UnitOfWork(AbstractContextManager["UnitOfWork"]):
 
     def commit(self) -> None:
         """Commit the current transaction."""
+        if self.read_only:
+            raise ReadOnlyUnitOfWorkError("UnitOfWork otwarty tylko do odczytu")
         if self.session is not None:
             self.session.commit()
 
@@ -92,5 +127,10 @@ class UnitOfWork(AbstractContextManager["UnitOfWork"]):
 
 def build_uow_factory(
     session_factory: sessionmaker[Session],
-) -> Callable[[], UnitOfWork]:
-    return lambda: UnitOfWork(session_factory)
+) -> Callable[..., UnitOfWork]:
+    """Factory of UnitOfWork; call with read_only=True for read-only work."""
+
+    def factory(*, read_only: bool = False) -> UnitOfWork:
+        return UnitOfWork(session_factory, read_only=read_only)
+
+    return factory
@@ -5,6 +5,37 @@ Pakiet zawiera komponenty do modelowania sieci elektroenergetycznych
 średniego napięcia (SN) i obliczeń rozpływu mocy.
 """
 
-from .core import Bus, Node, NodeType
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import Bus, Node, NodeType
+
+# Submodules load on first access to an export (NetworkX / NumPy only when needed)
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".core": (
+        "Bus",
+        "Node",
+        "NodeType",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = ["Bus", "Node", "NodeType"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
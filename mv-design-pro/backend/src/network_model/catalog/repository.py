@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Iterable
 
 from .types import (
@@ -480,6 +481,7 @@ class CatalogRepository:
         return sorted(values, key=lambda item: (str(item.name_pl), str(item.id)))
 
 
+@lru_cache(maxsize=1)
 def get_default_mv_catalog() -> CatalogRepository:
     """
     Get default MV catalog with full equipment data.
@@ -494,6 +496,9 @@ def get_default_mv_catalog() -> CatalogRepository:
     - Converter-based sources (PV, wind, BESS)
 
     This is the canonical catalog for MV network design.
+
+    The record modules are imported on the first call and the repository is
+    built once per process; the (frozen) instance is shared by all callers.
     """
     from .mv_auxiliary_catalog import (
         get_all_ct_types,
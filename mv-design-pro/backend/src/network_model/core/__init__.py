@@ -11,33 +11,107 @@ PowerFactory Alignment:
 - NetworkGraph = topologia sieci
 """
 
-from .bus import Bus
-from .node import Node, NodeType
-from .branch import BranchType, Branch, LineBranch, TransformerBranch
-from .switch import Switch, SwitchType, SwitchState
-from .station import Station, StationType
-from .graph import NetworkGraph
-from .inverter import InverterSource
-from .generator import GeneratorType, GeneratorSN, GeneratorNN, ControlMode
-from .snapshot import NetworkSnapshot, SnapshotMeta, create_network_snapshot
-from .canonical_hash import (
-    canonical_json,
-    canonical_json_from_dict,
-    snapshot_hash,
-    verify_hash,
-)
-from .action_apply import apply_action_to_snapshot
-from .action_envelope import (
-    ActionEnvelope,
-    ActionId,
-    ActionIssue,
-    ActionResult,
-    BatchActionResult,
-    ParentSnapshotId,
-    EntityId,
-    validate_action_envelope,
-)
-from .ybus import AdmittanceMatrixBuilder
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bus import Bus
+    from .node import Node, NodeType
+    from .branch import BranchType, Branch, LineBranch, TransformerBranch
+    from .switch import Switch, SwitchType, SwitchState
+    from .station import Station, StationType
+    from .graph import NetworkGraph
+    from .inverter import InverterSource
+    from .generator import GeneratorType, GeneratorSN, GeneratorNN, ControlMode
+    from .snapshot import NetworkSnapshot, SnapshotMeta, create_network_snapshot
+    from .canonical_hash import (
+        canonical_json,
+        canonical_json_from_dict,
+        snapshot_hash,
+        verify_hash,
+    )
+    from .action_apply import apply_action_to_snapshot
+    from .action_envelope import (
+        ActionEnvelope,
+        ActionId,
+        ActionIssue,
+        ActionResult,
+        BatchActionResult,
+        ParentSnapshotId,
+        EntityId,
+        validate_action_envelope,
+    )
+    from .ybus import AdmittanceMatrixBuilder
+
+# Submodules load on first access to an export (NetworkX / NumPy only when needed)
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".bus": (
+        "Bus",
+    ),
+    ".node": (
+        "Node",
+        "NodeType",
+    ),
+    ".branch": (
+        "BranchType",
+        "Branch",
+        "LineBranch",
+        "TransformerBranch",
+    ),
+    ".switch": (
+        "Switch",
+        "SwitchType",
+        "SwitchState",
+    ),
+    ".station": (
+        "Station",
+        "StationType",
+    ),
+    ".graph": (
+        "NetworkGraph",
+    ),
+    ".inverter": (
+        "InverterSource",
+    ),
+    ".generator": (
+        "GeneratorType",
+        "GeneratorSN",
+        "GeneratorNN",
+        "ControlMode",
+    ),
+    ".snapshot": (
+        "NetworkSnapshot",
+        "SnapshotMeta",
+        "create_network_snapshot",
+    ),
+    ".canonical_hash": (
+        "canonical_json",
+        "canonical_json_from_dict",
+        "snapshot_hash",
+        "verify_hash",
+    ),
+    ".action_apply": (
+        "apply_action_to_snapshot",
+    ),
+    ".action_envelope": (
+        "ActionEnvelope",
+        "ActionId",
+        "ActionIssue",
+        "ActionResult",
+        "BatchActionResult",
+        "ParentSnapshotId",
+        "EntityId",
+        "validate_action_envelope",
+    ),
+    ".ybus": (
+        "AdmittanceMatrixBuilder",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     # PowerFactory-aligned names
@@ -87,3 +161,16 @@ __all__ = [
     # Admittance matrix
     "AdmittanceMatrixBuilder",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
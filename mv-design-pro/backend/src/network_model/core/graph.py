@@ -6,9 +6,7 @@ elektroenergetycznej z wykorzystaniem biblioteki NetworkX do analizy
 spójności i znajdowania wysp.
 """
 
-from typing import Dict, List
-
-import networkx as nx
+from typing import TYPE_CHECKING, Dict, List
 
 from .node import Node, NodeType
 from .branch import Branch
@@ -16,6 +14,9 @@ from .inverter import InverterSource
 from .switch import Switch
 from .station import Station
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 
 class NetworkGraph:
     """
@@ -54,6 +55,9 @@ class NetworkGraph:
         self.inverter_sources: Dict[str, InverterSource] = {}
         self.switches: Dict[str, Switch] = {}
         self.stations: Dict[str, Station] = {}
+        # NetworkX ładowany przy pierwszym grafie, nie przy imporcie modułu
+        import networkx as nx
+
         self._graph: nx.MultiGraph = nx.MultiGraph()
 
     def add_node(self, node: Node) -> None:
@@ -626,6 +630,8 @@ class NetworkGraph:
         if len(self.nodes) == 0:
             return False
 
+        import networkx as nx
+
         # Konwertuj MultiGraph do prostego Graph dla analizy spójności
         simple_graph = nx.Graph(self._graph)
         return nx.is_connected(simple_graph)
@@ -649,6 +655,8 @@ class NetworkGraph:
         if len(self.nodes) == 0:
             return []
 
+        import networkx as nx
+
         # Konwertuj MultiGraph do prostego Graph dla analizy spójności
         simple_graph = nx.Graph(self._graph)
 
@@ -689,6 +697,8 @@ class NetworkGraph:
         Każda krawędź jest identyfikowana przez key=branch.id.
         Przydatne po zmianie statusu in_service gałęzi.
         """
+        import networkx as nx
+
         self._graph = nx.MultiGraph()
 
         # Dodaj wszystkie węzły
@@ -4,51 +4,117 @@ Reporting/export layer for network model results.
 This package provides export functionality for solver results to various formats.
 """
 
-from network_model.reporting.short_circuit_export import (
-    export_short_circuit_result_to_json,
-    export_short_circuit_results_to_jsonl,
-)
-from network_model.reporting.short_circuit_report_docx import (
-    export_short_circuit_result_to_docx,
-)
-from network_model.reporting.short_circuit_report_pdf import (
-    export_short_circuit_result_to_pdf,
-)
-from network_model.reporting.analysis_run_report_docx import (
-    export_analysis_run_to_docx,
-)
-from network_model.reporting.analysis_run_report_pdf import (
-    export_analysis_run_to_pdf,
-)
-from network_model.reporting.power_flow_report_pdf import (
-    export_power_flow_result_to_pdf,
-    export_power_flow_comparison_to_pdf,
-)
-from network_model.reporting.power_flow_report_docx import (
-    export_power_flow_result_to_docx,
-    export_power_flow_comparison_to_docx,
-)
-from network_model.reporting.power_flow_export import (
-    export_power_flow_result_to_json,
-    export_power_flow_results_to_jsonl,
-)
-from network_model.reporting.export_docx import (
-    generate_sc_report_docx,
-    generate_pf_report_docx,
-)
-from network_model.reporting.export_pdf import (
-    generate_sc_report_pdf,
-    generate_pf_report_pdf,
-)
-from network_model.reporting.export_jsonl import (
-    export_trace_jsonl,
-    export_snapshot_jsonl,
-)
-from network_model.reporting.export_manifest import (
-    ExportFile,
-    ExportManifest,
-    build_export_manifest,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from network_model.reporting.short_circuit_export import (
+        export_short_circuit_result_to_json,
+        export_short_circuit_results_to_jsonl,
+    )
+    from network_model.reporting.short_circuit_report_docx import (
+        export_short_circuit_result_to_docx,
+    )
+    from network_model.reporting.short_circuit_report_pdf import (
+        export_short_circuit_result_to_pdf,
+    )
+    from network_model.reporting.analysis_run_report_docx import (
+        export_analysis_run_to_docx,
+    )
+    from network_model.reporting.analysis_run_report_pdf import (
+        export_analysis_run_to_pdf,
+    )
+    from network_model.reporting.power_flow_report_pdf import (
+        export_power_flow_result_to_pdf,
+        export_power_flow_comparison_to_pdf,
+    )
+    from network_model.reporting.power_flow_report_docx import (
+        export_power_flow_result_to_docx,
+        export_power_flow_comparison_to_docx,
+    )
+    from network_model.reporting.power_flow_export import (
+        export_power_flow_result_to_json,
+        export_power_flow_results_to_jsonl,
+    )
+    from network_model.reporting.export_docx import (
+        generate_sc_report_docx,
+        generate_pf_report_docx,
+    )
+    from network_model.reporting.export_pdf import (
+        generate_sc_report_pdf,
+        generate_pf_report_pdf,
+    )
+    from network_model.reporting.export_jsonl import (
+        export_trace_jsonl,
+        export_snapshot_jsonl,
+        iter_jsonl_chunks,
+        iter_snapshot_jsonl,
+        iter_trace_jsonl,
+        write_jsonl_stream,
+    )
+    from network_model.reporting.export_manifest import (
+        ExportFile,
+        ExportManifest,
+        build_export_manifest,
+    )
+
+# Submodules (and python-docx / reportlab) load on first access to an export
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "network_model.reporting.short_circuit_export": (
+        "export_short_circuit_result_to_json",
+        "export_short_circuit_results_to_jsonl",
+    ),
+    "network_model.reporting.short_circuit_report_docx": (
+        "export_short_circuit_result_to_docx",
+    ),
+    "network_model.reporting.short_circuit_report_pdf": (
+        "export_short_circuit_result_to_pdf",
+    ),
+    "network_model.reporting.analysis_run_report_docx": (
+        "export_analysis_run_to_docx",
+    ),
+    "network_model.reporting.analysis_run_report_pdf": (
+        "export_analysis_run_to_pdf",
+    ),
+    "network_model.reporting.power_flow_report_pdf": (
+        "export_power_flow_result_to_pdf",
+        "export_power_flow_comparison_to_pdf",
+    ),
+    "network_model.reporting.power_flow_report_docx": (
+        "export_power_flow_result_to_docx",
+        "export_power_flow_comparison_to_docx",
+    ),
+    "network_model.reporting.power_flow_export": (
+        "export_power_flow_result_to_json",
+        "export_power_flow_results_to_jsonl",
+    ),
+    "network_model.reporting.export_docx": (
+        "generate_sc_report_docx",
+        "generate_pf_report_docx",
+    ),
+    "network_model.reporting.export_pdf": (
+        "generate_sc_report_pdf",
+        "generate_pf_report_pdf",
+    ),
+    "network_model.reporting.export_jsonl": (
+        "export_trace_jsonl",
+        "export_snapshot_jsonl",
+        "iter_jsonl_chunks",
+        "iter_snapshot_jsonl",
+        "iter_trace_jsonl",
+        "write_jsonl_stream",
+    ),
+    "network_model.reporting.export_manifest": (
+        "ExportFile",
+        "ExportManifest",
+        "build_export_manifest",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     # Short Circuit exports
@@ -74,8 +140,25 @@ __all__ = [
     # JSONL exports
     "export_trace_jsonl",
     "export_snapshot_jsonl",
+    "iter_jsonl_chunks",
+    "iter_snapshot_jsonl",
+    "iter_trace_jsonl",
+    "write_jsonl_stream",
     # Export manifest
     "ExportFile",
     "ExportManifest",
     "build_export_manifest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
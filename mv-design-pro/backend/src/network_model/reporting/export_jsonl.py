@@ -10,17 +10,37 @@ CANONICAL ALIGNMENT:
 - Deterministic: Same input -> identical output (sort_keys=True)
 - UTF-8 encoding
 - One JSON object per line (JSON Lines / JSONL format)
+
+STREAMING:
+- iter_trace_jsonl / iter_snapshot_jsonl yield lines lazily, so a trace
+  can be consumed from a step generator (solver or paged storage)
+- write_jsonl_stream / iter_jsonl_chunks write gzip/zstd/plain JSONL to a
+  file-like object or as byte chunks for an HTTP streaming response;
+  memory stays constant regardless of trace size
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Literal
+
+JsonlCompression = Literal["gzip", "zstd", "none"]
+
+JSONL_MEDIA_TYPES: dict[str, str] = {
+    "gzip": "application/gzip",
+    "zstd": "application/zstd",
+    "none": "application/x-ndjson",
+}
+JSONL_SUFFIXES: dict[str, str] = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst", "none": ".jsonl"}
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
 
 def export_trace_jsonl(
-    white_box_trace: list[dict[str, Any]],
+    white_box_trace: Iterable[dict[str, Any]],
     output_path: str | Path,
 ) -> Path:
     """
@@ -37,26 +57,72 @@ def export_trace_jsonl(
     Steps are ordered chronologically (by their position in the trace list).
 
     Args:
-        white_box_trace: List of white-box step dicts from solver output.
-            Each dict should have keys: key, title, formula_latex, inputs,
-            substitution, result, notes (optional).
+        white_box_trace: White-box step dicts from solver output (list or
+            generator). Each dict should have keys: key, title,
+            formula_latex, inputs, substitution, result, notes (optional).
         output_path: Target file path. Parent directories are created if needed.
 
     Returns:
         Path to the written JSONL file.
 
     Raises:
-        ValueError: If any step cannot be serialized to JSON.
+        ValueError: If any step cannot be serialized to JSON (no file is left).
 
     Example:
         >>> trace = result.white_box_trace  # or result.to_dict()["white_box_trace"]
         >>> path = export_trace_jsonl(trace, "output/trace.jsonl")
     """
-    out = Path(output_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
+    return _write_jsonl_file(iter_trace_jsonl(white_box_trace), output_path)
+
+
+def export_snapshot_jsonl(
+    snapshot: dict[str, Any],
+    output_path: str | Path,
+) -> Path:
+    """
+    Export a network snapshot to a JSONL file.
+
+    Each line represents one entity from the snapshot:
+    - First line: metadata (type="metadata", timestamp, snapshot_id, etc.)
+    - Then: one line per node (type="node")
+    - Then: one line per branch (type="branch")
+    - Then: one line per source (type="source")
+    - Then: one line per load (type="load")
+
+    Args:
+        snapshot: Network snapshot dict. Expected keys:
+            - nodes: list[dict]
+            - branches: list[dict]
+            - sources: list[dict] (optional)
+            - loads: list[dict] (optional)
+            - metadata: dict (optional)
+        output_path: Target file path. Parent directories are created if needed.
+
+    Returns:
+        Path to the written JSONL file.
+
+    Raises:
+        ValueError: If snapshot is not a dict or cannot be serialized.
+    """
+    if not isinstance(snapshot, dict):
+        raise ValueError(
+            f"snapshot must be a dict, got {type(snapshot).__name__}"
+        )
+    return _write_jsonl_file(iter_snapshot_jsonl(snapshot), output_path)
+
 
-    lines: list[str] = []
+# =============================================================================
+# Streaming
+# =============================================================================
 
+
+def iter_trace_jsonl(white_box_trace: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    JSONL lines (without newline) of trace steps, one step at a time.
+
+    Raises:
+        ValueError: If a step cannot be serialized to JSON.
+    """
     for idx, step in enumerate(white_box_trace):
         step_number = idx + 1
         step_name = step.get("key", f"step_{step_number}")
@@ -97,93 +163,139 @@ def export_trace_jsonl(
             line_data["notes"] = str(notes)
 
         try:
-            json_line = json.dumps(line_data, ensure_ascii=False, sort_keys=True)
+            yield json.dumps(line_data, ensure_ascii=False, sort_keys=True)
         except (TypeError, ValueError) as e:
             raise ValueError(
                 f"Step {step_number} ({step_name}): Failed to serialize to JSON: {e}"
             ) from e
 
-        lines.append(json_line)
-
-    out.write_text("\n".join(lines) + "\n" if lines else "", encoding="utf-8")
-    return out
-
 
-def export_snapshot_jsonl(
-    snapshot: dict[str, Any],
-    output_path: str | Path,
-) -> Path:
+def iter_snapshot_jsonl(snapshot: dict[str, Any]) -> Iterator[str]:
+    """JSONL lines (without newline) of a network snapshot: metadata, then entities."""
+    # 1) Metadata line
+    meta = snapshot.get("metadata", {})
+    meta_line: dict[str, Any] = {
+        "type": "metadata",
+        "snapshot_id": meta.get("snapshot_id") or snapshot.get("snapshot_id"),
+        "created_at": meta.get("created_at") or snapshot.get("created_at"),
+        "node_count": len(snapshot.get("nodes", [])),
+        "branch_count": len(snapshot.get("branches", [])),
+    }
+    yield json.dumps(meta_line, ensure_ascii=False, sort_keys=True)
+
+    # 2) Nodes, 3) branches, 4) sources (optional), 5) loads (optional)
+    for collection, entity_type in (
+        ("nodes", "node"),
+        ("branches", "branch"),
+        ("sources", "source"),
+        ("loads", "load"),
+    ):
+        for entity in snapshot.get(collection, []):
+            entity_line: dict[str, Any] = {"type": entity_type}
+            entity_line.update(_serialize_values(entity))
+            yield json.dumps(entity_line, ensure_ascii=False, sort_keys=True)
+
+
+def write_jsonl_stream(
+    lines: Iterable[str],
+    fileobj: IO[bytes],
+    *,
+    compression: JsonlCompression = "gzip",
+) -> int:
     """
-    Export a network snapshot to a JSONL file.
-
-    Each line represents one entity from the snapshot:
-    - First line: metadata (type="metadata", timestamp, snapshot_id, etc.)
-    - Then: one line per node (type="node")
-    - Then: one line per branch (type="branch")
-    - Then: one line per source (type="source")
-    - Then: one line per load (type="load")
+    Write JSONL lines to a binary file-like object, compressed on the fly.
 
-    Args:
-        snapshot: Network snapshot dict. Expected keys:
-            - nodes: list[dict]
-            - branches: list[dict]
-            - sources: list[dict] (optional)
-            - loads: list[dict] (optional)
-            - metadata: dict (optional)
-        output_path: Target file path. Parent directories are created if needed.
+    fileobj is not closed. gzip output is deterministic (mtime=0);
+    zstd requires the optional zstandard package.
 
     Returns:
-        Path to the written JSONL file.
+        Number of lines written.
 
     Raises:
-        ValueError: If snapshot is not a dict or cannot be serialized.
+        ImportError: compression="zstd" without zstandard installed
     """
-    out = Path(output_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
+    writer = _open_writer(fileobj, compression)
+    count = 0
+    try:
+        for line in lines:
+            writer.write(line.encode("utf-8") + b"\n")
+            count += 1
+    finally:
+        if writer is not fileobj:
+            writer.close()
+    return count
+
+
+def iter_jsonl_chunks(
+    lines: Iterable[str],
+    *,
+    compression: JsonlCompression = "gzip",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    JSONL as (compressed) byte chunks of about chunk_size, for HTTP streaming.
 
-    if not isinstance(snapshot, dict):
-        raise ValueError(
-            f"snapshot must be a dict, got {type(snapshot).__name__}"
-        )
+    The compressor is opened eagerly, so a missing optional dependency is
+    raised here, before a response is started.
+    """
+    sink = _ChunkBuffer()
+    writer = _open_writer(sink, compression)
 
-    lines: list[str] = []
+    def chunks() -> Iterator[bytes]:
+        try:
+            for line in lines:
+                writer.write(line.encode("utf-8") + b"\n")
+                if len(sink.buffer) >= chunk_size:
+                    yield sink.drain()
+        finally:
+            if writer is not sink:
+                writer.close()
+        if sink.buffer:
+            yield sink.drain()
 
-    # 1) Metadata line
-    meta = snapshot.get("metadata", {})
-    meta_line: dict[str, Any] = {
-        "type": "metadata",
-        "snapshot_id": meta.get("snapshot_id") or snapshot.get("snapshot_id"),
-        "created_at": meta.get("created_at") or snapshot.get("created_at"),
-        "node_count": len(snapshot.get("nodes", [])),
-        "branch_count": len(snapshot.get("branches", [])),
-    }
-    lines.append(json.dumps(meta_line, ensure_ascii=False, sort_keys=True))
-
-    # 2) Nodes
-    for node in snapshot.get("nodes", []):
-        node_line: dict[str, Any] = {"type": "node"}
-        node_line.update(_serialize_values(node))
-        lines.append(json.dumps(node_line, ensure_ascii=False, sort_keys=True))
-
-    # 3) Branches
-    for branch in snapshot.get("branches", []):
-        branch_line: dict[str, Any] = {"type": "branch"}
-        branch_line.update(_serialize_values(branch))
-        lines.append(json.dumps(branch_line, ensure_ascii=False, sort_keys=True))
-
-    # 4) Sources (optional)
-    for source in snapshot.get("sources", []):
-        source_line: dict[str, Any] = {"type": "source"}
-        source_line.update(_serialize_values(source))
-        lines.append(json.dumps(source_line, ensure_ascii=False, sort_keys=True))
-
-    # 5) Loads (optional)
-    for load in snapshot.get("loads", []):
-        load_line: dict[str, Any] = {"type": "load"}
-        load_line.update(_serialize_values(load))
-        lines.append(json.dumps(load_line, ensure_ascii=False, sort_keys=True))
-
-    out.write_text("\n".join(lines) + "\n" if lines else "", encoding="utf-8")
+    return chunks()
+
+
+class _ChunkBuffer:
+    """Write-only sink collecting compressed output between drains."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def _open_writer(fileobj: Any, compression: JsonlCompression) -> Any:
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=0)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False)
+    if compression == "none":
+        return fileobj
+    raise ValueError(f"Unsupported JSONL compression: {compression!r}")
+
+
+def _write_jsonl_file(lines: Iterable[str], output_path: str | Path) -> Path:
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with out.open("wb") as handle:
+            write_jsonl_stream(lines, handle, compression="none")
+    except ValueError:
+        out.unlink(missing_ok=True)
+        raise
     return out
 
 
@@ -1,47 +1,113 @@
 """Solvers for network model calculations."""
 
-from .short_circuit_iec60909 import (
-    C_MAX,
-    C_MIN,
-    ShortCircuitIEC60909Solver,
-    ShortCircuitResult,
-    ShortCircuitResult3PH,
-    ShortCircuitType,
-)
-from .short_circuit_contributions import (
-    ShortCircuitBranchContribution,
-    ShortCircuitSourceContribution,
-    SourceType,
-)
-from .power_flow_newton import PowerFlowNewtonSolver, PowerFlowNewtonSolution
-from .power_flow_trace import (
-    POWER_FLOW_SOLVER_VERSION,
-    PowerFlowIterationTrace,
-    PowerFlowTrace,
-    build_power_flow_trace,
-)
-from .power_flow_result import (
-    POWER_FLOW_RESULT_VERSION,
-    PowerFlowBusResult,
-    PowerFlowBranchResult,
-    PowerFlowSummary,
-    PowerFlowResultV1,
-    build_power_flow_result_v1,
-)
-from .protection_iec60255 import (
-    PROTECTION_IEC60255_SOLVER_VERSION,
-    IEC60255CurveType,
-    SelectivityVerdict,
-    RelaySettings,
-    CurveTripTimeResult,
-    I2tThermalResult,
-    SelectivityPairResult,
-    ProtectionCoordinationResult,
-    compute_curve_trip_time,
-    compute_i2t_thermal_energy,
-    check_selectivity_pair,
-    run_protection_coordination,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .short_circuit_iec60909 import (
+        C_MAX,
+        C_MIN,
+        ShortCircuitIEC60909Solver,
+        ShortCircuitResult,
+        ShortCircuitResult3PH,
+        ShortCircuitType,
+    )
+    from .short_circuit_contributions import (
+        ShortCircuitBranchContribution,
+        ShortCircuitSourceContribution,
+        SourceType,
+    )
+    from .power_flow_newton import PowerFlowNewtonSolver, PowerFlowNewtonSolution
+    from .power_flow_trace import (
+        POWER_FLOW_SOLVER_VERSION,
+        PowerFlowIterationTrace,
+        PowerFlowTrace,
+        build_power_flow_trace,
+    )
+    from .power_flow_result import (
+        POWER_FLOW_RESULT_VERSION,
+        PowerFlowBusResult,
+        PowerFlowBranchResult,
+        PowerFlowSummary,
+        PowerFlowResultV1,
+        build_power_flow_result_v1,
+    )
+    from .protection_iec60255 import (
+        PROTECTION_IEC60255_SOLVER_VERSION,
+        IEC60255CurveType,
+        SelectivityVerdict,
+        RelaySettings,
+        CurveTripTimeResult,
+        I2tThermalResult,
+        ThermalWithstandGrid,
+        SelectivityPairResult,
+        ProtectionCoordinationResult,
+        compute_curve_trip_time,
+        compute_i2t_thermal_energy,
+        compute_i2t_array,
+        compute_thermal_withstand_grid,
+        compute_trip_time_matrix,
+        check_selectivity_pair,
+        run_protection_coordination,
+    )
+
+# Submodules load on first access to an export (NetworkX / NumPy only when needed)
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".short_circuit_iec60909": (
+        "C_MAX",
+        "C_MIN",
+        "ShortCircuitIEC60909Solver",
+        "ShortCircuitResult",
+        "ShortCircuitResult3PH",
+        "ShortCircuitType",
+    ),
+    ".short_circuit_contributions": (
+        "ShortCircuitBranchContribution",
+        "ShortCircuitSourceContribution",
+        "SourceType",
+    ),
+    ".power_flow_newton": (
+        "PowerFlowNewtonSolver",
+        "PowerFlowNewtonSolution",
+    ),
+    ".power_flow_trace": (
+        "POWER_FLOW_SOLVER_VERSION",
+        "PowerFlowIterationTrace",
+        "PowerFlowTrace",
+        "build_power_flow_trace",
+    ),
+    ".power_flow_result": (
+        "POWER_FLOW_RESULT_VERSION",
+        "PowerFlowBusResult",
+        "PowerFlowBranchResult",
+        "PowerFlowSummary",
+        "PowerFlowResultV1",
+        "build_power_flow_result_v1",
+    ),
+    ".protection_iec60255": (
+        "PROTECTION_IEC60255_SOLVER_VERSION",
+        "IEC60255CurveType",
+        "SelectivityVerdict",
+        "RelaySettings",
+        "CurveTripTimeResult",
+        "I2tThermalResult",
+        "ThermalWithstandGrid",
+        "SelectivityPairResult",
+        "ProtectionCoordinationResult",
+        "compute_curve_trip_time",
+        "compute_i2t_thermal_energy",
+        "compute_i2t_array",
+        "compute_thermal_withstand_grid",
+        "compute_trip_time_matrix",
+        "check_selectivity_pair",
+        "run_protection_coordination",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "C_MAX",
@@ -71,10 +137,27 @@ __all__ = [
     "RelaySettings",
     "CurveTripTimeResult",
     "I2tThermalResult",
+    "ThermalWithstandGrid",
     "SelectivityPairResult",
     "ProtectionCoordinationResult",
     "compute_curve_trip_time",
     "compute_i2t_thermal_energy",
+    "compute_i2t_array",
+    "compute_thermal_withstand_grid",
+    "compute_trip_time_matrix",
     "check_selectivity_pair",
     "run_protection_coordination",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
@@ -9,6 +9,8 @@ SOLVER LAYER RULES:
     - WHITE BOX REQUIRED: all intermediate values exposed
     - Deterministic: same inputs -> same outputs
     - Self-contained: imports only from stdlib / numpy
+    - Batch paths (I^2*t, thermal withstand grids) are numpy array
+      computations returning the same values as the scalar functions
 
 Supported curve types:
     NI  — Normal Inverse:      t = TMS * 0.14 / ((I/Is)^0.02 - 1)
@@ -27,7 +29,9 @@ import json
 import math
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
 
 
 # =============================================================================
@@ -543,7 +547,19 @@ def compute_i2t_thermal_energy(
         raise ValueError(f"Trip time cannot be negative, got {t_trip_s}")
 
     i2t = i_fault_a * i_fault_a * t_trip_s
+    return _build_i2t_result(
+        relay_id=relay_id, i_fault_a=i_fault_a, t_trip_s=t_trip_s, i2t=i2t,
+    )
 
+
+def _build_i2t_result(
+    *,
+    relay_id: str,
+    i_fault_a: float,
+    t_trip_s: float,
+    i2t: float,
+) -> I2tThermalResult:
+    """Build I2tThermalResult (with trace) for an already computed I^2*t."""
     formula_latex = r"I^2 t = I_k^2 \cdot t_{\mathrm{trip}}"
     substitution = (
         f"I^2*t = {i_fault_a:.4f}^2 * {t_trip_s:.6f} "
@@ -573,6 +589,184 @@ def compute_i2t_thermal_energy(
     )
 
 
+# =============================================================================
+# I^2*t / THERMAL WITHSTAND — BATCH (ARRAY) ENGINE
+# =============================================================================
+
+
+def compute_i2t_array(
+    i_fault_a: Sequence[float] | np.ndarray,
+    t_trip_s: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """Element-wise I^2*t = Ik^2 * t [A^2*s] for paired currents and times.
+
+    Same arithmetic as compute_i2t_thermal_energy (Ik * Ik * t), so every
+    element equals the scalar result exactly.
+    """
+    i = np.asarray(i_fault_a, dtype=np.float64)
+    t = np.asarray(t_trip_s, dtype=np.float64)
+    if i.shape != t.shape:
+        raise ValueError(
+            f"Fault currents and trip times must have the same shape, got {i.shape} and {t.shape}"
+        )
+    if np.any(i < 0):
+        raise ValueError("Fault current cannot be negative")
+    if np.any(t < 0):
+        raise ValueError("Trip time cannot be negative")
+    return i * i * t
+
+
+@dataclass(frozen=True)
+class ThermalWithstandGrid:
+    """Thermal withstand over a grid of fault currents × clearing times.
+
+    Applies to any element rated by a 1-second thermal current: conductors
+    (I_th1s = s * j_thn) and current transformers (rated I_th).
+
+    Criterion: Ik <= I_th_dop(t) = I_th1s / sqrt(t)  (equivalently I^2*t <= I_th1s^2)
+
+    Attributes:
+        i_fault_a: Fault currents [A] (grid rows)
+        t_clear_s: Clearing times [s] (grid columns)
+        i_th_1s_a: Rated 1-second thermal current [A]
+        i2t_a2s: I^2*t surface [A^2*s] (rows × columns)
+        i_th_dop_a: Permissible thermal current per clearing time [A]
+        margin_percent: (I_th_dop - Ik) / I_th_dop * 100 (rows × columns)
+    """
+
+    i_fault_a: np.ndarray
+    t_clear_s: np.ndarray
+    i_th_1s_a: float
+    i2t_a2s: np.ndarray
+    i_th_dop_a: np.ndarray
+    margin_percent: np.ndarray
+
+    @property
+    def adequate(self) -> np.ndarray:
+        """Boolean surface: True where Ik <= I_th_dop."""
+        return self.i_fault_a[:, None] <= self.i_th_dop_a[None, :]
+
+    @property
+    def worst_index(self) -> tuple[int, int]:
+        """(row, column) of the worst-case (minimum) margin."""
+        flat = int(np.argmin(self.margin_percent))
+        row, col = np.unravel_index(flat, self.margin_percent.shape)
+        return int(row), int(col)
+
+    @property
+    def worst_margin_percent(self) -> float:
+        """Worst-case (minimum) margin over the whole grid [%]."""
+        row, col = self.worst_index
+        return float(self.margin_percent[row, col])
+
+    def to_dict(self) -> dict[str, Any]:
+        row, col = self.worst_index
+        return {
+            "i_fault_a": [round(v, 6) for v in self.i_fault_a.tolist()],
+            "t_clear_s": [round(v, 6) for v in self.t_clear_s.tolist()],
+            "i_th_1s_a": round(self.i_th_1s_a, 6),
+            "i2t_a2s": [[round(v, 6) for v in r] for r in self.i2t_a2s.tolist()],
+            "i_th_dop_a": [round(v, 6) for v in self.i_th_dop_a.tolist()],
+            "margin_percent": [
+                [round(v, 6) for v in r] for r in self.margin_percent.tolist()
+            ],
+            "worst_case": {
+                "i_fault_a": round(float(self.i_fault_a[row]), 6),
+                "t_clear_s": round(float(self.t_clear_s[col]), 6),
+                "margin_percent": round(self.worst_margin_percent, 6),
+            },
+        }
+
+
+def compute_thermal_withstand_grid(
+    *,
+    i_fault_a: Sequence[float] | np.ndarray,
+    t_clear_s: Sequence[float] | np.ndarray,
+    i_th_1s_a: float,
+) -> ThermalWithstandGrid:
+    """Evaluate thermal withstand for every (fault current, clearing time) pair.
+
+    One array computation for the whole grid:
+        I^2*t      = Ik^2 * t
+        I_th_dop   = I_th1s / sqrt(t)
+        margin [%] = (I_th_dop - Ik) / I_th_dop * 100
+
+    Args:
+        i_fault_a: Fault currents [A] (>= 0)
+        t_clear_s: Clearing times [s] (> 0)
+        i_th_1s_a: Rated 1-second thermal current [A] (> 0)
+
+    Returns:
+        ThermalWithstandGrid with read-only surfaces
+    """
+    i = np.array(i_fault_a, dtype=np.float64).reshape(-1)
+    t = np.array(t_clear_s, dtype=np.float64).reshape(-1)
+    if i.size == 0 or t.size == 0:
+        raise ValueError("Grid requires at least one fault current and one clearing time")
+    if np.any(i < 0):
+        raise ValueError("Fault current cannot be negative")
+    if np.any(t <= 0):
+        raise ValueError("Clearing time must be positive")
+    if i_th_1s_a <= 0:
+        raise ValueError(f"Rated thermal current must be positive, got {i_th_1s_a}")
+
+    i2t = np.multiply.outer(i * i, t)
+    i_th_dop = i_th_1s_a / np.sqrt(t)
+    margin = (i_th_dop[None, :] - i[:, None]) / i_th_dop[None, :] * 100
+
+    for array in (i, t, i2t, i_th_dop, margin):
+        array.setflags(write=False)
+
+    return ThermalWithstandGrid(
+        i_fault_a=i,
+        t_clear_s=t,
+        i_th_1s_a=float(i_th_1s_a),
+        i2t_a2s=i2t,
+        i_th_dop_a=i_th_dop,
+        margin_percent=margin,
+    )
+
+
+def compute_trip_time_matrix(
+    relays: Sequence[RelaySettings],
+    fault_currents_a: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """Trip times of every relay at every fault current [s] (relays × currents).
+
+    One array computation with the same arithmetic as compute_curve_trip_time:
+        IDMT: t = round(TMS * A / max((I/Is)^B - 1, 1e-12), 6)
+        DT:   t = TMS
+    NaN where the relay does not trip (I/Is <= 1).
+    """
+    i = np.asarray(fault_currents_a, dtype=np.float64).reshape(-1)
+    if np.any(i < 0):
+        raise ValueError("Fault current cannot be negative")
+    for relay in relays:
+        if relay.pickup_current_a <= 0:
+            raise ValueError(
+                f"Pickup current must be positive, got {relay.pickup_current_a}"
+            )
+        if relay.tms <= 0:
+            raise ValueError(f"TMS must be positive, got {relay.tms}")
+
+    pickup = np.array([r.pickup_current_a for r in relays], dtype=np.float64)
+    tms = np.array([r.tms for r in relays], dtype=np.float64)
+    is_dt = np.array([r.curve_type == IEC60255CurveType.DT for r in relays], dtype=bool)
+    params = [
+        IEC60255_CURVE_PARAMS.get(r.curve_type, (0.0, 1.0)) for r in relays
+    ]
+    a = np.array([p[0] for p in params], dtype=np.float64)
+    b = np.array([p[1] for p in params], dtype=np.float64)
+
+    m = i[None, :] / pickup[:, None]
+    with np.errstate(over="ignore", invalid="ignore"):
+        denominator = np.maximum(np.power(m, b[:, None]) - 1.0, 1e-12)
+        idmt = np.round(tms[:, None] * (a[:, None] / denominator), 6)
+    times = np.where(is_dt[:, None], tms[:, None], idmt)
+    times[m <= 1.0] = np.nan
+    return times
+
+
 # =============================================================================
 # SELECTIVITY CHECK
 # =============================================================================
@@ -688,7 +882,9 @@ def run_protection_coordination(
     3. Compute I^2*t thermal energy
 
     Args:
-        relay_pairs: Tuple of (upstream, downstream) RelaySettings pairs
+        relay_pairs: Tuple of (upstream, downstream) RelaySettings pairs;
+            derive them from topology with
+            enm.relay_pairs.RelayPairIndex.coordination_pairs(settings_by_ref)
         fault_currents_a: Tuple of fault currents to check [A]
         required_margin_s: Required grading margin [s]
 
@@ -696,7 +892,6 @@ def run_protection_coordination(
         ProtectionCoordinationResult — frozen, with full white_box_trace
     """
     all_selectivity: list[SelectivityPairResult] = []
-    all_i2t: list[I2tThermalResult] = []
     pair_ids: list[tuple[str, str]] = []
     trace_steps: list[dict[str, Any]] = []
 
@@ -712,38 +907,6 @@ def run_protection_coordination(
         )
         all_selectivity.extend(pair_results)
 
-        # I^2*t for each relay at each fault current
-        for i_fault in fault_currents_a:
-            # Upstream I^2*t
-            up_trip = compute_curve_trip_time(
-                curve_type=upstream.curve_type,
-                i_fault_a=i_fault,
-                is_pickup_a=upstream.pickup_current_a,
-                tms=upstream.tms,
-            )
-            if up_trip.calculated_time_s is not None:
-                up_i2t = compute_i2t_thermal_energy(
-                    relay_id=upstream.relay_id,
-                    i_fault_a=i_fault,
-                    t_trip_s=up_trip.calculated_time_s,
-                )
-                all_i2t.append(up_i2t)
-
-            # Downstream I^2*t
-            dn_trip = compute_curve_trip_time(
-                curve_type=downstream.curve_type,
-                i_fault_a=i_fault,
-                is_pickup_a=downstream.pickup_current_a,
-                tms=downstream.tms,
-            )
-            if dn_trip.calculated_time_s is not None:
-                dn_i2t = compute_i2t_thermal_energy(
-                    relay_id=downstream.relay_id,
-                    i_fault_a=i_fault,
-                    t_trip_s=dn_trip.calculated_time_s,
-                )
-                all_i2t.append(dn_i2t)
-
         # Trace for this pair
         trace_steps.append({
             "pair": [upstream.relay_id, downstream.relay_id],
@@ -762,15 +925,35 @@ def run_protection_coordination(
     else:
         overall = SelectivityVerdict.PASS
 
-    # Deduplicate I^2*t results (same relay+current may appear from
-    # multiple pairs)
+    # I^2*t for every relay at every fault current: one trip-time matrix
+    # and one I^2*t array; results in pair order (upstream, downstream per
+    # current), deduplicated by (relay, current) across pairs
+    relays = list(dict.fromkeys(r for pair in relay_pairs for r in pair))
+    row_of = {relay: k for k, relay in enumerate(relays)}
+    trip_times = compute_trip_time_matrix(relays, fault_currents_a)
+    tripping = np.argwhere(~np.isnan(trip_times))
+    currents = np.asarray(fault_currents_a, dtype=np.float64)
+    i2t = np.full(trip_times.shape, np.nan)
+    i2t[tripping[:, 0], tripping[:, 1]] = compute_i2t_array(
+        currents[tripping[:, 1]], trip_times[tripping[:, 0], tripping[:, 1]],
+    )
+
     seen_i2t: set[tuple[str, float]] = set()
     unique_i2t: list[I2tThermalResult] = []
-    for r in all_i2t:
-        key = (r.relay_id, r.i_fault_a)
-        if key not in seen_i2t:
-            seen_i2t.add(key)
-            unique_i2t.append(r)
+    for upstream, downstream in relay_pairs:
+        for col, i_fault in enumerate(fault_currents_a):
+            for relay in (upstream, downstream):
+                row = row_of[relay]
+                key = (relay.relay_id, round(i_fault, 6))
+                if np.isnan(trip_times[row, col]) or key in seen_i2t:
+                    continue
+                seen_i2t.add(key)
+                unique_i2t.append(_build_i2t_result(
+                    relay_id=relay.relay_id,
+                    i_fault_a=i_fault,
+                    t_trip_s=float(trip_times[row, col]),
+                    i2t=float(i2t[row, col]),
+                ))
 
     # Build full white-box trace
     full_trace: dict[str, Any] = {
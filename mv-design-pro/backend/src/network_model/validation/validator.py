@@ -20,8 +20,6 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Set
 
-import networkx as nx
-
 
 class Severity(Enum):
     """Validation issue severity."""
@@ -0,0 +1,90 @@
+"""
+Tests for chunked cloud backup and chunk-level incremental export endpoints.
+
+Routers mounted on a dedicated app (they are not part of api.main).
+"""
+from __future__ import annotations
+
+import pytest
+
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.cloud_backup import router as cloud_backup_router
+from api.dependencies import get_uow_factory
+from api.incremental_archive import router as incremental_router
+from api.projects import router as projects_router
+from infrastructure.cloud_backup import (
+    CloudBackendType,
+    CloudBackupConfig,
+    LocalBackupProvider,
+)
+
+
+@pytest.fixture()
+def backup_client(uow_factory, tmp_path):
+    app = FastAPI()
+    app.include_router(projects_router)
+    app.include_router(cloud_backup_router)
+    app.include_router(incremental_router)
+    app.state.uow_factory = uow_factory
+    app.state.cloud_backup_provider = LocalBackupProvider(
+        CloudBackupConfig(
+            backend=CloudBackendType.LOCAL,
+            bucket_name=str(tmp_path / "bucket"),
+        )
+    )
+    app.dependency_overrides[get_uow_factory] = lambda: uow_factory
+    with TestClient(app) as client:
+        yield client
+
+
+class TestChunkedBackupApi:
+    def test_backup_dedups_and_restores(self, backup_client):
+        project = backup_client.post("/api/projects", json={"name": "Kopia SN-02"}).json()
+        pid = project["id"]
+
+        first = backup_client.post(f"/projects/{pid}/backup")
+        second = backup_client.post(f"/projects/{pid}/backup")
+        assert first.status_code == 200, first.text
+        assert first.json()["chunks_uploaded"] == first.json()["chunks_total"]
+        assert second.json()["chunks_uploaded"] == 0
+
+        backups = backup_client.get(f"/projects/{pid}/backups").json()["backups"]
+        restored = backup_client.post(f"/projects/{pid}/restore/{backups[0]['backup_id']}")
+        assert restored.status_code == 200, restored.text
+
+    def test_delete_prunes_chunks_of_last_backup(self, backup_client):
+        project = backup_client.post("/api/projects", json={"name": "Kopia SN-04"}).json()
+        pid = project["id"]
+        chunks_total = backup_client.post(f"/projects/{pid}/backup").json()["chunks_total"]
+        backup_client.post(f"/projects/{pid}/backup")
+        backups = backup_client.get(f"/projects/{pid}/backups").json()["backups"]
+
+        shared = backup_client.delete(f"/projects/{pid}/backups/{backups[0]['backup_id']}")
+        assert shared.status_code == 200, shared.text
+        assert shared.json()["chunks_pruned"] == 0
+
+        last = backup_client.delete(f"/projects/{pid}/backups/{backups[1]['backup_id']}")
+        assert last.json()["chunks_pruned"] == chunks_total
+        provider = backup_client.app.state.cloud_backup_provider
+        assert provider._list_chunk_hashes(pid) == set()
+
+    def test_incremental_export_roundtrip(self, backup_client):
+        project = backup_client.post("/api/projects", json={"name": "Delta SN-03"}).json()
+        pid = project["id"]
+
+        first = backup_client.post(f"/projects/{pid}/export/incremental")
+        assert first.status_code == 200, first.text
+        assert first.headers["X-Chunks-Changed"] == "0"
+
+        second = backup_client.post(f"/projects/{pid}/export/incremental")
+        imported = backup_client.post(
+            f"/projects/{pid}/import/incremental",
+            files={"file": ("delta.mvdp-delta.zip", second.content, "application/zip")},
+        )
+        assert imported.status_code == 200, imported.text
+        assert imported.json()["sections_applied"] == 0
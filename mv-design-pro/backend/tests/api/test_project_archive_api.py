@@ -0,0 +1,42 @@
+"""
+Tests for Project Archive API — streamed export and import.
+"""
+from __future__ import annotations
+
+import io
+import zipfile
+
+import pytest
+
+
+pytest.importorskip("fastapi")
+
+
+class TestProjectArchiveApi:
+    def test_export_streams_archive_and_import_roundtrips(self, app_client):
+        project = app_client.post("/api/projects", json={"name": "Archiwum SN-01"}).json()
+
+        exported = app_client.post(f"/projects/{project['id']}/export")
+        assert exported.status_code == 200
+        assert exported.headers["content-type"] == "application/zip"
+        with zipfile.ZipFile(io.BytesIO(exported.content)) as zf:
+            assert "project_meta.json" in zf.namelist()
+
+        imported = app_client.post(
+            "/projects/import",
+            files={"file": ("archiwum.mvdp.zip", exported.content, "application/zip")},
+            data={"new_name": "Kopia SN-01"},
+        )
+        assert imported.status_code == 200
+        assert imported.json()["status"] == "SUCCESS", imported.json()["errors"]
+
+        preview = app_client.post(
+            "/projects/import/preview",
+            files={"file": ("archiwum.mvdp.zip", exported.content, "application/zip")},
+        )
+        assert preview.json()["valid"] is True
+        assert preview.json()["project_name"] == "Archiwum SN-01"
+
+    def test_export_unknown_project_404(self, app_client):
+        resp = app_client.post("/projects/00000000-0000-0000-0000-000000000000/export")
+        assert resp.status_code == 404
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import json
 import zipfile
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -88,13 +89,13 @@ def _prepare_api_client(tmp_path):
     )
     AnalysisRunRepository(session).create(run)
 
-    proof = _build_sc3f_proof()
-    ResultRepository(session).add_result(
-        run_id=run_id,
-        project_id=project_id,
-        result_type="proof_document",
-        payload=proof.to_dict(),
-    )
+    for _ in range(2):
+        ResultRepository(session).add_result(
+            run_id=run_id,
+            project_id=project_id,
+            result_type="proof_document",
+            payload=_build_sc3f_proof().to_dict(),
+        )
 
     missing_run_id = uuid4()
     run_missing = AnalysisRun(
@@ -134,6 +135,24 @@ def test_proof_pack_api_returns_zip(tmp_path):
     assert "proof_pack/proof.tex" in names
 
 
+def test_project_proof_pack_api_streams_all_run_proofs(tmp_path):
+    client, data = _prepare_api_client(tmp_path)
+    base = f"/api/proof/{data['project_id']}/{data['case_id']}"
+
+    response = client.get(f"{base}/{data['run_id']}/project-pack")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        assert zf.testzip() is None
+        manifest = json.loads(zf.read("proof_pack/manifest.json"))
+    assert [proof["path"] for proof in manifest["proofs"]] == [
+        "documents/000001_SC3F_IEC60909/",
+        "documents/000002_SC3F_IEC60909/",
+    ]
+
+    assert client.get(f"{base}/{data['missing_run_id']}/project-pack").status_code == 404
+
+
 def test_proof_pack_api_404_when_missing(tmp_path):
     client, data = _prepare_api_client(tmp_path)
 
@@ -384,6 +384,35 @@ class TestSelectivityCheck:
         assert check.t_upstream_s > check.t_downstream_s
         assert check.margin_s > 0
 
+    def test_selectivity_uses_relay_pairs_over_device_order(
+        self,
+        default_config: CoordinationConfig,
+        sample_device: ProtectionDevice,
+        sample_upstream_device: ProtectionDevice,
+    ):
+        """Pairs from the topology relay pair index win over device order."""
+        fault_1 = FaultCurrentData(location_id="bus_1", ik_max_3f_a=5000.0, ik_min_3f_a=2000.0)
+        upstream_id = str(sample_upstream_device.id)
+        downstream_id = str(sample_device.id)
+
+        input_data = CoordinationInput(
+            devices=(sample_upstream_device, sample_device),  # upstream first
+            fault_currents=(fault_1,),
+            operating_currents=(),
+            config=default_config,
+            relay_pairs=((upstream_id, downstream_id), (upstream_id, "missing")),
+        )
+
+        result = OvercurrentCoordinationAnalyzer(config=default_config).analyze(input_data)
+
+        assert [
+            (c.upstream_device_id, c.downstream_device_id) for c in result.selectivity_checks
+        ] == [(upstream_id, downstream_id)]
+        assert result.selectivity_checks[0].margin_s > 0
+        assert input_data.to_dict()["relay_pairs"] == [
+            [upstream_id, downstream_id], [upstream_id, "missing"],
+        ]
+
     def test_selectivity_fail_negative_margin(self, default_config: CoordinationConfig):
         """Test selectivity FAIL when upstream trips before downstream."""
         # Create upstream with LOWER TMS than downstream (wrong coordination)
@@ -0,0 +1,437 @@
+"""
+Testy obwiedni pradow zwarciowych (Fault Envelope).
+
+- Tabela zgodna z bezposrednimi obliczeniami solvera IEC 60909
+- Wezly wspolne liczone raz (jedno przejscie zwarciowe)
+- Cache per snapshot: ponowne sprawdzenia bez obliczen zwarciowych
+- Sanity checks i dobor I>> korzystaja z tej samej tabeli
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from application.analyses.protection.base_values.models import (
+    BaseValues,
+    BaseValueSourceIn,
+    BaseValueSourceUn,
+    ProtectionSetpoint,
+    ProtectionSetpointBasis,
+    ProtectionSetpointOperator,
+)
+from application.analyses.protection.fault_envelope import builder as envelope_builder
+from application.analyses.protection.fault_envelope import (
+    FAULT_ENVELOPE_COLUMNS,
+    ProtectedElementSpan,
+    clear_fault_envelope_cache,
+    get_fault_envelope,
+    sweep_fault_envelope,
+)
+from application.analyses.protection.line_overcurrent_setting import (
+    ConductorData,
+    ConductorMaterial,
+    LineOvercurrentSettingAnalyzer,
+    LineOvercurrentSettingInput,
+)
+from application.analyses.protection.sanity_checks import (
+    ElementContext,
+    ElementSanityInput,
+    ProtectionFunctionSummary,
+    SanityCheckCode,
+    run_sanity_checks,
+    run_sanity_checks_for_snapshot,
+)
+from application.reference_patterns.pattern_line_i_doubleprime_thermal_spz import (
+    run_pattern_a,
+)
+from network_model.core.branch import BranchType, LineBranch, TransformerBranch
+from network_model.core.graph import NetworkGraph
+from network_model.core.node import Node, NodeType
+from network_model.solvers.short_circuit_core import build_zbus
+from network_model.solvers.short_circuit_iec60909 import (
+    C_MAX,
+    C_MIN,
+    ShortCircuitIEC60909Solver,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _node(node_id: str, voltage_kv: float) -> Node:
+    return Node(
+        id=node_id,
+        name=node_id,
+        node_type=NodeType.PQ,
+        voltage_level=voltage_kv,
+        active_power=0.0,
+        reactive_power=0.0,
+    )
+
+
+def _line(branch_id: str, from_id: str, to_id: str, r: float, x: float) -> LineBranch:
+    return LineBranch(
+        id=branch_id,
+        name=branch_id,
+        branch_type=BranchType.LINE,
+        from_node_id=from_id,
+        to_node_id=to_id,
+        r_ohm_per_km=r,
+        x_ohm_per_km=x,
+        b_us_per_km=0.0,
+        length_km=1.0,
+        rated_current_a=0.0,
+    )
+
+
+def _graph() -> NetworkGraph:
+    """A (110 kV, SLACK) → T1 → B (20 kV) → L1 → C → L2 → D."""
+    graph = NetworkGraph()
+    graph.add_node(Node(
+        id="A",
+        name="A",
+        node_type=NodeType.SLACK,
+        voltage_level=110.0,
+        voltage_magnitude=1.0,
+        voltage_angle=0.0,
+    ))
+    for node_id in ("B", "C", "D"):
+        graph.add_node(_node(node_id, 20.0))
+    graph.add_branch(TransformerBranch(
+        id="T1",
+        name="T1",
+        branch_type=BranchType.TRANSFORMER,
+        from_node_id="A",
+        to_node_id="B",
+        in_service=True,
+        rated_power_mva=25.0,
+        voltage_hv_kv=110.0,
+        voltage_lv_kv=20.0,
+        uk_percent=10.0,
+        pk_kw=120.0,
+        i0_percent=0.0,
+        p0_kw=0.0,
+        vector_group="Dyn11",
+        tap_position=0,
+        tap_step_percent=2.5,
+    ))
+    graph.add_branch(_line("L1", "B", "C", 0.2, 0.4))
+    graph.add_branch(_line("L2", "C", "D", 0.3, 0.4))
+    return graph
+
+
+ELEMENTS = (
+    ProtectedElementSpan(element_id="L2", near_node_id="C", far_node_id="D"),
+    ProtectedElementSpan(element_id="L1", near_node_id="B", far_node_id="C"),
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_fault_envelope_cache()
+    yield
+    clear_fault_envelope_cache()
+
+
+def _count_zbus_builds(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    original = envelope_builder.build_zbus
+
+    def counting(graph):
+        calls.append(len(graph.nodes))
+        return original(graph)
+
+    monkeypatch.setattr(envelope_builder, "build_zbus", counting)
+    return calls
+
+
+def _setpoint_in(multiplier: float) -> ProtectionSetpoint:
+    return ProtectionSetpoint(
+        basis=ProtectionSetpointBasis.IN,
+        operator=ProtectionSetpointOperator.GT,
+        multiplier=multiplier,
+        unit="pu",
+        display_pl=f"{multiplier}×In",
+    )
+
+
+def _base_values() -> BaseValues:
+    return BaseValues(
+        un_kv=20.0,
+        in_a=400.0,
+        source_un=BaseValueSourceUn.BUS,
+        source_in=BaseValueSourceIn.LINE,
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestFaultEnvelopeSweep:
+    def test_matches_direct_solver_results(self):
+        graph = _graph()
+        table = sweep_fault_envelope(graph, ELEMENTS, snapshot_fingerprint="snap-1", tk_s=1.0)
+
+        assert table.element_ids == ("L1", "L2")
+        row = table.row("L1")
+        ik3_max_c = ShortCircuitIEC60909Solver.compute_3ph_short_circuit(
+            graph=graph, fault_node_id="C", c_factor=C_MAX, tk_s=1.0,
+        )
+        ik2_min_b = ShortCircuitIEC60909Solver.compute_2ph_short_circuit(
+            graph=graph, fault_node_id="B", c_factor=C_MIN, tk_s=1.0,
+        )
+        ik3_max_b = ShortCircuitIEC60909Solver.compute_3ph_short_circuit(
+            graph=graph, fault_node_id="B", c_factor=C_MAX, tk_s=1.0,
+        )
+        assert math.isclose(row.ik3_max_far_a, ik3_max_c.ikss_a)
+        assert math.isclose(row.ik2_min_near_a, ik2_min_b.ikss_a)
+        assert math.isclose(row.ith_a, ik3_max_b.ith_a)
+        assert row.ik3_min_near_a < row.ik3_max_near_a
+        assert row.ik3_max_far_a < row.ik3_max_near_a
+
+    def test_1f_from_z0_matches_direct_solver_results(self):
+        graph = _graph()
+        _, z0_bus = build_zbus(graph)
+        table = sweep_fault_envelope(
+            graph, ELEMENTS, snapshot_fingerprint="snap-1", z0_bus=z0_bus,
+        )
+
+        row = table.row("L2")
+        for c_factor, node_id, value in (
+            (C_MIN, "C", row.ik1_min_near_a),
+            (C_MAX, "C", row.ik1_max_near_a),
+            (C_MIN, "D", row.ik1_min_far_a),
+        ):
+            direct = ShortCircuitIEC60909Solver.compute_1ph_short_circuit(
+                graph=graph, fault_node_id=node_id, c_factor=c_factor, tk_s=1.0,
+                z0_bus=z0_bus,
+            )
+            assert math.isclose(value, direct.ikss_a)
+
+    def test_missing_1f_without_z0(self):
+        table = sweep_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+
+        row = table.row("L2")
+        assert row.ik1_min_near_a is None
+        assert row.ik1_max_far_a is None
+        assert math.isnan(table.column("ik1_max_far_a")[0])
+
+    def test_zbus_built_once_for_all_nodes(self, monkeypatch):
+        calls = _count_zbus_builds(monkeypatch)
+
+        sweep_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+
+        # One Zbus for unique nodes B, C, D × (3F, 2F) × (c_min, c_max)
+        assert calls == [4]
+
+    def test_table_is_columnar_and_read_only(self):
+        table = sweep_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+
+        assert table.values.shape == (2, len(FAULT_ENVELOPE_COLUMNS))
+        with pytest.raises(ValueError):
+            table.values[0, 0] = 0.0
+        assert table.to_dict()["columns"]["ik3_max_near_a"][1] == table.row("L2").ik3_max_near_a
+
+    def test_deterministic(self):
+        first = sweep_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+        second = sweep_fault_envelope(_graph(), tuple(reversed(ELEMENTS)), snapshot_fingerprint="snap-1")
+
+        assert first.to_dict() == second.to_dict()
+
+
+class TestFaultEnvelopeReuse:
+    def test_cached_per_snapshot(self, monkeypatch):
+        graph = _graph()
+        first = get_fault_envelope(graph, ELEMENTS, snapshot_fingerprint="snap-1")
+        calls = _count_zbus_builds(monkeypatch)
+
+        second = get_fault_envelope(graph, reversed(ELEMENTS), snapshot_fingerprint="snap-1")
+
+        assert second is first
+        assert calls == []
+
+    def test_cache_key_includes_z0(self):
+        graph = _graph()
+        _, z0_bus = build_zbus(graph)
+
+        without_z0 = get_fault_envelope(graph, ELEMENTS, snapshot_fingerprint="snap-1")
+        with_z0 = get_fault_envelope(
+            graph, ELEMENTS, snapshot_fingerprint="snap-1", z0_bus=z0_bus,
+        )
+
+        assert with_z0 is not without_z0
+        assert without_z0.row("L2").ik1_max_near_a is None
+        assert with_z0.row("L2").ik1_max_near_a is not None
+        assert get_fault_envelope(
+            graph, ELEMENTS, snapshot_fingerprint="snap-1", z0_bus=z0_bus.copy(),
+        ) is with_z0
+
+    def test_sanity_checks_rerun_without_short_circuit_work(self, monkeypatch):
+        table = get_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+        calls = _count_zbus_builds(monkeypatch)
+        ctx = ElementContext(
+            element_id="L2", element_type="LINE", fault_envelope=table.row("L2"),
+        )
+        ik_max = table.row("L2").ik3_max_near_a
+
+        for multiplier in (1.5, 2.0, ik_max / 400.0 + 1.0):
+            functions = [
+                ProtectionFunctionSummary(
+                    code="OVERCURRENT_TIME", ansi=("51",), label_pl="I>",
+                    setpoint=_setpoint_in(1.2),
+                ),
+                ProtectionFunctionSummary(
+                    code="OVERCURRENT_INST", ansi=("50",), label_pl="I>>",
+                    setpoint=_setpoint_in(multiplier),
+                ),
+            ]
+            results = run_sanity_checks(functions, _base_values(), ctx)
+
+        codes = {r.code for r in results}
+        assert SanityCheckCode.OC_I_INST_ABOVE_IK_MAX in codes
+        assert SanityCheckCode.OC_I_GT_ABOVE_IK_MIN not in codes
+        assert calls == []
+
+    def test_i_gt_above_ik_min_far(self):
+        table = get_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+        row = table.row("L2")
+        ctx = ElementContext(element_id="L2", element_type="LINE", fault_envelope=row)
+        functions = [
+            ProtectionFunctionSummary(
+                code="OVERCURRENT_TIME", ansi=("51",), label_pl="I>",
+                setpoint=_setpoint_in(row.ik2_min_far_a / 400.0 + 0.5),
+            ),
+        ]
+
+        results = run_sanity_checks(functions, _base_values(), ctx)
+
+        assert any(r.code == SanityCheckCode.OC_I_GT_ABOVE_IK_MIN for r in results)
+
+    def test_no_envelope_no_envelope_findings(self):
+        ctx = ElementContext(element_id="L2", element_type="LINE")
+        functions = [
+            ProtectionFunctionSummary(
+                code="OVERCURRENT_INST", ansi=("50",), label_pl="I>>",
+                setpoint=_setpoint_in(1000.0),
+            ),
+        ]
+
+        results = run_sanity_checks(functions, _base_values(), ctx)
+
+        assert all(r.code != SanityCheckCode.OC_I_INST_ABOVE_IK_MAX for r in results)
+
+    def test_sanity_checks_take_row_from_table(self):
+        table = get_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+        ctx = ElementContext(element_id="L2", element_type="LINE")
+        functions = [
+            ProtectionFunctionSummary(
+                code="OVERCURRENT_INST", ansi=("50",), label_pl="I>>",
+                setpoint=_setpoint_in(1000.0),
+            ),
+        ]
+
+        results = run_sanity_checks(functions, _base_values(), ctx, fault_envelope=table)
+
+        assert any(r.code == SanityCheckCode.OC_I_INST_ABOVE_IK_MAX for r in results)
+
+    def test_snapshot_sanity_checks_build_envelope_once(self, monkeypatch):
+        calls = _count_zbus_builds(monkeypatch)
+        functions = (
+            ProtectionFunctionSummary(
+                code="OVERCURRENT_INST", ansi=("50",), label_pl="I>>",
+                setpoint=_setpoint_in(1000.0),
+            ),
+        )
+        elements = [
+            ElementSanityInput(
+                span=span, element_type="LINE", functions=functions,
+                base_values=_base_values(),
+            )
+            for span in ELEMENTS
+        ]
+
+        for _ in range(2):
+            results = run_sanity_checks_for_snapshot(
+                _graph(), elements, snapshot_fingerprint="snap-1",
+            )
+
+        flagged = [
+            r.element_id for r in results if r.code == SanityCheckCode.OC_I_INST_ABOVE_IK_MAX
+        ]
+        assert flagged == ["L1", "L2"]
+        assert calls == [4]
+
+    def test_element_context_serializes_envelope_only_when_set(self):
+        table = get_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+
+        assert "fault_envelope" not in ElementContext("L2", "LINE").to_dict()
+        payload = ElementContext("L2", "LINE", fault_envelope=table.row("L2")).to_dict()
+        assert payload["fault_envelope"] == table.row("L2").to_dict()
+
+    def test_line_overcurrent_analysis_uses_envelope(self):
+        table = get_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+        l1, l2 = table.row("L1"), table.row("L2")
+        base_input = LineOvercurrentSettingInput(
+            line_id="L1",
+            line_name="Linia L1",
+            ct_ratio=80.0,
+            conductor=ConductorData(
+                material=ConductorMaterial.XLPE_AL,
+                cross_section_mm2=150.0,
+                jthn_a_mm2=94.0,
+            ),
+        )
+        explicit = LineOvercurrentSettingInput(
+            line_id="L1",
+            line_name="Linia L1",
+            ct_ratio=80.0,
+            conductor=base_input.conductor,
+            ik_max_busbars_a=l1.ik3_max_near_a,
+            ik_min_busbars_a=l1.ik3_min_near_a,
+            ik_max_next_protection_a=l2.ik3_max_near_a,
+            ik_min_2f_busbars_a=l1.ik2_min_near_a,
+        )
+        analyzer = LineOvercurrentSettingAnalyzer()
+
+        from_envelope = analyzer.analyze_with_envelope(base_input, l1, next_protection=l2)
+        direct = analyzer.analyze(explicit)
+
+        assert from_envelope.input_data == direct.input_data
+        assert from_envelope.setting_window == direct.setting_window
+        assert from_envelope.overall_verdict == direct.overall_verdict
+
+    def test_reference_pattern_uses_envelope(self):
+        table = get_fault_envelope(_graph(), ELEMENTS, snapshot_fingerprint="snap-1")
+        l1, l2 = table.row("L1"), table.row("L2")
+        conductor = ConductorData(
+            material=ConductorMaterial.XLPE_AL,
+            cross_section_mm2=150.0,
+            jthn_a_mm2=94.0,
+        )
+        base_input = LineOvercurrentSettingInput(
+            line_id="L1", line_name="Linia L1", ct_ratio=80.0, conductor=conductor,
+        )
+        explicit = LineOvercurrentSettingInput(
+            line_id="L1",
+            line_name="Linia L1",
+            ct_ratio=80.0,
+            conductor=conductor,
+            ik_max_busbars_a=l1.ik3_max_near_a,
+            ik_min_busbars_a=l1.ik3_min_near_a,
+            ik_max_next_protection_a=l2.ik3_max_near_a,
+            ik_min_2f_busbars_a=l1.ik2_min_near_a,
+        )
+
+        from_envelope = run_pattern_a(
+            input_data=base_input, fault_envelope=table, next_protection_id="L2",
+        )
+        direct = run_pattern_a(input_data=explicit)
+
+        assert from_envelope.verdict == direct.verdict
+        assert from_envelope.artifacts == direct.artifacts
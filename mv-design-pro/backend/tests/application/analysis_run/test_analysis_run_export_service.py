@@ -12,6 +12,7 @@ backend_src = Path(__file__).parents[3] / "src"
 sys.path.insert(0, str(backend_src))
 
 from application.analysis_run import AnalysisRunExportService
+from application.report_rendering import ReportRenderingService
 from domain.analysis_run import AnalysisRun
 from domain.models import OperatingCase, Project
 from domain.project_design_mode import ProjectDesignMode
@@ -26,7 +27,9 @@ from infrastructure.persistence.repositories import (
 from infrastructure.persistence.unit_of_work import build_uow_factory
 
 
-def _build_export_service() -> tuple[AnalysisRunExportService, dict[str, UUID]]:
+def _build_export_service(
+    renderer: ReportRenderingService | None = None,
+) -> tuple[AnalysisRunExportService, dict[str, UUID]]:
     engine = create_engine_from_url("sqlite+pysqlite:///:memory:")
     init_db(engine)
     session_factory = create_session_factory(engine)
@@ -106,7 +109,7 @@ def _build_export_service() -> tuple[AnalysisRunExportService, dict[str, UUID]]:
     SldRepository(session).save(project_id=project_id, name="Main", payload=sld_payload)
     session.close()
 
-    service = AnalysisRunExportService(uow_factory)
+    service = AnalysisRunExportService(uow_factory, renderer)
     return service, {"run_id": run_id}
 
 
@@ -153,3 +156,65 @@ def test_export_bundle_exposes_catalog_context_and_step_provenance() -> None:
         "rx_ratio": 0.1,
     }
     assert bundle["white_box_trace"][0]["manual_override_count"] == 1
+
+
+def test_rendered_reports_are_cached_per_run_and_report_type(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, data = _build_export_service(ReportRenderingService())
+    built: list[UUID] = []
+    build_bundle = service.export_run_bundle
+    monkeypatch.setattr(
+        service, "export_run_bundle", lambda run_id: built.append(run_id) or build_bundle(run_id)
+    )
+
+    first = service.export_run_pdf(data["run_id"])
+    second = service.export_run_pdf(data["run_id"])
+    assert first.startswith(b"%PDF")
+    assert second == first
+    assert built == [data["run_id"]]
+
+    # Only the missing DOCX needs the bundle; the PDF comes from the cache
+    pdf, docx = service.export_run_reports(
+        data["run_id"], ["analysis_run_pdf", "analysis_run_docx"]
+    )
+    assert pdf == first
+    assert docx.startswith(b"PK")
+    assert built == [data["run_id"], data["run_id"]]
+
+
+def test_rendered_reports_follow_project_case_and_sld_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from dataclasses import replace
+
+    service, data = _build_export_service(ReportRenderingService())
+    built: list[UUID] = []
+    build_bundle = service.export_run_bundle
+    monkeypatch.setattr(
+        service, "export_run_bundle", lambda run_id: built.append(run_id) or build_bundle(run_id)
+    )
+    service.export_run_pdf(data["run_id"])
+
+    with service._uow_factory() as uow:
+        run = uow.analysis_runs.get(data["run_id"], include_payloads=False)
+        project = uow.projects.get(run.project_id)
+        uow.projects.update(replace(project, name="Renamed Project"), commit=False)
+    service.export_run_pdf(data["run_id"])
+    assert len(built) == 2
+
+    with service._uow_factory() as uow:
+        case = uow.cases.get_operating_case(run.operating_case_id)
+        uow.cases.update_operating_case(replace(case, name="Renamed Case"), commit=False)
+    service.export_run_pdf(data["run_id"])
+    assert len(built) == 3
+
+    with service._uow_factory() as uow:
+        (diagram,) = uow.sld.list_by_project(run.project_id)
+        moved = [{**node, "x": 10.0} for node in diagram["payload"]["nodes"]]
+        uow.sld.update_payload(
+            diagram["id"], {**diagram["payload"], "nodes": moved}, commit=False
+        )
+    service.export_run_pdf(data["run_id"])
+    service.export_run_pdf(data["run_id"])
+    assert len(built) == 4
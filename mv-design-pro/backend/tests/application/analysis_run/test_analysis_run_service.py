@@ -634,3 +634,68 @@ def test_short_circuit_results_are_deterministic() -> None:
     assert first.status == "FINISHED"
     assert second.status == "FINISHED"
     assert first_results == second_results
+
+
+def test_short_circuit_results_deduplicated_by_reference() -> None:
+    wizard, service = _build_services()
+    project = wizard.create_project("SC Dedup")
+    slack_node, _ = _create_basic_network(wizard, project.id)
+    wizard.set_connection_node(project.id, slack_node["id"])
+    _add_grid_source(wizard, project.id, slack_node["id"])
+    case = wizard.create_operating_case(
+        project.id,
+        "Dedup Case",
+        {
+            "base_mva": 100.0,
+            "active_snapshot_id": str(uuid4()),
+            "project_design_mode": ProjectDesignMode.SN_NETWORK.value,
+        },
+    )
+
+    fault_spec = {"fault_type": "3F", "node_id": str(slack_node["id"])}
+    source = service.execute_run(
+        service.create_short_circuit_run(project.id, case.id, fault_spec).id
+    )
+    repeat = service.create_short_circuit_run(project.id, case.id, fault_spec)
+
+    assert repeat.id != source.id
+    assert repeat.status == "FINISHED"
+    assert repeat.result_source_run_id == source.id
+    assert repeat.result_summary == source.result_summary
+    assert repeat.white_box_trace == source.white_box_trace
+    assert repeat.trace_json["_dedup"] == {
+        "dedup_source_run_id": str(source.id),
+        "dedup_reason": "identical_input_hash",
+    }
+    assert "_dedup" not in (source.trace_json or {})
+    source_results = service.get_results(source.id)
+    repeat_results = service.get_results(repeat.id)
+    assert [r["payload"] for r in repeat_results] == [r["payload"] for r in source_results]
+    assert all(r["run_id"] == repeat.id for r in repeat_results)
+
+    other_spec = {"fault_type": "2F", "node_id": str(slack_node["id"])}
+    other = service.create_short_circuit_run(project.id, case.id, other_spec)
+    assert other.status == "CREATED"
+    assert other.result_source_run_id is None
+
+
+def test_fault_loop_failed_run_is_not_reused() -> None:
+    wizard, service = _build_services()
+    project = wizard.create_project("FL Dedup")
+    _create_basic_network(wizard, project.id)
+    case = wizard.create_operating_case(
+        project.id,
+        "NN Case",
+        {
+            "base_mva": 100.0,
+            "active_snapshot_id": str(uuid4()),
+            "project_design_mode": ProjectDesignMode.NN_NETWORK.value,
+        },
+    )
+
+    failed = service.execute_run(service.create_fault_loop_run(project.id, case.id).id)
+    repeat = service.create_fault_loop_run(project.id, case.id)
+
+    assert failed.status == "FAILED"
+    assert repeat.status == "CREATED"
+    assert repeat.result_source_run_id is None
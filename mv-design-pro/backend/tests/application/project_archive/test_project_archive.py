@@ -38,6 +38,7 @@ from domain.project_archive import (
     ProofsSection,
     ResultsSection,
     RunsSection,
+    SectionHasher,
     SldSection,
     archive_to_dict,
     canonicalize,
@@ -474,6 +475,34 @@ class TestIntegrity:
         assert any("project_meta" in err for err in errors)
 
 
+class TestSectionHasher:
+    """Incremental section hash equals compute_hash of the whole section."""
+
+    def test_matches_compute_hash(self):
+        section = {
+            "analysis_runs": [{"id": "b", "trace": [1.5, None, "Ik''"]}, {"id": "a", "x": 1e-05}],
+            "settings": {"z": 1, "a": {"zażółć": True}},
+            "study_runs": [],
+        }
+        hasher = SectionHasher()
+        hasher.begin_list("analysis_runs")
+        for row in section["analysis_runs"]:
+            hasher.add_item(row)
+        hasher.end_list()
+        hasher.add_value("settings", section["settings"])
+        hasher.begin_list("study_runs")
+        hasher.end_list()
+
+        assert hasher.hexdigest() == compute_hash(section)
+        assert SectionHasher().hexdigest() == compute_hash({})
+
+    def test_rejects_out_of_order_keys(self):
+        hasher = SectionHasher()
+        hasher.add_value("b", 1)
+        with pytest.raises(ValueError):
+            hasher.add_value("a", 2)
+
+
 # =============================================================================
 # Test: Version Compatibility
 # =============================================================================
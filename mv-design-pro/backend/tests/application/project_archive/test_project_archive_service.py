@@ -25,11 +25,19 @@ from domain.project_archive import (
     ArchiveImportStatus,
     compute_hash,
 )
+from domain.analysis_run import AnalysisRun
 from infrastructure.persistence.models import (
+    AnalysisRunORM,
     NetworkBranchORM,
     NetworkNodeORM,
+    OperatingCaseORM,
     ProjectORM,
     StudyCaseORM,
+    StudyResultORM,
+    StudyRunORM,
+)
+from infrastructure.persistence.repositories.analysis_run_repository import (
+    AnalysisRunRepository,
 )
 
 
@@ -116,6 +124,82 @@ def sample_project(test_db_session):
     return project
 
 
+@pytest.fixture
+def project_with_runs(test_db_session, sample_project):
+    """Sample project with analysis runs (payloads in blobs) and study results."""
+    now = datetime.now(timezone.utc)
+    case = test_db_session.query(StudyCaseORM).filter_by(project_id=sample_project.id).one()
+    operating_case = OperatingCaseORM(
+        id=uuid4(),
+        project_id=sample_project.id,
+        name="Przypadek eksploatacyjny",
+        case_jsonb={"c_factor": 1.1},
+        created_at=now,
+        updated_at=now,
+    )
+    test_db_session.add(operating_case)
+    test_db_session.commit()
+
+    trace = [{"step": i, "opis": "Prąd zwarciowy Ik''", "ik_ka": 12.5 + i} for i in range(50)]
+    runs = AnalysisRunRepository(test_db_session)
+    for index in range(3):
+        runs.create(
+            AnalysisRun(
+                id=uuid4(),
+                project_id=sample_project.id,
+                operating_case_id=operating_case.id,
+                analysis_type="SC",
+                status="FINISHED",
+                created_at=datetime(2026, 1, 1, 12, index, tzinfo=timezone.utc),
+                input_snapshot={"nodes": ["BUS-1", "BUS-2"]},
+                input_hash=f"hash-{index}",
+                result_summary={"ik_max_ka": 12.5},
+                white_box_trace=trace,
+            )
+        )
+
+    study_run = StudyRunORM(
+        id=uuid4(),
+        project_id=sample_project.id,
+        case_id=case.id,
+        analysis_type="SC",
+        input_hash="hash-0",
+        result_state="VALID",
+        status="FINISHED",
+        started_at=now,
+        finished_at=now,
+    )
+    source_result = StudyResultORM(
+        id=uuid4(),
+        run_id=study_run.id,
+        project_id=sample_project.id,
+        result_type="short_circuit",
+        result_jsonb={"ik_ka": 12.5},
+        created_at=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+    )
+    test_db_session.add_all([study_run, source_result])
+    test_db_session.flush()
+    test_db_session.add(
+        StudyResultORM(
+            id=uuid4(),
+            run_id=study_run.id,
+            project_id=sample_project.id,
+            result_type="short_circuit_copy",
+            result_jsonb=None,
+            source_result_id=source_result.id,
+            created_at=datetime(2026, 1, 1, 12, 1, tzinfo=timezone.utc),
+        )
+    )
+    test_db_session.commit()
+    return sample_project
+
+
+def _stream_export(service, project_id) -> bytes:
+    buffer = io.BytesIO()
+    service.export_project_stream(project_id, buffer)
+    return buffer.getvalue()
+
+
 # =============================================================================
 # Test: Export
 # =============================================================================
@@ -481,3 +565,132 @@ class TestErrorHandling:
 
         assert result.status == ArchiveImportStatus.FAILED
         assert any("project.json" in err for err in result.errors)
+
+
+# =============================================================================
+# Test: Streaming layout (stream-v1)
+# =============================================================================
+
+
+class TestStreamingArchive:
+    """Streaming export/import: one ZIP member per section list and per run."""
+
+    def test_stream_export_members(self, test_db_session, project_with_runs):
+        service = ProjectArchiveService(test_db_session)
+
+        archive_bytes = _stream_export(service, project_with_runs.id)
+
+        with zipfile.ZipFile(io.BytesIO(archive_bytes), "r") as zf:
+            names = zf.namelist()
+            manifest = json.loads(zf.read("manifest.json"))
+            nodes = zf.read("network_model/nodes.jsonl").decode("utf-8").splitlines()
+
+        assert "project.json" not in names
+        assert "project_meta.json" in names
+        assert "cases/settings.json" in names
+        assert len([n for n in names if n.startswith("runs/analysis_runs/")]) == 3
+        assert len([n for n in names if n.startswith("results/study_results/")]) == 2
+        assert len(nodes) == 2
+        assert manifest["layout"] == "stream-v1"
+        assert manifest["counts"]["runs/analysis_runs"] == 3
+
+    def test_stream_fingerprints_match_legacy_export(self, test_db_session, project_with_runs):
+        service = ProjectArchiveService(test_db_session)
+
+        legacy = service.export_project(project_with_runs.id)
+        fingerprints = service.export_project_stream(project_with_runs.id, io.BytesIO())
+
+        with zipfile.ZipFile(io.BytesIO(legacy), "r") as zf:
+            project_json = json.loads(zf.read("project.json"))
+        assert fingerprints.archive_hash == project_json["fingerprints"]["archive_hash"]
+        assert fingerprints.runs_hash == project_json["fingerprints"]["runs_hash"]
+
+    def test_export_reads_run_payloads_from_blobs(self, test_db_session, project_with_runs):
+        service = ProjectArchiveService(test_db_session)
+
+        with zipfile.ZipFile(io.BytesIO(service.export_project(project_with_runs.id))) as zf:
+            project_json = json.loads(zf.read("project.json"))
+
+        runs = project_json["runs"]["analysis_runs"]
+        results = project_json["results"]["study_results"]
+        assert [r["input_hash"] for r in runs] == ["hash-0", "hash-1", "hash-2"]
+        assert runs[0]["result_summary"] == {"ik_max_ka": 12.5}
+        assert len(runs[0]["white_box_trace"]) == 50
+        # Reference rows are exported with the source payload
+        assert [r["result_jsonb"] for r in results] == [{"ik_ka": 12.5}, {"ik_ka": 12.5}]
+
+    def test_stream_export_deterministic(self, test_db_session, project_with_runs):
+        service = ProjectArchiveService(test_db_session)
+
+        first = _stream_export(service, project_with_runs.id)
+        second = _stream_export(service, project_with_runs.id)
+
+        with zipfile.ZipFile(io.BytesIO(first)) as zf1, zipfile.ZipFile(io.BytesIO(second)) as zf2:
+            assert zf1.namelist() == zf2.namelist()
+            for name in zf1.namelist():
+                if name != "manifest.json":
+                    assert zf1.read(name) == zf2.read(name)
+
+    @pytest.mark.parametrize("layout", ["stream", "legacy"])
+    def test_roundtrip_restores_runs(self, test_db_session, project_with_runs, layout):
+        service = ProjectArchiveService(test_db_session)
+        if layout == "stream":
+            archive_bytes = _stream_export(service, project_with_runs.id)
+        else:
+            archive_bytes = service.export_project(project_with_runs.id)
+
+        result = service.import_project(archive_bytes, new_project_name="Kopia")
+
+        assert result.status == ArchiveImportStatus.SUCCESS, result.errors
+        runs = AnalysisRunRepository(test_db_session).list_by_project(
+            result.project_id, include_payloads=True
+        )
+        assert sorted(r.input_hash for r in runs) == ["hash-0", "hash-1", "hash-2"]
+        assert all(len(r.white_box_trace) == 50 for r in runs)
+        assert test_db_session.query(NetworkNodeORM).filter_by(
+            project_id=result.project_id
+        ).count() == 2
+        assert test_db_session.query(StudyResultORM).filter_by(
+            project_id=result.project_id
+        ).count() == 2
+
+    def test_import_stream_from_file(self, test_db_session, project_with_runs, tmp_path):
+        service = ProjectArchiveService(test_db_session)
+        path = tmp_path / "projekt.mvdp.zip"
+        with path.open("wb") as fileobj:
+            service.export_project_stream(project_with_runs.id, fileobj)
+
+        with path.open("rb") as fileobj:
+            result = service.import_project_stream(fileobj)
+
+        assert result.status == ArchiveImportStatus.SUCCESS
+
+    def test_tampered_member_fails_integrity(self, test_db_session, project_with_runs):
+        service = ProjectArchiveService(test_db_session)
+        archive_bytes = _stream_export(service, project_with_runs.id)
+
+        tampered = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(archive_bytes)) as src, zipfile.ZipFile(tampered, "w") as dst:
+            for name in src.namelist():
+                data = src.read(name)
+                if name.startswith("runs/analysis_runs/"):
+                    data = data.replace(b'"ik_max_ka":12.5', b'"ik_max_ka":99.9')
+                dst.writestr(name, data)
+        runs_before = test_db_session.query(AnalysisRunORM).count()
+
+        result = service.import_project(tampered.getvalue())
+
+        assert result.status == ArchiveImportStatus.FAILED
+        assert any("'runs'" in err for err in result.errors)
+        assert test_db_session.query(AnalysisRunORM).count() == runs_before
+
+    def test_preview_stream_archive(self, test_db_session, project_with_runs):
+        service = ProjectArchiveService(test_db_session)
+
+        preview = service.preview_archive(_stream_export(service, project_with_runs.id))
+
+        assert preview["valid"] is True
+        assert preview["project_name"] == "Projekt Testowy Export"
+        assert preview["summary"]["analysis_runs_count"] == 3
+        assert preview["summary"]["results_count"] == 2
+        assert preview["summary"]["nodes_count"] == 2
@@ -0,0 +1 @@
+"""Tests for cached report rendering."""
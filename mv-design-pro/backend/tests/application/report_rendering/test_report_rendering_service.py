@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from application.report_rendering import (
+    ReportCache,
+    ReportKey,
+    ReportRenderingService,
+    UnknownReportTypeError,
+    iter_chunks,
+    template_version,
+)
+
+
+def _power_flow_bundle() -> dict:
+    return {
+        "result": {
+            "converged": True,
+            "iterations_count": 3,
+            "slack_bus_id": "bus-main",
+            "summary": {"min_v_pu": 0.97, "max_v_pu": 1.0},
+            "bus_results": [{"bus_id": "bus-main", "v_pu": 1.0, "angle_deg": 0.0}],
+        },
+        "metadata": {"run_id": "run-1", "catalog_context_count": 0},
+        "catalog_context": [],
+        "white_box_trace": [{"key": "init", "title": "Start"}],
+    }
+
+
+def _render(service: ReportRenderingService, report_types: list[str], builds: list[int], **kwargs):
+    def build_payload() -> dict:
+        builds.append(1)
+        return _power_flow_bundle()
+
+    return service.render_many(
+        report_types,
+        run_id=kwargs.pop("run_id", "run-1"),
+        input_hash=kwargs.pop("input_hash", "hash-1"),
+        build_payload=build_payload,
+        **kwargs,
+    )
+
+
+def test_reports_are_cached_by_run_input_hash_type_and_template() -> None:
+    service = ReportRenderingService(max_workers=1)
+    builds: list[int] = []
+
+    (first,) = _render(service, ["power_flow_run_pdf"], builds)
+    (second,) = _render(service, ["power_flow_run_pdf"], builds)
+    assert first.content.startswith(b"%PDF")
+    assert (first.cached, second.cached) == (False, True)
+    assert second.content == first.content
+    assert first.key == ReportKey(
+        run_id="run-1",
+        input_hash="hash-1",
+        report_type="power_flow_run_pdf",
+        template_version=template_version("power_flow_run_pdf"),
+    )
+    assert len(builds) == 1
+
+    # Another input hash is another report; transient runs are never stored
+    (changed,) = _render(service, ["power_flow_run_pdf"], builds, input_hash="hash-2")
+    assert not changed.cached
+    _render(service, ["power_flow_run_docx"], builds, cacheable=False)
+    (uncached,) = _render(service, ["power_flow_run_docx"], builds, cacheable=False)
+    assert not uncached.cached
+    assert len(builds) == 4
+    assert service.cache.stats()["entries"] == 2
+
+    with pytest.raises(UnknownReportTypeError):
+        _render(service, ["power_flow_run_xlsx"], builds)
+
+
+def test_template_version_covers_imported_project_helpers(tmp_path, monkeypatch) -> None:
+    from application.report_rendering import service as rendering
+
+    package = tmp_path / "fake_reports"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("STYLE = 'a'\n")
+    (package / "renderer.py").write_text(
+        "import json\nfrom .helpers import STYLE\n\ndef render(payload):\n    return b''\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(
+        rendering.REPORT_FORMATS,
+        "fake_pdf",
+        rendering.ReportFormat(
+            "fake_pdf", "fake_reports.renderer:render", "application/pdf", "pdf"
+        ),
+    )
+    template_version.cache_clear()
+    before = template_version("fake_pdf")
+
+    (package / "helpers.py").write_text("STYLE = 'b'\n")
+    template_version.cache_clear()
+    assert template_version("fake_pdf") != before
+    template_version.cache_clear()
+
+
+def test_report_bundle_is_rendered_concurrently_in_process_pool() -> None:
+    service = ReportRenderingService(max_workers=2)
+    builds: list[int] = []
+    try:
+        pdf, docx = _render(service, ["power_flow_run_pdf", "power_flow_run_docx"], builds)
+        assert service._executor is not None
+    finally:
+        service.shutdown()
+
+    assert pdf.content.startswith(b"%PDF") and pdf.extension == "pdf"
+    assert docx.content.startswith(b"PK") and docx.extension == "docx"
+    assert len(builds) == 1
+    assert [report.cached for report in _render(service, ["power_flow_run_docx"], builds)] == [True]
+
+
+def test_cache_evicts_least_recently_used_bytes() -> None:
+    cache = ReportCache(max_bytes=10)
+    keys = [ReportKey(f"run-{i}", "hash", "power_flow_run_pdf", "v1") for i in range(3)]
+    cache.put(keys[0], b"aaaa")
+    cache.put(keys[1], b"bbbb")
+    assert cache.get(keys[0]) == b"aaaa"
+    cache.put(keys[2], b"cccc")
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == b"aaaa"
+    cache.put(keys[1], b"x" * 11)
+    assert cache.get(keys[1]) is None
+    assert cache.stats()["bytes"] == 8
+
+
+def test_chunks_stream_bytes_and_files() -> None:
+    assert list(iter_chunks(b"abcde", 2)) == [b"ab", b"cd", b"e"]
+
+    source = io.BytesIO(b"abcde")
+    assert b"".join(iter_chunks(source, 3)) == b"abcde"
+    assert source.closed
@@ -0,0 +1,126 @@
+"""
+Incremental SLD layout tests.
+
+SLD-INV-006 (Determinism): the incremental engine must return exactly the
+positions of a full rebuild, while re-laying out only the changed part.
+"""
+
+from __future__ import annotations
+
+import random
+from uuid import UUID, uuid4
+
+from application.sld.layout import _layout_positions, build_auto_layout_diagram
+from application.sld.layout_engine import SldLayoutEngine, compute_layout_hash
+
+
+def _full_positions(adjacency: dict, connection_node_id, vertical: bool = False) -> dict:
+    return _layout_positions(
+        adjacency,
+        adjacency.keys(),
+        connection_node_id,
+        x_spacing=200.0,
+        y_spacing=120.0,
+        vertical=vertical,
+    )
+
+
+def _connect(adjacency: dict, first: UUID, second: UUID) -> None:
+    adjacency.setdefault(first, set()).add(second)
+    adjacency.setdefault(second, set()).add(first)
+
+
+def _trunk(count: int, rnd: random.Random) -> tuple[dict, list[UUID]]:
+    node_ids = [UUID(int=rnd.getrandbits(128)) for _ in range(count)]
+    adjacency: dict = {node_ids[0]: set()}
+    for index in range(1, count):
+        _connect(adjacency, node_ids[index], node_ids[max(0, index - 1 - rnd.randrange(3))])
+    return adjacency, node_ids
+
+
+def test_random_edits_match_full_rebuild() -> None:
+    for seed in range(60):
+        rnd = random.Random(seed)
+        vertical = seed % 2 == 0
+        adjacency, node_ids = _trunk(12, rnd)
+        connection_node_id = node_ids[0] if seed % 3 else None
+        engine = SldLayoutEngine(vertical=vertical)
+
+        for _ in range(30):
+            nodes = list(adjacency)
+            operation = rnd.random()
+            if operation < 0.35:
+                new_node = UUID(int=rnd.getrandbits(128))
+                adjacency[new_node] = set()
+                if rnd.random() < 0.85:
+                    _connect(adjacency, new_node, rnd.choice(nodes))
+            elif operation < 0.55:
+                _connect(adjacency, *rnd.sample(nodes, 2))
+            elif operation < 0.75:
+                edges = [(a, b) for a in adjacency for b in adjacency[a]]
+                if edges:
+                    first, second = rnd.choice(edges)
+                    adjacency[first].discard(second)
+                    adjacency[second].discard(first)
+            elif operation < 0.85 and len(nodes) > 2:
+                removed = rnd.choice([node for node in nodes if node != connection_node_id])
+                for neighbor in adjacency.pop(removed):
+                    adjacency[neighbor].discard(removed)
+
+            positions = engine.positions(adjacency, connection_node_id, scope="diagram")
+            assert positions == _full_positions(adjacency, connection_node_id, vertical)
+
+
+def test_station_insert_relays_only_the_affected_levels() -> None:
+    adjacency, node_ids = _trunk(2000, random.Random(7))
+    engine = SldLayoutEngine()
+    engine.positions(adjacency, node_ids[0], scope="diagram")
+
+    _connect(adjacency, uuid4(), node_ids[1500])
+    positions = engine.positions(adjacency, node_ids[0], scope="diagram")
+
+    assert positions == _full_positions(adjacency, node_ids[0])
+    stats = engine.stats()
+    assert (stats["full"], stats["incremental"]) == (1, 1)
+    # Only the new node's level (a handful of nodes) is placed again
+    assert stats["relaid_nodes"] - len(node_ids) < 10
+
+
+def test_unchanged_topology_is_a_cache_hit() -> None:
+    adjacency, node_ids = _trunk(20, random.Random(3))
+    engine = SldLayoutEngine()
+
+    first = engine.positions(adjacency, node_ids[0])
+    shuffled = {node: set(adjacency[node]) for node in reversed(list(adjacency))}
+    assert compute_layout_hash(shuffled, node_ids[0]) == compute_layout_hash(
+        adjacency, node_ids[0]
+    )
+    assert engine.positions(shuffled, node_ids[0]) == first
+    assert engine.stats()["hits"] == 1
+
+
+def test_incremental_diagram_matches_full_diagram() -> None:
+    project_id = uuid4()
+    node_ids = [uuid4() for _ in range(4)]
+    nodes = [{"id": node_id, "name": f"N{index}"} for index, node_id in enumerate(node_ids)]
+    branches = [
+        {"id": uuid4(), "from_node_id": node_ids[index], "to_node_id": node_ids[index + 1]}
+        for index in range(3)
+    ]
+
+    def build(incremental: bool):
+        return build_auto_layout_diagram(
+            project_id=project_id,
+            name="SLD",
+            nodes=nodes,
+            branches=branches,
+            connection_node_id=node_ids[0],
+            incremental=incremental,
+        )
+
+    assert build(True) == build(False)
+    nodes.append({"id": uuid4(), "name": "N4"})
+    branches.append(
+        {"id": uuid4(), "from_node_id": node_ids[1], "to_node_id": nodes[-1]["id"]}
+    )
+    assert build(True) == build(False)
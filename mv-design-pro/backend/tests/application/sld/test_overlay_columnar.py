@@ -0,0 +1,88 @@
+"""
+Columnar SLD overlay tests.
+
+The packed payload must decode back to the overlay rows (float32 precision)
+with every column buffer aligned for Float32Array/Uint8Array views.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+
+import pytest
+
+from application.sld.overlay_columnar import (
+    OverlayFormatError,
+    decode_sld_overlay_columnar,
+    encode_sld_overlay_columnar,
+    etag_matches,
+    overlay_etag,
+)
+
+OVERLAY = {
+    "diagram_id": "diagram-1",
+    "run_id": "run-1",
+    "result_status": "VALID",
+    "nodes": [
+        {"symbol_id": "sym-b1", "bus_id": "B1", "node_id": "B1", "u_pu": 1.0, "ikss_ka": 12.5},
+        {"symbol_id": "sym-b2", "bus_id": "B2", "node_id": "B2", "u_pu": 0.97, "ikss_ka": None},
+        {"symbol_id": "sym-b3", "bus_id": "B3", "node_id": "B3", "u_pu": None, "ikss_ka": 8.25},
+    ],
+    "branches": [
+        {"symbol_id": "sym-l1", "branch_id": "L1", "loading_pct": 41.5, "ev_status": "PASS"},
+        {"symbol_id": "sym-l2", "branch_id": "L2", "loading_pct": 103.0, "ev_status": "FAIL"},
+        {"symbol_id": "sym-l3", "branch_id": "L3", "loading_pct": None, "ev_status": "UNKNOWN"},
+    ],
+}
+
+
+def _header(payload: bytes) -> dict:
+    _, _, _, header_length = struct.unpack_from("<4sHHI", payload)
+    return json.loads(payload[12 : 12 + header_length])
+
+
+def test_columnar_round_trip() -> None:
+    decoded = decode_sld_overlay_columnar(encode_sld_overlay_columnar(OVERLAY))
+
+    assert decoded["run_id"] == "run-1"
+    assert [row["element_id"] for row in decoded["nodes"]] == ["B1", "B2", "B3"]
+    assert [row["u_pu"] for row in decoded["nodes"]] == [1.0, pytest.approx(0.97), None]
+    assert [row["ikss_ka"] for row in decoded["nodes"]] == [12.5, None, 8.25]
+    assert [row["symbol_id"] for row in decoded["branches"]] == ["sym-l1", "sym-l2", "sym-l3"]
+    assert [row["loading_pct"] for row in decoded["branches"]] == [41.5, 103.0, None]
+    assert [row["ev_status"] for row in decoded["branches"]] == ["PASS", "FAIL", "UNKNOWN"]
+    # Columns absent from every row are not transmitted
+    assert "sk_mva" not in decoded["nodes"][0]
+
+
+def test_columns_are_aligned_typed_buffers() -> None:
+    payload = encode_sld_overlay_columnar(OVERLAY)
+    header = _header(payload)
+
+    columns = [column for section in header["sections"] for column in section["columns"]]
+    assert {column["dtype"] for column in columns} == {"float32", "uint8"}
+    for column in columns:
+        assert column["offset"] % 4 == 0
+        width = 4 if column["dtype"] == "float32" else 1
+        assert column["length"] == 3 * width
+    assert "UNKNOWN" in header["status_codes"]
+
+
+def test_decode_rejects_foreign_payload() -> None:
+    with pytest.raises(OverlayFormatError):
+        decode_sld_overlay_columnar(b"{}")
+    with pytest.raises(OverlayFormatError):
+        decode_sld_overlay_columnar(b"XXXX" + bytes(8))
+
+
+def test_etag_revalidation() -> None:
+    etag = overlay_etag("sld-overlay", "json", "run-1", {"nodes": [1, 2]})
+
+    assert etag == overlay_etag("sld-overlay", "json", "run-1", {"nodes": [1, 2]})
+    assert etag != overlay_etag("sld-overlay", "columnar", "run-1", {"nodes": [1, 2]})
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+
+
+def _load_script(module_name: str):
+    script_path = SCRIPTS_DIR / f"{module_name}.py"
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Cannot load script module: {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+import_time_guard = _load_script("import_time_guard")
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     docx.shared
+import time:      3000 |       3120 |   docx
+import time:       500 |       3620 | api.main
+"""
+
+
+def test_importtime_output_is_parsed():
+    profile = import_time_guard.parse_importtime(_SAMPLE)
+
+    assert profile.modules == {"docx.shared", "docx", "api.main"}
+    assert profile.cumulative_ms("api.main") == 3.62
+    assert [r.module for r in profile.slowest(2)] == ["docx", "api.main"]
+    assert import_time_guard.check_lazy_modules(profile) == [
+        "docx is imported at start-up (must load on first use)"
+    ]
+    assert import_time_guard.check_budget([profile], limit_ms=3.0)
+    assert import_time_guard.check_budget([profile], limit_ms=4.0) == []
+
+
+def test_api_start_up_defers_heavy_modules_and_fits_budget():
+    profile = import_time_guard.measure_import()
+
+    assert import_time_guard.check_lazy_modules(profile) == []
+    assert import_time_guard.check_budget([profile], import_time_guard.budget_ms()) == []
+
+
+def test_lazy_package_exports_resolve_on_access():
+    import network_model.reporting as reporting
+    from network_model.catalog import get_default_mv_catalog
+
+    assert callable(reporting.export_trace_jsonl)
+    assert "export_trace_jsonl" in dir(reporting)
+    assert get_default_mv_catalog() is get_default_mv_catalog()
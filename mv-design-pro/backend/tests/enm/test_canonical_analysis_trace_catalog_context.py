@@ -161,3 +161,59 @@ def test_build_extended_trace_uses_snapshot_catalog_context_without_fabrication(
         "manual_override_count": 1,
     }
     assert payload["catalog_context_by_element"]["line-002"]["source_catalog_label"] == "mv_cables:cable-120@2026.04"
+
+
+def test_trace_pages_match_full_enriched_trace() -> None:
+    from enm.canonical_analysis import enrich_trace_steps, get_trace_index
+
+    steps = []
+    for index in range(40):
+        step = {"key": f"phase-{index % 3}", "title": f"Krok {index}"}
+        if index % 4 == 0:
+            step["element_id"] = f"line-{index % 8:03d}"
+        if index % 5 == 0:
+            step["target_id"] = "line-002" if index % 10 == 0 else f"bus-{index}"
+        steps.append(step)
+    run = CanonicalRun(
+        id=uuid4(),
+        case_id="case-002",
+        project_id="project-002",
+        analysis_type="short_circuit_sn",
+        status="FINISHED",
+        created_at=datetime.now(timezone.utc),
+        snapshot_hash="snap-002",
+        input_hash="input-002",
+        snapshot={"branches": [{"ref_id": "line-002", "catalog_ref": "cable-120"}]},
+        validation={},
+        readiness={},
+        white_box_trace=steps,
+    )
+
+    full = build_extended_trace(run)
+    trace_index = get_trace_index(run)
+    assert get_trace_index(run) is trace_index
+
+    expected_selection: dict[str, int] = {}
+    for position, step in enumerate(full["white_box_trace"]):
+        for ref in step["selection_refs"]:
+            expected_selection.setdefault(ref, position)
+    assert trace_index.selection_index == full["selection_index"] == expected_selection
+
+    for filters in (
+        {},
+        {"element_id": "line-002"},
+        {"target_id": "line-002"},
+        {"key": "phase-1"},
+        {"element_id": "line-000", "key": "phase-0"},
+        {"element_id": "missing"},
+    ):
+        positions = trace_index.positions(**filters)
+        assert enrich_trace_steps(run, positions) == [
+            step
+            for step in full["white_box_trace"]
+            if all(
+                (step.get("primary_element_ref") if name == "element_id" else step.get(name))
+                == value
+                for name, value in filters.items()
+            )
+        ]
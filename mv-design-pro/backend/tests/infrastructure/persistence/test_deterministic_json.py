@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import numpy as np
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select, text
+
+from infrastructure.persistence.db import create_engine_from_url
+from infrastructure.persistence.models import (
+    CanonicalJSON,
+    DeterministicJSON,
+    _canonicalize,
+    canonical_json_dumps,
+)
+
+
+def _legacy_dumps(value) -> str:
+    """Encoding used before the single-pass encoder (reference bytes)."""
+    return json.dumps(_canonicalize(value), sort_keys=True, separators=(",", ":"))
+
+
+def _large_trace(steps: int) -> list[dict]:
+    return [
+        {
+            "step": index,
+            "opis": "Obliczenie prądu zwarciowego Ik'' — węzeł źródłowy",
+            "formula_latex": r"I_k'' = \frac{c \cdot U_n}{\sqrt{3} \cdot |Z_k|}",
+            "inputs": {"c": 1.1, "u_kv": 15.0, "z_ohm": (0.123456789, 1e-05 * index)},
+            "result": {"ik_ka": np.float64(12.3456789 + index), "n": np.int64(index)},
+            "vector": np.arange(3, dtype=np.float64) * 0.1,
+            "tags": {"b", "a"},
+            "nested": {"z": [1, 2, {"y": None, "x": True}], "a": 1e+16},
+        }
+        for index in range(steps)
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"b": 1, "a": [3, 2, 1], "c": {"z": None, "y": (1, 2)}},
+        [1.5e300, 2.5e-07, -0.0, 1e22, float("nan"), float("inf")],
+        {"tekst": "zażółć gęślą jaźń", "ctrl": " \t\n"},
+        {10: "a", 2: "b"},
+        {"ids": {"n2", "n10", "n1"}, "objs": [{"id": "b"}, {"id": "a"}]},
+        {"arr": np.array([[1, 2], [3, 4]], dtype=np.int32), "b": np.bool_(True)},
+        {"f32": np.float32(0.1), "f64": np.float64(0.1), "s": np.str_("x")},
+        [],
+        {},
+    ],
+)
+def test_canonical_dumps_bytes_identical_to_legacy(value) -> None:
+    assert canonical_json_dumps(value) == _legacy_dumps(value)
+
+
+def test_canonical_dumps_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        canonical_json_dumps({"x": frozenset({1})})
+    with pytest.raises(TypeError):
+        canonical_json_dumps({"x": object()})
+
+
+def test_canonical_json_tag() -> None:
+    payload = {"b": (1, 2), "a": np.float64(0.5)}
+    tagged = CanonicalJSON.of(payload)
+
+    assert tagged.text == _legacy_dumps(payload)
+    assert tagged.sha256 == hashlib.sha256(tagged.text.encode("utf-8")).hexdigest()
+    assert CanonicalJSON.of(tagged) is tagged
+
+
+def test_deterministic_json_binds_tagged_and_plain_values_identically() -> None:
+    engine = create_engine_from_url("sqlite+pysqlite:///:memory:")
+    metadata = MetaData()
+    table = Table(
+        "payloads",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("payload", DeterministicJSON()),
+    )
+    metadata.create_all(engine)
+    payload = _large_trace(5)
+
+    with engine.begin() as conn:
+        conn.execute(insert(table), [
+            {"id": 1, "payload": payload},
+            {"id": 2, "payload": CanonicalJSON.of(payload)},
+        ])
+        raw = conn.execute(text("SELECT payload FROM payloads ORDER BY id")).scalars().all()
+        loaded = conn.execute(select(table.c.payload).where(table.c.id == 2)).scalar_one()
+
+    assert raw[0] == raw[1] == _legacy_dumps(payload)
+    assert loaded == json.loads(raw[0])
+
+
+def test_large_trace_encodings_identical() -> None:
+    """Single-pass and pre-tagged encodings produce the legacy bytes.
+
+    Timings: scripts/canonical_json_benchmark.py.
+    """
+    trace = _large_trace(5_000)
+    legacy = _legacy_dumps(trace)
+
+    tagged = CanonicalJSON.of(trace)
+    bind = DeterministicJSON().process_bind_param
+    dialect = create_engine_from_url("sqlite+pysqlite:///:memory:").dialect
+
+    assert canonical_json_dumps(trace) == legacy
+    assert bind(tagged, dialect) == legacy
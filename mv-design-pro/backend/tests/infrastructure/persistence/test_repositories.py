@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from sqlalchemy import event, inspect, select, text
 from sqlalchemy.orm import Session
 
+from application.analyses.run_index import AnalysisRunIndexEntry
+from domain.analysis_run import new_analysis_run
 from domain.models import OperatingCase, Project, StudyCase, StudyRun
 from infrastructure.persistence.db import (
     create_engine_from_url,
     create_session_factory,
     init_db,
+    upgrade_analysis_runs,
+    upgrade_indexes,
+    upgrade_study_results,
+)
+from infrastructure.persistence.models import AnalysisRunBlobORM
+from infrastructure.persistence.repositories.analysis_run_index_repository import (
+    AnalysisRunIndexRepository,
 )
 from infrastructure.persistence.repositories import (
+    AnalysisRunRepository,
     CaseRepository,
     NetworkRepository,
     ProjectRepository,
@@ -107,6 +119,65 @@ def test_network_repository_nodes_and_branches() -> None:
     session.close()
 
 
+def test_bulk_inserts_use_one_executemany_per_table() -> None:
+    session = _setup_session()
+    project = Project(id=uuid4(), name="Bulk")
+    ProjectRepository(session).add(project)
+    inserts: list[tuple[str, bool]] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.startswith("INSERT"):
+            inserts.append((statement.split()[2], executemany))
+
+    network = NetworkRepository(session)
+    nodes = [
+        {"id": uuid4(), "name": f"Bus {i}", "node_type": "bus", "base_kv": 15.0}
+        for i in range(50)
+    ]
+    assert network.add_nodes(project.id, nodes) == 50
+    branches = [
+        {
+            "id": uuid4(),
+            "name": f"Line {i}",
+            "branch_type": "line",
+            "from_node_id": nodes[i]["id"],
+            "to_node_id": nodes[i + 1]["id"],
+        }
+        for i in range(49)
+    ]
+    network.replace_branches(project.id, branches)
+
+    assert inserts == [("network_nodes", True), ("network_branches", True)]
+
+    case = StudyCase(id=uuid4(), project_id=project.id, name="SC", study_payload={})
+    CaseRepository(session).add_study_case(case)
+    study_run = StudyRun(
+        id=uuid4(),
+        project_id=project.id,
+        case_id=case.id,
+        analysis_type="PF",
+        input_hash="hash",
+    )
+    StudyRunRepository(session).add(study_run)
+    inserts.clear()
+
+    results = ResultRepository(session)
+    result_ids = results.add_results(
+        run_id=study_run.id,
+        project_id=project.id,
+        results=[("pf", {"u": 1.0}), ("trace", {"steps": []})],
+    )
+
+    assert inserts == [("study_results", True)]
+    assert {row["id"] for row in results.list_results(study_run.id)} == set(result_ids)
+    assert len(network.list_nodes(project.id)) == 50
+    assert network.list_nodes(project.id)[0]["attrs"] == {}
+    assert len(network.list_branches(project.id)) == 49
+    assert all(branch["in_service"] for branch in network.list_branches(project.id))
+    session.close()
+
+
 def test_case_repository_operating_and_study_cases() -> None:
     session = _setup_session()
     project = Project(id=uuid4(), name="Cases")
@@ -181,6 +252,341 @@ def test_study_runs_and_results() -> None:
     session.close()
 
 
+def test_analysis_run_payloads_in_blob_store() -> None:
+    session = _setup_session()
+    project = Project(id=uuid4(), name="Blobs")
+    ProjectRepository(session).add(project)
+    operating_case = OperatingCase(
+        id=uuid4(), project_id=project.id, name="Normal", case_payload={}
+    )
+    CaseRepository(session).add_operating_case(operating_case)
+
+    repo = AnalysisRunRepository(session)
+    snapshot = {"nodes": [{"id": "n1"}], "options": {"c": 1.1}}
+    runs = [
+        new_analysis_run(
+            project_id=project.id,
+            operating_case_id=operating_case.id,
+            analysis_type="short_circuit_sn",
+            input_snapshot=snapshot,
+            input_hash=f"hash-{index}",
+        )
+        for index in range(2)
+    ]
+    for run in runs:
+        repo.create(run)
+    trace = [{"step": "Ik", "value": 12.3}]
+    for run in runs:
+        repo.update_status(
+            run.id,
+            "FINISHED",
+            result_summary={"ik_max": 12.3},
+            white_box_trace=trace,
+        )
+
+    # Identical payloads are stored once: snapshot, {}, summary, trace
+    assert len(session.execute(select(AnalysisRunBlobORM.content_hash)).all()) == 4
+
+    loaded = repo.get(runs[0].id)
+    assert loaded is not None
+    assert loaded.input_snapshot == snapshot
+    assert loaded.result_summary == {"ik_max": 12.3}
+    assert loaded.white_box_trace == trace
+    assert loaded.trace_json is None
+
+    listed = repo.list_by_project(project.id)
+    assert {run.id for run in listed} == {run.id for run in runs}
+    assert all(run.status == "FINISHED" and run.white_box_trace is None for run in listed)
+    hydrated = repo.list_by_project(project.id, include_payloads=True)
+    assert all(run.white_box_trace == trace for run in hydrated)
+
+    found = repo.get_by_deterministic_key(
+        project.id, operating_case.id, "short_circuit_sn", "hash-1"
+    )
+    assert found is not None
+    assert found.id == runs[1].id
+    assert found.input_snapshot == {}
+    session.close()
+
+
+_LEGACY_ANALYSIS_RUNS_DDL = """
+CREATE TABLE analysis_runs (
+    id VARCHAR(36) NOT NULL PRIMARY KEY,
+    project_id VARCHAR(36) NOT NULL,
+    operating_case_id VARCHAR(36) NOT NULL,
+    analysis_type VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    result_status VARCHAR(20) NOT NULL,
+    created_at DATETIME NOT NULL,
+    started_at DATETIME,
+    finished_at DATETIME,
+    input_snapshot TEXT NOT NULL,
+    input_hash VARCHAR(128) NOT NULL,
+    result_summary TEXT NOT NULL,
+    trace_json TEXT,
+    white_box_trace TEXT,
+    error_message TEXT
+)
+"""
+
+
+def test_legacy_analysis_runs_are_upgraded_to_blobs(tmp_path) -> None:
+    engine = create_engine_from_url(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    run_ids = [uuid4(), uuid4()]
+    project_id, case_id = uuid4(), uuid4()
+    with engine.begin() as conn:
+        conn.execute(text(_LEGACY_ANALYSIS_RUNS_DDL))
+        conn.execute(text("CREATE INDEX ix_analysis_runs_input_hash ON analysis_runs (input_hash)"))
+        for index, run_id in enumerate(run_ids):
+            conn.execute(
+                text(
+                    "INSERT INTO analysis_runs VALUES (:id, :project, :case, 'PF', 'FINISHED',"
+                    " 'VALID', '2026-01-01 12:00:00', NULL, NULL, :snapshot, :hash, :summary,"
+                    " NULL, :trace, NULL)"
+                ),
+                {
+                    "id": str(run_id),
+                    "project": str(project_id),
+                    "case": str(case_id),
+                    "snapshot": '{"nodes":["A"]}',
+                    "hash": f"hash-{index}",
+                    "summary": '{"nodes":["A"]}',
+                    "trace": '[{"step":1}]',
+                },
+            )
+
+    init_db(engine)
+
+    columns = {c["name"] for c in inspect(engine).get_columns("analysis_runs")}
+    assert "input_snapshot" not in columns and "input_snapshot_ref" in columns
+    indexes = {
+        ix["name"]: ix["column_names"] for ix in inspect(engine).get_indexes("analysis_runs")
+    }
+    assert indexes["ix_analysis_runs_input_hash"][:2] == ["input_hash", "project_id"]
+
+    session = create_session_factory(engine)()
+    # Identical snapshot/summary and traces are stored once
+    assert len(session.execute(select(AnalysisRunBlobORM.content_hash)).all()) == 2
+    loaded = AnalysisRunRepository(session).get(run_ids[1])
+    assert loaded is not None
+    assert loaded.input_snapshot == {"nodes": ["A"]}
+    assert loaded.result_summary == {"nodes": ["A"]}
+    assert loaded.white_box_trace == [{"step": 1}]
+    assert loaded.trace_json is None
+    session.close()
+
+    # A current schema is left untouched
+    assert upgrade_analysis_runs(engine) is False
+
+
+def test_keyset_indexes_are_added_to_existing_tables(tmp_path) -> None:
+    engine = create_engine_from_url(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    init_db(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_analysis_runs_project_created"))
+        conn.execute(text("DROP INDEX ix_analysis_runs_index_case_created"))
+        conn.execute(text("DROP INDEX ix_analysis_runs_index_created_at_utc"))
+        conn.execute(
+            text(
+                "CREATE INDEX ix_analysis_runs_index_created_at_utc"
+                " ON analysis_runs_index (created_at_utc)"
+            )
+        )
+
+    init_db(engine)
+
+    runs_indexes = {
+        ix["name"]: ix["column_names"] for ix in inspect(engine).get_indexes("analysis_runs")
+    }
+    index_indexes = {
+        ix["name"]: ix["column_names"]
+        for ix in inspect(engine).get_indexes("analysis_runs_index")
+    }
+    assert runs_indexes["ix_analysis_runs_project_created"] == ["project_id", "created_at", "id"]
+    assert index_indexes["ix_analysis_runs_index_case_created"] == [
+        "case_id",
+        "created_at_utc",
+        "run_id",
+    ]
+    assert index_indexes["ix_analysis_runs_index_created_at_utc"] == ["created_at_utc", "run_id"]
+    assert upgrade_indexes(engine) is False
+
+
+_LEGACY_STUDY_RESULTS_DDL = """
+CREATE TABLE study_results (
+    id VARCHAR(36) NOT NULL PRIMARY KEY,
+    run_id VARCHAR(36) NOT NULL REFERENCES study_runs (id),
+    project_id VARCHAR(36) NOT NULL REFERENCES projects (id),
+    result_type VARCHAR(100) NOT NULL,
+    result_jsonb TEXT NOT NULL,
+    created_at DATETIME NOT NULL
+)
+"""
+
+
+def test_legacy_study_results_accept_reference_rows(tmp_path) -> None:
+    engine = create_engine_from_url(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    result_id, run_id, project_id = uuid4(), uuid4(), uuid4()
+    with engine.begin() as conn:
+        conn.execute(text(_LEGACY_STUDY_RESULTS_DDL))
+        conn.execute(
+            text(
+                "INSERT INTO study_results VALUES"
+                " (:id, :run, :project, 'PF', '{\"u\":[1.0]}', '2026-01-01 12:00:00')"
+            ),
+            {"id": str(result_id), "run": str(run_id), "project": str(project_id)},
+        )
+
+    init_db(engine)
+
+    columns = {c["name"]: c for c in inspect(engine).get_columns("study_results")}
+    assert "source_result_id" in columns and columns["result_jsonb"]["nullable"]
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO study_results VALUES"
+                " (:id, :run, :project, 'PF', NULL, :source, '2026-01-02 12:00:00')"
+            ),
+            {
+                "id": str(uuid4()),
+                "run": str(uuid4()),
+                "project": str(project_id),
+                "source": str(result_id),
+            },
+        )
+    session = create_session_factory(engine)()
+    assert ResultRepository(session).list_results(run_id)[0]["payload"] == {"u": [1.0]}
+    session.close()
+
+    # A current schema is left untouched
+    assert upgrade_study_results(engine) is False
+
+
+def test_analysis_run_dedup_lookup_and_result_references() -> None:
+    session = _setup_session()
+    project = Project(id=uuid4(), name="Dedup")
+    ProjectRepository(session).add(project)
+    operating_case = OperatingCase(
+        id=uuid4(), project_id=project.id, name="Normal", case_payload={}
+    )
+    CaseRepository(session).add_operating_case(operating_case)
+    runs = AnalysisRunRepository(session)
+    results = ResultRepository(session)
+
+    def _new_run():
+        run = new_analysis_run(
+            project_id=project.id,
+            operating_case_id=operating_case.id,
+            analysis_type="short_circuit_sn",
+            input_snapshot={"fault": "3F"},
+            input_hash="key",
+        )
+        runs.create(run)
+        return run
+
+    source = _new_run()
+    assert runs.find_reusable_run_id(project.id, operating_case.id, "short_circuit_sn", "key") is None
+    results.add_result(
+        run_id=source.id, project_id=project.id, result_type="short_circuit_sn",
+        payload={"ik": [1.0, 2.0]},
+    )
+    runs.update_status(source.id, "FINISHED", white_box_trace=[{"step": 1}])
+
+    found = runs.find_reusable_run_id(project.id, operating_case.id, "short_circuit_sn", "key")
+    assert found == source.id
+    plan = session.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM analysis_runs WHERE input_hash = 'key' "
+            "AND project_id = :p AND operating_case_id = :c AND analysis_type = 'x' "
+            "AND status = 'FINISHED' ORDER BY created_at, id LIMIT 1"
+        ),
+        {"p": str(project.id), "c": str(operating_case.id)},
+    ).all()
+    assert "COVERING INDEX ix_analysis_runs_input_hash" in " ".join(str(r) for r in plan)
+
+    first = _new_run()
+    results.add_result_references(run_id=first.id, project_id=project.id, source_run_id=source.id)
+    reused = runs.finish_with_reused_results(
+        first.id, source.id, finished_at=datetime.now(timezone.utc)
+    )
+    second = _new_run()
+    results.add_result_references(run_id=second.id, project_id=project.id, source_run_id=first.id)
+
+    assert reused.status == "FINISHED"
+    assert reused.result_source_run_id == source.id
+    assert reused.white_box_trace == [{"step": 1}]
+    assert results.list_results(second.id)[0]["payload"] == {"ik": [1.0, 2.0]}
+    stored = session.execute(
+        text("SELECT result_jsonb, source_result_id FROM study_results ORDER BY created_at")
+    ).all()
+    assert [row[0] is None for row in stored] == [False, True, True]
+    assert stored[1][1] == stored[2][1]
+    session.close()
+
+
+def test_analysis_run_keyset_pages() -> None:
+    session = _setup_session()
+    project = Project(id=uuid4(), name="Paging")
+    ProjectRepository(session).add(project)
+    operating_case = OperatingCase(
+        id=uuid4(), project_id=project.id, name="Normal", case_payload={}
+    )
+    CaseRepository(session).add_operating_case(operating_case)
+    repo = AnalysisRunRepository(session)
+    shared = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index in range(7):
+        run = new_analysis_run(
+            project_id=project.id,
+            operating_case_id=operating_case.id,
+            analysis_type="short_circuit_sn",
+            input_snapshot={"i": index},
+            input_hash=f"hash-{index}",
+        )
+        # Ties on created_at are broken by id
+        created_at = shared if index < 4 else shared.replace(hour=index)
+        repo.create(replace(run, created_at=created_at))
+
+    pages, cursor = [], None
+    while True:
+        page = repo.list_page_by_project(project.id, limit=3, cursor=cursor)
+        pages.append([run.id for run in page.items])
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert [len(ids) for ids in pages] == [3, 3, 1]
+    assert [run_id for ids in pages for run_id in ids] == [
+        run.id for run in repo.list_by_project(project.id)
+    ]
+    assert repo.list_page_by_project(project.id, limit=3).items[0].input_snapshot == {}
+
+    index_repo = AnalysisRunIndexRepository(session)
+    for index in range(3):
+        index_repo.add(
+            AnalysisRunIndexEntry(
+                run_id=f"run-{index}",
+                analysis_type="protection",
+                case_id="case",
+                base_snapshot_id=None,
+                primary_artifact_type="result",
+                primary_artifact_id=f"artifact-{index}",
+                fingerprint=f"fp-{index}",
+                created_at_utc=shared,
+                status="FINISHED",
+                meta_json={"index": index},
+            )
+        )
+    first = index_repo.list_page(case_id="case", limit=2)
+    assert [entry.run_id for entry in first.items] == ["run-2", "run-1"]
+    assert first.items[0].meta_json is None
+    second = index_repo.list_page(
+        case_id="case", limit=2, cursor=first.next_cursor, include_meta=True
+    )
+    assert [entry.run_id for entry in second.items] == ["run-0"]
+    assert second.items[0].meta_json == {"index": 0}
+    assert second.next_cursor is None
+    session.close()
+
+
 def test_sld_repository() -> None:
     session = _setup_session()
     project = Project(id=uuid4(), name="SLD")
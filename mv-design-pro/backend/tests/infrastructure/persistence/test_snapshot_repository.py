@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import json
 
-from sqlalchemy import text
+from sqlalchemy import event, inspect, select, text
 from sqlalchemy.orm import Session
 
 from infrastructure.persistence.db import (
     create_engine_from_url,
     create_session_factory,
     init_db,
+    upgrade_network_snapshots,
 )
-from infrastructure.persistence.models import _canonicalize
-from infrastructure.persistence.repositories import SnapshotRepository
+from infrastructure.persistence.models import NetworkSnapshotORM, _canonicalize
+from infrastructure.persistence.repositories import SnapshotRepository, snapshot_repository
+from infrastructure.persistence.repositories.snapshot_repository import lineage_positions
 from network_model.core import Branch, BranchType, NetworkGraph, Node, NodeType
 from network_model.core.snapshot import NetworkSnapshot, SnapshotMeta, create_network_snapshot
 
@@ -115,6 +117,107 @@ def test_snapshot_lineage_lists_parent_chain() -> None:
     session.close()
 
 
+def _add_chain(repo: SnapshotRepository, ids: list[str], parent: str | None) -> None:
+    for snapshot_id in ids:
+        repo.add_snapshot(_build_snapshot(snapshot_id=snapshot_id, parent_snapshot_id=parent))
+        parent = snapshot_id
+
+
+def test_snapshot_lineage_branches_and_common_ancestor(monkeypatch) -> None:
+    session = _setup_session()
+    repo = SnapshotRepository(session)
+    _add_chain(repo, [f"s{i}" for i in range(50)], None)
+    _add_chain(repo, ["a1", "a2"], "s30")
+    _add_chain(repo, ["b1"], "s40")
+    _add_chain(repo, ["other"], None)
+
+    statements: list[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", _record(statements))
+    lineage = repo.list_lineage("a2")
+    assert len(statements) == 1
+    assert "snapshot_json" not in statements[0]
+    assert [meta.snapshot_id for meta in lineage] == [f"s{i}" for i in range(31)] + ["a1", "a2"]
+
+    assert repo.find_common_ancestor("a2", "b1").snapshot_id == "s30"
+    assert repo.find_common_ancestor("s10", "a2").snapshot_id == "s10"
+    assert repo.find_common_ancestor("a2", "other") is None
+
+    depths = dict(
+        session.execute(text("SELECT snapshot_id, lineage_depth FROM network_snapshots")).all()
+    )
+    assert (depths["s0"], depths["a2"], depths["b1"], depths["other"]) == (0, 32, 41, 0)
+
+    # Fallback (no recursive CTE) gives the same answers from the lineage range
+    monkeypatch.setattr(snapshot_repository.sqlite3, "sqlite_version_info", (3, 7, 0))
+    assert repo.list_lineage("a2") == lineage
+    assert repo.find_common_ancestor("a2", "b1").snapshot_id == "s30"
+    assert repo.find_common_ancestor("a2", "other") is None
+    session.close()
+
+
+def test_lineage_positions_for_bulk_insert() -> None:
+    positions = lineage_positions({"c": "b", "b": "a", "a": None, "x": "missing", "y": "x"})
+    assert positions == {
+        "a": ("a", 0),
+        "b": ("a", 1),
+        "c": ("a", 2),
+        "x": ("missing", 1),
+        "y": ("missing", 2),
+    }
+
+
+_LEGACY_NETWORK_SNAPSHOTS_DDL = """
+CREATE TABLE network_snapshots (
+    snapshot_id VARCHAR(64) NOT NULL PRIMARY KEY,
+    parent_snapshot_id VARCHAR(64),
+    created_at DATETIME NOT NULL,
+    schema_version VARCHAR(50),
+    network_model_id VARCHAR(64),
+    fingerprint VARCHAR(64),
+    snapshot_json TEXT NOT NULL
+)
+"""
+
+
+def test_legacy_network_snapshots_get_lineage_backfilled(tmp_path, monkeypatch) -> None:
+    engine = create_engine_from_url(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    parents = {"s0": None, "s1": "s0", "s2": "s1", "a1": "s2", "b1": "s1", "b2": "b1"}
+    with engine.begin() as conn:
+        conn.execute(text(_LEGACY_NETWORK_SNAPSHOTS_DDL))
+        for snapshot_id, parent in parents.items():
+            conn.execute(
+                text(
+                    "INSERT INTO network_snapshots VALUES"
+                    " (:id, :parent, '2026-01-01 12:00:00', '1.0', 'model-1', NULL, '{}')"
+                ),
+                {"id": snapshot_id, "parent": parent},
+            )
+
+    init_db(engine)
+
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("network_snapshots")}
+    assert {"ix_network_snapshots_parent", "ix_network_snapshots_lineage"} <= indexes
+    session = create_session_factory(engine)()
+    rows = session.execute(select(NetworkSnapshotORM)).scalars().all()
+    positions = {row.snapshot_id: (row.lineage_root_id, row.lineage_depth) for row in rows}
+    assert positions == lineage_positions(parents)
+
+    repo = SnapshotRepository(session)
+    monkeypatch.setattr(snapshot_repository.sqlite3, "sqlite_version_info", (3, 7, 0))
+    assert repo.find_common_ancestor("a1", "b2").snapshot_id == "s1"
+    session.close()
+
+    # A backfilled schema is left untouched
+    assert upgrade_network_snapshots(engine) is False
+
+
+def _record(statements: list[str]):
+    def listener(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    return listener
+
+
 def test_snapshot_json_is_deterministic_and_json_safe() -> None:
     session = _setup_session()
     repo = SnapshotRepository(session)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from domain.models import Project
+from infrastructure.persistence.db import (
+    PoolConfig,
+    create_engine_from_url,
+    create_session_factory,
+    init_db,
+    pool_metrics,
+)
+from infrastructure.persistence.repositories import ProjectRepository
+from infrastructure.persistence.unit_of_work import (
+    ReadOnlyUnitOfWorkError,
+    build_uow_factory,
+)
+
+
+def _uow_factory(url: str = "sqlite+pysqlite:///:memory:", pool: PoolConfig | None = None):
+    engine = create_engine_from_url(url, pool=pool)
+    init_db(engine)
+    return engine, build_uow_factory(create_session_factory(engine))
+
+
+def test_repositories_are_built_on_first_access() -> None:
+    _, uow_factory = _uow_factory()
+    with uow_factory() as uow:
+        assert "projects" not in vars(uow)
+        projects = uow.projects
+        assert isinstance(projects, ProjectRepository)
+        assert uow.projects is projects
+        assert "sld" not in vars(uow)
+        with pytest.raises(AttributeError):
+            uow.not_a_repository  # noqa: B018
+
+    # A reused UnitOfWork binds fresh repositories to its new session
+    with uow as reused:
+        assert reused.projects is not projects
+        assert reused.projects._session is reused.session
+
+
+def test_read_only_uow_never_commits() -> None:
+    _, uow_factory = _uow_factory()
+    project = Project(id=uuid4(), name="RO")
+    with uow_factory(read_only=True) as uow:
+        assert uow.session.autoflush is False
+        uow.projects.add(project, commit=False)
+        with pytest.raises(ReadOnlyUnitOfWorkError):
+            uow.commit()
+
+    # Pending writes of a read-only unit are rolled back on exit
+    with uow_factory(read_only=True) as uow:
+        assert uow.projects.get(project.id) is None
+
+    with uow_factory() as uow:
+        uow.projects.add(project)
+    with uow_factory(read_only=True) as uow:
+        assert uow.projects.get(project.id) is not None
+
+
+def test_pool_config_and_metrics(tmp_path) -> None:
+    config = PoolConfig.from_env(
+        {"DB_POOL_SIZE": "3", "DB_MAX_OVERFLOW": "1", "DB_POOL_PRE_PING": "false"}
+    )
+    assert (config.pool_size, config.max_overflow, config.pool_pre_ping) == (3, 1, False)
+    assert config.pool_recycle == PoolConfig().pool_recycle
+
+    engine, uow_factory = _uow_factory(f"sqlite+pysqlite:///{tmp_path / 'pool.db'}", config)
+    with uow_factory(read_only=True) as uow:
+        uow.projects.list_all_orm()
+        busy = pool_metrics(engine)
+    idle = pool_metrics(engine)
+
+    assert busy["pool_class"] == "QueuePool"
+    assert (busy["size"], busy["checked_out"]) == (3, 1)
+    assert idle["checked_out"] == 0
+    assert idle["checkouts"] >= 2
+    assert idle["connects"] == 1
+
+    memory_engine = create_engine_from_url("sqlite+pysqlite:///:memory:", pool=config)
+    assert "size" not in pool_metrics(memory_engine)
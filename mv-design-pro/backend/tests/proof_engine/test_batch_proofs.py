@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import inspect
+import io
+import json
+import zipfile
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from application.proof_engine import batch
+from application.proof_engine.batch import (
+    SC3FColumns,
+    iter_sc3f_proof_packs,
+    iter_sc3f_proofs,
+    proof_artifact_id,
+    stream_sc3f_pack_bundle,
+)
+from application.proof_engine.proof_generator import ProofGenerator, SC3FInput
+from application.proof_engine.proof_inspector import export_to_json
+from application.proof_engine.proof_pack import ProofPackContext
+from network_model.solvers.short_circuit_iec60909 import ShortCircuitType
+
+TIMESTAMP = datetime(2026, 1, 27, 10, 30, 0)
+
+
+def _result(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        fault_node_id=f"B{index}",
+        short_circuit_type=ShortCircuitType.THREE_PHASE,
+        c_factor=1.10,
+        un_v=15000.0,
+        zkk_ohm=complex(0.749 + 0.013 * index, 3.419 - 0.021 * index),
+        ikss_a=2722.0 + 7.3 * index,
+        ip_a=5882.0 + 11.1 * index,
+        ith_a=2722.0 + 7.3 * index,
+        sk_mva=70.7 + 0.19 * index,
+        kappa=1.528,
+        rx_ratio=0.219,
+        tk_s=1.0,
+    )
+
+
+def _columns(count: int) -> tuple[SC3FColumns, list[SimpleNamespace]]:
+    results = [_result(index) for index in range(count)]
+    columns = SC3FColumns.from_short_circuit_results(
+        results, solver_version="1.0.0-test", run_timestamp=TIMESTAMP
+    )
+    return columns, results
+
+
+def _artifact_ids(count: int) -> list[UUID]:
+    return [UUID(int=index + 1) for index in range(count)]
+
+
+def _context() -> ProofPackContext:
+    return ProofPackContext(
+        project_id="project-1",
+        case_id="case-1",
+        run_id="run-1",
+        snapshot_id="snapshot-1",
+        mv_design_pro_version="0.1.0-test",
+    )
+
+
+def _comparable(proof) -> dict:
+    # document_id and created_at are minted per document
+    payload = json.loads(export_to_json(proof))
+    payload.pop("document_id")
+    payload.pop("created_at")
+    return payload
+
+
+def test_batch_proofs_match_single_target_proofs() -> None:
+    columns, results = _columns(5)
+    artifact_ids = _artifact_ids(5)
+
+    batch = list(iter_sc3f_proofs(columns, artifact_ids))
+
+    assert len(batch) == len(columns) == 5
+    for result, artifact_id, proof in zip(results, artifact_ids, batch):
+        single_input = SC3FInput.from_short_circuit_result(result, solver_version="1.0.0-test")
+        single_input.run_timestamp = TIMESTAMP
+        single = ProofGenerator.generate_sc3f_proof(single_input, artifact_id)
+        assert _comparable(proof) == _comparable(single)
+
+
+def test_batch_proofs_are_emitted_lazily() -> None:
+    columns, _ = _columns(3)
+    proofs = iter_sc3f_proofs(columns, _artifact_ids(3))
+
+    assert inspect.isgenerator(proofs)
+    assert next(proofs).header.fault_location == "B0"
+    assert columns.slice(1, 3).fault_node_id == ("B1", "B2")
+    assert columns.row(2).z_thevenin_ohm == _result(2).zkk_ohm
+
+    with pytest.raises(ValueError):
+        list(iter_sc3f_proofs(columns, _artifact_ids(2)))
+
+
+def test_proof_packs_are_built_in_worker_pool_in_row_order() -> None:
+    columns, _ = _columns(4)
+    artifact_ids = _artifact_ids(4)
+
+    packs = list(
+        iter_sc3f_proof_packs(
+            columns, _context(), artifact_ids=artifact_ids, max_workers=2, chunk_size=2
+        )
+    )
+
+    assert [node_id for node_id, _ in packs] == ["B0", "B1", "B2", "B3"]
+    for (node_id, pack), artifact_id in zip(packs, artifact_ids):
+        proof_json = json.loads(zipfile.ZipFile(io.BytesIO(pack)).read("proof_pack/proof.json"))
+        assert proof_json["artifact_id"] == str(artifact_id)
+        assert proof_json["header"]["fault_location"] == node_id
+
+
+def test_pool_submissions_are_capped_at_max_workers(monkeypatch) -> None:
+    from concurrent.futures import Future
+
+    submitted: list[int] = []
+
+    class _InlineExecutor:
+        def submit(self, fn, *args):
+            submitted.append(len(args[0]))
+            future: Future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    monkeypatch.setattr(batch, "_get_executor", lambda: _InlineExecutor())
+    columns, _ = _columns(10)
+    packs = iter_sc3f_proof_packs(columns, _context(), max_workers=2, chunk_size=2)
+
+    assert next(packs)[0] == "B0"
+    assert submitted == [2, 2]
+    assert [node_id for node_id, _ in packs] == [f"B{index}" for index in range(1, 10)]
+    assert len(submitted) == 5
+
+
+def test_default_artifact_ids_are_deterministic() -> None:
+    columns, _ = _columns(2)
+
+    first = [proof.artifact_id for proof in iter_sc3f_proofs(columns)]
+    again = [proof.artifact_id for proof in iter_sc3f_proofs(columns)]
+
+    assert first == again
+    assert len(set(first)) == 2
+    assert proof_artifact_id("run-1", "3F", "B0") != proof_artifact_id("run-2", "3F", "B0")
+
+
+def test_chunk_size_is_validated_before_iteration() -> None:
+    columns, _ = _columns(2)
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        iter_sc3f_proof_packs(columns, _context(), chunk_size=0)
+
+
+def test_columns_from_stored_payloads_match_result_columns() -> None:
+    columns, results = _columns(3)
+    payloads = [
+        {
+            **vars(result),
+            "short_circuit_type": result.short_circuit_type.value,
+            "zkk_ohm": {"re": result.zkk_ohm.real, "im": result.zkk_ohm.imag},
+        }
+        for result in results
+    ]
+
+    from_payloads = SC3FColumns.from_short_circuit_payloads(
+        payloads, solver_version="1.0.0-test", run_timestamp=TIMESTAMP
+    )
+
+    for index in range(len(columns)):
+        assert from_payloads.row(index) == columns.row(index)
+
+
+def test_pack_bundle_holds_one_pack_per_bus() -> None:
+    columns, _ = _columns(3)
+
+    bundle = zipfile.ZipFile(
+        io.BytesIO(b"".join(stream_sc3f_pack_bundle(columns, _context(), max_workers=1)))
+    )
+
+    assert bundle.namelist() == [f"pakiet_dowodowy/B{index}.zip" for index in range(3)]
+    pack = zipfile.ZipFile(io.BytesIO(bundle.read("pakiet_dowodowy/B1.zip")))
+    assert "proof_pack/proof.json" in pack.namelist()
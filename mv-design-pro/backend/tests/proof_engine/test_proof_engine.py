@@ -14,12 +14,14 @@ Testy:
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from datetime import datetime
 from uuid import uuid4
 
 import pytest
 
-from application.proof_engine.equation_registry import EquationRegistry
+from application.proof_engine.equation_registry import EquationRegistry, registry
+from application.proof_engine.latex_renderer import LaTeXRenderer, format_value_latex
 from application.proof_engine.proof_generator import (
     ProofGenerator,
     SC1Input,
@@ -595,6 +597,20 @@ class TestEquationRegistry:
             for sym in eq.symbols:
                 assert sym.mapping_key != "", f"Missing mapping_key in {eq.equation_id}"
 
+    def test_equations_are_compiled_at_freeze(self):
+        """Stałe fragmenty LaTeX budowane raz, przy zamrożeniu rejestru."""
+        eq = EquationRegistry.get_equation("EQ_SC3F_004")
+        compiled = registry.compiled(eq)
+
+        assert compiled is registry.compiled(eq)
+        assert compiled.formula_block == f"$$\n{eq.latex.strip()}\n$$"
+        assert compiled.symbol_for("ikss_ka") == eq.get_symbol_by_mapping_key("ikss_ka")
+        assert "EQ\\_SC3F\\_004" in compiled.register_entry
+
+        # Równanie spoza rejestru kompilowane na miejscu
+        custom = replace(eq, latex="x = y")
+        assert registry.compiled(custom).formula_block == "$$\nx = y\n$$"
+
 
 # =============================================================================
 # Unit Verifier Tests
@@ -995,3 +1011,39 @@ class TestP11_1c_QU_VDROP_Link:
 
         # Delta U w różnicach
         assert "Delta U_{(B-A)}" in latex or "\\Delta U_{(B-A)}" in latex
+
+
+# =============================================================================
+# Batch LaTeX Rendering
+# =============================================================================
+
+
+class TestBatchLatexRendering:
+    """Pakiet dowodów w jednym dokumencie LaTeX."""
+
+    def test_batch_shares_preamble_and_equation_register(self, sc3f_test_input: SC3FInput):
+        proofs = [
+            ProofGenerator.generate_sc3f_proof(
+                replace(sc3f_test_input, fault_node_id=node_id), uuid4()
+            )
+            for node_id in ("B1", "B2", "B3")
+        ]
+
+        latex = LaTeXRenderer.render_batch(proofs, title_pl="Zwarcia SC3F")
+
+        assert latex.count(r"\documentclass") == 1
+        assert latex.count(r"\part{") == 3
+        assert latex.count(r"\section*{Rejestr równań}") == 1
+        assert latex.count(r"\subsection*{EQ\_SC3F\_004") == 1
+        assert latex.count(r"Równanie EQ\_SC3F\_004 (rejestr równań)") == 3
+        assert latex.count(r"\section{Dowód}") == 3
+        assert LaTeXRenderer.render_batch(proofs, title_pl="Zwarcia SC3F") == latex
+
+        with pytest.raises(ValueError):
+            LaTeXRenderer.render_batch([])
+
+    def test_memoized_formatting_keeps_signed_zero(self):
+        assert format_value_latex(1.23456, "kA") == r"1.2346\,\text{kA}"
+        assert format_value_latex(0.0, "kA") == r"0.0000\,\text{kA}"
+        assert format_value_latex(-0.0, "kA") == r"-0.0000\,\text{kA}"
+        assert format_value_latex(complex(1, -2), "Ω") == r"1.0000 - j2.0000\,\text{Ω}"
@@ -8,7 +8,11 @@ from hashlib import sha256
 from uuid import UUID
 
 from application.proof_engine.proof_generator import ProofGenerator, SC3FInput
-from application.proof_engine.proof_pack import ProofPackBuilder, ProofPackContext
+from application.proof_engine.proof_pack import (
+    ProjectProofPackBuilder,
+    ProofPackBuilder,
+    ProofPackContext,
+)
 from application.proof_engine.proof_inspector.exporters import is_pdf_export_available
 
 
@@ -131,3 +135,50 @@ def test_signature_matches_files_hashes():
             payload = zf.read(file_entry["path"])
             assert file_entry["sha256"] == sha256(payload).hexdigest()
             assert file_entry["bytes"] == len(payload)
+
+
+def test_proof_pack_streams_to_disk_and_http_chunks(tmp_path):
+    proof = _build_sc3f_proof()
+    builder = ProofPackBuilder(_build_context())
+
+    pack_path = tmp_path / "proof_pack.zip"
+    with pack_path.open("wb") as sink:
+        builder.write(proof, sink)
+    assert pack_path.read_bytes() == builder.build(proof)
+
+    # Unseekable sink: entries carry data descriptors, contents are the same
+    streamed = b"".join(builder.stream(proof))
+    with _read_zip(streamed) as streamed_zf, _read_zip(builder.build(proof)) as built_zf:
+        assert streamed_zf.testzip() is None
+        assert streamed_zf.namelist() == built_zf.namelist()
+        for name in built_zf.namelist():
+            assert streamed_zf.read(name) == built_zf.read(name)
+
+
+def test_project_proof_pack_hashes_every_member_incrementally():
+    proofs = [_build_sc3f_proof() for _ in range(3)]
+    builder = ProjectProofPackBuilder(_build_context())
+
+    chunks = list(builder.stream(iter(proofs)))
+    assert len(chunks) > len(proofs)
+
+    with _read_zip(b"".join(chunks)) as zf:
+        names = zf.namelist()
+        manifest = json.loads(zf.read("proof_pack/manifest.json"))
+        signature = json.loads(zf.read("proof_pack/signature.json"))
+
+        assert names == sorted(names)
+        assert [proof["artifact_id"] for proof in manifest["proofs"]] == [
+            str(proof.artifact_id) for proof in proofs
+        ]
+        for file_entry in signature["files"]:
+            payload = zf.read(file_entry["path"])
+            assert file_entry["sha256"] == sha256(payload).hexdigest()
+            assert file_entry["bytes"] == len(payload)
+        for proof_entry in manifest["proofs"]:
+            proof_json = zf.read(f"{proof_entry['path']}proof.json")
+            assert proof_entry["proof_fingerprint"] == sha256(proof_json).hexdigest()
+
+    concatenated = "".join(file_entry["sha256"] for file_entry in signature["files"])
+    assert signature["pack_fingerprint"] == sha256(concatenated.encode("utf-8")).hexdigest()
+    assert signature["files"][-1]["path"] == "proof_pack/manifest.json"
@@ -51,6 +51,8 @@ from application.batch_execution_service import (
 )
 from application.sc_comparison_service import (
     ScComparisonService,
+    align_sc_result_sets,
+    build_comparison_from_aligned,
     AnalysisTypeMismatchError,
     RunNotDoneError,
     StudyCaseMismatchError,
@@ -992,6 +994,182 @@ class TestGoldenFixture:
         assert b1.batch_id != b2.batch_id  # Different batch IDs
 
 
+# =============================================================================
+# N-way comparison
+# =============================================================================
+
+
+def _n_way_result_sets() -> list:
+    """Base + 2 variants with missing elements, zero base and non-numeric values."""
+    def rs(elements: list[ElementResult], global_results: dict) -> object:
+        return build_result_set(
+            run_id=uuid4(),
+            analysis_type=ExecutionAnalysisType.SC_3F,
+            validation_snapshot={},
+            readiness_snapshot={},
+            element_results=elements,
+            global_results=global_results,
+        )
+
+    return [
+        rs(
+            [
+                ElementResult("src-1", "Source", {"ikss_a": 500.0, "ip_a": 1000.0, "label": "A"}),
+                ElementResult("branch-1", "Branch", {"i_a": 300.0, "loading_pct": 0.0}),
+                ElementResult("bus-1", "Bus", {"u_kv": 15.0}),
+                ElementResult("branch-2", "Branch", {"i_a": 120.0}),
+            ],
+            {"ikss_a": 1000.0, "kappa": 1.5},
+        ),
+        rs(
+            [
+                ElementResult("src-1", "Source", {"ikss_a": 600.0, "ip_a": 1200.0, "label": "B"}),
+                ElementResult("branch-1", "Branch", {"i_a": 360.0, "loading_pct": 12.5}),
+                ElementResult("bus-1", "Bus", {"u_kv": 14.8, "extra": 3}),
+            ],
+            {"ikss_a": 1200.0, "kappa": 1.6, "ib_a": 500.0},
+        ),
+        rs(
+            [
+                ElementResult("src-1", "Source", {"ikss_a": 450.0}),
+                ElementResult("branch-2", "Branch", {"i_a": 100.0}),
+                ElementResult("branch-3", "Branch", {"i_a": 90.0}),
+            ],
+            {"ikss_a": 900.0},
+        ),
+    ]
+
+
+class TestNWayComparison:
+    """N-way aligned comparison must equal pairwise build_comparison."""
+
+    @staticmethod
+    def _payload(comparison: ShortCircuitComparison) -> dict:
+        data = comparison.to_dict()
+        data.pop("comparison_id")
+        data.pop("created_at")
+        return data
+
+    def test_aligned_comparison_identical_to_pairwise(self):
+        result_sets = _n_way_result_sets()
+        run_ids = [rs.run_id for rs in result_sets]
+        aligned = align_sc_result_sets(run_ids, result_sets)
+        case_id, base_sid, other_sid = uuid4(), uuid4(), uuid4()
+
+        for row in (1, 2):
+            expected = build_comparison(
+                study_case_id=case_id,
+                analysis_type=ExecutionAnalysisType.SC_3F,
+                base_scenario_id=base_sid,
+                other_scenario_id=other_sid,
+                base_result_set=result_sets[0],
+                other_result_set=result_sets[row],
+            )
+            actual = build_comparison_from_aligned(
+                aligned,
+                other_row=row,
+                study_case_id=case_id,
+                analysis_type=ExecutionAnalysisType.SC_3F,
+                base_scenario_id=base_sid,
+                other_scenario_id=other_sid,
+            )
+            assert self._payload(actual) == self._payload(expected)
+
+    def test_zero_base_relative_delta_is_none(self):
+        result_sets = _n_way_result_sets()
+        aligned = align_sc_result_sets([rs.run_id for rs in result_sets], result_sets)
+        comparison = build_comparison_from_aligned(
+            aligned,
+            other_row=1,
+            study_case_id=uuid4(),
+            analysis_type=ExecutionAnalysisType.SC_3F,
+            base_scenario_id=uuid4(),
+            other_scenario_id=uuid4(),
+        )
+        branch = next(
+            d for d in comparison.deltas_by_branch if d["element_ref"] == "branch-1"
+        )
+        assert branch["deltas"]["loading_pct"]["rel"] is None
+        assert branch["deltas"]["loading_pct"]["abs"] == 12.5
+
+    def test_service_n_way_matches_pairwise(self):
+        engine, case_id = _make_engine_with_case()
+        batch_service = BatchExecutionService(engine)
+        comparison_service = ScComparisonService(engine)
+
+        batch = batch_service.create_batch_job(
+            study_case_id=case_id,
+            analysis_type=ExecutionAnalysisType.SC_3F,
+            scenario_ids=[uuid4(), uuid4(), uuid4()],
+            scenario_content_hashes=["ch0", "ch1", "ch2"],
+            solver_inputs=[_sample_solver_input(v) for v in range(3)],
+        )
+        done = batch_service.execute_batch(batch.batch_id)
+        sids = done.scenario_ids
+
+        many = comparison_service.compute_comparisons_many(
+            study_case_id=case_id,
+            base_run_id=done.run_ids[0],
+            base_scenario_id=sids[0],
+            others=[(done.run_ids[1], sids[1]), (done.run_ids[2], sids[2])],
+            max_workers=2,
+        )
+        assert len(many) == 2
+        for i, comparison in enumerate(many, start=1):
+            pairwise = comparison_service.compute_comparison(
+                study_case_id=case_id,
+                base_run_id=done.run_ids[0],
+                other_run_id=done.run_ids[i],
+                base_scenario_id=sids[0],
+                other_scenario_id=sids[i],
+            )
+            assert self._payload(comparison) == self._payload(pairwise)
+
+        # Aligned arrays are cached for drilldowns
+        aligned = comparison_service.get_aligned_results(done.run_ids)
+        assert aligned is comparison_service.get_aligned_results(done.run_ids)
+        assert len(comparison_service.list_comparisons(case_id)) == 4
+
+    def test_aligned_cache_evicts_least_recently_used(self, monkeypatch):
+        import application.sc_comparison_service as sc_comparison_service
+
+        monkeypatch.setattr(sc_comparison_service, "ALIGNED_RESULTS_CACHE_SIZE", 2)
+        engine, case_id = _make_engine_with_case()
+        batch_service = BatchExecutionService(engine)
+        batch = batch_service.create_batch_job(
+            study_case_id=case_id,
+            analysis_type=ExecutionAnalysisType.SC_3F,
+            scenario_ids=[uuid4(), uuid4(), uuid4()],
+            scenario_content_hashes=["ch0", "ch1", "ch2"],
+            solver_inputs=[_sample_solver_input(v) for v in range(3)],
+        )
+        r0, r1, r2 = batch_service.execute_batch(batch.batch_id).run_ids
+        service = ScComparisonService(engine)
+
+        first = service.get_aligned_results((r0, r1))
+        service.get_aligned_results((r0, r2))
+        assert service.get_aligned_results((r0, r1)) is first
+        service.get_aligned_results((r1, r2))
+
+        assert list(service._aligned) == [(r0, r1), (r1, r2)]
+
+    def test_service_n_way_rejects_not_done(self):
+        engine, case_id = _make_engine_with_case()
+        service = ScComparisonService(engine)
+        run = engine.create_run(
+            study_case_id=case_id,
+            analysis_type=ExecutionAnalysisType.SC_3F,
+            solver_input=_sample_solver_input(0),
+        )
+        with pytest.raises(RunNotDoneError):
+            service.compute_comparisons_many(
+                study_case_id=case_id,
+                base_run_id=run.id,
+                base_scenario_id=uuid4(),
+                others=[(run.id, uuid4())],
+            )
+
+
 # =============================================================================
 # BatchJob Domain Model Tests
 # =============================================================================
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import io
+import json
+import zipfile
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
 from api.main import app
+from application.proof_engine.batch import proof_artifact_id
 from tests.catalog_test_helpers import gpz_payload, gpz_source_record
 
 
@@ -293,6 +297,19 @@ def test_power_flow_read_and_export_endpoints_use_canonical_run(client: TestClie
     assert "branch-load" in {row["element_id"] for row in export_payload["branch_results"]["rows"]}
     assert export_payload["white_box_trace"]
 
+    pdf_response = client.get(f"/power-flow-runs/{run_id}/export/pdf")
+    assert pdf_response.status_code == 200
+    assert pdf_response.headers["content-type"] == "application/pdf"
+    assert pdf_response.content.startswith(b"%PDF")
+    assert client.get(f"/power-flow-runs/{run_id}/export/pdf").content == pdf_response.content
+
+    bundle_response = client.get(f"/power-flow-runs/{run_id}/export/bundle")
+    assert bundle_response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(bundle_response.content)) as archive:
+        assert archive.namelist() == [f"power_flow_run_{run_id}.pdf", f"power_flow_run_{run_id}.docx"]
+        assert archive.read(f"power_flow_run_{run_id}.pdf") == pdf_response.content
+    assert client.get(f"/power-flow-runs/{run_id}/export/bundle?formats=xlsx").status_code == 400
+
 
 def test_legacy_snapshot_and_analysis_index_routes_are_disabled_in_main_app(client: TestClient) -> None:
     case_id = str(uuid4())
@@ -302,3 +319,263 @@ def test_legacy_snapshot_and_analysis_index_routes_are_disabled_in_main_app(clie
     assert client.post(f"/cases/{case_id}/actions/batch", json={"actions": []}).status_code == 404
     assert client.get("/analysis-runs/design_synth.connection_study/run-1").status_code == 404
     assert client.get("/analysis-runs").status_code == 404
+
+
+def test_sld_overlay_columnar_format_and_etag_revalidation(client: TestClient) -> None:
+    from application.sld.overlay_columnar import (
+        OVERLAY_COLUMNAR_MEDIA_TYPE,
+        decode_sld_overlay_columnar,
+    )
+    from domain.models import Project
+
+    case_id = str(uuid4())
+    _seed_power_flow_enm(client, case_id)
+    run_id = client.post(f"/api/cases/{case_id}/runs/power-flow").json()["run_id"]
+
+    project_id = uuid4()
+    node_ids = sorted(str(uuid4()) for _ in range(2))
+    with client.app.state.uow_factory() as uow:
+        uow.projects.add(Project(id=project_id, name="Projekt SLD"))
+        diagram_id = uow.sld.save(
+            project_id=project_id,
+            name="SLD",
+            payload={"nodes": [{"node_id": node_id} for node_id in node_ids]},
+        )
+
+    url = f"/projects/{project_id}/sld/{diagram_id}/overlay"
+    json_response = client.get(url, params={"run_id": run_id})
+    assert json_response.status_code == 200
+    etag = json_response.headers["etag"]
+    overlay = json_response.json()
+
+    not_modified = client.get(url, params={"run_id": run_id}, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    columnar = client.get(url, params={"run_id": run_id, "format": "columnar"})
+    assert columnar.status_code == 200
+    assert columnar.headers["content-type"] == OVERLAY_COLUMNAR_MEDIA_TYPE
+    assert columnar.headers["etag"] != etag
+    decoded = decode_sld_overlay_columnar(columnar.content)
+    assert [row["element_id"] for row in decoded["nodes"]] == node_ids
+    assert [row["symbol_id"] for row in decoded["nodes"]] == [
+        row["symbol_id"] for row in overlay["nodes"]
+    ]
+    assert [row["u_pu"] for row in decoded["nodes"]] == [row["u_pu"] for row in overlay["nodes"]]
+    assert decoded["branches"] == []
+
+    run_overlay = client.get(
+        f"/analysis-runs/{run_id}/overlay",
+        params={"diagram_id": str(diagram_id)},
+        headers={"If-None-Match": etag},
+    )
+    assert run_overlay.status_code == 200
+    assert run_overlay.json()["bus_overlays"] == overlay["nodes"]
+
+
+def test_result_tables_are_served_from_materialized_read_model(client: TestClient) -> None:
+    from uuid import UUID
+
+    from enm import canonical_analysis
+
+    case_id = str(uuid4())
+    _seed_power_flow_enm(client, case_id)
+    run_id = client.post(f"/api/cases/{case_id}/runs/power-flow").json()["run_id"]
+    run = canonical_analysis.get_run(UUID(run_id))
+    read_model = canonical_analysis._read_models[run.id]
+
+    full = client.get(f"/analysis-runs/{run_id}/results/buses").json()
+    assert full["rows"] == read_model.bus_results["rows"]
+    assert (full["total"], full["next_cursor"]) == (len(full["rows"]), None)
+    assert canonical_analysis.get_results_read_model(run) is read_model
+
+    by_voltage = client.get(
+        f"/analysis-runs/{run_id}/results/buses", params={"sort": "u_pu", "order": "desc"}
+    ).json()["rows"]
+    assert [row["u_pu"] for row in by_voltage] == sorted(
+        (row["u_pu"] for row in full["rows"]), reverse=True
+    )
+
+    slack = client.get(
+        f"/analysis-runs/{run_id}/results/buses", params={"flag": "SLACK"}
+    ).json()
+    assert slack["total"] == 1 and slack["rows"][0]["flags"] == ["SLACK"]
+    searched = client.get(
+        f"/analysis-runs/{run_id}/results/buses", params={"q": "ODBIORU"}
+    ).json()
+    assert [row["element_id"] for row in searched["rows"]] == ["bus-load"]
+
+    first = client.get(f"/analysis-runs/{run_id}/results/buses", params={"limit": 1}).json()
+    assert len(first["rows"]) == 1 and first["total"] == len(full["rows"])
+    second = client.get(
+        f"/analysis-runs/{run_id}/results/buses",
+        params={"limit": 1, "cursor": first["next_cursor"]},
+    ).json()
+    assert first["rows"] + second["rows"] == full["rows"][:2]
+
+    assert client.get(
+        f"/analysis-runs/{run_id}/results/buses", params={"sort": "nope"}
+    ).status_code == 400
+    assert client.get(
+        f"/analysis-runs/{run_id}/results/branches", params={"cursor": "###", "limit": 1}
+    ).status_code == 400
+
+
+def test_read_model_failure_marks_run_failed_and_is_not_cached(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from enm import canonical_analysis
+
+    case_id = str(uuid4())
+    _seed_power_flow_enm(client, case_id)
+
+    def _broken(run):
+        raise RuntimeError("projection failed")
+
+    monkeypatch.setattr(canonical_analysis, "build_bus_results", _broken)
+    run = canonical_analysis.run_power_flow_now(case_id=case_id)
+
+    assert run.status == "FAILED"
+    assert run.error_message == "projection failed"
+    assert run.finished_at is not None
+    assert run.id not in canonical_analysis._read_models
+
+    monkeypatch.undo()
+    read_model = canonical_analysis.get_results_read_model(run)
+    assert canonical_analysis._read_models[run.id] is read_model
+
+
+def test_short_circuit_proof_pack_is_built_from_run_columns(client: TestClient) -> None:
+    from enm import canonical_analysis
+
+    case_id = str(uuid4())
+    client.post(
+        f"/api/cases/{case_id}/enm/domain-ops",
+        json={
+            "operation": {
+                "name": "add_grid_source_sn",
+                "payload": gpz_payload(voltage_kv=15.0, sk3_mva=250.0, rx_ratio=0.10),
+            }
+        },
+    )
+    run = canonical_analysis.run_short_circuit_now(case_id=case_id)
+    node_ids = [row["fault_node_id"] for row in run.raw_result["results"]]
+
+    project_pack = client.get(f"/analysis-runs/{run.id}/proof-pack")
+    assert project_pack.status_code == 200
+    assert project_pack.headers["content-type"] == "application/zip"
+    manifest = json.loads(
+        zipfile.ZipFile(io.BytesIO(project_pack.content)).read("proof_pack/manifest.json")
+    )
+    assert manifest["run_id"] == str(run.id)
+    assert len(manifest["proofs"]) == len(node_ids)
+
+    per_bus = client.get(f"/analysis-runs/{run.id}/proof-pack", params={"layout": "per_bus"})
+    assert per_bus.status_code == 200
+    assert zipfile.ZipFile(io.BytesIO(per_bus.content)).namelist() == [
+        f"pakiet_dowodowy/{node_id}.zip" for node_id in node_ids
+    ]
+
+    # Artifact IDs are derived from the run and bus, so re-exports agree
+    again = json.loads(
+        zipfile.ZipFile(io.BytesIO(client.get(f"/analysis-runs/{run.id}/proof-pack").content)).read(
+            "proof_pack/manifest.json"
+        )
+    )
+    assert [proof["artifact_id"] for proof in again["proofs"]] == [
+        proof["artifact_id"] for proof in manifest["proofs"]
+    ]
+    assert manifest["proofs"][0]["artifact_id"] == str(
+        proof_artifact_id(str(run.id), "3F", node_ids[0])
+    )
+
+    power_flow_case_id = str(uuid4())
+    _seed_power_flow_enm(client, power_flow_case_id)
+    power_flow_run = canonical_analysis.run_power_flow_now(case_id=power_flow_case_id)
+    assert client.get(f"/analysis-runs/{power_flow_run.id}/proof-pack").status_code == 404
+
+
+def test_proof_pack_names_come_from_the_study_case() -> None:
+    from types import SimpleNamespace
+
+    from api.analysis_runs import _run_display_names
+
+    case_id, project_id = uuid4(), uuid4()
+    run = SimpleNamespace(case_id=str(case_id), project_id=str(project_id))
+
+    class _Uow:
+        cases = SimpleNamespace(
+            get_study_case=lambda key: (
+                SimpleNamespace(name="Zima szczyt") if key == case_id else None
+            )
+        )
+        projects = SimpleNamespace(
+            get=lambda key: SimpleNamespace(name="GPZ Północ") if key == project_id else None
+        )
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc) -> None:
+            return None
+
+    assert _run_display_names(run, _Uow) == ("GPZ Północ", "Zima szczyt")
+    missing = SimpleNamespace(case_id=str(uuid4()), project_id=None)
+    assert _run_display_names(missing, _Uow) == ("Projekt", f"Przypadek {missing.case_id}")
+
+
+def test_trace_steps_are_paged_and_filtered_server_side(client: TestClient) -> None:
+    case_id = str(uuid4())
+    _seed_power_flow_enm(client, case_id)
+    run_id = client.post(f"/api/cases/{case_id}/runs/power-flow").json()["run_id"]
+    full_trace = client.get(f"/analysis-runs/{run_id}/results/trace").json()["white_box_trace"]
+
+    steps: list[dict] = []
+    positions: list[int] = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/analysis-runs/{run_id}/results/trace/steps", params=params).json()
+        assert page["total"] == len(full_trace)
+        steps += page["steps"]
+        positions += page["positions"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert steps == full_trace
+    assert positions == list(range(len(full_trace)))
+
+    index = client.get(f"/analysis-runs/{run_id}/results/trace/index").json()
+    assert index["step_count"] == len(full_trace)
+    empty = client.get(
+        f"/analysis-runs/{run_id}/results/trace/steps", params={"element_id": "missing"}
+    ).json()
+    assert (empty["steps"], empty["total"]) == ([], 0)
+    assert client.get(
+        f"/analysis-runs/{run_id}/results/trace/steps", params={"cursor": "###"}
+    ).status_code == 400
+
+
+def test_trace_jsonl_export_is_streamed_gzip(client: TestClient) -> None:
+    import gzip
+    import json
+
+    case_id = str(uuid4())
+    _seed_power_flow_enm(client, case_id)
+    run_id = client.post(f"/api/cases/{case_id}/runs/power-flow").json()["run_id"]
+    trace = client.get(f"/analysis-runs/{run_id}/results/trace").json()["white_box_trace"]
+
+    response = client.get(f"/analysis-runs/{run_id}/results/trace/export/jsonl")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert f"trace_{run_id}.jsonl.gz" in response.headers["content-disposition"]
+    lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+    assert [json.loads(line)["step_name"] for line in lines] == [
+        step.get("key", f"step_{index}") for index, step in enumerate(trace, start=1)
+    ]
+
+    plain = client.get(
+        f"/analysis-runs/{run_id}/results/trace/export/jsonl", params={"compression": "none"}
+    )
+    assert plain.content == gzip.decompress(response.content)
@@ -45,6 +45,20 @@ from infrastructure.cloud_backup import (
     create_backup_provider,
     extract_backup_id_from_key,
     generate_backup_key,
+    generate_chunk_key,
+)
+from domain.archive_chunks import (
+    assemble_archive,
+    chunk_archive,
+    read_chunk_manifest,
+    serialize_chunk_manifest,
+)
+from domain.project_archive import (
+    ARCHIVE_FORMAT_ID,
+    ARCHIVE_SCHEMA_VERSION,
+    ProjectArchive,
+    compute_archive_fingerprints,
+    dict_to_archive,
 )
 
 
@@ -794,3 +808,326 @@ class TestErrorHandling:
         # Powinien być parsowany jako ISO 8601
         dt = datetime.fromisoformat(result.timestamp)
         assert dt.tzinfo is not None
+
+
+# ============================================================================
+# TEST: KOPIE CHUNKOWANE (DEDUPLIKACJA)
+# ============================================================================
+
+
+def _project_archive(runs: int, changed: int | None = None) -> ProjectArchive:
+    """Archiwum z `runs` runami; run `changed` ma zmieniony wynik."""
+    sections = {
+        "project_meta": {
+            "id": "proj-1", "name": "Backup", "description": None,
+            "schema_version": ARCHIVE_SCHEMA_VERSION,
+            "active_network_snapshot_id": None, "connection_node_id": None,
+            "sources": [], "created_at": "2026-01-01T00:00:00",
+            "updated_at": "2026-01-01T00:00:00",
+        },
+        "network_model": {
+            "nodes": [{"id": "n1"}], "branches": [], "sources": [],
+            "loads": [], "snapshots": [],
+        },
+        "sld_diagrams": {
+            "diagrams": [], "node_symbols": [], "branch_symbols": [],
+            "annotations": [],
+        },
+        "cases": {
+            "study_cases": [], "operating_cases": [], "switching_states": [],
+            "settings": None,
+        },
+        "runs": {
+            "analysis_runs": [
+                {"id": f"run-{i}", "ik_ka": 10.0 + i + (0.5 if i == changed else 0.0)}
+                for i in range(runs)
+            ],
+            "analysis_runs_index": [],
+            "study_runs": [],
+        },
+        "results": {"study_results": []},
+        "proofs": {"design_specs": [], "design_proposals": [], "design_evidence": []},
+        "interpretations": {"cached": []},
+        "issues": {"snapshot": []},
+    }
+    fp = compute_archive_fingerprints(
+        project_meta=sections["project_meta"],
+        network_model=sections["network_model"],
+        sld=sections["sld_diagrams"],
+        cases=sections["cases"],
+        runs=sections["runs"],
+        results=sections["results"],
+        proofs=sections["proofs"],
+        interpretations=sections["interpretations"],
+        issues=sections["issues"],
+    )
+    return dict_to_archive(
+        {
+            "format_id": ARCHIVE_FORMAT_ID,
+            "schema_version": ARCHIVE_SCHEMA_VERSION,
+            "fingerprints": fp.__dict__,
+            **sections,
+        }
+    )
+
+
+class InMemoryS3Client:
+    """Minimalny klient S3 (słownik) ze stronicowaniem list_objects_v2."""
+
+    class exceptions:  # noqa: N801 — nazwa jak w boto3
+        class NoSuchKey(Exception):
+            pass
+
+        class NoSuchBucket(Exception):
+            pass
+
+    def __init__(self, page_size: int = 2) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.put_keys: list[str] = []
+        self._page_size = page_size
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs: object) -> None:
+        self.objects[Key] = Body
+        self.put_keys.append(Key)
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        if Key not in self.objects:
+            raise self.exceptions.NoSuchKey(Key)
+        import io
+
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def delete_object(self, Bucket: str, Key: str) -> None:
+        self.objects.pop(Key, None)
+
+    def list_objects_v2(
+        self, Bucket: str, Prefix: str, ContinuationToken: str | None = None
+    ) -> dict:
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + self._page_size]
+        response: dict = {
+            "Contents": [{"Key": k, "Size": len(self.objects[k])} for k in page],
+            "IsTruncated": start + self._page_size < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + self._page_size)
+        return response
+
+
+class TestChunkedBackup:
+    """Kopie chunkowane: przesyłane tylko brakujące chunki."""
+
+    def test_second_backup_uploads_only_changed_chunk(
+        self,
+        local_provider: LocalBackupProvider,
+        sample_project_id: str,
+    ) -> None:
+        manifest, chunks = chunk_archive(_project_archive(20))
+        first = local_provider.upload_chunked(
+            manifest, chunks, sample_project_id,
+            timestamp="2026-01-15T10:00:00+00:00",
+        )
+        manifest2, chunks2 = chunk_archive(_project_archive(20, changed=3))
+        second = local_provider.upload_chunked(
+            manifest2, chunks2, sample_project_id,
+            timestamp="2026-01-16T10:00:00+00:00",
+        )
+
+        assert first.success and second.success
+        assert first.chunks_uploaded == first.chunks_total == len(chunks)
+        assert second.chunks_total == len(chunks2)
+        assert second.chunks_uploaded == 1
+        assert second.size_bytes < first.size_bytes
+        assert len(local_provider.list_backups(sample_project_id)) == 2
+
+    def test_restore_assembles_archive(
+        self,
+        local_provider: LocalBackupProvider,
+        sample_project_id: str,
+    ) -> None:
+        archive = _project_archive(5)
+        manifest, chunks = chunk_archive(archive)
+        local_provider.upload_chunked(
+            manifest, chunks, sample_project_id,
+            timestamp="2026-01-15T10:00:00+00:00",
+        )
+        entry = local_provider.list_backups(sample_project_id)[0]
+
+        stored = read_chunk_manifest(
+            local_provider.download(entry.backup_id, sample_project_id)
+        )
+        assert stored is not None
+        rebuilt = assemble_archive(
+            stored, local_provider.fetch_chunks(stored, sample_project_id)
+        )
+        assert rebuilt.fingerprints == archive.fingerprints
+
+    def test_fetch_detects_corrupted_chunk(
+        self,
+        local_config: CloudBackupConfig,
+        local_provider: LocalBackupProvider,
+        sample_project_id: str,
+    ) -> None:
+        manifest, chunks = chunk_archive(_project_archive(2))
+        local_provider.upload_chunked(manifest, chunks, sample_project_id)
+        digest = sorted(chunks)[0]
+        key = generate_chunk_key(local_config.prefix, sample_project_id, digest)
+        (Path(local_config.bucket_name) / key).write_bytes(b"{}")
+
+        with pytest.raises(CloudBackupIntegrityError):
+            local_provider.fetch_chunks(manifest, sample_project_id)
+
+    def test_prune_removes_orphaned_chunks(
+        self,
+        local_provider: LocalBackupProvider,
+        sample_project_id: str,
+    ) -> None:
+        manifest, chunks = chunk_archive(_project_archive(4))
+        local_provider.upload_chunked(
+            manifest, chunks, sample_project_id,
+            timestamp="2026-01-15T10:00:00+00:00",
+        )
+        manifest2, chunks2 = chunk_archive(_project_archive(4, changed=0))
+        local_provider.upload_chunked(
+            manifest2, chunks2, sample_project_id,
+            timestamp="2026-01-16T10:00:00+00:00",
+        )
+        oldest = local_provider.list_backups(sample_project_id)[-1]
+        local_provider.delete_backup(oldest.backup_id, sample_project_id)
+
+        assert local_provider.prune_chunks(sample_project_id) == 1
+        assert local_provider.fetch_chunks(manifest2, sample_project_id)
+
+    def test_prune_reads_only_zip_directory_of_full_archives(
+        self,
+        local_provider: LocalBackupProvider,
+        sample_project_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import io
+        import zipfile
+
+        manifest, chunks = chunk_archive(_project_archive(2))
+        local_provider.upload_chunked(
+            manifest, chunks, sample_project_id,
+            timestamp="2026-01-15T10:00:00+00:00",
+        )
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("project.json", os.urandom(1024 * 1024))
+        full = buf.getvalue()
+        local_provider.upload(
+            full, sample_project_id, compute_file_hash(full),
+            timestamp="2026-01-16T10:00:00+00:00",
+        )
+
+        read_bytes: list[int] = []
+        read_range = local_provider._read_range
+
+        def counting(key: str, start: int, end: int) -> bytes:
+            data = read_range(key, start, end)
+            read_bytes.append(len(data))
+            return data
+
+        monkeypatch.setattr(local_provider, "_read_range", counting)
+        monkeypatch.setattr(
+            local_provider, "download", lambda *args: pytest.fail("pełne pobranie kopii")
+        )
+
+        assert local_provider.prune_chunks(sample_project_id) == 0
+        assert 0 < sum(read_bytes) < len(full) // 4
+
+    def test_prune_waits_for_running_chunked_upload(
+        self,
+        local_provider: LocalBackupProvider,
+        sample_project_id: str,
+    ) -> None:
+        import threading
+
+        from infrastructure.cloud_backup import _project_chunk_lock
+
+        lock = _project_chunk_lock(sample_project_id)
+        pruned: list[int] = []
+        with lock:
+            worker = threading.Thread(
+                target=lambda: pruned.append(local_provider.prune_chunks(sample_project_id))
+            )
+            worker.start()
+            worker.join(timeout=0.2)
+            assert worker.is_alive() and not pruned
+        worker.join(timeout=5)
+        assert pruned == [0]
+
+    def test_large_chunks_and_manifest_go_through_upload_file(
+        self,
+        local_config: CloudBackupConfig,
+        sample_project_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from infrastructure.cloud_transfer import TransferConfig
+
+        manifest, chunks = chunk_archive(_project_archive(3))
+        threshold = min(
+            max(len(data) for data in chunks.values()),
+            len(serialize_chunk_manifest(manifest)),
+        )
+        provider = LocalBackupProvider(
+            local_config,
+            transfer=TransferConfig(part_size=64, multipart_threshold=threshold),
+        )
+        upload_file = provider.upload_file
+        keys: list[str | None] = []
+
+        def spy(*args, **kwargs):
+            keys.append(kwargs.get("key"))
+            return upload_file(*args, **kwargs)
+
+        monkeypatch.setattr(provider, "upload_file", spy)
+        result = provider.upload_chunked(
+            manifest, chunks, sample_project_id,
+            timestamp="2026-01-15T10:00:00+00:00",
+        )
+
+        large = [d for d, data in chunks.items() if len(data) >= threshold]
+        assert result.success and result.chunks_uploaded == len(chunks)
+        assert keys[: len(large)] == [
+            generate_chunk_key(local_config.prefix, sample_project_id, d)
+            for d in sorted(large)
+        ]
+        assert keys[len(large):] == [None]  # manifest
+        assert not list(Path(local_config.bucket_name).rglob("*.part"))
+        rebuilt = assemble_archive(
+            manifest, provider.fetch_chunks(manifest, sample_project_id)
+        )
+        assert rebuilt.fingerprints == manifest.fingerprints
+
+    def test_s3_dedup_with_paginated_listing(self, sample_project_id: str) -> None:
+        client = InMemoryS3Client(page_size=2)
+        provider = S3BackupProvider(
+            CloudBackupConfig(
+                backend=CloudBackendType.S3,
+                bucket_name="bucket",
+                region="eu-central-1",
+            ),
+            s3_client=client,
+        )
+        manifest, chunks = chunk_archive(_project_archive(6))
+        provider.upload_chunked(
+            manifest, chunks, sample_project_id,
+            timestamp="2026-01-15T10:00:00+00:00",
+        )
+        client.put_keys.clear()
+
+        manifest2, chunks2 = chunk_archive(_project_archive(6, changed=5))
+        result = provider.upload_chunked(
+            manifest2, chunks2, sample_project_id,
+            timestamp="2026-01-16T10:00:00+00:00",
+        )
+
+        assert result.chunks_uploaded == 1
+        assert len(client.put_keys) == 2  # chunk + manifest
+        rebuilt = assemble_archive(
+            manifest2, provider.fetch_chunks(manifest2, sample_project_id)
+        )
+        assert rebuilt.fingerprints == manifest2.fingerprints
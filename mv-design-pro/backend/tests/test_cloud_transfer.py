@@ -0,0 +1,325 @@
+"""
+Testy warstwy transferu częściowego kopii zapasowych.
+
+Pokrycie:
+- ordered_parallel_map: kolejność wyników i limit zadań w toku
+- LocalBackupProvider: upload_file / download_file, wznawianie pobierania
+- S3BackupProvider (in-process stand-in S3): multipart równoległy,
+  wznowienie po przerwaniu (stan na dysku), weryfikacja hash, zakresy
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from infrastructure.cloud_backup import (
+    CloudBackendType,
+    CloudBackupConfig,
+    CloudBackupIntegrityError,
+    CloudBackupUploadError,
+    LocalBackupProvider,
+    S3BackupProvider,
+)
+from infrastructure.cloud_transfer import (
+    TransferConfig,
+    TransferStateStore,
+    TransferState,
+    byte_ranges,
+    ordered_parallel_map,
+)
+
+
+PROJECT_ID = "proj-transfer"
+TIMESTAMP = "2026-02-01T12:00:00+00:00"
+
+
+class InProcessS3:
+    """S3-compatible stand-in: put/get (Range)/head, multipart, list_parts."""
+
+    class exceptions:  # noqa: N801 — nazwa jak w boto3
+        class NoSuchKey(Exception):
+            pass
+
+        class NoSuchBucket(Exception):
+            pass
+
+        class NoSuchUpload(Exception):
+            pass
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.part_calls: list[int] = []
+        self.fail_parts: set[int] = set()
+        self.aborted: list[str] = []
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs: object) -> None:
+        self.objects[Key] = Body
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        if Key not in self.objects:
+            raise self.exceptions.NoSuchKey(f"404 {Key}")
+        return {"ContentLength": len(self.objects[Key])}
+
+    def get_object(self, Bucket: str, Key: str, Range: str | None = None) -> dict:
+        if Key not in self.objects:
+            raise self.exceptions.NoSuchKey(Key)
+        data = self.objects[Key]
+        if Range is not None:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start):int(end) + 1]
+        return {"Body": io.BytesIO(data)}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs: object) -> dict:
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict:
+        with self._lock:
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+        try:
+            time.sleep(0.002)
+            self.part_calls.append(PartNumber)
+            if PartNumber in self.fail_parts:
+                self.fail_parts.discard(PartNumber)
+                raise ConnectionError(f"zerwane połączenie (część {PartNumber})")
+            self.uploads[UploadId][PartNumber] = Body
+            return {"ETag": hashlib.md5(Body).hexdigest()}
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def list_parts(self, Bucket: str, Key: str, UploadId: str, **kwargs: object) -> dict:
+        if UploadId not in self.uploads:
+            raise self.exceptions.NoSuchUpload(UploadId)
+        return {
+            "Parts": [
+                {"PartNumber": n, "ETag": hashlib.md5(b).hexdigest()}
+                for n, b in sorted(self.uploads[UploadId].items())
+            ],
+            "IsTruncated": False,
+        }
+
+    def complete_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict
+    ) -> None:
+        parts = self.uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        assert numbers == list(range(1, len(parts) + 1))
+        self.objects[Key] = b"".join(parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> None:
+        self.uploads.pop(UploadId, None)
+        self.aborted.append(UploadId)
+
+
+@pytest.fixture()
+def archive_file(tmp_path: Path) -> Path:
+    path = tmp_path / "archive.mvdp.zip"
+    path.write_bytes(bytes(range(256)) * 41)  # 10 496 B — 11 części po 1 KiB
+    return path
+
+
+@pytest.fixture()
+def transfer(tmp_path: Path) -> TransferConfig:
+    return TransferConfig(
+        part_size=1024,
+        multipart_threshold=2048,
+        max_workers=3,
+        state_dir=str(tmp_path / "state"),
+    )
+
+
+def _sha(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _s3(client: InProcessS3, transfer: TransferConfig) -> S3BackupProvider:
+    return S3BackupProvider(
+        CloudBackupConfig(
+            backend=CloudBackendType.S3,
+            bucket_name="bucket",
+            region="eu-central-1",
+        ),
+        s3_client=client,
+        transfer=transfer,
+    )
+
+
+class TestTransferPrimitives:
+    def test_ordered_parallel_map_keeps_order_and_bound(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work(n: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.001 * (n % 3))
+            with lock:
+                active -= 1
+            return n * n
+
+        assert list(ordered_parallel_map(work, range(20), 4)) == [n * n for n in range(20)]
+        assert peak <= 4
+
+    def test_byte_ranges(self) -> None:
+        assert byte_ranges(0, 2500, 1000) == [(0, 999), (1000, 1999), (2000, 2499)]
+        assert byte_ranges(2000, 2000, 1000) == []
+
+    def test_state_store_survives_restart(self, tmp_path: Path) -> None:
+        state = TransferState(
+            project_id="p", archive_hash="h", key="k", timestamp="t",
+            upload_id="u", parts={1: "e1", 2: "e2"},
+        )
+        TransferStateStore(str(tmp_path)).save(state)
+
+        assert TransferStateStore(str(tmp_path)).load("p", "h") == state
+
+
+class TestLocalFileTransfer:
+    def test_upload_and_download_file(
+        self, tmp_path: Path, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        provider = LocalBackupProvider(
+            CloudBackupConfig(
+                backend=CloudBackendType.LOCAL,
+                bucket_name=str(tmp_path / "bucket"),
+            ),
+            transfer=transfer,
+        )
+        result = provider.upload_file(
+            archive_file, PROJECT_ID, _sha(archive_file), timestamp=TIMESTAMP
+        )
+        assert result.success is True
+        backup_id = provider.list_backups(PROJECT_ID)[0].backup_id
+
+        target = tmp_path / "restored.zip"
+        downloaded = provider.download_file(backup_id, PROJECT_ID, target)
+
+        assert target.read_bytes() == archive_file.read_bytes()
+        assert downloaded.hash == _sha(archive_file)
+
+    def test_upload_wrong_hash_leaves_no_backup(
+        self, tmp_path: Path, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        provider = LocalBackupProvider(
+            CloudBackupConfig(
+                backend=CloudBackendType.LOCAL,
+                bucket_name=str(tmp_path / "bucket"),
+            ),
+            transfer=transfer,
+        )
+        result = provider.upload_file(archive_file, PROJECT_ID, "0" * 64)
+
+        assert result.success is False
+        assert provider.list_backups(PROJECT_ID) == []
+
+    def test_download_resumes_partial_file(
+        self, tmp_path: Path, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        provider = LocalBackupProvider(
+            CloudBackupConfig(
+                backend=CloudBackendType.LOCAL,
+                bucket_name=str(tmp_path / "bucket"),
+            ),
+            transfer=transfer,
+        )
+        provider.upload_file(archive_file, PROJECT_ID, _sha(archive_file), timestamp=TIMESTAMP)
+        backup_id = provider.list_backups(PROJECT_ID)[0].backup_id
+        target = tmp_path / "restored.zip"
+        # Przerwane pobieranie: pierwsze 3 KiB już na dysku
+        (tmp_path / "restored.zip.part").write_bytes(archive_file.read_bytes()[:3072])
+
+        provider.download_file(backup_id, PROJECT_ID, target)
+
+        assert target.read_bytes() == archive_file.read_bytes()
+        assert not (tmp_path / "restored.zip.part").exists()
+
+
+class TestS3MultipartTransfer:
+    def test_parallel_multipart_upload_and_ranged_download(
+        self, tmp_path: Path, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        client = InProcessS3()
+        provider = _s3(client, transfer)
+
+        result = provider.upload_file(
+            archive_file, PROJECT_ID, _sha(archive_file), timestamp=TIMESTAMP
+        )
+
+        assert result.success is True
+        assert sorted(client.part_calls) == list(range(1, 12))
+        assert client.max_concurrent <= transfer.max_workers
+        backup_id = result.url.rsplit("/", 1)[-1].removesuffix(".mvdp.zip")
+
+        target = tmp_path / "restored.zip"
+        provider.download_file(backup_id, PROJECT_ID, target)
+        assert target.read_bytes() == archive_file.read_bytes()
+
+    def test_interrupted_upload_resumes_after_restart(
+        self, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        client = InProcessS3()
+        client.fail_parts = {7}
+        with pytest.raises(CloudBackupUploadError):
+            _s3(client, transfer).upload_file(
+                archive_file, PROJECT_ID, _sha(archive_file), timestamp=TIMESTAMP
+            )
+        sent_before = len(client.part_calls)
+        client.part_calls.clear()
+
+        # Nowa instancja (restart procesu) — stan z state_dir
+        result = _s3(client, transfer).upload_file(
+            archive_file, PROJECT_ID, _sha(archive_file)
+        )
+
+        assert result.success is True
+        assert result.timestamp == TIMESTAMP
+        assert 7 in client.part_calls
+        assert len(client.part_calls) < 11
+        assert sent_before + len(client.part_calls) >= 11
+        (stored,) = client.objects.values()
+        assert stored == archive_file.read_bytes()
+
+    def test_hash_mismatch_aborts_multipart(
+        self, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        client = InProcessS3()
+
+        result = _s3(client, transfer).upload_file(archive_file, PROJECT_ID, "f" * 64)
+
+        assert result.success is False
+        assert client.aborted and not client.objects
+
+    def test_download_verifies_hash(
+        self, tmp_path: Path, archive_file: Path, transfer: TransferConfig
+    ) -> None:
+        client = InProcessS3()
+        provider = _s3(client, transfer)
+        result = provider.upload_file(
+            archive_file, PROJECT_ID, _sha(archive_file), timestamp=TIMESTAMP
+        )
+        backup_id = result.url.rsplit("/", 1)[-1].removesuffix(".mvdp.zip")
+        (key,) = client.objects
+        client.objects[key] = b"x" + client.objects[key][1:]
+
+        target = tmp_path / "restored.zip"
+        with pytest.raises(CloudBackupIntegrityError):
+            provider.download_file(backup_id, PROJECT_ID, target)
+        assert not target.exists()
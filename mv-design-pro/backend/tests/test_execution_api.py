@@ -258,6 +258,20 @@ class TestListRunsEndpoint:
         data = response.json()
         assert data["count"] == 2
         assert len(data["runs"]) == 2
+        assert data["next_cursor"] is None
+
+        first_page = client.get(
+            f"/api/execution/study-cases/{registered_case}/runs", params={"limit": 1}
+        ).json()
+        assert len(first_page["runs"]) == 1
+        second_page = client.get(
+            f"/api/execution/study-cases/{registered_case}/runs",
+            params={"cursor": first_page["next_cursor"]},
+        ).json()
+        assert second_page["next_cursor"] is None
+        assert {run["id"] for run in first_page["runs"] + second_page["runs"]} == {
+            run["id"] for run in data["runs"]
+        }
 
 
 class TestExecuteRunEndpoint:
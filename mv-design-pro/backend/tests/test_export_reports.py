@@ -902,3 +902,65 @@ class TestExportManifestDeterminism:
         )
 
         assert m1.export_id == m2.export_id
+
+
+# =============================================================================
+# Streaming JSONL Export Tests
+# =============================================================================
+
+class TestStreamingJSONLExport:
+    """Streaming JSONL: generator input, gzip output, constant memory."""
+
+    @staticmethod
+    def _steps(count: int):
+        for index in range(count):
+            yield {
+                "key": f"step_{index}",
+                "title": f"Krok {index}",
+                "formula_latex": r"I_k = \frac{c U_n}{\sqrt{3} Z_k}",
+                "inputs": {"z_ohm": complex(0.5, index % 7)},
+                "result": {"ikss_ka": 10.0 + index / 1000.0},
+            }
+
+    def test_gzip_stream_matches_file_export(self, tmp_path: Path) -> None:
+        import gzip
+        import io
+
+        from network_model.reporting.export_jsonl import (
+            export_trace_jsonl,
+            iter_jsonl_chunks,
+            iter_trace_jsonl,
+            write_jsonl_stream,
+        )
+
+        out = export_trace_jsonl(self._steps(300), tmp_path / "trace.jsonl")
+        buffer = io.BytesIO()
+
+        assert write_jsonl_stream(iter_trace_jsonl(self._steps(300)), buffer) == 300
+        assert gzip.decompress(buffer.getvalue()) == out.read_bytes()
+        chunks = list(
+            iter_jsonl_chunks(iter_trace_jsonl(self._steps(300)), chunk_size=1024)
+        )
+        assert b"".join(chunks) == buffer.getvalue()
+
+    def test_memory_does_not_grow_with_trace_size(self) -> None:
+        import tracemalloc
+
+        from network_model.reporting.export_jsonl import iter_jsonl_chunks, iter_trace_jsonl
+
+        def peak(count: int) -> int:
+            tracemalloc.start()
+            for _ in iter_jsonl_chunks(iter_trace_jsonl(self._steps(count))):
+                pass
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak_bytes
+
+        small, large = peak(2_000), peak(40_000)
+        assert large < small * 2
+
+    def test_unknown_compression_is_rejected(self) -> None:
+        from network_model.reporting.export_jsonl import iter_jsonl_chunks
+
+        with pytest.raises(ValueError):
+            iter_jsonl_chunks(iter(["{}"]), compression="lz4")  # type: ignore[arg-type]
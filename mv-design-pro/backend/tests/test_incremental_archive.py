@@ -30,6 +30,7 @@ import pytest
 
 from domain.project_archive import (
     ARCHIVE_FORMAT_ID,
+    ArchiveError,
     ARCHIVE_SCHEMA_VERSION,
     ArchiveFingerprints,
     CasesSection,
@@ -46,6 +47,12 @@ from domain.project_archive import (
     compute_archive_fingerprints,
     compute_hash,
 )
+from domain.archive_chunks import (
+    assemble_archive,
+    chunk_archive,
+    read_chunk_manifest,
+    serialize_chunk_manifest,
+)
 from domain.incremental_archive import (
     INCREMENTAL_FORMAT_ID,
     INCREMENTAL_SCHEMA_VERSION,
@@ -57,11 +64,16 @@ from domain.incremental_archive import (
     IncrementalStructureError,
     SectionChangeStatus,
     SectionDelta,
+    apply_chunk_delta,
     apply_incremental_archive,
+    build_chunk_delta,
     build_incremental_archive,
     compute_export_result,
     compute_section_deltas,
+    deserialize_chunk_delta,
     deserialize_incremental,
+    is_chunk_delta,
+    serialize_chunk_delta,
     serialize_incremental,
 )
 
@@ -777,3 +789,116 @@ class TestFrozenDataclasses:
         )
         with pytest.raises(AttributeError):
             result.success = False  # type: ignore[misc]
+
+
+# ============================================================================
+# DELTA NA POZIOMIE CHUNKÓW
+# ============================================================================
+
+
+def _results(count: int, changed: int | None = None) -> list[dict]:
+    return [
+        {
+            "id": f"r{i}",
+            "ik_ka": 12.5 + i + (0.1 if i == changed else 0.0),
+            "trace": [
+                {"step": s, "z_ohm": (i + 1) * 0.0137 * (s + 1) ** 0.5}
+                for s in range(100)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+class TestChunkManifest:
+    """Podział archiwum na chunki i ponowne złożenie."""
+
+    def test_roundtrip_preserves_fingerprints(self) -> None:
+        archive = _make_archive(study_results=_results(5))
+        manifest, chunks = chunk_archive(archive)
+
+        rebuilt = assemble_archive(manifest, chunks)
+
+        assert rebuilt.fingerprints == archive.fingerprints
+        assert archive_to_dict(rebuilt) == archive_to_dict(archive)
+        assert len(manifest.sections["results"]["study_results"]) == 5
+        assert manifest.chunk_hashes() == frozenset(chunks)
+
+    def test_manifest_serialization_is_deterministic(self) -> None:
+        manifest, _ = chunk_archive(_make_archive(study_results=_results(3)))
+
+        data = serialize_chunk_manifest(manifest)
+
+        assert data == serialize_chunk_manifest(manifest)
+        assert read_chunk_manifest(data) == manifest
+
+    def test_plain_project_zip_has_no_manifest(self) -> None:
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("project.json", "{}")
+        assert read_chunk_manifest(buf.getvalue()) is None
+
+    def test_corrupted_chunk_rejected(self) -> None:
+        manifest, chunks = chunk_archive(_make_archive(study_results=_results(2)))
+        digest = manifest.sections["results"]["study_results"][0]
+        chunks[digest] = b'{"id":"r0"}'
+
+        with pytest.raises(ArchiveError):
+            assemble_archive(manifest, chunks)
+
+
+class TestChunkDelta:
+    """Delta chunków: tylko zmienione elementy."""
+
+    def test_single_changed_result_ships_one_chunk(self) -> None:
+        base = _make_archive(study_results=_results(50))
+        current = _make_archive(study_results=_results(50, changed=7))
+        base_manifest, _ = chunk_archive(base)
+
+        delta = build_chunk_delta(
+            base.fingerprints, base_manifest.chunk_hashes(), current
+        )
+
+        assert delta.changed_sections == ("results",)
+        assert len(delta.chunks) == 1
+        section_delta = compute_section_deltas(base.fingerprints, current)
+        sectional = serialize_incremental(
+            build_incremental_archive(base.fingerprints, current)
+        )
+        assert any(d.status == SectionChangeStatus.MODIFIED for d in section_delta)
+        assert len(serialize_chunk_delta(delta)) < len(sectional)
+
+    def test_serialize_apply_roundtrip(self) -> None:
+        base = _make_archive(study_results=_results(10))
+        current = _make_archive(
+            study_results=_results(11, changed=2), project_name="Nowa nazwa"
+        )
+        base_manifest, _ = chunk_archive(base)
+        delta = build_chunk_delta(
+            base.fingerprints, base_manifest.chunk_hashes(), current
+        )
+
+        data = serialize_chunk_delta(delta)
+        assert is_chunk_delta(data)
+        assert not is_chunk_delta(serialize_incremental(
+            build_incremental_archive(base.fingerprints, current)
+        ))
+        restored = apply_chunk_delta(base, deserialize_chunk_delta(data))
+
+        assert restored.fingerprints == current.fingerprints
+        assert set(delta.changed_sections) == {"project_meta", "results"}
+
+    def test_apply_on_wrong_base_raises(self) -> None:
+        base = _make_archive(study_results=_results(3))
+        current = _make_archive(study_results=_results(3, changed=0))
+        delta = build_chunk_delta(base.fingerprints, frozenset(), current)
+
+        with pytest.raises(BaseHashMismatchError):
+            apply_chunk_delta(current, delta)
+
+    def test_deserialize_wrong_format_id(self) -> None:
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("chunk_delta.json", json.dumps({"format_id": "X"}))
+        with pytest.raises(IncrementalStructureError):
+            deserialize_chunk_delta(buf.getvalue())
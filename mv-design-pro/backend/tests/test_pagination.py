@@ -0,0 +1,99 @@
+"""
+Keyset pagination tests.
+
+- Cursor round-trip and rejection of malformed cursors
+- In-memory pages: ties on created_at broken by id, no item skipped or repeated
+- Items inserted after a page do not shift the following pages
+- Offset pages of immutable row sets (result read models)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from application.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    encode_offset_cursor,
+    keyset_page,
+    offset_page,
+)
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class _Item:
+    id: str
+    created_at: datetime
+
+
+def _key(item: _Item) -> tuple[datetime, str]:
+    return item.created_at, item.id
+
+
+def _all_pages(items: list[_Item], limit: int) -> list[list[str]]:
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        page = keyset_page(items, key=_key, limit=limit, cursor=cursor)
+        pages.append([item.id for item in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_cursor_round_trip_normalizes_to_utc() -> None:
+    local = datetime(2026, 3, 1, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+    created_at, item_id = decode_cursor(encode_cursor(local, "abc"))
+    assert created_at == T0
+    assert created_at.tzinfo == timezone.utc
+    assert item_id == "abc"
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "bnVsbA", "WzEsMl0"])
+def test_malformed_cursor_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_pages_cover_all_items_once_newest_first() -> None:
+    items = [_Item(f"id-{i}", T0 + timedelta(seconds=i // 3)) for i in range(10)]
+    pages = _all_pages(list(reversed(items)), limit=4)
+
+    assert [len(page) for page in pages] == [4, 4, 2]
+    expected = sorted(items, key=_key, reverse=True)
+    assert [item_id for page in pages for item_id in page] == [i.id for i in expected]
+
+
+def test_exact_multiple_of_limit_has_no_empty_page() -> None:
+    items = [_Item(f"id-{i}", T0 + timedelta(seconds=i)) for i in range(4)]
+    assert _all_pages(items, limit=2) == [["id-3", "id-2"], ["id-1", "id-0"]]
+
+
+def test_new_items_do_not_shift_following_pages() -> None:
+    items = [_Item(f"id-{i}", T0 + timedelta(seconds=i)) for i in range(6)]
+    first = keyset_page(items, key=_key, limit=3)
+    items.append(_Item("newest", T0 + timedelta(hours=1)))
+
+    second = keyset_page(items, key=_key, limit=3, cursor=first.next_cursor)
+    assert [item.id for item in second.items] == ["id-2", "id-1", "id-0"]
+
+
+def test_offset_pages_cover_rows_once() -> None:
+    rows = list(range(7))
+    pages = [offset_page(rows, limit=3)]
+    while pages[-1].next_cursor:
+        pages.append(offset_page(rows, limit=3, cursor=pages[-1].next_cursor))
+
+    assert [list(page.items) for page in pages] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert offset_page(rows, limit=7).next_cursor is None
+    with pytest.raises(InvalidCursorError):
+        offset_page(rows, limit=3, cursor=encode_cursor(T0, "id-1"))
+    with pytest.raises(InvalidCursorError):
+        offset_page(rows, limit=3, cursor="###")
+    assert offset_page(rows, limit=3, cursor=encode_offset_cursor(99)).items == ()
@@ -39,6 +39,11 @@ from domain.protection_comparison import (
     StateChange,
     compute_comparison_input_hash,
 )
+from application.protection_comparison import (
+    ProtectionComparisonService,
+    align_protection_results,
+    compute_pair_rows,
+)
 
 
 # =============================================================================
@@ -524,5 +529,142 @@ class TestComparisonLogic:
             result.comparison_id = "modified"  # type: ignore
 
 
+# =============================================================================
+# N-WAY COMPARISON TESTS
+# =============================================================================
+
+
+def _n_way_results() -> tuple[ProtectionResult, ...]:
+    """Baseline + 2 variants with missing keys and all state changes."""
+    baseline = make_result("run_base", (
+        make_evaluation("dev_1", "line_1", "bus_1", 1000.0, 400.0, 0.50, TripState.TRIPS, 40.0),
+        make_evaluation("dev_2", "line_2", "bus_2", 300.0, 400.0, None, TripState.NO_TRIP),
+        make_evaluation("dev_3", "line_3", "bus_3", 800.0, 400.0, 0.30, TripState.TRIPS, 20.0),
+        make_evaluation("dev_4", "line_4", "bus_4", 0.0, 400.0, None, TripState.INVALID),
+    ))
+    variant_1 = make_result("run_v1", (
+        make_evaluation("dev_1", "line_1", "bus_1", 1100.0, 400.0, 0.62, TripState.TRIPS, 30.0),
+        make_evaluation("dev_2", "line_2", "bus_2", 500.0, 400.0, 0.90, TripState.TRIPS, 10.0),
+        make_evaluation("dev_3", "line_3", "bus_3", 350.0, 400.0, None, TripState.NO_TRIP),
+        make_evaluation("dev_5", "line_5", "bus_5", 700.0, 400.0, 0.40, TripState.TRIPS),
+    ))
+    variant_2 = make_result("run_v2", (
+        make_evaluation("dev_1", "line_1", "bus_1", 1000.0, 400.0, 0.50, TripState.TRIPS, 40.0),
+        make_evaluation("dev_4", "line_4", "bus_4", 0.0, 400.0, None, TripState.INVALID),
+    ))
+    return baseline, variant_1, variant_2
+
+
+class TestNWayComparison:
+    """N-way aligned comparison must match pairwise A/B rows exactly."""
+
+    def test_aligned_keys_sorted_union(self):
+        results = _n_way_results()
+        matrix = align_protection_results(("a", "b", "c"), results)
+
+        assert matrix.keys == tuple(sorted(matrix.keys))
+        assert len(matrix.keys) == 5
+        assert matrix.state_codes.shape == (3, 5)
+        assert matrix.present.sum() == 10
+
+    def test_pair_rows_identical_to_ab_matching(self):
+        results = _n_way_results()
+        matrix = align_protection_results(("a", "b", "c"), results)
+        service = ProtectionComparisonService(uow_factory=None)  # type: ignore[arg-type]
+
+        for row_b in (1, 2):
+            expected_rows, expected_matched = service._match_evaluations(
+                results[0].evaluations, results[row_b].evaluations,
+            )
+            expected_rows = service._compute_deltas(expected_rows)
+
+            rows, matched = compute_pair_rows(matrix, 0, row_b)
+
+            assert matched == expected_matched
+            assert [r.to_dict() for r in rows] == [r.to_dict() for r in expected_rows]
+
+    def test_pair_rows_state_changes(self):
+        matrix = align_protection_results(("a", "b", "c"), _n_way_results())
+        rows, _ = compute_pair_rows(matrix, 0, 1)
+        changes = {r.protected_element_ref: r.state_change for r in rows}
+
+        assert changes["line_1"] == StateChange.NO_CHANGE
+        assert changes["line_2"] == StateChange.NO_TRIP_TO_TRIP
+        assert changes["line_3"] == StateChange.TRIP_TO_NO_TRIP
+        assert changes["line_4"] == StateChange.INVALID_CHANGE
+        assert changes["line_5"] == StateChange.INVALID_CHANGE
+
+    def test_drilldown_returns_value_per_run(self):
+        matrix = align_protection_results(("a", "b", "c"), _n_way_results())
+        drill = matrix.drilldown("line_2", "bus_2")
+
+        assert [d["run_id"] for d in drill] == ["a", "b", "c"]
+        assert [d["trip_state"] for d in drill] == ["NO_TRIP", "TRIPS", "MISSING"]
+        assert drill[1]["t_trip_s"] == 0.90
+        assert drill[0]["t_trip_s"] is None
+        assert matrix.drilldown("unknown", "bus_1") == []
+
+    def test_aligned_matrix_validates_runs_and_is_lru_cached(self, monkeypatch):
+        from collections import OrderedDict
+
+        from application.protection_comparison import service as comparison_service
+        from domain.protection_comparison import (
+            ProtectionResultNotFoundError,
+            ProtectionRunNotFoundError,
+        )
+
+        monkeypatch.setattr(comparison_service, "_aligned_matrix_cache", OrderedDict())
+        project_id = uuid4()
+        run_ids = [str(uuid4()) for _ in range(3)]
+        stored: dict[str, list[dict]] = {}
+        for run_id, result in zip(run_ids, _n_way_results()):
+            run = ProtectionAnalysisRun(
+                id=UUID(run_id),
+                project_id=project_id,
+                sc_run_id="test_sc_run",
+                protection_case_id=uuid4(),
+                status=ProtectionRunStatus.FINISHED,
+            )
+            stored[run_id] = [
+                {"result_type": "protection_analysis_run", "payload": run.to_dict()},
+                {"result_type": "protection_result", "payload": result.to_dict()},
+            ]
+        without_result = str(uuid4())
+        stored[without_result] = stored[run_ids[0]][:1]
+
+        class _Results:
+            def list_results(self, run_id):
+                return stored.get(str(run_id), [])
+
+        class _Uow:
+            results = _Results()
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+        service = ProtectionComparisonService(uow_factory=_Uow)
+
+        matrix = service.get_aligned_matrix(run_ids[0], run_ids[1:])
+        assert matrix.run_ids == tuple(run_ids)
+        assert service.get_aligned_matrix(run_ids[0], run_ids[1:]) is matrix
+
+        with pytest.raises(ProtectionResultNotFoundError):
+            service.get_aligned_matrix(run_ids[0], [without_result])
+        with pytest.raises(ProtectionRunNotFoundError):
+            service.get_aligned_matrix(run_ids[0], [str(uuid4())])
+
+        monkeypatch.setattr(comparison_service, "ALIGNED_MATRIX_CACHE_SIZE", 2)
+        service.get_aligned_matrix(run_ids[0], [run_ids[1]])
+        service.get_aligned_matrix(run_ids[0], run_ids[1:])
+        service.get_aligned_matrix(run_ids[0], [run_ids[2]])
+        assert list(comparison_service._aligned_matrix_cache) == [
+            tuple(run_ids),
+            (run_ids[0], run_ids[2]),
+        ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
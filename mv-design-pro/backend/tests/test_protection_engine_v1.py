@@ -38,6 +38,7 @@ from domain.protection_engine_v1 import (
     RelayV1,
     TestPoint,
     execute_protection_v1,
+    execute_protection_v1_incremental,
     function_50_evaluate,
     function_51_evaluate,
     iec_curve_time_seconds,
@@ -704,3 +705,139 @@ class TestMultiRelay:
         assert t_ei is not None
         assert t_si is not None
         assert t_ei.t_trip_s != t_si.t_trip_s
+
+
+# =============================================================================
+# INCREMENTAL (DEPENDENCY-TRACKED) EVALUATION
+# =============================================================================
+
+
+def _relay(relay_id: str, tms: float, i_inst: float | None = None) -> RelayV1:
+    return RelayV1(
+        relay_id=relay_id,
+        attached_cb_id=f"cb-{relay_id}",
+        ct_ratio=CTRatio(primary_a=400.0, secondary_a=5.0),
+        f51=Function51Settings(
+            curve_type=IECCurveTypeV1.STANDARD_INVERSE,
+            pickup_a_secondary=1.0, tms=tms,
+        ),
+        f50=(
+            Function50Settings(enabled=True, pickup_a_secondary=i_inst)
+            if i_inst is not None else None
+        ),
+    )
+
+
+_TEST_POINTS = (
+    TestPoint(point_id="tp-2", i_a_primary=4000.0),
+    TestPoint(point_id="tp-1", i_a_primary=1200.0),
+)
+
+
+class TestIncrementalEvaluation:
+    """Settings delta re-evaluates only the changed relay."""
+
+    def _input(self, relays: tuple[RelayV1, ...]) -> ProtectionStudyInputV1:
+        return ProtectionStudyInputV1(relays=relays, test_points=_TEST_POINTS)
+
+    def test_full_pass_matches_execute(self):
+        study_input = self._input((_relay("r-2", 0.2), _relay("r-1", 0.1, 30.0)))
+
+        result, state = execute_protection_v1_incremental(study_input)
+
+        assert result == execute_protection_v1(study_input)
+        assert state.recomputed_relay_ids == ("r-1", "r-2")
+
+    def test_tms_change_recomputes_one_relay(self):
+        relays = (_relay("r-1", 0.1, 30.0), _relay("r-2", 0.2), _relay("r-3", 0.3))
+        _, state = execute_protection_v1_incremental(self._input(relays))
+
+        changed = self._input((relays[0], _relay("r-2", 0.25), relays[2]))
+        result, new_state = execute_protection_v1_incremental(changed, state)
+
+        assert new_state.recomputed_relay_ids == ("r-2",)
+        assert result.deterministic_signature == (
+            execute_protection_v1(changed).deterministic_signature
+        )
+        assert result.to_dict() == execute_protection_v1(changed).to_dict()
+        assert new_state.relay_result_hashes["r-1"] == state.relay_result_hashes["r-1"]
+        assert new_state.relay_result_hashes["r-2"] != state.relay_result_hashes["r-2"]
+
+    def test_test_point_change_recomputes_all(self):
+        relays = (_relay("r-1", 0.1), _relay("r-2", 0.2))
+        _, state = execute_protection_v1_incremental(self._input(relays))
+
+        changed = ProtectionStudyInputV1(
+            relays=relays,
+            test_points=(TestPoint(point_id="tp-1", i_a_primary=1500.0),),
+        )
+        result, new_state = execute_protection_v1_incremental(changed, state)
+
+        assert new_state.recomputed_relay_ids == ("r-1", "r-2")
+        assert result == execute_protection_v1(changed)
+
+    def test_added_and_removed_relays(self):
+        _, state = execute_protection_v1_incremental(
+            self._input((_relay("r-1", 0.1), _relay("r-2", 0.2)))
+        )
+
+        changed = self._input((_relay("r-1", 0.1), _relay("r-3", 0.3)))
+        result, new_state = execute_protection_v1_incremental(changed, state)
+
+        assert new_state.recomputed_relay_ids == ("r-3",)
+        assert set(new_state.relay_input_hashes) == {"r-1", "r-3"}
+        assert result == execute_protection_v1(changed)
+
+    def test_signature_is_hash_of_full_payload(self):
+        import hashlib
+        import json
+
+        study_input = self._input((_relay("r-1", 0.1, 30.0), _relay("r-2", 0.2)))
+        result = execute_protection_v1(study_input)
+        payload = {
+            "analysis_type": "PROTECTION",
+            "relay_results": [rr.to_dict() for rr in result.relay_results],
+        }
+        expected = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+
+        assert result.deterministic_signature == expected
+
+    def test_execution_service_reuses_state_per_study_case(self):
+        from uuid import uuid4
+
+        from application.execution_engine.service import ExecutionEngineService
+        from domain.execution import ExecutionAnalysisType
+        from domain.study_case import StudyCaseConfig, new_study_case
+
+        engine = ExecutionEngineService()
+        case = new_study_case(
+            project_id=uuid4(), name="Incremental", config=StudyCaseConfig(),
+        )
+        engine.register_study_case(case)
+
+        signatures = []
+        for study_input in (
+            self._input((_relay("r-1", 0.1), _relay("r-2", 0.2))),
+            self._input((_relay("r-1", 0.1), _relay("r-2", 0.4))),
+        ):
+            run = engine.create_run(
+                study_case_id=case.id,
+                analysis_type=ExecutionAnalysisType.PROTECTION,
+                solver_input=study_input.to_dict(),
+            )
+            _, result_set = engine.execute_run_protection(
+                run.id,
+                study_input=study_input,
+                readiness_snapshot={},
+                validation_snapshot={},
+            )
+            signatures.append(
+                result_set.global_results["deterministic_signature"]
+            )
+
+        assert engine.get_protection_state(case.id).recomputed_relay_ids == ("r-2",)
+        assert signatures[1] == execute_protection_v1(
+            self._input((_relay("r-1", 0.1), _relay("r-2", 0.4)))
+        ).deterministic_signature
@@ -39,7 +39,10 @@ from network_model.solvers.protection_iec60255 import (
     SelectivityVerdict,
     check_selectivity_pair,
     compute_curve_trip_time,
+    compute_i2t_array,
     compute_i2t_thermal_energy,
+    compute_thermal_withstand_grid,
+    compute_trip_time_matrix,
     run_protection_coordination,
 )
 
@@ -626,6 +629,118 @@ class TestI2tThermalEnergy:
         assert "substitution" in trace
 
 
+class TestThermalWithstandGrid:
+    """Verify batch I^2*t / thermal withstand grid."""
+
+    def test_i2t_array_matches_scalar(self) -> None:
+        """Every element equals compute_i2t_thermal_energy exactly."""
+        currents = [500.0, 1234.5678, 10000.0]
+        times = [1.0, 0.123456, 0.05]
+        values = compute_i2t_array(currents, times)
+        for i, t, value in zip(currents, times, values.tolist()):
+            scalar = compute_i2t_thermal_energy(relay_id="R1", i_fault_a=i, t_trip_s=t)
+            assert round(value, 6) == scalar.i2t_a2s
+
+    def test_i2t_array_negative_raises(self) -> None:
+        with pytest.raises(ValueError, match="negative"):
+            compute_i2t_array([-1.0], [0.5])
+
+    def test_grid_shape_and_values(self) -> None:
+        """I_th_dop = I_th1s / sqrt(t), margin = (I_th_dop - Ik) / I_th_dop * 100."""
+        i_th_1s = 150.0 * 94.0
+        grid = compute_thermal_withstand_grid(
+            i_fault_a=[5000.0, 12000.0, 20000.0],
+            t_clear_s=[0.1, 0.37, 1.0],
+            i_th_1s_a=i_th_1s,
+        )
+        assert grid.i2t_a2s.shape == (3, 3)
+        assert grid.i2t_a2s[1, 2] == 12000.0 * 12000.0 * 1.0
+        i_th_dop = i_th_1s / math.sqrt(0.37)
+        assert grid.i_th_dop_a[1] == i_th_dop
+        assert grid.margin_percent[0, 1] == (i_th_dop - 5000.0) / i_th_dop * 100
+        assert bool(grid.adequate[0, 2]) is True
+        assert bool(grid.adequate[2, 2]) is False
+
+    def test_worst_case_margin(self) -> None:
+        """Worst case = highest current at longest clearing time."""
+        grid = compute_thermal_withstand_grid(
+            i_fault_a=[8000.0, 3000.0],
+            t_clear_s=[0.5, 2.0, 0.2],
+            i_th_1s_a=10000.0,
+        )
+        assert grid.worst_index == (0, 1)
+        assert grid.worst_margin_percent == pytest.approx(
+            (10000.0 / math.sqrt(2.0) - 8000.0) / (10000.0 / math.sqrt(2.0)) * 100
+        )
+        worst = grid.to_dict()["worst_case"]
+        assert worst["i_fault_a"] == 8000.0
+        assert worst["t_clear_s"] == 2.0
+
+    def test_grid_read_only(self) -> None:
+        grid = compute_thermal_withstand_grid(
+            i_fault_a=[1000.0], t_clear_s=[1.0], i_th_1s_a=5000.0,
+        )
+        with pytest.raises(ValueError):
+            grid.margin_percent[0, 0] = 0.0
+
+    def test_grid_invalid_inputs_raise(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            compute_thermal_withstand_grid(
+                i_fault_a=[1000.0], t_clear_s=[0.0], i_th_1s_a=5000.0,
+            )
+        with pytest.raises(ValueError, match="positive"):
+            compute_thermal_withstand_grid(
+                i_fault_a=[1000.0], t_clear_s=[1.0], i_th_1s_a=0.0,
+            )
+
+    def test_trip_time_matrix_matches_scalar(self) -> None:
+        """Every matrix cell equals compute_curve_trip_time (NaN = no trip)."""
+        relays = [
+            RelaySettings(curve.value, curve, 100.0, 0.3) for curve in IEC60255CurveType
+        ]
+        currents = [50.0, 100.0, 100.5, 150.0, 777.7, 5000.0]
+        matrix = compute_trip_time_matrix(relays, currents)
+        assert matrix.shape == (len(relays), len(currents))
+        for row, relay in enumerate(relays):
+            for col, i in enumerate(currents):
+                scalar = compute_curve_trip_time(
+                    curve_type=relay.curve_type, i_fault_a=i,
+                    is_pickup_a=relay.pickup_current_a, tms=relay.tms,
+                ).calculated_time_s
+                if scalar is None:
+                    assert math.isnan(matrix[row, col])
+                else:
+                    assert float(matrix[row, col]) == scalar
+
+    def test_coordination_i2t_matches_scalar_path(self) -> None:
+        """Batched I^2*t in coordination equals per-point scalar results."""
+        a = RelaySettings("A", IEC60255CurveType.NI, 200.0, 0.5)
+        b = RelaySettings("B", IEC60255CurveType.VI, 100.0, 0.2)
+        c = RelaySettings("C", IEC60255CurveType.DT, 80.0, 0.1)
+        currents = (150.0, 900.0, 4000.0)
+        result = run_protection_coordination(
+            relay_pairs=((a, b), (b, c)),
+            fault_currents_a=currents,
+        )
+
+        expected = []
+        seen = set()
+        for relay in (a, b, c):
+            for i in currents:
+                trip = compute_curve_trip_time(
+                    curve_type=relay.curve_type, i_fault_a=i,
+                    is_pickup_a=relay.pickup_current_a, tms=relay.tms,
+                )
+                if trip.calculated_time_s is not None and (relay.relay_id, i) not in seen:
+                    seen.add((relay.relay_id, i))
+                    expected.append(compute_i2t_thermal_energy(
+                        relay_id=relay.relay_id, i_fault_a=i,
+                        t_trip_s=trip.calculated_time_s,
+                    ))
+        assert sorted(result.i2t_results, key=lambda r: (r.relay_id, r.i_fault_a)) == \
+            sorted(expected, key=lambda r: (r.relay_id, r.i_fault_a))
+
+
 # =============================================================================
 # TEST: WHITEBOX TRACE COMPLETENESS
 # =============================================================================
@@ -444,6 +444,29 @@ class TestThermalWithstand:
         assert len(result.thermal.trace) >= 2
 
 
+    def test_thermal_matches_grid_single_point(self):
+        """Scalar check reads the I_k3,max × t_k cell of the computed grid."""
+        inp = _make_input(cross_section_mm2=70.0, ik3_max_beginning_a=8000.0)
+        result = ProtectionSettingsEngine.calculate(inp)
+        i_th_dop = 70.0 * 94.0 / math.sqrt(result.thermal.t_fault_s)
+        margin = (i_th_dop - 8000.0) / i_th_dop * 100
+        assert result.thermal.i_th_dop_a == round(i_th_dop, 1)
+        assert result.thermal.margin_percent == round(margin, 1)
+
+    def test_thermal_surface_worst_case(self):
+        """Surface over Ik_min/Ik_max × (t_k, t_SPZ); worst case at Ik_max, longest t."""
+        inp = _make_input(cross_section_mm2=120.0, conductor_material="Al", spz_enabled=True)
+        result = ProtectionSettingsEngine.calculate(inp)
+        surface = result.thermal.margin_surface
+        assert surface["i_fault_a"] == [inp.ik3_min_beginning_a, inp.ik3_max_beginning_a]
+        assert len(surface["t_clear_s"]) == 2
+        assert surface["i_th_1s_a"] == 120.0 * 94.0
+        assert surface["worst_case"]["i_fault_a"] == inp.ik3_max_beginning_a
+        assert surface["worst_case"]["t_clear_s"] == max(surface["t_clear_s"])
+        assert round(surface["i_th_dop_a"][1], 1) == result.spz.i_th_available_a
+        assert result.to_dict()["thermal"]["margin_surface"] == surface
+
+
 # =============================================================================
 # Test: SPZ Analysis
 # =============================================================================
@@ -0,0 +1,288 @@
+"""
+Test: Relay Pair Index — upstream/downstream relay pairs derived from topology.
+
+Validates:
+- Path-to-source ordering (nearest relay first)
+- Adjacent (upstream, downstream) pairs for coordination
+- Unlocated relays (open breaker, island without source)
+- Fingerprint-keyed cache
+- Incremental update after attach_protection / detach_protection equals full rebuild
+- topology_ops stay pure; the API syncs the cache after persisting the ENM
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.enm import router as enm_router
+from api.protection_coordination import router as coordination_router
+from enm.models import EnergyNetworkModel
+from enm.relay_pairs import (
+    RelayPairIndexCache,
+    RELAY_PAIR_INDEX_CACHE,
+    build_relay_pair_index,
+    compute_relay_index_fingerprint,
+    sync_relay_pair_index,
+)
+from enm.store import set_enm
+from enm.topology_ops import attach_protection, detach_protection
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _bus(ref: str) -> dict:
+    return {"ref_id": ref, "name": ref, "voltage_kv": 15, "phase_system": "3ph",
+            "tags": [], "meta": {}}
+
+
+def _branch(ref: str, btype: str, fr: str, to: str, status: str = "closed") -> dict:
+    return {"ref_id": ref, "name": ref, "type": btype, "from_bus_ref": fr,
+            "to_bus_ref": to, "status": status, "tags": [], "meta": {}}
+
+
+def _relay(ref: str, breaker_ref: str) -> dict:
+    return {"ref_id": ref, "name": ref, "breaker_ref": breaker_ref,
+            "device_type": "custom", "settings": [], "is_enabled": True,
+            "tags": [], "meta": {}}
+
+
+def _radial_enm(relays: list[tuple[str, str]]) -> dict:
+    """GPZ → brk_a → A → line_1 → B → brk_b → C → line_2 → D → brk_d → E,
+    lateral B → brk_l → L, island X → brk_x → Y, open breaker brk_o."""
+    return {
+        "header": {"enm_version": "1.0", "name": "Test", "revision": 1},
+        "buses": [_bus(r) for r in ("gpz", "a", "b", "c", "d", "e", "l", "o", "x", "y")],
+        "branches": [
+            _branch("brk_a", "breaker", "gpz", "a"),
+            _branch("line_1", "cable", "a", "b"),
+            _branch("brk_b", "breaker", "b", "c"),
+            _branch("line_2", "line_overhead", "c", "d"),
+            _branch("brk_d", "breaker", "d", "e"),
+            _branch("brk_l", "breaker", "b", "l"),
+            _branch("brk_o", "breaker", "e", "o", status="open"),
+            _branch("brk_x", "breaker", "x", "y"),
+        ],
+        "transformers": [],
+        "sources": [{"ref_id": "src", "name": "GPZ", "bus_ref": "gpz"}],
+        "measurements": [],
+        "protection_assignments": [_relay(ref, brk) for ref, brk in relays],
+    }
+
+
+ALL_RELAYS = [
+    ("pa_a", "brk_a"), ("pa_b", "brk_b"), ("pa_d", "brk_d"),
+    ("pa_l", "brk_l"), ("pa_o", "brk_o"), ("pa_x", "brk_x"),
+]
+
+
+# ---------------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------------
+
+
+class TestRelayPairIndex:
+    def test_path_to_source_nearest_first(self):
+        index = build_relay_pair_index(_radial_enm(ALL_RELAYS))
+
+        assert index.path_to_source("pa_d") == ("pa_d", "pa_b", "pa_a")
+        assert index.upstream_paths["pa_l"] == ("pa_a",)
+        assert index.upstream_paths["pa_a"] == ()
+        assert index.relay_bus["pa_d"] == "e"
+
+    def test_adjacent_pairs(self):
+        index = build_relay_pair_index(_radial_enm(ALL_RELAYS))
+
+        assert index.pairs == (("pa_a", "pa_b"), ("pa_a", "pa_l"), ("pa_b", "pa_d"))
+        assert index.downstream_of("pa_a") == ("pa_b", "pa_l")
+        assert index.upstream_of("pa_d") == ("pa_b",)
+
+    def test_unlocated_relays(self):
+        index = build_relay_pair_index(_radial_enm(ALL_RELAYS))
+
+        assert index.unlocated == ("pa_o", "pa_x")
+        assert index.path_to_source("pa_x") == ()
+
+    def test_disabled_relay_skipped(self):
+        enm = _radial_enm(ALL_RELAYS)
+        enm["protection_assignments"][1]["is_enabled"] = False
+        index = build_relay_pair_index(enm)
+
+        assert "pa_b" not in index.upstream_paths
+        assert index.upstream_of("pa_d") == ("pa_a",)
+
+    def test_coordination_pairs_map_settings(self):
+        index = build_relay_pair_index(_radial_enm(ALL_RELAYS))
+        settings = {"pa_a": "S_A", "pa_b": "S_B", "pa_d": "S_D"}
+
+        assert index.coordination_pairs(settings) == (("S_A", "S_B"), ("S_B", "S_D"))
+
+    def test_deterministic(self):
+        enm = _radial_enm(ALL_RELAYS)
+        reordered = _radial_enm(list(reversed(ALL_RELAYS)))
+        reordered["branches"].reverse()
+
+        assert build_relay_pair_index(enm).to_dict() == build_relay_pair_index(reordered).to_dict()
+
+
+class TestRelayPairIndexCache:
+    def test_cache_hit_by_fingerprint(self):
+        cache = RelayPairIndexCache()
+        enm = _radial_enm(ALL_RELAYS)
+
+        first = cache.get(enm)
+        assert cache.get(_radial_enm(ALL_RELAYS)) is first
+        assert first.fingerprint == compute_relay_index_fingerprint(enm)
+
+    def test_topology_change_invalidates(self):
+        cache = RelayPairIndexCache()
+        enm = _radial_enm(ALL_RELAYS)
+        first = cache.get(enm)
+
+        enm["branches"][4]["status"] = "open"  # brk_d
+        second = cache.get(enm)
+
+        assert second is not first
+        assert "pa_d" in second.unlocated
+
+    @pytest.mark.parametrize("relay_ref,breaker_ref", [
+        ("pa_b", "brk_b"), ("pa_a", "brk_a"), ("pa_d", "brk_d"), ("pa_x", "brk_x"),
+    ])
+    def test_attach_updates_incrementally(self, relay_ref, breaker_ref):
+        RELAY_PAIR_INDEX_CACHE.clear()
+        before = _radial_enm([r for r in ALL_RELAYS if r[0] != relay_ref])
+        RELAY_PAIR_INDEX_CACHE.get(before)
+
+        result = attach_protection(before, _relay(relay_ref, breaker_ref))
+        assert result.success is True
+        sync_relay_pair_index("attach_protection", before, result.enm, result.created_ref)
+
+        cached = RELAY_PAIR_INDEX_CACHE._indexes.get(
+            compute_relay_index_fingerprint(result.enm)
+        )
+        assert cached is not None
+        assert cached.to_dict() == build_relay_pair_index(result.enm).to_dict()
+
+    @pytest.mark.parametrize("relay_ref", ["pa_a", "pa_b", "pa_d", "pa_x"])
+    def test_detach_updates_incrementally(self, relay_ref):
+        RELAY_PAIR_INDEX_CACHE.clear()
+        before = _radial_enm(ALL_RELAYS)
+        RELAY_PAIR_INDEX_CACHE.get(before)
+
+        result = detach_protection(before, relay_ref)
+        assert result.success is True
+        sync_relay_pair_index("detach_protection", before, result.enm, result.created_ref)
+
+        cached = RELAY_PAIR_INDEX_CACHE._indexes.get(
+            compute_relay_index_fingerprint(result.enm)
+        )
+        assert cached is not None
+        assert cached.to_dict() == build_relay_pair_index(result.enm).to_dict()
+
+    def test_attach_without_cached_index_is_noop(self):
+        RELAY_PAIR_INDEX_CACHE.clear()
+        before = _radial_enm([])
+
+        result = attach_protection(before, _relay("pa_a", "brk_a"))
+        sync_relay_pair_index("attach_protection", before, result.enm, result.created_ref)
+
+        assert len(RELAY_PAIR_INDEX_CACHE) == 0
+
+    def test_topology_ops_do_not_touch_cache(self):
+        RELAY_PAIR_INDEX_CACHE.clear()
+        before = _radial_enm(ALL_RELAYS)
+        RELAY_PAIR_INDEX_CACHE.get(before)
+
+        detach_protection(before, "pa_b")
+
+        assert len(RELAY_PAIR_INDEX_CACHE) == 1
+
+
+# ---------------------------------------------------------------------------
+# API wiring
+# ---------------------------------------------------------------------------
+
+
+def _stored_enm(relays: list[tuple[str, str]]) -> EnergyNetworkModel:
+    enm = _radial_enm(relays)
+    for branch in enm["branches"]:
+        if branch["type"] != "breaker":
+            branch.update(length_km=1.0, r_ohm_per_km=0.2, x_ohm_per_km=0.1)
+    enm["sources"][0]["model"] = "short_circuit_power"
+    return EnergyNetworkModel.model_validate(enm)
+
+
+def _device(breaker_ref: str, tms: float) -> dict:
+    stage = {
+        "pickup_current_a": 400.0,
+        "curve_settings": {
+            "standard": "IEC", "variant": "SI",
+            "pickup_current_a": 400.0, "time_multiplier": tms,
+        },
+    }
+    return {
+        "id": str(uuid4()), "name": breaker_ref, "device_type": "RELAY",
+        "location_element_id": breaker_ref, "settings": {"stage_51": stage},
+    }
+
+
+@pytest.fixture
+def api_client():
+    app = FastAPI()
+    app.include_router(enm_router)
+    app.include_router(coordination_router)
+    RELAY_PAIR_INDEX_CACHE.clear()
+    with TestClient(app) as client:
+        yield client
+    RELAY_PAIR_INDEX_CACHE.clear()
+
+
+class TestRelayPairApiWiring:
+    def test_ops_endpoint_syncs_cache_after_save(self, api_client):
+        case_id = str(uuid4())
+        set_enm(case_id, _stored_enm([r for r in ALL_RELAYS if r[0] != "pa_b"]))
+        api_client.get(f"/api/cases/{case_id}/enm/relay-pairs")
+
+        response = api_client.post(
+            f"/api/cases/{case_id}/enm/ops",
+            json={"op": "attach_protection", "data": _relay("pa_b", "brk_b")},
+        )
+        assert response.json()["success"] is True
+        assert len(RELAY_PAIR_INDEX_CACHE) == 2
+
+        pairs = api_client.get(f"/api/cases/{case_id}/enm/relay-pairs").json()
+        assert len(RELAY_PAIR_INDEX_CACHE) == 2  # served from the synced entry
+        assert pairs["pairs"] == [["pa_a", "pa_b"], ["pa_a", "pa_l"], ["pa_b", "pa_d"]]
+
+    def test_coordination_takes_selectivity_pairs_from_topology(self, api_client):
+        case_id = str(uuid4())
+        set_enm(case_id, _stored_enm(ALL_RELAYS))
+        devices = [_device("brk_d", 0.1), _device("brk_a", 0.5), _device("brk_b", 0.3)]
+        ids = {device["location_element_id"]: device["id"] for device in devices}
+
+        response = api_client.post(
+            f"/protection-coordination/projects/{uuid4()}/run",
+            json={
+                "devices": devices,
+                "fault_currents": [
+                    {"location_id": ref, "ik_max_3f_a": 5000.0, "ik_min_3f_a": 2000.0}
+                    for ref in ("brk_a", "brk_b", "brk_d")
+                ],
+                "operating_currents": [],
+                "case_id": case_id,
+            },
+        )
+        assert response.status_code == 201, response.text
+        result = api_client.get(f"/protection-coordination/{response.json()['run_id']}").json()
+
+        assert [
+            (check["upstream_device_id"], check["downstream_device_id"])
+            for check in result["selectivity_checks"]
+        ] == [(ids["brk_a"], ids["brk_b"]), (ids["brk_b"], ids["brk_d"])]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: canonical JSON encoding of large white-box traces.
+
+Compares, on the same synthetic trace:
+- the legacy encoding (_canonicalize + json.dumps),
+- the single-pass encoder (canonical_json_dumps),
+- binding a pre-tagged payload (CanonicalJSON) through DeterministicJSON,
+and checks that all three produce identical bytes. Reports the best of N
+runs; timings are informational and never fail the script.
+
+Usage:
+    python scripts/canonical_json_benchmark.py [--steps N] [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_SRC = PROJECT_ROOT / "backend" / "src"
+sys.path.insert(0, str(BACKEND_SRC))
+
+from infrastructure.persistence.db import create_engine_from_url  # noqa: E402
+from infrastructure.persistence.models import (  # noqa: E402
+    CanonicalJSON,
+    DeterministicJSON,
+    _canonicalize,
+    canonical_json_dumps,
+)
+
+
+def large_trace(steps: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "step": index,
+            "opis": "Obliczenie prądu zwarciowego Ik'' — węzeł źródłowy",
+            "formula_latex": r"I_k'' = \frac{c \cdot U_n}{\sqrt{3} \cdot |Z_k|}",
+            "inputs": {"c": 1.1, "u_kv": 15.0, "z_ohm": (0.123456789, 1e-05 * index)},
+            "result": {"ik_ka": np.float64(12.3456789 + index), "n": np.int64(index)},
+            "vector": np.arange(3, dtype=np.float64) * 0.1,
+            "tags": {"b", "a"},
+            "nested": {"z": [1, 2, {"y": None, "x": True}], "a": 1e16},
+        }
+        for index in range(steps)
+    ]
+
+
+def best_of(runs: int, fn: Callable[[], str]) -> tuple[float, str]:
+    best = float("inf")
+    output = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=5_000, help="trace steps")
+    parser.add_argument("--runs", type=int, default=5, help="runs per variant (best is shown)")
+    args = parser.parse_args()
+
+    trace = large_trace(args.steps)
+    tagged = CanonicalJSON.of(trace)
+    bind = DeterministicJSON().process_bind_param
+    dialect = create_engine_from_url("sqlite+pysqlite:///:memory:").dialect
+
+    legacy_s, legacy = best_of(
+        args.runs,
+        lambda: json.dumps(_canonicalize(trace), sort_keys=True, separators=(",", ":")),
+    )
+    fast_s, fast = best_of(args.runs, lambda: canonical_json_dumps(trace))
+    tagged_s, bound = best_of(args.runs, lambda: bind(tagged, dialect))
+
+    if not (fast == legacy == bound):
+        print("FAIL: encodings differ", file=sys.stderr)
+        return 1
+    print(f"trace: {args.steps} steps, {len(legacy)} bytes (best of {args.runs})")
+    print(f"  legacy encoding      {legacy_s * 1e3:9.2f} ms")
+    print(f"  single-pass encoder  {fast_s * 1e3:9.2f} ms")
+    print(f"  pre-tagged bind      {tagged_s * 1e3:9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
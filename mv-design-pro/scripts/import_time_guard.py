@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+CI Guard: import_time_guard.py
+
+Startup benchmark of the API module based on `python -X importtime`.
+
+Imports api.main in a fresh interpreter and checks that:
+- modules loaded on first use (python-docx, reportlab, NetworkX, the MV
+  equipment catalog records, proof generator) are not imported at start-up,
+- the cumulative import time of api.main stays within the budget
+  (best of N runs; IMPORT_TIME_BUDGET_MS overrides the default).
+
+Usage:
+    python scripts/import_time_guard.py [--runs N] [--top K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_SRC = PROJECT_ROOT / "backend" / "src"
+
+ENTRY_MODULE = "api.main"
+DEFAULT_BUDGET_MS = 4000.0
+
+# Loaded on first use, never while importing the API
+LAZY_MODULES = (
+    "docx",
+    "reportlab",
+    "networkx",
+    "network_model.catalog.mv_cable_line_catalog",
+    "network_model.catalog.mv_transformer_catalog",
+    "network_model.catalog.mv_auxiliary_catalog",
+    "application.proof_engine.proof_generator",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    records: tuple[ImportRecord, ...]
+
+    @property
+    def modules(self) -> frozenset[str]:
+        return frozenset(record.module for record in self.records)
+
+    def cumulative_ms(self, module: str) -> float:
+        for record in self.records:
+            if record.module == module:
+                return record.cumulative_us / 1000.0
+        raise KeyError(module)
+
+    def slowest(self, count: int) -> list[ImportRecord]:
+        return sorted(self.records, key=lambda r: (-r.self_us, r.module))[:count]
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Records of `-X importtime` output (header and other lines skipped)."""
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return ImportProfile(tuple(records))
+
+
+def measure_import(module: str = ENTRY_MODULE) -> ImportProfile:
+    """Import profile of `module` in a fresh interpreter (no bytecode writes)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(BACKEND_SRC), env.get("PYTHONPATH")])
+    )
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=BACKEND_SRC,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def budget_ms() -> float:
+    return float(os.environ.get("IMPORT_TIME_BUDGET_MS", DEFAULT_BUDGET_MS))
+
+
+def check_lazy_modules(profile: ImportProfile) -> list[str]:
+    loaded = profile.modules
+    return [
+        f"{module} is imported at start-up (must load on first use)"
+        for module in LAZY_MODULES
+        if module in loaded
+    ]
+
+
+def check_budget(profiles: list[ImportProfile], limit_ms: float) -> list[str]:
+    best = min(profile.cumulative_ms(ENTRY_MODULE) for profile in profiles)
+    if best > limit_ms:
+        return [f"import {ENTRY_MODULE} took {best:.0f} ms (budget {limit_ms:.0f} ms)"]
+    return []
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    profiles = [measure_import() for _ in range(max(1, args.runs))]
+    times = [profile.cumulative_ms(ENTRY_MODULE) for profile in profiles]
+    print(f"import {ENTRY_MODULE}: " + ", ".join(f"{t:.0f} ms" for t in times))
+    print("Slowest modules (self time):")
+    for record in profiles[-1].slowest(args.top):
+        print(f"  {record.self_us / 1000.0:8.1f} ms  {record.module}")
+
+    errors = check_lazy_modules(profiles[-1]) + check_budget(profiles, budget_ms())
+    if errors:
+        for error in errors:
+            print(f"ERROR: {error}")
+        return 1
+    print("OK: start-up imports within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())